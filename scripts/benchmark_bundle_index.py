@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Bundle Index Benchmark
+
+Times BundleManager lookups and repricing on a marketplace with many
+bundles. The old paths scanned every bundle (and rewrote bundles.json on
+each change); the new paths read the repo, trigram and owner indexes and
+persist only the bundles that changed.
+
+Usage:
+    python scripts/benchmark_bundle_index.py [--bundles 10000] [--repos 2000]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from rra.bundling import BundleDiscount, BundledRepo, BundleManager, BundleType, DiscountType
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bundles", type=int, default=10000)
+    parser.add_argument("--repos", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    words = ["python", "rust", "web", "data", "ml", "starter", "toolkit", "cli", "api", "ui"]
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = BundleManager(storage_path=Path(tmp) / "bundles.json")
+        for i in range(args.bundles):
+            # r1 is a popular repo, in about one bundle in twenty
+            members = set(rng.sample(range(2, args.repos), 4))
+            if rng.random() < 0.05:
+                members.add(1)
+            manager.create_bundle(
+                name=f"{rng.choice(words).title()} {rng.choice(words).title()} Bundle {i}",
+                description=f"A {rng.choice(words)} collection for {rng.choice(words)} work",
+                bundle_type=rng.choice(list(BundleType)),
+                owner_address=f"0x{i % 500:040x}",
+                repos=[
+                    BundledRepo(f"r{m}", f"url{m}", f"Repo {m}", individual_price=50.0)
+                    for m in members
+                ],
+                discount=BundleDiscount(DiscountType.TIERED, 0),
+                tags=rng.sample(words, 2),
+            )
+        bundles = list(manager._bundles.values())
+        popular = "r1"
+
+        def legacy_containing():
+            return [b for b in bundles if any(r.repo_id == popular for r in b.repos)]
+
+        def legacy_search():
+            q = "python toolkit"
+            return [
+                b
+                for b in bundles
+                if b.is_active
+                and (
+                    q in b.name.lower()
+                    or q in b.description.lower()
+                    or any(q in t.lower() for t in b.tags)
+                )
+            ]
+
+        def legacy_save():
+            with open(Path(tmp) / "legacy.json", "w") as f:
+                json.dump({b.bundle_id: b.to_dict() for b in bundles}, f, indent=2, default=str)
+
+        def legacy_prices():
+            # Every read recomputed totals and discounts
+            return sum(b.savings_percent for b in bundles)
+
+        def legacy_reprice():
+            for bundle in legacy_containing():
+                for repo in bundle.repos:
+                    if repo.repo_id == popular:
+                        repo.individual_price = 45.0
+            legacy_save()
+
+        def cold_prices():
+            for bundle in bundles:
+                bundle.invalidate_pricing()
+            return legacy_prices()
+
+        rows = [
+            (
+                "repo -> bundles",
+                timed(legacy_containing, args.repeat),
+                timed(lambda: manager.get_bundles_containing_repo(popular), args.repeat),
+            ),
+            (
+                "search",
+                timed(legacy_search, args.repeat),
+                timed(lambda: manager.search_bundles("python toolkit"), args.repeat),
+            ),
+            ("savings of all", timed(cold_prices, args.repeat), timed(legacy_prices, args.repeat)),
+            (
+                "save one change",
+                timed(legacy_save, 3),
+                timed(lambda: manager._save_bundle(bundles[0].bundle_id), args.repeat),
+            ),
+            (
+                f"reprice {popular}",
+                timed(legacy_reprice, 3),
+                timed(lambda: manager.reprice_repo(popular, 45.0), args.repeat),
+            ),
+        ]
+
+        affected = len(manager.get_bundles_containing_repo(popular))
+        print(f"{args.bundles:,} bundles, {affected:,} containing {popular}")
+        print(f"  {'':18} {'old (ms)':>10} {'new (ms)':>10}")
+        for name, old, new in rows:
+            print(f"  {name:18} {old:10.3f} {new:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
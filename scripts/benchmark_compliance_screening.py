@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Compliance Screening Benchmark
+
+Screens a batch of cross-border transfers with JurisdictionRulesRegistry
+and JurisdictionDetector. The unmemoized path evaluates every transfer
+against the rule objects, as each call used to; the compiled path looks up
+the memoized decision for its (from, to, amount band) corridor.
+
+Usage:
+    python scripts/benchmark_compliance_screening.py [--transfers 200000]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from rra.legal import (
+    JurisdictionCode,
+    JurisdictionDetector,
+    create_jurisdiction_detector,
+    create_rules_registry,
+)
+
+
+def legacy_are_compatible(
+    detector: JurisdictionDetector, code1: JurisdictionCode, code2: JurisdictionCode
+) -> tuple:
+    """The previous per-call check (restrictions plus an EU set built each time)."""
+    restricted1, reason1 = detector.is_restricted(code1)
+    restricted2, reason2 = detector.is_restricted(code2)
+    if restricted1:
+        return False, f"{code1.value} is restricted: {reason1}"
+    if restricted2:
+        return False, f"{code2.value} is restricted: {reason2}"
+    eu = set(detector.get_eu_jurisdictions())
+    if code1 in eu and code2 in eu:
+        return True, None
+    return True, None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transfers", type=int, default=200000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    registry = create_rules_registry()
+    detector = create_jurisdiction_detector()
+    codes = list(registry.compiled.codes)
+    amounts = [Decimal(10**k) for k in range(2, 9)]
+    transfers = [
+        (rng.choice(codes), rng.choice(codes), "license", rng.choice(amounts))
+        for _ in range(args.transfers)
+    ]
+
+    compiled = registry.compiled
+    start = time.perf_counter()
+    for from_code, to_code, _, amount in transfers:
+        registry._decide(compiled, from_code, to_code, compiled.amount_band(to_code, amount))
+        legacy_are_compatible(detector, from_code, to_code)
+    unmemoized = args.transfers / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    registry.check_transactions_compliance(transfers)
+    for from_code, to_code, _, _ in transfers:
+        detector.are_compatible(from_code, to_code)
+    memoized = args.transfers / (time.perf_counter() - start)
+
+    print(f"{args.transfers:,} transfers over {len(codes)} jurisdictions")
+    print(f"  evaluated per transfer:   {unmemoized:12,.0f} transfers/s")
+    print(f"  compiled + memoized:      {memoized:12,.0f} transfers/s")
+    print(f"  memoized decisions:       {len(compiled._decisions):12,}")
+
+
+if __name__ == "__main__":
+    main()
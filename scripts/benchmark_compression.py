@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Compression Benchmark
+
+Compares gzip level 6 (the storage default) against zstd, with and without a
+trained dictionary, on synthetic evidence envelopes and knowledge-base
+sections. Reports compression ratio and throughput for each configuration.
+
+Usage:
+    python scripts/benchmark_compression.py [--samples 2000]
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Callable, Dict, List
+
+from rra.storage.compression import (
+    ZSTD_AVAILABLE,
+    CompressionAlgorithm,
+    CompressionConfig,
+    compress,
+    decompress,
+    train_dictionary,
+)
+
+
+def make_envelope(i: int) -> bytes:
+    """Build an evidence envelope shaped like store_evidence packages."""
+    return json.dumps(
+        {
+            "version": "1.1",
+            "dispute_id": i,
+            "evidence_hash": os.urandom(32).hex(),
+            "viewing_key_commitment": os.urandom(32).hex(),
+            "encrypted_evidence": json.dumps(
+                {
+                    "ciphertext": os.urandom(96).hex(),
+                    "ephemeral_public_key": os.urandom(65).hex(),
+                    "nonce": os.urandom(12).hex(),
+                }
+            ),
+            "metadata": {
+                "repo_url": f"https://github.com/example/repo-{i % 50}",
+                "severity": ["low", "medium", "high", "critical"][i % 4],
+            },
+            "created_at": f"2025-01-{i % 28 + 1:02d}T10:{i % 60:02d}:00",
+        },
+        sort_keys=True,
+    ).encode()
+
+
+def make_kb_section(i: int) -> bytes:
+    """Build a knowledge-base section shaped like KnowledgeBase JSON."""
+    return json.dumps(
+        {
+            "repo_url": f"https://github.com/example/repo-{i}",
+            "market_config": {
+                "license_model": "per-seat",
+                "target_price": f"0.0{i % 9 + 1} ETH",
+                "floor_price": "0.01 ETH",
+                "negotiation_style": "concise",
+                "features": ["Full source code access", "Updates", "Developer support"],
+            },
+            "statistics": {"code_files": i % 300, "languages": ["Python", "TypeScript"]},
+        },
+        sort_keys=True,
+    ).encode()
+
+
+def run(name: str, payloads: List[bytes], config: CompressionConfig) -> Dict[str, float]:
+    """Compress and decompress every payload, returning ratio and MB/s."""
+    total_in = sum(len(p) for p in payloads)
+
+    start = time.perf_counter()
+    outputs = [compress(p, config)[0] for p in payloads]
+    compress_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for out in outputs:
+        decompress(out)
+    decompress_time = time.perf_counter() - start
+
+    total_out = sum(len(o) for o in outputs)
+    result = {
+        "ratio": total_in / total_out,
+        "compress_mb_s": total_in / compress_time / 1e6,
+        "decompress_mb_s": total_in / decompress_time / 1e6,
+    }
+    print(
+        f"  {name:<24} ratio {result['ratio']:6.2f}x  "
+        f"compress {result['compress_mb_s']:8.1f} MB/s  "
+        f"decompress {result['decompress_mb_s']:8.1f} MB/s"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpora: Dict[str, Callable[[int], bytes]] = {
+        "evidence envelopes": make_envelope,
+        "knowledge-base sections": make_kb_section,
+    }
+
+    for corpus_name, factory in corpora.items():
+        payloads = [factory(i) for i in range(args.samples)]
+        avg = sum(len(p) for p in payloads) / len(payloads)
+        print(f"\n{corpus_name} ({len(payloads)} payloads, avg {avg:.0f} bytes)")
+
+        # min_size=0 so small payloads are compressed in every configuration
+        run("gzip-6", payloads, CompressionConfig(level=6, min_size=0))
+
+        if not ZSTD_AVAILABLE:
+            print("  zstandard not installed, skipping zstd runs")
+            continue
+
+        run(
+            "zstd-3",
+            payloads,
+            CompressionConfig(algorithm=CompressionAlgorithm.ZSTD, level=3, min_size=0),
+        )
+
+        training, test = payloads[: len(payloads) // 2], payloads[len(payloads) // 2 :]
+        dictionary = train_dictionary(training, dict_size=16 * 1024)
+        run(
+            "zstd-3 + dictionary",
+            test,
+            CompressionConfig(
+                algorithm=CompressionAlgorithm.ZSTD, level=3, min_size=0, dictionary=dictionary
+            ),
+        )
+
+    big = b"".join(make_kb_section(i) for i in range(args.samples * 10))
+    print(f"\nlarge input ({len(big) / 1e6:.1f} MB)")
+    run("gzip-6", [big], CompressionConfig(level=6))
+    if ZSTD_AVAILABLE:
+        run("zstd-3", [big], CompressionConfig(algorithm=CompressionAlgorithm.ZSTD, level=3))
+        run(
+            "zstd-3 threads=-1",
+            [big],
+            CompressionConfig(algorithm=CompressionAlgorithm.ZSTD, level=3, threads=-1),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Fork Graph Benchmark
+
+Times derivative tree queries on a repository with many forks, several
+generations deep. The old path scanned every recorded fork for the
+parent's direct forks and made three more passes for the stats; the new
+path reads the parent -> fork index and the running subtree counts.
+
+Usage:
+    python scripts/benchmark_fork_graph.py [--forks 20000] [--queries 200]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from rra.integrations.github_webhooks import ForkTracker, GitHubWebhookHandler
+
+
+def fork_event(parent: str, fork: str) -> dict:
+    return {
+        "repository": {"full_name": parent, "html_url": f"https://github.com/{parent}"},
+        "forkee": {"full_name": fork, "html_url": "", "owner": {"login": fork.split("/")[0]}},
+        "sender": {},
+    }
+
+
+def legacy_tree(handler: GitHubWebhookHandler, parent_repo: str) -> dict:
+    """The previous one-level tree: a scan over all forks plus three passes."""
+    forks = [f for f in handler.get_all_forks() if f.parent_repo == parent_repo]
+    registered = [f for f in forks if f.registered_as_derivative]
+    unregistered = [f for f in forks if not f.registered_as_derivative]
+    notified = sum(1 for f in forks if f.notified)
+    derivatives = [ForkTracker._derivative_entry(f) for f in registered + unregistered]
+    return {"derivatives": derivatives, "notified": notified}
+
+
+def legacy_descendants(handler: GitHubWebhookHandler, repo: str) -> int:
+    """All generations with the old API: one full scan per generation."""
+    found, frontier = 0, {repo}
+    while frontier:
+        frontier = {f.fork_repo for f in handler.get_all_forks() if f.parent_repo in frontier}
+        found += len(frontier)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--forks", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = GitHubWebhookHandler(data_path=Path(tmp) / "forks.json")
+        repos = ["origin/repo"]
+
+        async def ingest() -> None:
+            for i in range(args.forks):
+                # Most forks are of the original, the rest fork earlier forks
+                parent = repos[0] if rng.random() < 0.5 else rng.choice(repos)
+                fork = f"user{i}/repo"
+                await handler.handle_fork_event(fork_event(parent, fork))
+                repos.append(fork)
+
+        t0 = time.perf_counter()
+        asyncio.run(ingest())
+        ingest_time = (time.perf_counter() - t0) / args.forks
+        for fork in rng.sample(repos[1:], args.forks // 10):
+            handler.mark_registered(fork, f"ip-{fork}")
+
+        # The old handler rewrote the whole forks file on every event
+        t0 = time.perf_counter()
+        with open(Path(tmp) / "legacy.json", "w") as f:
+            json.dump(
+                {fk.fork_repo: fk.model_dump() for fk in handler.get_all_forks()}, f, indent=2
+            )
+        legacy_save = time.perf_counter() - t0
+
+        tracker = ForkTracker(handler)
+        t0 = time.perf_counter()
+        for _ in range(args.queries):
+            legacy_tree(handler, "origin/repo")
+        legacy = (time.perf_counter() - t0) / args.queries
+
+        t0 = time.perf_counter()
+        for _ in range(args.queries):
+            tracker.get_derivative_tree("origin/repo")
+        indexed = (time.perf_counter() - t0) / args.queries
+
+        sample = rng.sample(repos[1:], args.queries)
+        t0 = time.perf_counter()
+        for repo in sample:
+            legacy_descendants(handler, repo)
+        legacy_lineage = (time.perf_counter() - t0) / args.queries
+
+        t0 = time.perf_counter()
+        for repo in sample:
+            handler.get_fork_counts(repo)
+            handler.get_ancestors(repo)
+        counts = (time.perf_counter() - t0) / args.queries
+
+        print(f"{args.forks:,} forks")
+        print(f"  legacy fork event save:       {legacy_save * 1000:10.3f} ms")
+        print(f"  fork event (index + oplog):   {ingest_time * 1000:10.3f} ms")
+        print(f"  legacy one-level tree:        {legacy * 1000:10.3f} ms")
+        print(f"  indexed one-level tree:       {indexed * 1000:10.3f} ms")
+        print(f"  legacy subtree walk:          {legacy_lineage * 1000:10.3f} ms")
+        print(f"  subtree counts + ancestors:   {counts * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
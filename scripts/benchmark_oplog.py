@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Op-Log Persistence Benchmark
+
+Compares the managers' old persistence (rewrite the whole JSON state file on
+every mutation) with OpLogStore (append one operation per mutation, group
+commit, periodic snapshot) on a state of many entities, then times recovery.
+
+Usage:
+    python scripts/benchmark_oplog.py [--entities 100000] [--mutations 50000] [--no-fsync]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from rra.persistence.oplog import OpLogStore
+
+
+def make_entity(i: int) -> dict:
+    return {
+        "address": f"0x{i:040x}",
+        "score": 500,
+        "total_disputes": 0,
+        "last_activity_at": "2025-01-01T00:00:00",
+    }
+
+
+def bench_rewrite(directory: Path, state: dict, samples: int) -> float:
+    """Mutations per second when every write dumps the whole state."""
+    path = directory / "state.json"
+    start = time.perf_counter()
+    for i in range(samples):
+        state["participants"][f"0x{i:040x}"]["score"] += 1
+        with open(path, "w") as f:
+            json.dump(state, f, indent=2, default=str)
+    return samples / (time.perf_counter() - start)
+
+
+def bench_oplog(directory: Path, state: dict, mutations: int, fsync: bool) -> OpLogStore:
+    """Mutations per second through OpLogStore on the same state."""
+    store = OpLogStore(directory, fsync=fsync)
+    store.replace_state(state)
+    keys = list(state["participants"])
+    rng = random.Random(7)
+
+    start = time.perf_counter()
+    for n in range(mutations):
+        key = keys[rng.randrange(len(keys))]
+        entity = make_entity(n)
+        entity["address"] = key
+        entity["score"] = n
+        store.put("participants", key, entity)
+    store.flush()
+    elapsed = time.perf_counter() - start
+
+    stats = store.get_stats()
+    print(f"  op-log          {mutations / elapsed:12,.0f} mutations/s")
+    print(
+        f"                  {stats['group_commits']:,} group commits, {stats['snapshots']} snapshots"
+    )
+    return store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--mutations", type=int, default=50_000)
+    parser.add_argument("--rewrite-samples", type=int, default=3)
+    parser.add_argument("--no-fsync", action="store_true")
+    args = parser.parse_args()
+
+    state = {
+        "participants": {f"0x{i:040x}": make_entity(i) for i in range(args.entities)},
+        "dispute_participants": {},
+    }
+    print(f"state: {args.entities:,} entities, fsync {'off' if args.no_fsync else 'on'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        rewrite = bench_rewrite(tmp_path, state, args.rewrite_samples)
+        print(f"  full rewrite    {rewrite:12,.1f} mutations/s")
+
+        store = bench_oplog(tmp_path / "oplog", state, args.mutations, not args.no_fsync)
+        store.close()
+
+        start = time.perf_counter()
+        recovered = OpLogStore(tmp_path / "oplog")
+        recovery = time.perf_counter() - start
+        print(f"  recovery        {recovery * 1000:12,.0f} ms (snapshot + log replay)")
+        assert len(recovered.get("participants")) == args.entities
+        recovered.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Repository Backend Benchmark
+
+Compares StakingManager lookups (get_stakes_by_staker, get_stakes_by_pool)
+on the in-memory dicts, which scan every stake, with the SQLite backend,
+which answers from indexes. Also times loading the stakes into SQLite.
+
+Usage:
+    python scripts/benchmark_repository.py [--sizes 10000,100000,1000000] [--queries 200]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from rra.defi.yield_tokens import StakedLicense, StakingManager
+
+STAKERS_PER_SIZE = 1000
+POOLS = 50
+
+
+def make_stakes(count: int) -> dict:
+    now = datetime.now()
+    return {
+        f"stake_{i:08d}": StakedLicense(
+            stake_id=f"stake_{i:08d}",
+            license_id=f"lic_{i}",
+            token_id=i,
+            repo_url="https://github.com/example/repo",
+            license_value=1.0,
+            staker_address=f"0x{i % STAKERS_PER_SIZE:040x}",
+            pool_id=f"pool_{i % POOLS}",
+            staked_at=now,
+        )
+        for i in range(count)
+    }
+
+
+def time_queries(manager: StakingManager, queries: int) -> tuple:
+    rng = random.Random(3)
+    stakers = [f"0x{rng.randrange(STAKERS_PER_SIZE):040x}" for _ in range(queries)]
+    pools = [f"pool_{rng.randrange(POOLS)}" for _ in range(queries)]
+
+    start = time.perf_counter()
+    for staker in stakers:
+        manager.get_stakes_by_staker(staker)
+    by_staker = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for pool in pools:
+        manager.get_stakes_by_pool(pool)
+    by_pool = (time.perf_counter() - start) / queries
+    return by_staker, by_pool
+
+
+def bench_size(size: int, queries: int, directory: Path) -> None:
+    stakes = make_stakes(size)
+
+    memory = StakingManager()
+    memory.stakes = stakes
+    mem_staker, mem_pool = time_queries(memory, queries)
+
+    sqlite = StakingManager(data_dir=directory / f"n{size}", storage_backend="sqlite")
+    sqlite.stakes = stakes
+    start = time.perf_counter()
+    sqlite._save_state()
+    load = time.perf_counter() - start
+    sql_staker, sql_pool = time_queries(sqlite, queries)
+    sqlite._store.close()
+
+    print(f"\n{size:,} stakes (SQLite bulk load {load:.2f} s)")
+    print(f"  {'query':<22}{'in-memory':>12}{'sqlite':>12}{'speedup':>10}")
+    for label, mem, sql in (
+        ("by staker", mem_staker, sql_staker),
+        ("by pool", mem_pool, sql_pool),
+    ):
+        print(f"  {label:<22}{mem * 1000:10.3f}ms{sql * 1000:10.3f}ms{mem / sql:9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.sizes.split(",")):
+            bench_size(size, args.queries, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
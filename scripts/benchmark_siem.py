@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+SIEM Forwarding Benchmark
+
+Measures sustained enqueue and drain throughput of the persistent SIEM
+event queue while the SIEM is unreachable (every event spills to disk),
+then drains the backlog in acknowledged batches. Also measures forwarding
+throughput per protocol against local TCP, UDP and HTTP listeners.
+
+Usage:
+    python scripts/benchmark_siem.py [--events 1000000] [--batch-size 500]
+        [--send-events 50000]
+"""
+
+import argparse
+import socket
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from rra.integration.boundary_daemon import BoundaryEvent, BoundaryMode, EventSeverity
+from rra.integration.boundary_siem import (
+    BoundarySIEMClient,
+    PersistentEventQueue,
+    SIEMConfig,
+    SIEMProtocol,
+)
+
+
+def make_event(i: int) -> BoundaryEvent:
+    """Build an access event shaped like BoundaryDaemon output."""
+    return BoundaryEvent(
+        event_id=f"evt_{i:016x}",
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        event_type="access_check",
+        source="rra-module",
+        action="read",
+        outcome="allowed" if i % 7 else "denied",
+        severity=EventSeverity.INFO if i % 7 else EventSeverity.MEDIUM,
+        mode=BoundaryMode.RESTRICTED,
+        principal_id=f"agent_{i % 100}",
+        resource_type="repository",
+        resource_id=f"repo_{i % 1000}",
+        context={"correlation_id": f"{i:032x}"},
+        previous_hash=f"{i:064x}",
+    )
+
+
+def bench_queue(events: int, batch_size: int) -> None:
+    """Fill the queue as during an outage, then drain it."""
+    print(f"\npersistent queue ({events:,} events, batch {batch_size})")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        queue = PersistentEventQueue(
+            data_dir=Path(tmpdir), memory_limit=1000, disk_limit=events + 1000
+        )
+        sample = [make_event(i) for i in range(1000)]
+
+        start = time.perf_counter()
+        for i in range(events):
+            queue.add(sample[i % len(sample)])
+        queue.flush()
+        enqueue_time = time.perf_counter() - start
+        print(f"  enqueue  {events / enqueue_time:12,.0f} events/s")
+
+        drained = 0
+        start = time.perf_counter()
+        while True:
+            batch = queue.get_batch(batch_size)
+            if not batch:
+                break
+            queue.acknowledge(batch)
+            drained += len(batch)
+        drain_time = time.perf_counter() - start
+        print(f"  drain    {drained / drain_time:12,.0f} events/s")
+        queue.close()
+
+
+def start_tcp_sink() -> int:
+    """Accept connections and discard everything received."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+
+    def drain(conn: socket.socket) -> None:
+        while conn.recv(1 << 20):
+            pass
+
+    def accept() -> None:
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(target=drain, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def start_udp_sink() -> int:
+    """Receive and discard datagrams."""
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+    sink.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
+
+    def drain() -> None:
+        while True:
+            sink.recv(65536)
+
+    threading.Thread(target=drain, daemon=True).start()
+    return sink.getsockname()[1]
+
+
+def start_http_sink() -> int:
+    """Keep-alive HTTP server that accepts and discards event batches."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
+
+
+def bench_transports(events: int, batch_size: int) -> None:
+    """Forward batches over each protocol to a local listener."""
+    print(f"\ntransports ({events:,} events, batch {batch_size})")
+    sample = [make_event(i) for i in range(batch_size)]
+    tcp_port, udp_port, http_port = start_tcp_sink(), start_udp_sink(), start_http_sink()
+
+    runs = [
+        ("syslog tcp", SIEMProtocol.SYSLOG_TCP, tcp_port, {}),
+        ("syslog udp", SIEMProtocol.SYSLOG_UDP, udp_port, {}),
+        ("cef tcp", SIEMProtocol.CEF_TCP, tcp_port, {}),
+        ("cef udp", SIEMProtocol.CEF_UDP, udp_port, {}),
+        ("json http", SIEMProtocol.JSON_HTTP, http_port, {}),
+        ("json http gzip", SIEMProtocol.JSON_HTTP, http_port, {"http_gzip": True}),
+    ]
+    for name, protocol, port, options in runs:
+        config = SIEMConfig(host="127.0.0.1", port=port, protocol=protocol, **options)
+        client = BoundarySIEMClient(config=config)
+
+        sent = 0
+        start = time.perf_counter()
+        while sent < events:
+            if not client._send_events(sample):
+                print(f"  {name:<16} send failed")
+                break
+            sent += len(sample)
+        elapsed = time.perf_counter() - start
+        client.close_transports()
+        print(f"  {name:<16} {sent / elapsed:12,.0f} events/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--send-events", type=int, default=50_000)
+    args = parser.parse_args()
+
+    bench_queue(args.events, args.batch_size)
+    bench_transports(args.send_events, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
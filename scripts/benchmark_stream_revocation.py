@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Stream Revocation Sweep Benchmark
+
+Times one revocation sweep over a large population of stopped streaming
+licenses for several numbers of due expirations. The old sweep scanned
+every license (and rewrote the licenses file); the deadline queue only
+visits the licenses whose grace period has ended.
+
+Usage:
+    python scripts/benchmark_stream_revocation.py [--licenses 500000] [--expiring 0,10,1000,10000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from rra.integrations.superfluid import StreamingLicense, StreamStatus, SuperfluidManager
+
+
+def populate(manager: SuperfluidManager, count: int, start: datetime) -> None:
+    """Stopped licenses whose grace periods end one second apart."""
+    for i in range(count):
+        license_id = f"sf_{i:08d}"
+        manager._licenses[license_id] = StreamingLicense(
+            license_id=license_id,
+            repo_id=f"repo_{i % 1000}",
+            buyer_address=f"0x{i:040x}",
+            seller_address="0xseller",
+            flow_rate=1,
+            token="USDCx",
+            monthly_cost_usd=10.0,
+            start_time=start,
+            grace_period_seconds=3600 + i,
+            status=StreamStatus.STOPPED,
+            stop_time=start,
+        )
+    manager._save_licenses()
+
+
+def scan_sweep(manager: SuperfluidManager, now: datetime) -> list:
+    """The previous implementation's full scan (without its file rewrite)."""
+    expired = []
+    for license_id, license in manager._licenses.items():
+        if license.status == StreamStatus.STOPPED and license.stop_time:
+            grace_end = license.stop_time + timedelta(seconds=license.grace_period_seconds)
+            if now >= grace_end:
+                expired.append(license_id)
+    return expired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--licenses", type=int, default=500_000)
+    parser.add_argument("--expiring", default="0,10,1000,10000")
+    args = parser.parse_args()
+
+    start = datetime.utcnow() - timedelta(hours=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SuperfluidManager(storage_path=Path(tmp) / "licenses.json")
+        t0 = time.perf_counter()
+        populate(manager, args.licenses, start)
+        print(f"{args.licenses:,} stopped licenses (load {time.perf_counter() - t0:.1f} s)")
+        print(f"  {'expiring':>10}{'full scan':>14}{'queue sweep':>14}")
+
+        revoked_so_far = 0
+        for expiring in (int(n) for n in args.expiring.split(",")):
+            # Grace ends are start + 3600 + i seconds: move the clock past `expiring` more
+            now = start + timedelta(seconds=3600 + revoked_so_far + expiring - 0.5)
+
+            t0 = time.perf_counter()
+            scan_sweep(manager, now)
+            scan = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            revoked = asyncio.run(manager.revoke_expired_licenses(now=now))
+            sweep = time.perf_counter() - t0
+
+            assert len(revoked) == expiring
+            revoked_so_far += expiring
+            print(f"  {expiring:>10,}{scan * 1000:12.1f}ms{sweep * 1000:12.3f}ms")
+        manager._store.close()
+
+
+if __name__ == "__main__":
+    main()
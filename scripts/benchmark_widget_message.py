@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Widget Message Path Benchmark
+
+Times the knowledge base lookup and negotiator setup of one REST widget
+message on a marketplace with many repositories. The old path built a
+DeepLinkService (re-reading the mappings), loaded knowledge bases until one
+matched and constructed a new NegotiatorAgent; the new path looks the agent
+up in a cached index and reuses the session's pooled negotiator.
+
+Usage:
+    python scripts/benchmark_widget_message.py [--repos 2000] [--messages 20]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rra.agents.negotiator import NegotiatorAgent
+from rra.agents.pool import AgentPool
+from rra.config.market_config import MarketConfig
+from rra.ingestion.knowledge_base import KnowledgeBase
+from rra.services.deep_links import DeepLinkService
+from rra.services.kb_index import KnowledgeBaseIndex
+
+
+def populate(kb_dir: Path, count: int) -> DeepLinkService:
+    """Knowledge bases of ~40 KB each, half of them registered."""
+    links = DeepLinkService(mappings_path=kb_dir / "repo_mappings.json")
+    for i in range(count):
+        url = f"https://github.com/owner{i}/repo{i}"
+        kb = KnowledgeBase(repo_path=Path("."), repo_url=url)
+        kb.market_config = MarketConfig(target_price="0.05 ETH", floor_price="0.02 ETH")
+        kb.code_structure = {"files": [f"src/package/module_{j}.py" for j in range(1000)]}
+        kb.save(kb_dir / f"owner{i}_repo{i}_kb.json", compress=False)
+        if i % 2 == 0:
+            links._mappings[links.generate_repo_id(url)] = {"repo_url": url}
+    links._save_mappings()
+    return links
+
+
+def legacy_negotiator(kb_dir: Path, agent_id: str) -> NegotiatorAgent:
+    """The previous per-message path (unregistered agents fall back to the scan)."""
+    link_service = DeepLinkService(mappings_path=kb_dir / "repo_mappings.json")
+    for kb_file in kb_dir.glob("*_kb.json"):
+        kb = KnowledgeBase.load(kb_file)
+        if agent_id in str(kb_file) or agent_id == link_service.generate_repo_id(kb.repo_url):
+            return NegotiatorAgent(kb)
+    raise LookupError(agent_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=2000)
+    parser.add_argument("--messages", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp)
+        links = populate(kb_dir, args.repos)
+        # An unregistered repository halfway through the directory scan
+        names = [p.name for p in kb_dir.glob("*_kb.json")]
+        middle = [n for n in names if int(n.split("_")[0][5:]) % 2][len(names) // 4]
+        owner, repo = middle.split("_")[:2]
+        agent_id = links.generate_repo_id(f"https://github.com/{owner}/{repo}")
+
+        t0 = time.perf_counter()
+        for _ in range(args.messages):
+            legacy_negotiator(kb_dir, agent_id)
+        legacy = (time.perf_counter() - t0) / args.messages
+
+        index = KnowledgeBaseIndex(kb_dir)
+        pool: AgentPool = AgentPool()
+        t0 = time.perf_counter()
+        index.refresh()
+        build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(args.messages):
+            pool.get_or_create("widget_1", lambda: NegotiatorAgent(index.load(agent_id)))
+        cached = (time.perf_counter() - t0) / args.messages
+
+        # A new session for the same agent: index lookup plus a new negotiator
+        t0 = time.perf_counter()
+        for i in range(args.messages):
+            pool.get_or_create(f"widget_new_{i}", lambda: NegotiatorAgent(index.load(agent_id)))
+        new_session = (time.perf_counter() - t0) / args.messages
+
+        print(f"{args.repos:,} knowledge bases (index build {build * 1000:.0f} ms, once)")
+        print(f"  legacy per message:        {legacy * 1000:10.1f} ms")
+        print(f"  pooled session message:   {cached * 1000:10.3f} ms")
+        print(f"  first message of session:  {new_session * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -75,8 +75,13 @@ class StreamAccessController:
         self.default_grace_hours = default_grace_hours
         self.check_interval_seconds = check_interval_seconds
         self._access_grants: Dict[str, AccessGrant] = {}
+        # repo_id -> license IDs with a grant (dict as an insertion-ordered set)
+        self._grants_by_repo: Dict[str, Dict[str, None]] = {}
         self._revocation_callbacks: List[Callable] = []
         self._monitor_task: Optional[asyncio.Task] = None
+        # Set when a stream stops, so the monitor can re-arm for its grace end
+        self._wakeup: Optional[asyncio.Event] = None
+        self.sf.add_schedule_listener(self._on_revocation_scheduled)
 
     def add_revocation_callback(self, callback: Callable[[str, str], None]) -> None:
         """
@@ -148,8 +153,7 @@ class StreamAccessController:
         Returns:
             Access status and details
         """
-        licenses = self.sf.get_licenses_for_buyer(buyer_address)
-        repo_licenses = [lic for lic in licenses if lic.repo_id == repo_id]
+        repo_licenses = self.sf.get_licenses_for_repo_buyer(repo_id, buyer_address)
 
         if not repo_licenses:
             return {
@@ -160,9 +164,9 @@ class StreamAccessController:
             }
 
         # Check for any active license
-        for license in repo_licenses:
-            if self.sf.check_access(license.license_id):
-                return await self.check_access(license.license_id)
+        license = self.sf.find_access_license(repo_id, buyer_address)
+        if license:
+            return await self.check_access(license.license_id)
 
         # No active access
         return {
@@ -210,6 +214,7 @@ class StreamAccessController:
         )
 
         self._access_grants[license_id] = grant
+        self._grants_by_repo.setdefault(grant.repo_id, {})[license_id] = None
         return grant
 
     async def revoke_access(self, license_id: str, reason: str = "stream_stopped") -> bool:
@@ -231,11 +236,12 @@ class StreamAccessController:
         # Update license status
         if license.status != StreamStatus.REVOKED:
             license.status = StreamStatus.REVOKED
-            self.sf._save_licenses()
+            self.sf._save_license(license_id)
 
         # Remove access grant
-        if license_id in self._access_grants:
-            del self._access_grants[license_id]
+        grant = self._access_grants.pop(license_id, None)
+        if grant:
+            del self._grants_by_repo[grant.repo_id][license_id]
 
         # Call revocation callbacks
         for callback in self._revocation_callbacks:
@@ -251,6 +257,7 @@ class StreamAccessController:
         if self._monitor_task is not None:
             return
 
+        self._wakeup = asyncio.Event()
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
     async def stop_monitoring(self) -> None:
@@ -263,8 +270,30 @@ class StreamAccessController:
                 pass
             self._monitor_task = None
 
+    def _on_revocation_scheduled(self, grace_end: datetime) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _wait_for_next_deadline(self) -> None:
+        """
+        Sleep until the earliest grace-period end, a newly stopped stream,
+        or at most check_interval_seconds.
+        """
+        timeout = float(self.check_interval_seconds)
+        next_at = self.sf.next_revocation_at()
+        if next_at is not None:
+            timeout = min(timeout, max(0.0, (next_at - datetime.utcnow()).total_seconds()))
+
+        wakeup = self._wakeup
+        assert wakeup is not None  # created by start_monitoring() before the loop runs
+        wakeup.clear()
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _monitor_loop(self) -> None:
-        """Background loop to check and revoke expired licenses."""
+        """Background loop that revokes licenses as their grace periods end."""
         while True:
             try:
                 # Revoke expired licenses
@@ -273,7 +302,7 @@ class StreamAccessController:
                 for license_id in revoked:
                     await self.revoke_access(license_id, reason="grace_period_expired")
 
-                await asyncio.sleep(self.check_interval_seconds)
+                await self._wait_for_next_deadline()
 
             except asyncio.CancelledError:
                 break
@@ -287,7 +316,7 @@ class StreamAccessController:
 
     def get_grants_for_repo(self, repo_id: str) -> List[AccessGrant]:
         """Get all grants for a repository."""
-        return [grant for grant in self._access_grants.values() if grant.repo_id == repo_id]
+        return [self._access_grants[lid] for lid in self._grants_by_repo.get(repo_id, ())]
 
     async def get_access_summary(self, repo_id: str) -> Dict[str, Any]:
         """
@@ -354,8 +383,8 @@ class AccessVerificationMiddleware:
         Returns:
             True if access is granted
         """
-        result = await self.controller.check_access_by_buyer(repo_id, buyer_address)
-        return result.get("has_access", False)
+        # Download path: only the access decision, without building a report
+        return self.controller.sf.find_access_license(repo_id, buyer_address) is not None
 
     async def get_access_token(self, license_id: str, duration_hours: int = 24) -> Optional[str]:
         """
@@ -4,5 +4,6 @@
 
 from rra.agents.negotiator import NegotiatorAgent
 from rra.agents.buyer import BuyerAgent
+from rra.agents.pool import AgentPool
 
-__all__ = ["NegotiatorAgent", "BuyerAgent"]
+__all__ = ["NegotiatorAgent", "BuyerAgent", "AgentPool"]
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Bounded pool of live agents keyed by session.
+
+Keeps negotiators alive between the messages of a session so their
+negotiation history and phase carry over, instead of constructing a new
+agent per message. The pool is bounded in size (least recently used
+agents go first) and drops agents idle for longer than idle_ttl.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+A = TypeVar("A")
+
+# Default pool bounds
+DEFAULT_POOL_SIZE = 1000
+DEFAULT_IDLE_TTL = 1800.0  # 30 minutes
+
+
+class AgentPool(Generic[A]):
+    """
+    LRU pool of agents with idle eviction.
+
+    Example:
+        pool = AgentPool(max_size=500, idle_ttl=900, on_evict=save_state)
+        agent = pool.get_or_create(session_id, lambda: NegotiatorAgent(kb))
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        on_evict: Optional[Callable[[str, A], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_size: Maximum number of live agents
+            idle_ttl: Seconds an agent may go unused before it is evicted
+            on_evict: Called with (key, agent) when an agent is evicted
+                (not when it is discarded explicitly)
+            clock: Monotonic time source
+        """
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self._clock = clock
+        self._lock = threading.RLock()
+        # key -> (agent, last used), least recently used first
+        self._agents: "OrderedDict[str, Tuple[A, float]]" = OrderedDict()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._agents
+
+    def _evict(self, key: str) -> None:
+        agent, _ = self._agents.pop(key)
+        self.evictions += 1
+        if self.on_evict:
+            self.on_evict(key, agent)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Evict agents idle for longer than idle_ttl.
+
+        Returns:
+            Number of agents evicted
+        """
+        now = self._clock() if now is None else now
+        evicted = 0
+        with self._lock:
+            # Oldest first, so stop at the first agent still in use
+            while self._agents:
+                key, (_, last_used) = next(iter(self._agents.items()))
+                if now - last_used < self.idle_ttl:
+                    break
+                self._evict(key)
+                evicted += 1
+        return evicted
+
+    def get(self, key: str) -> Optional[A]:
+        """Get a live agent and mark it used, or None."""
+        with self._lock:
+            self.evict_idle()
+            entry = self._agents.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._agents[key] = (entry[0], self._clock())
+            self._agents.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, agent: A) -> None:
+        """Add (or replace) the agent of a key, evicting the least recently used if full."""
+        with self._lock:
+            self._agents.pop(key, None)
+            self._agents[key] = (agent, self._clock())
+            while len(self._agents) > self.max_size:
+                self._evict(next(iter(self._agents)))
+
+    def get_or_create(self, key: str, factory: Callable[[], A]) -> A:
+        """
+        Get the live agent of a key, creating it with factory if absent.
+
+        Args:
+            key: Session key
+            factory: Builds a new agent
+
+        Returns:
+            The pooled agent
+        """
+        with self._lock:
+            agent = self.get(key)
+            if agent is not None:
+                return agent
+            agent = factory()
+            self.put(key, agent)
+            return agent
+
+    def discard(self, key: str) -> Optional[A]:
+        """Remove an agent without calling on_evict."""
+        with self._lock:
+            entry = self._agents.pop(key, None)
+            return entry[0] if entry else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._agents.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "live": len(self._agents),
+            "max_size": self.max_size,
+            "idle_ttl": self.idle_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
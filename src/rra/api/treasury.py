@@ -811,6 +811,26 @@ async def get_votes(proposal_id: str) -> Dict[str, Any]:
     raise HTTPException(404, f"Proposal not found: {proposal_id}")
 
 
+@router.get("/votes/{proposal_id}/tally")
+async def get_live_tally(proposal_id: str) -> Dict[str, Any]:
+    """
+    Get the live tally of a treasury governance proposal.
+
+    Served from running totals, so the cost does not grow with the number
+    of voters.
+
+    Args:
+        proposal_id: Treasury voting proposal identifier
+
+    Returns:
+        Current stake totals, quorum and approval status
+    """
+    tally = get_voting_manager().get_live_tally(proposal_id)
+    if tally is None:
+        raise HTTPException(404, f"Proposal not found: {proposal_id}")
+    return tally
+
+
 # -----------------------------------------------------------------------------
 # Resolution
 # -----------------------------------------------------------------------------
@@ -9,15 +9,20 @@ Provides REST API endpoints for:
 - Widget analytics and tracking
 """
 
+import os
 import secrets
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response, Depends
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 
+from rra.agents.pool import AgentPool
 from rra.api.auth import verify_api_key
+from rra.api.widget_store import WidgetSessionStore
+from rra.services.kb_index import KnowledgeBaseIndex
 
 
 router = APIRouter(prefix="/api/widget", tags=["widget"])
@@ -121,8 +126,41 @@ class WidgetEventRequest(BaseModel):
 # Widget Session Storage (use Redis in production)
 # =============================================================================
 
-_widget_sessions: Dict[str, Dict[str, Any]] = {}
-_widget_analytics: List[Dict[str, Any]] = []
+
+def _on_session_expired(widget_id: str, session: Dict[str, Any]) -> None:
+    """Release the expired session's pooled negotiator."""
+    _negotiator_pool.discard(widget_id)
+
+
+# Directory of the rolling widget event log; unset keeps events in memory only
+WIDGET_EVENT_LOG_DIR = os.environ.get("RRA_WIDGET_EVENT_LOG_DIR")
+
+# PERFORMANCE: Sessions expire after an idle TTL and the store is size-bounded;
+# each session keeps its recent events in memory, all events go to a rolling
+# on-disk log when one is configured, and per-agent analytics are aggregated
+# as events arrive
+_widget_sessions = WidgetSessionStore(
+    event_log_dir=Path(WIDGET_EVENT_LOG_DIR) if WIDGET_EVENT_LOG_DIR else None,
+    on_evict=_on_session_expired,
+)
+
+
+# PERFORMANCE: Agent ID -> knowledge base file index, built once and
+# refreshed when the directory or the deep link mappings change (instead of
+# re-reading the mappings and loading every knowledge base per message)
+_kb_index = KnowledgeBaseIndex()
+
+
+def _save_negotiator_state(widget_id: str, negotiator: Any) -> None:
+    """Keep an evicted negotiator's context in its session so it can be restored."""
+    session = _widget_sessions.peek(widget_id)
+    if session is not None:
+        session["negotiator_state"] = negotiator.get_state()
+
+
+# PERFORMANCE: Live negotiators keyed by widget session, so negotiation
+# context carries over between messages; bounded, with idle eviction
+_negotiator_pool: AgentPool = AgentPool(on_evict=_save_negotiator_state)
 
 
 # =============================================================================
@@ -199,8 +237,7 @@ async def record_widget_event(event: WidgetEventRequest) -> Dict[str, str]:
     }
 
     # Store event
-    _widget_analytics.append(event_record)
-    session["events"].append(event_record)
+    _widget_sessions.add_event(event.widget_id, event_record, analytics=True)
 
     return {"status": "recorded"}
 
@@ -698,53 +735,23 @@ async def widget_message(
         raise HTTPException(404, "Widget session not found")
 
     # Load the negotiator agent and get response
-    from rra.services.deep_links import DeepLinkService
-    from rra.ingestion.knowledge_base import KnowledgeBase
     from rra.agents.negotiator import NegotiatorAgent
-    from pathlib import Path
-
-    agent_id = session["agent_id"]
-    link_service = DeepLinkService()
-
-    # Try to find knowledge base
-    kb_dir = Path("agent_knowledge_bases")
-    kb = None
-
-    # Check registered mappings first
-    mapping = link_service.resolve_repo_id(agent_id)
-    if mapping:
-        repo_url = mapping["repo_url"]
-        # Extract repo name from URL
-        import re
-
-        match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
-        if match:
-            repo_name = f"{match.group(1)}_{match.group(2)}"
-            kb_path = kb_dir / f"{repo_name}_kb.json"
-            if kb_path.exists():
-                kb = KnowledgeBase.load(kb_path)
-
-    # Fallback: search for any matching KB
-    if not kb and kb_dir.exists():
-        for kb_file in kb_dir.glob("*_kb.json"):
-            try:
-                temp_kb = KnowledgeBase.load(kb_file)
-                if agent_id in str(kb_file) or agent_id == link_service.generate_repo_id(
-                    temp_kb.repo_url
-                ):
-                    kb = temp_kb
-                    break
-            except Exception:
-                continue
-
-    if not kb:
-        return {
-            "response": "I'm sorry, I couldn't find information about this repository. Please try again later.",
-            "phase": "error",
-        }
 
-    # Get or create negotiator
-    negotiator = NegotiatorAgent(kb)
+    negotiator = _negotiator_pool.get(widget_id)
+    if negotiator is None:
+        kb = _kb_index.load(session["agent_id"])
+        if not kb:
+            return {
+                "response": "I'm sorry, I couldn't find information about this repository. Please try again later.",
+                "phase": "error",
+            }
+
+        negotiator = NegotiatorAgent(kb)
+        # Resume a negotiation whose agent was evicted while idle
+        state = session.pop("negotiator_state", None)
+        if state:
+            negotiator.restore_state(state)
+        _negotiator_pool.put(widget_id, negotiator)
 
     # Start or continue negotiation
     if not session.get("negotiation_started"):
@@ -755,13 +762,14 @@ async def widget_message(
     response = negotiator.respond(message)
 
     # Track message
-    session["events"].append(
+    _widget_sessions.add_event(
+        widget_id,
         {
             "type": "message",
             "user_message": message,
             "agent_response": response,
             "timestamp": datetime.utcnow().isoformat(),
-        }
+        },
     )
 
     return {
@@ -777,13 +785,13 @@ async def get_widget_analytics(
     _auth: bool = Depends(verify_api_key),
 ) -> Dict[str, Any]:
     """Get widget analytics for an agent."""
-    # Filter analytics for this agent
-    agent_events = [e for e in _widget_analytics if e.get("agent_id") == agent_id]
+    # Running aggregates for this agent
+    stats = _widget_sessions.get_agent_analytics(agent_id)
 
     # Calculate metrics
-    total_opens = sum(1 for e in agent_events if e["event_type"] == "widget_opened")
-    total_messages = sum(1 for e in agent_events if e["event_type"] == "message_sent")
-    unique_sessions = len(set(e["widget_id"] for e in agent_events))
+    total_opens = stats.count("widget_opened") if stats else 0
+    total_messages = stats.count("message_sent") if stats else 0
+    unique_sessions = stats.unique_sessions if stats else 0
 
     return {
         "agent_id": agent_id,
@@ -796,7 +804,7 @@ async def get_widget_analytics(
                 total_messages / unique_sessions if unique_sessions > 0 else 0
             ),
         },
-        "recent_events": agent_events[-20:],  # Last 20 events
+        "recent_events": list(stats.recent) if stats else [],  # Last 20 events
     }
 
 
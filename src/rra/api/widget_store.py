@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Widget session store for the embeddable widget API.
+
+Sessions are kept in memory with an idle TTL and a size bound (least
+recently used sessions go first). Each session keeps only its most recent
+events in memory; when a log directory is configured, every event is also
+appended to a rolling on-disk log.
+Per-agent analytics are aggregated as events arrive, so reading them does
+not walk raw events.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from rra.persistence.rolling import RollingLog, open_rolling_log
+
+# Default bounds
+DEFAULT_MAX_SESSIONS = 10_000
+DEFAULT_SESSION_TTL = 3600.0  # 1 hour idle
+DEFAULT_SESSION_EVENTS = 50
+DEFAULT_RECENT_EVENTS = 20
+
+
+class AgentAnalytics:
+    """Running widget analytics of one agent."""
+
+    def __init__(self, recent_size: int = DEFAULT_RECENT_EVENTS):
+        self.event_counts: Dict[str, int] = {}
+        self.unique_sessions = 0
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=recent_size)
+
+    def record(self, event: Dict[str, Any], new_session: bool) -> None:
+        event_type = event.get("event_type", "")
+        self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+        if new_session:
+            self.unique_sessions += 1
+        self.recent.append(event)
+
+    def count(self, event_type: str) -> int:
+        return self.event_counts.get(event_type, 0)
+
+
+class WidgetSessionStore(MutableMapping):
+    """
+    Bounded widget session mapping with idle expiry.
+
+    Behaves like the dict it replaces (widget_id -> session dict); reads
+    refresh a session's idle timer.
+
+    Example:
+        sessions = WidgetSessionStore(event_log_dir=Path("data/widget/events"))
+        sessions[widget_id] = {"agent_id": agent_id, ...}
+        sessions.add_event(widget_id, record, analytics=True)
+        stats = sessions.get_agent_analytics(agent_id)
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl: float = DEFAULT_SESSION_TTL,
+        max_events: int = DEFAULT_SESSION_EVENTS,
+        event_log_dir: Optional[Path] = None,
+        on_evict: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the store. The event log is opened on the first event.
+
+        Args:
+            max_sessions: Maximum number of live sessions
+            idle_ttl: Seconds a session may go unused before it expires
+            max_events: Events kept in memory per session
+            event_log_dir: Directory of the rolling event log (None: no log)
+            on_evict: Called with (widget_id, session) when a session expires
+                or is pushed out
+            clock: Monotonic time source
+        """
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_events = max_events
+        self.event_log_dir = event_log_dir
+        self.on_evict = on_evict
+        self._clock = clock
+        self._lock = threading.RLock()
+        # widget_id -> (session, last used), least recently used first
+        self._sessions: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._analytics: Dict[str, AgentAnalytics] = {}
+        self._event_log: Optional[RollingLog] = None
+
+        # Stats
+        self.evictions = 0
+
+    # =========================================================================
+    # Mapping interface
+    # =========================================================================
+
+    def __getitem__(self, widget_id: str) -> Dict[str, Any]:
+        with self._lock:
+            self.evict_idle()
+            session, _ = self._sessions[widget_id]
+            self._sessions[widget_id] = (session, self._clock())
+            self._sessions.move_to_end(widget_id)
+            return session
+
+    def __setitem__(self, widget_id: str, session: Dict[str, Any]) -> None:
+        session["events"] = deque(session.get("events", ()), maxlen=self.max_events)
+        with self._lock:
+            self.evict_idle()
+            self._sessions.pop(widget_id, None)
+            self._sessions[widget_id] = (session, self._clock())
+            while len(self._sessions) > self.max_sessions:
+                self._evict(next(iter(self._sessions)))
+
+    def __delitem__(self, widget_id: str) -> None:
+        with self._lock:
+            del self._sessions[widget_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, widget_id: object) -> bool:
+        return widget_id in self._sessions
+
+    def peek(self, widget_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session without refreshing its idle timer."""
+        entry = self._sessions.get(widget_id)
+        return entry[0] if entry else None
+
+    # =========================================================================
+    # Expiry
+    # =========================================================================
+
+    def _evict(self, widget_id: str) -> None:
+        session, _ = self._sessions.pop(widget_id)
+        self.evictions += 1
+        if self.on_evict:
+            self.on_evict(widget_id, session)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Expire sessions idle for longer than idle_ttl.
+
+        Returns:
+            Number of sessions expired
+        """
+        now = self._clock() if now is None else now
+        evicted = 0
+        with self._lock:
+            while self._sessions:
+                widget_id, (_, last_used) = next(iter(self._sessions.items()))
+                if now - last_used < self.idle_ttl:
+                    break
+                self._evict(widget_id)
+                evicted += 1
+        return evicted
+
+    # =========================================================================
+    # Events and analytics
+    # =========================================================================
+
+    def _log(self) -> Optional[RollingLog]:
+        if self._event_log is None and self.event_log_dir is not None:
+            self._event_log = open_rolling_log(self.event_log_dir, name="events")
+        return self._event_log
+
+    def add_event(self, widget_id: str, event: Dict[str, Any], analytics: bool = False) -> None:
+        """
+        Record an event of a live session.
+
+        Args:
+            widget_id: Widget session ID
+            event: Event record
+            analytics: Count the event in the agent's analytics
+
+        Raises:
+            KeyError: If the session does not exist
+        """
+        with self._lock:
+            session = self[widget_id]
+            session["events"].append(event)
+            log = self._log()
+            if log is not None:
+                log.append({"widget_id": widget_id, **event})
+            if analytics:
+                agent_id = session["agent_id"]
+                stats = self._analytics.get(agent_id)
+                if stats is None:
+                    stats = self._analytics[agent_id] = AgentAnalytics()
+                new_session = not session.get("analytics_counted")
+                session["analytics_counted"] = True
+                stats.record(event, new_session)
+
+    def get_agent_analytics(self, agent_id: str) -> Optional[AgentAnalytics]:
+        """Get the running analytics of an agent (None if it has no events)."""
+        return self._analytics.get(agent_id)
+
+    def read_event_log(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read retained events from the on-disk log, oldest first."""
+        log = self._log()
+        return log.read(limit=limit) if log is not None else []
+
+    def close(self) -> None:
+        if self._event_log is not None:
+            self._event_log.close()
+            self._event_log = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "live_sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_ttl": self.idle_ttl,
+            "evictions": self.evictions,
+            "agents_with_analytics": len(self._analytics),
+            "event_log": self._event_log.get_stats() if self._event_log else None,
+        }
@@ -8,6 +8,10 @@ Allows packaging multiple repositories into a single licensable bundle:
 - Discounted pricing for bundles
 - Cross-repo dependency bundling
 - Themed collections (e.g., "Full Stack Starter Kit")
+
+Bundle prices are cached until a bundle's repos or discount change, and
+BundleManager indexes bundles by repo, owner, type, category, tag and text
+trigram, so lookups, searches and repricing touch only matching bundles.
 """
 
 import json
@@ -15,9 +19,11 @@ import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 from enum import Enum
 
+from rra.persistence.oplog import OpLogStore, open_store
+
 
 class BundleType(Enum):
     """Types of repository bundles."""
@@ -123,6 +129,30 @@ class RepoBundle:
     cover_image_url: Optional[str] = None
     category: Optional[str] = None
 
+    # Cached (total individual price, bundle price)
+    _pricing: Optional[Tuple[float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("repos", "discount"):
+            super().__setattr__("_pricing", None)
+
+    def invalidate_pricing(self) -> None:
+        """Drop cached prices (after changing a repo's price or the discount in place)."""
+        self._pricing = None
+
+    def _get_pricing(self) -> Tuple[float, float]:
+        if self._pricing is None:
+            total = sum(r.individual_price for r in self.repos)
+            price = total
+            if self.discount:
+                discount_amount = self.discount.calculate_discount(total, self.repo_count)
+                price = max(0, total - discount_amount)
+            self._pricing = (total, price)
+        return self._pricing
+
     @property
     def repo_count(self) -> int:
         """Number of repos in the bundle."""
@@ -131,16 +161,12 @@ class RepoBundle:
     @property
     def total_individual_price(self) -> float:
         """Total price if repos were purchased individually."""
-        return sum(r.individual_price for r in self.repos)
+        return self._get_pricing()[0]
 
     @property
     def bundle_price(self) -> float:
         """Discounted bundle price."""
-        total = self.total_individual_price
-        if self.discount:
-            discount_amount = self.discount.calculate_discount(total, self.repo_count)
-            return max(0, total - discount_amount)
-        return total
+        return self._get_pricing()[1]
 
     @property
     def savings(self) -> float:
@@ -157,6 +183,7 @@ class RepoBundle:
     def add_repo(self, repo: BundledRepo) -> None:
         """Add a repository to the bundle."""
         self.repos.append(repo)
+        self._pricing = None
         self.updated_at = datetime.utcnow().isoformat()
 
     def remove_repo(self, repo_id: str) -> bool:
@@ -164,6 +191,7 @@ class RepoBundle:
         for i, repo in enumerate(self.repos):
             if repo.repo_id == repo_id:
                 del self.repos[i]
+                self._pricing = None
                 self.updated_at = datetime.utcnow().isoformat()
                 return True
         return False
@@ -259,39 +287,128 @@ class RepoBundle:
         )
 
 
+def _trigrams(texts: Iterable[str]) -> Set[str]:
+    """Lowercase character trigrams of each text (not across texts)."""
+    grams: Set[str] = set()
+    for text in texts:
+        text = text.lower()
+        grams.update(text[i : i + 3] for i in range(len(text) - 2))
+    return grams
+
+
 class BundleManager:
     """
     Manages repository bundles.
 
     Provides CRUD operations and search functionality for bundles.
+    Indexes are refreshed by create_bundle and update_bundle, so call
+    update_bundle after changing a bundle.
     """
 
+    _INDEXES = ("repo", "owner", "type", "category", "tag", "trigram")
+
     def __init__(self, storage_path: Path = None):
         """
         Initialize the bundle manager.
 
         Args:
-            storage_path: Path for bundle storage
+            storage_path: Legacy bundles JSON file; bundles are stored in an
+                operation log next to it
         """
         self.storage_path = storage_path or Path("data/bundles.json")
+        self._store_dir = self.storage_path.with_name(f"{self.storage_path.stem}_oplog")
+        self._store: Optional[OpLogStore] = None
         self._bundles: Dict[str, RepoBundle] = {}
+
+        # Inverted indexes: index name -> key -> bundle IDs, plus the keys
+        # each bundle was indexed under and its creation order
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in self._INDEXES}
+        self._indexed_keys: Dict[str, Dict[str, Set[Any]]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
         self._load_bundles()
 
+    def _get_store(self) -> OpLogStore:
+        if self._store is None:
+            self._store = open_store(self._store_dir)
+        return self._store
+
     def _load_bundles(self) -> None:
-        """Load bundles from storage."""
-        if self.storage_path.exists():
+        """Load bundles from storage, importing a legacy bundles file once."""
+        if self._store_dir.exists() or self.storage_path.exists():
+            store = self._get_store()
             try:
-                with open(self.storage_path, "r") as f:
-                    data = json.load(f)
-                    self._bundles = {k: RepoBundle.from_dict(v) for k, v in data.items()}
+                if store.is_empty and self.storage_path.exists():
+                    with open(self.storage_path, "r") as f:
+                        store.replace_state({"bundles": json.load(f)})
+                state = store.load_state() or {}
+                self._bundles = {
+                    k: RepoBundle.from_dict(v) for k, v in state.get("bundles", {}).items()
+                }
             except (json.JSONDecodeError, IOError):
                 self._bundles = {}
+        for bundle in self._bundles.values():
+            self._index_bundle(bundle)
+
+    def _save_bundle(self, bundle_id: str) -> None:
+        """Persist one changed (or deleted) bundle."""
+        self._get_store().save("bundles", bundle_id, self._bundles.get(bundle_id))
 
-    def _save_bundles(self) -> None:
-        """Save bundles to storage."""
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.storage_path, "w") as f:
-            json.dump({k: v.to_dict() for k, v in self._bundles.items()}, f, indent=2, default=str)
+    # =========================================================================
+    # Indexes
+    # =========================================================================
+
+    @staticmethod
+    def _index_keys(bundle: RepoBundle) -> Dict[str, Set[Any]]:
+        return {
+            "repo": {r.repo_id for r in bundle.repos},
+            "owner": {bundle.owner_address},
+            "type": {bundle.bundle_type},
+            "category": {bundle.category} if bundle.category else set(),
+            "tag": set(bundle.tags),
+            "trigram": _trigrams([bundle.name, bundle.description, *bundle.tags]),
+        }
+
+    def _index_bundle(self, bundle: RepoBundle) -> None:
+        bundle_id = bundle.bundle_id
+        self._unindex_bundle(bundle_id)
+        if bundle_id not in self._order:
+            self._order[bundle_id] = self._next_order
+            self._next_order += 1
+        keys = self._index_keys(bundle)
+        for name, values in keys.items():
+            index = self._indexes[name]
+            for value in values:
+                index.setdefault(value, set()).add(bundle_id)
+        self._indexed_keys[bundle_id] = keys
+
+    def _unindex_bundle(self, bundle_id: str) -> None:
+        keys = self._indexed_keys.pop(bundle_id, None)
+        if keys is None:
+            return
+        for name, values in keys.items():
+            index = self._indexes[name]
+            for value in values:
+                ids = index.get(value)
+                if ids is not None:
+                    ids.discard(bundle_id)
+                    if not ids:
+                        del index[value]
+
+    def _lookup(self, name: str, value: Any) -> Set[str]:
+        return self._indexes[name].get(value, set())
+
+    def _in_order(self, bundle_ids: Iterable[str]) -> List[RepoBundle]:
+        """Bundles in creation order."""
+        return [self._bundles[bid] for bid in sorted(bundle_ids, key=self._order.__getitem__)]
+
+    @staticmethod
+    def _intersect(postings: List[Set[str]]) -> Set[str]:
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+        return result
 
     def create_bundle(
         self,
@@ -332,7 +449,8 @@ class BundleManager:
         )
 
         self._bundles[bundle_id] = bundle
-        self._save_bundles()
+        self._index_bundle(bundle)
+        self._save_bundle(bundle_id)
         return bundle
 
     def get_bundle(self, bundle_id: str) -> Optional[RepoBundle]:
@@ -342,17 +460,43 @@ class BundleManager:
     def update_bundle(self, bundle: RepoBundle) -> None:
         """Update a bundle."""
         bundle.updated_at = datetime.utcnow().isoformat()
+        bundle.invalidate_pricing()
         self._bundles[bundle.bundle_id] = bundle
-        self._save_bundles()
+        self._index_bundle(bundle)
+        self._save_bundle(bundle.bundle_id)
 
     def delete_bundle(self, bundle_id: str) -> bool:
         """Delete a bundle."""
         if bundle_id in self._bundles:
             del self._bundles[bundle_id]
-            self._save_bundles()
+            self._unindex_bundle(bundle_id)
+            self._order.pop(bundle_id, None)
+            self._save_bundle(bundle_id)
             return True
         return False
 
+    def reprice_repo(self, repo_id: str, individual_price: float) -> List[RepoBundle]:
+        """
+        Change a repo's individual price in every bundle containing it.
+
+        Args:
+            repo_id: Repository ID
+            individual_price: New individual price
+
+        Returns:
+            The bundles that were repriced
+        """
+        bundles = self.get_bundles_containing_repo(repo_id)
+        now = datetime.utcnow().isoformat()
+        for bundle in bundles:
+            for repo in bundle.repos:
+                if repo.repo_id == repo_id:
+                    repo.individual_price = individual_price
+            bundle.invalidate_pricing()
+            bundle.updated_at = now
+            self._save_bundle(bundle.bundle_id)
+        return bundles
+
     def list_bundles(
         self,
         owner_address: str = None,
@@ -376,7 +520,20 @@ class BundleManager:
         Returns:
             List of matching bundles
         """
-        bundles = list(self._bundles.values())
+        # Narrow down with the indexes, then check every filter on the candidates
+        postings: List[Set[str]] = []
+        if owner_address:
+            postings.append(self._lookup("owner", owner_address))
+        if bundle_type:
+            postings.append(self._lookup("type", bundle_type))
+        if category:
+            postings.append(self._lookup("category", category))
+        if tags:
+            postings.append(set().union(*(self._lookup("tag", t) for t in tags)))
+        if postings:
+            bundles = self._in_order(self._intersect(postings))
+        else:
+            bundles = list(self._bundles.values())
 
         if owner_address:
             bundles = [b for b in bundles if b.owner_address == owner_address]
@@ -409,9 +566,16 @@ class BundleManager:
             Matching bundles
         """
         query_lower = query.lower()
+        if len(query_lower) >= 3:
+            # A substring match contains every trigram of the query
+            candidates = self._in_order(
+                self._intersect([self._lookup("trigram", g) for g in _trigrams([query_lower])])
+            )
+        else:
+            candidates = list(self._bundles.values())
         return [
             b
-            for b in self._bundles.values()
+            for b in candidates
             if b.is_active
             and (
                 query_lower in b.name.lower()
@@ -422,7 +586,7 @@ class BundleManager:
 
     def get_bundles_containing_repo(self, repo_id: str) -> List[RepoBundle]:
         """Get all bundles containing a specific repo."""
-        return [b for b in self._bundles.values() if any(r.repo_id == repo_id for r in b.repos)]
+        return self._in_order(self._lookup("repo", repo_id))
 
     def get_stats(self) -> Dict[str, Any]:
         """Get bundle statistics."""
@@ -10,11 +10,12 @@ allowing multiple parties to own portions of valuable IP assets.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-import json
 import secrets
 
+from rra.persistence import IndexSpec, OpLogStore, SQLiteStore, open_repository
+
 
 class FractionStatus(Enum):
     """Status of a fractionalized asset."""
@@ -317,16 +318,30 @@ class ShareOrder:
         )
 
 
+# Indexed columns when the manager uses the SQLite backend
+_SQLITE_INDEXES: Dict[str, Dict[str, IndexSpec]] = {
+    "assets": {"status": "status", "owner": lambda a: a["original_owner"].lower()},
+    "orders": {
+        "asset_id": "asset_id",
+        "active": lambda o: o["filled_at"] is None and o["cancelled_at"] is None,
+    },
+}
+
+
 class FractionalIPManager:
     """Manages fractional IP ownership."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, storage_backend: str = "oplog"):
         self.data_dir = data_dir or Path("data/fractional")
         self.assets: Dict[str, FractionalAsset] = {}
         self.orders: Dict[str, ShareOrder] = {}
 
+        self._store: Optional[Union[OpLogStore, SQLiteStore]] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_repository(
+                self.data_dir, "fractional", storage_backend, indexes=_SQLITE_INDEXES
+            )
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -363,7 +378,7 @@ class FractionalIPManager:
         )
 
         self.assets[asset.asset_id] = asset
-        self._save_state()
+        self._save_entity("assets", asset.asset_id)
 
         return asset
 
@@ -378,7 +393,7 @@ class FractionalIPManager:
 
         asset.status = FractionStatus.ACTIVE
         asset.activated_at = datetime.now()
-        self._save_state()
+        self._save_entity("assets", asset_id)
 
         return asset
 
@@ -390,6 +405,14 @@ class FractionalIPManager:
         self, status: Optional[FractionStatus] = None, owner: Optional[str] = None
     ) -> List[FractionalAsset]:
         """List fractionalized assets."""
+        if isinstance(self._store, SQLiteStore) and (status or owner):
+            keys = self._store.query(
+                "assets",
+                status=status.value if status else None,
+                owner=owner.lower() if owner else None,
+            )
+            return [self.assets[k] for k in keys if k in self.assets]
+
         assets = list(self.assets.values())
 
         if status:
@@ -414,7 +437,7 @@ class FractionalIPManager:
             raise ValueError(f"Asset is not active: {asset.status.value}")
 
         holder = asset.add_shareholder(buyer_address, shares)
-        self._save_state()
+        self._save_entity("assets", asset_id)
 
         return holder
 
@@ -441,7 +464,7 @@ class FractionalIPManager:
         )
 
         self.orders[order.order_id] = order
-        self._save_state()
+        self._save_entity("orders", order.order_id)
 
         return order
 
@@ -475,7 +498,8 @@ class FractionalIPManager:
         if order.filled_shares >= order.shares:
             order.filled_at = datetime.now()
 
-        self._save_state()
+        self._save_entity("orders", order_id)
+        self._save_entity("assets", order.asset_id)
 
         return order, buyer_holder
 
@@ -489,7 +513,7 @@ class FractionalIPManager:
             raise ValueError("Order is already closed")
 
         order.cancelled_at = datetime.now()
-        self._save_state()
+        self._save_entity("orders", order_id)
 
         return order
 
@@ -497,6 +521,12 @@ class FractionalIPManager:
         self, asset_id: Optional[str] = None, active_only: bool = True
     ) -> List[ShareOrder]:
         """List share orders."""
+        if isinstance(self._store, SQLiteStore) and (asset_id or active_only):
+            keys = self._store.query(
+                "orders", asset_id=asset_id or None, active=True if active_only else None
+            )
+            return [self.orders[k] for k in keys if k in self.orders]
+
         orders = list(self.orders.values())
 
         if asset_id:
@@ -518,7 +548,7 @@ class FractionalIPManager:
             raise ValueError(f"Asset not found: {asset_id}")
 
         distributions = asset.distribute_revenue(amount)
-        self._save_state()
+        self._save_entity("assets", asset_id)
 
         return distributions
 
@@ -549,7 +579,7 @@ class FractionalIPManager:
             days=deadline_days
         )
 
-        self._save_state()
+        self._save_entity("assets", asset_id)
 
         return asset
 
@@ -570,7 +600,7 @@ class FractionalIPManager:
                 asset.transfer_shares(address, initiator, holder.shares)
 
         asset.status = FractionStatus.BOUGHT_OUT
-        self._save_state()
+        self._save_entity("assets", asset_id)
 
         return asset
 
@@ -630,8 +660,14 @@ class FractionalIPManager:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed asset or order."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot every asset and order."""
+        if not self._store:
             return
 
         state = {
@@ -639,29 +675,30 @@ class FractionalIPManager:
             "orders": {oid: o.to_dict() for oid, o in self.orders.items()},
         }
 
-        with open(self.data_dir / "fractional_state.json", "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        state_file = self.data_dir / "fractional_state.json"
-        if not state_file.exists():
+        if not self._store:
             return
 
-        try:
-            with open(state_file) as f:
-                state = json.load(f)
+        state = self._store.load_state(legacy_file=self.data_dir / "fractional_state.json")
+        if not state:
+            return
 
+        try:
             self.assets = {
                 aid: FractionalAsset.from_dict(a) for aid, a in state.get("assets", {}).items()
             }
             self.orders = {
                 oid: ShareOrder.from_dict(o) for oid, o in state.get("orders", {}).items()
             }
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
 
-def create_fractional_manager(data_dir: Optional[str] = None) -> FractionalIPManager:
+def create_fractional_manager(
+    data_dir: Optional[str] = None, storage_backend: str = "oplog"
+) -> FractionalIPManager:
     """Factory function to create a fractional IP manager."""
     path = Path(data_dir) if data_dir else None
-    return FractionalIPManager(data_dir=path)
+    return FractionalIPManager(data_dir=path, storage_backend=storage_backend)
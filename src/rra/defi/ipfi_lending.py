@@ -10,11 +10,12 @@ for loans, similar to NFTfi but specialized for IP assets.
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-import json
 import secrets
 
+from rra.persistence import IndexSpec, OpLogStore, SQLiteStore, open_repository
+
 
 class LoanStatus(Enum):
     """Status of a loan."""
@@ -315,18 +316,33 @@ class CollateralValuator:
         return max(0.01, value)  # Minimum 0.01 ETH
 
 
+# Indexed columns when the manager uses the SQLite backend
+_SQLITE_INDEXES: Dict[str, Dict[str, IndexSpec]] = {
+    "loans": {
+        "borrower": lambda ln: ln["borrower_address"].lower(),
+        "lender": lambda ln: ln["lender_address"].lower(),
+        "status": "status",
+    },
+    "offers": {"active": "active"},
+}
+
+
 class IPFiLendingManager:
     """Manages IP-backed lending operations."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, storage_backend: str = "oplog"):
         self.data_dir = data_dir or Path("data/lending")
         self.loans: Dict[str, Loan] = {}
         self.offers: Dict[str, LoanOffer] = {}
         self.collaterals: Dict[str, Collateral] = {}
         self.valuator = CollateralValuator()
 
+        self._store: Optional[Union[OpLogStore, SQLiteStore]] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_repository(
+                self.data_dir, "lending", storage_backend, indexes=_SQLITE_INDEXES
+            )
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -353,7 +369,7 @@ class IPFiLendingManager:
         )
 
         self.collaterals[collateral.collateral_id] = collateral
-        self._save_state()
+        self._save_entity("collaterals", collateral.collateral_id)
 
         return collateral
 
@@ -364,7 +380,7 @@ class IPFiLendingManager:
             raise ValueError(f"Collateral not found: {collateral_id}")
 
         collateral.estimated_value = new_value
-        self._save_state()
+        self._save_entity("collaterals", collateral_id)
 
         return collateral
 
@@ -379,7 +395,7 @@ class IPFiLendingManager:
 
         collateral.locked = True
         collateral.locked_at = datetime.now()
-        self._save_state()
+        self._save_entity("collaterals", collateral_id)
 
         return collateral
 
@@ -391,7 +407,7 @@ class IPFiLendingManager:
 
         collateral.locked = False
         collateral.locked_at = None
-        self._save_state()
+        self._save_entity("collaterals", collateral_id)
 
         return collateral
 
@@ -432,7 +448,7 @@ class IPFiLendingManager:
         )
 
         self.offers[offer.offer_id] = offer
-        self._save_state()
+        self._save_entity("offers", offer.offer_id)
 
         return offer
 
@@ -444,7 +460,11 @@ class IPFiLendingManager:
         max_principal: Optional[float] = None,
     ) -> List[LoanOffer]:
         """List available loan offers."""
-        offers = list(self.offers.values())
+        if isinstance(self._store, SQLiteStore) and active_only:
+            keys = self._store.query("offers", active=True)
+            offers = [self.offers[k] for k in keys if k in self.offers]
+        else:
+            offers = list(self.offers.values())
 
         if active_only:
             offers = [o for o in offers if o.active and not o.is_expired]
@@ -467,7 +487,7 @@ class IPFiLendingManager:
             raise ValueError(f"Offer not found: {offer_id}")
 
         offer.active = False
-        self._save_state()
+        self._save_entity("offers", offer_id)
 
         return offer
 
@@ -514,7 +534,7 @@ class IPFiLendingManager:
         )
 
         self.loans[loan.loan_id] = loan
-        self._save_state()
+        self._save_entity("loans", loan.loan_id)
 
         return loan
 
@@ -535,7 +555,7 @@ class IPFiLendingManager:
         loan.funded_at = datetime.now()
         loan.due_date = datetime.now() + timedelta(days=loan.terms.duration_days)
 
-        self._save_state()
+        self._save_entity("loans", loan_id)
 
         return loan
 
@@ -557,7 +577,7 @@ class IPFiLendingManager:
             # Unlock collateral
             self.unlock_collateral(loan.collateral.collateral_id)
 
-        self._save_state()
+        self._save_entity("loans", loan_id)
 
         return loan
 
@@ -577,7 +597,7 @@ class IPFiLendingManager:
         loan.status = LoanStatus.LIQUIDATED
         # Collateral transfers to lender (remains locked but ownership changes)
 
-        self._save_state()
+        self._save_entity("loans", loan_id)
 
         return loan
 
@@ -592,6 +612,15 @@ class IPFiLendingManager:
         status: Optional[LoanStatus] = None,
     ) -> List[Loan]:
         """List loans with optional filters."""
+        if isinstance(self._store, SQLiteStore) and (borrower_address or lender_address or status):
+            keys = self._store.query(
+                "loans",
+                borrower=borrower_address.lower() if borrower_address else None,
+                lender=lender_address.lower() if lender_address else None,
+                status=status.value if status else None,
+            )
+            return [self.loans[k] for k in keys if k in self.loans]
+
         loans = list(self.loans.values())
 
         if borrower_address:
@@ -639,8 +668,14 @@ class IPFiLendingManager:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed loan, offer or collateral."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot every loan, offer and collateral."""
+        if not self._store:
             return
 
         state = {
@@ -649,18 +684,17 @@ class IPFiLendingManager:
             "collaterals": {cid: coll.to_dict() for cid, coll in self.collaterals.items()},
         }
 
-        with open(self.data_dir / "lending_state.json", "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        state_file = self.data_dir / "lending_state.json"
-        if not state_file.exists():
+        if not self._store:
             return
 
-        try:
-            with open(state_file) as f:
-                state = json.load(f)
+        state = self._store.load_state(legacy_file=self.data_dir / "lending_state.json")
+        if not state:
+            return
 
+        try:
             self.loans = {lid: Loan.from_dict(loan) for lid, loan in state.get("loans", {}).items()}
             self.offers = {
                 oid: LoanOffer.from_dict(offer) for oid, offer in state.get("offers", {}).items()
@@ -669,11 +703,13 @@ class IPFiLendingManager:
                 cid: Collateral.from_dict(coll)
                 for cid, coll in state.get("collaterals", {}).items()
             }
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
 
-def create_lending_manager(data_dir: Optional[str] = None) -> IPFiLendingManager:
+def create_lending_manager(
+    data_dir: Optional[str] = None, storage_backend: str = "oplog"
+) -> IPFiLendingManager:
     """Factory function to create a lending manager."""
     path = Path(data_dir) if data_dir else None
-    return IPFiLendingManager(data_dir=path)
+    return IPFiLendingManager(data_dir=path, storage_backend=storage_backend)
@@ -11,11 +11,12 @@ and automatic reward calculation.
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-import json
 import secrets
 
+from rra.persistence import IndexSpec, OpLogStore, SQLiteStore, open_repository
+
 
 class YieldStrategy(Enum):
     """Yield distribution strategies."""
@@ -426,17 +427,31 @@ class YieldDistributor:
         return projections
 
 
+# Indexed columns when the manager uses the SQLite backend
+_SQLITE_INDEXES: Dict[str, Dict[str, IndexSpec]] = {
+    "stakes": {
+        "staker": lambda s: s["staker_address"].lower(),
+        "pool_id": "pool_id",
+        "active": "active",
+    },
+}
+
+
 class StakingManager:
     """Manages staking pools and stakes."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, storage_backend: str = "oplog"):
         self.data_dir = data_dir or Path("data/staking")
         self.pools: Dict[str, YieldPool] = {}
         self.stakes: Dict[str, StakedLicense] = {}
         self.distributor = YieldDistributor()
 
+        self._store: Optional[Union[OpLogStore, SQLiteStore]] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_repository(
+                self.data_dir, "staking", storage_backend, indexes=_SQLITE_INDEXES
+            )
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -477,7 +492,7 @@ class StakingManager:
         )
 
         self.pools[pool.pool_id] = pool
-        self._save_state()
+        self._save_entity("pools", pool.pool_id)
 
         return pool
 
@@ -559,7 +574,8 @@ class StakingManager:
         pool.total_value_locked += license_value
         pool.stake_count += 1
 
-        self._save_state()
+        self._save_entity("stakes", stake.stake_id)
+        self._save_entity("pools", pool_id)
 
         return stake
 
@@ -597,7 +613,8 @@ class StakingManager:
             pool.stake_count -= 1
 
         stake.active = False
-        self._save_state()
+        self._save_entity("stakes", stake_id)
+        self._save_entity("pools", stake.pool_id)
 
         return stake
 
@@ -628,7 +645,7 @@ class StakingManager:
             stake.add_yield(pending)
 
         claimed = stake.claim_yield()
-        self._save_state()
+        self._save_entity("stakes", stake_id)
 
         return claimed
 
@@ -638,12 +655,18 @@ class StakingManager:
 
     def get_stakes_by_staker(self, staker_address: str) -> List[StakedLicense]:
         """Get all stakes for a staker."""
+        if isinstance(self._store, SQLiteStore):
+            keys = self._store.query("stakes", staker=staker_address.lower())
+            return [self.stakes[k] for k in keys if k in self.stakes]
         return [
             s for s in self.stakes.values() if s.staker_address.lower() == staker_address.lower()
         ]
 
     def get_stakes_by_pool(self, pool_id: str) -> List[StakedLicense]:
         """Get all stakes in a pool."""
+        if isinstance(self._store, SQLiteStore):
+            keys = self._store.query("stakes", pool_id=pool_id)
+            return [self.stakes[k] for k in keys if k in self.stakes]
         return [s for s in self.stakes.values() if s.pool_id == pool_id]
 
     def add_pool_revenue(self, pool_id: str, amount: float) -> None:
@@ -662,7 +685,7 @@ class StakingManager:
             raise ValueError(f"Pool not found: {pool_id}")
 
         pool.add_revenue(amount)
-        self._save_state()
+        self._save_entity("pools", pool_id)
 
     def distribute_pool_revenue(self, pool_id: str) -> Dict[str, float]:
         """
@@ -684,7 +707,14 @@ class StakingManager:
         stakes = self.get_stakes_by_pool(pool_id)
         distributions = self.distributor.distribute_revenue(pool, stakes)
 
-        self._save_state()
+        if distributions:
+            self._save_entity("pools", pool_id)
+            for stake_id in distributions:
+                self._save_entity("stakes", stake_id)
+            if self._store:
+                self._store.set(
+                    "distribution_history", self.distributor.distribution_history[-100:]
+                )
 
         return distributions
 
@@ -758,9 +788,14 @@ class StakingManager:
             "unique_stakers": len(set(s.staker_address for s in active_stakes)),
         }
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed pool or stake."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
     def _save_state(self) -> None:
-        """Save state to disk."""
-        if not self.data_dir:
+        """Snapshot the whole staking state."""
+        if not self._store:
             return
 
         state = {
@@ -769,20 +804,18 @@ class StakingManager:
             "distribution_history": self.distributor.distribution_history[-100:],  # Keep last 100
         }
 
-        state_file = self.data_dir / "staking_state.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        """Load state from disk."""
-        state_file = self.data_dir / "staking_state.json"
-        if not state_file.exists():
+        """Load state from the op-log store."""
+        if not self._store:
             return
 
-        try:
-            with open(state_file) as f:
-                state = json.load(f)
+        state = self._store.load_state(legacy_file=self.data_dir / "staking_state.json")
+        if not state:
+            return
 
+        try:
             self.pools = {
                 pid: YieldPool.from_dict(pdata) for pid, pdata in state.get("pools", {}).items()
             }
@@ -793,21 +826,24 @@ class StakingManager:
             }
 
             self.distributor.distribution_history = state.get("distribution_history", [])
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             # Start fresh if state is corrupted
             self.pools = {}
             self.stakes = {}
 
 
-def create_staking_manager(data_dir: Optional[str] = None) -> StakingManager:
+def create_staking_manager(
+    data_dir: Optional[str] = None, storage_backend: str = "oplog"
+) -> StakingManager:
     """
     Factory function to create a staking manager.
 
     Args:
         data_dir: Optional data directory path
+        storage_backend: "oplog" or "sqlite"
 
     Returns:
         Configured StakingManager instance
     """
     path = Path(data_dir) if data_dir else None
-    return StakingManager(data_dir=path)
+    return StakingManager(data_dir=path, storage_backend=storage_backend)
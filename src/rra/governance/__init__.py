@@ -29,6 +29,7 @@ from .treasury_votes import (
     TreasuryVotingManager,
     create_treasury_voting_manager,
 )
+from .tally import VoteTally, TallyDict
 from .rep_voting import (
     ProposalStatus as RepProposalStatus,
     VoteChoice as RepVoteChoice,
@@ -66,4 +67,7 @@ __all__ = [
     "RepWeightedProposal",
     "RepWeightedGovernance",
     "create_rep_weighted_governance",
+    # Running Tallies
+    "VoteTally",
+    "TallyDict",
 ]
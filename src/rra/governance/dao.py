@@ -10,11 +10,13 @@ through voting mechanisms and treasury management.
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-import json
 import secrets
 
+from rra.governance.tally import TallyDict
+from rra.persistence import IndexSpec, OpLogStore, SQLiteStore, open_repository
+
 
 class ProposalStatus(Enum):
     """Status of a governance proposal."""
@@ -79,6 +81,11 @@ class Vote:
         )
 
 
+def _dao_votes(votes: Optional[Dict[str, Vote]] = None) -> TallyDict[str, Vote]:
+    """Votes dict tallying voting power per choice."""
+    return TallyDict("voting_power", votes=votes)
+
+
 @dataclass
 class Proposal:
     """A governance proposal."""
@@ -104,8 +111,12 @@ class Proposal:
     # Proposal data
     data: Dict[str, Any] = field(default_factory=dict)
 
-    # Votes
-    _votes: Dict[str, Vote] = field(default_factory=dict)
+    # Votes (running tallies are kept by TallyDict)
+    _votes: TallyDict[str, Vote] = field(default_factory=_dao_votes)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self._votes, TallyDict):
+            self._votes = _dao_votes(self._votes)
 
     @property
     def is_active(self) -> bool:
@@ -114,19 +125,19 @@ class Proposal:
 
     @property
     def votes_for(self) -> int:
-        return sum(v.voting_power for v in self._votes.values() if v.choice == VoteChoice.FOR)
+        return self._votes.tally.weight(VoteChoice.FOR)
 
     @property
     def votes_against(self) -> int:
-        return sum(v.voting_power for v in self._votes.values() if v.choice == VoteChoice.AGAINST)
+        return self._votes.tally.weight(VoteChoice.AGAINST)
 
     @property
     def votes_abstain(self) -> int:
-        return sum(v.voting_power for v in self._votes.values() if v.choice == VoteChoice.ABSTAIN)
+        return self._votes.tally.weight(VoteChoice.ABSTAIN)
 
     @property
     def total_votes(self) -> int:
-        return sum(v.voting_power for v in self._votes.values())
+        return self._votes.tally.total_weight
 
     @property
     def voter_count(self) -> int:
@@ -166,7 +177,8 @@ class Proposal:
             "passed": passed,
         }
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_record(self) -> Dict[str, Any]:
+        """Scalar fields for storage; votes are stored as their own entries."""
         return {
             "proposal_id": self.proposal_id,
             "dao_id": self.dao_id,
@@ -182,6 +194,11 @@ class Proposal:
             "quorum_percentage": self.quorum_percentage,
             "approval_percentage": self.approval_percentage,
             "data": self.data,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.to_record(),
             "votes": {addr: v.to_dict() for addr, v in self._votes.items()},
             "votes_for": self.votes_for,
             "votes_against": self.votes_against,
@@ -254,6 +271,11 @@ class DAOMember:
         )
 
 
+def _dao_members(members: Optional[Dict[str, DAOMember]] = None) -> TallyDict[str, DAOMember]:
+    """Members dict tallying total voting power."""
+    return TallyDict("voting_power", choice_attr=None, votes=members)
+
+
 @dataclass
 class IPDAO:
     """An IP Portfolio DAO."""
@@ -276,12 +298,16 @@ class IPDAO:
     quorum_percentage: float = 20.0
     approval_percentage: float = 50.0
 
-    # Members
-    _members: Dict[str, DAOMember] = field(default_factory=dict)
+    # Members (TallyDict keeps the running total of voting power)
+    _members: TallyDict[str, DAOMember] = field(default_factory=_dao_members)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self._members, TallyDict):
+            self._members = _dao_members(self._members)
 
     @property
     def total_voting_power(self) -> int:
-        return sum(m.voting_power for m in self._members.values())
+        return self._members.tally.total_weight
 
     @property
     def member_count(self) -> int:
@@ -291,7 +317,9 @@ class IPDAO:
         """Add or update a DAO member."""
         address = address.lower()
         if address in self._members:
-            self._members[address].voting_power += voting_power
+            member = self._members[address]
+            member.voting_power += voting_power
+            self._members[address] = member  # re-tally the updated power
         else:
             self._members[address] = DAOMember(
                 address=address,
@@ -339,7 +367,8 @@ class IPDAO:
 
         return member
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_record(self) -> Dict[str, Any]:
+        """Scalar fields for storage; members are stored as their own entries."""
         return {
             "dao_id": self.dao_id,
             "name": self.name,
@@ -352,6 +381,11 @@ class IPDAO:
             "proposal_threshold": self.proposal_threshold,
             "quorum_percentage": self.quorum_percentage,
             "approval_percentage": self.approval_percentage,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.to_record(),
             "members": {addr: m.to_dict() for addr, m in self._members.items()},
             "total_voting_power": self.total_voting_power,
             "member_count": self.member_count,
@@ -379,16 +413,26 @@ class IPDAO:
         return dao
 
 
+# Indexed columns when the manager uses the SQLite backend
+_SQLITE_INDEXES: Dict[str, Dict[str, IndexSpec]] = {
+    "proposals": {"dao_id": "dao_id", "status": "status"},
+}
+
+
 class DAOGovernanceManager:
     """Manages DAO governance operations."""
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, storage_backend: str = "oplog"):
         self.data_dir = data_dir or Path("data/governance")
         self.daos: Dict[str, IPDAO] = {}
         self.proposals: Dict[str, Proposal] = {}
 
+        self._store: Optional[Union[OpLogStore, SQLiteStore]] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_repository(
+                self.data_dir, "governance", storage_backend, indexes=_SQLITE_INDEXES
+            )
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -423,10 +467,11 @@ class DAOGovernanceManager:
         )
 
         # Creator gets initial voting power
-        dao.add_member(creator, initial_voting_power)
+        member = dao.add_member(creator, initial_voting_power)
 
         self.daos[dao.dao_id] = dao
-        self._save_state()
+        self._save_entity("daos", dao.dao_id)
+        self._save_member(dao.dao_id, member.address)
 
         return dao
 
@@ -443,7 +488,7 @@ class DAOGovernanceManager:
             raise ValueError(f"DAO not found: {dao_id}")
 
         member = dao.add_member(address, voting_power)
-        self._save_state()
+        self._save_member(dao_id, member.address)
 
         return member
 
@@ -455,7 +500,7 @@ class DAOGovernanceManager:
 
         if asset_id not in dao.asset_ids:
             dao.asset_ids.append(asset_id)
-            self._save_state()
+            self._save_entity("daos", dao_id)
 
         return dao
 
@@ -466,7 +511,7 @@ class DAOGovernanceManager:
             raise ValueError(f"DAO not found: {dao_id}")
 
         dao.treasury_balance += amount
-        self._save_state()
+        self._save_entity("daos", dao_id)
 
         return dao
 
@@ -515,7 +560,7 @@ class DAOGovernanceManager:
         )
 
         self.proposals[proposal.proposal_id] = proposal
-        self._save_state()
+        self._save_entity("proposals", proposal.proposal_id)
 
         return proposal
 
@@ -548,10 +593,33 @@ class DAOGovernanceManager:
         )
 
         proposal.add_vote(vote)
-        self._save_state()
+        self._save_vote(proposal_id, voter_address.lower())
 
         return vote
 
+    def get_live_tally(self, proposal_id: str) -> Dict[str, Any]:
+        """
+        Current tally for a proposal, read from its running totals.
+
+        O(1) in the number of voters and members, so it can be polled while
+        voting is open.
+        """
+        proposal = self.proposals.get(proposal_id)
+        if not proposal:
+            raise ValueError(f"Proposal not found: {proposal_id}")
+
+        dao = self.daos.get(proposal.dao_id)
+        if not dao:
+            raise ValueError(f"DAO not found: {proposal.dao_id}")
+
+        return {
+            "proposal_id": proposal_id,
+            "status": proposal.status.value,
+            "is_active": proposal.is_active,
+            "total_voting_power": dao.total_voting_power,
+            **proposal.get_result(dao.total_voting_power),
+        }
+
     def finalize_proposal(self, proposal_id: str) -> Proposal:
         """Finalize voting on a proposal."""
         proposal = self.proposals.get(proposal_id)
@@ -575,7 +643,7 @@ class DAOGovernanceManager:
         else:
             proposal.status = ProposalStatus.REJECTED
 
-        self._save_state()
+        self._save_entity("proposals", proposal_id)
 
         return proposal
 
@@ -597,7 +665,8 @@ class DAOGovernanceManager:
 
         proposal.status = ProposalStatus.EXECUTED
         proposal.executed_at = datetime.now()
-        self._save_state()
+        self._save_entity("daos", dao.dao_id)
+        self._save_entity("proposals", proposal_id)
 
         return proposal
 
@@ -639,6 +708,12 @@ class DAOGovernanceManager:
         self, dao_id: Optional[str] = None, status: Optional[ProposalStatus] = None
     ) -> List[Proposal]:
         """List proposals with optional filters."""
+        if isinstance(self._store, SQLiteStore) and (dao_id or status):
+            keys = self._store.query(
+                "proposals", dao_id=dao_id, status=status.value if status else None
+            )
+            return [self.proposals[k] for k in keys if k in self.proposals]
+
         proposals = list(self.proposals.values())
 
         if dao_id:
@@ -675,36 +750,75 @@ class DAOGovernanceManager:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log the scalar record of one changed DAO or proposal."""
+        if self._store:
+            entity = getattr(self, collection).get(key)
+            self._store.save(collection, key, entity.to_record() if entity is not None else None)
+
+    def _save_member(self, dao_id: str, address: str) -> None:
+        """Log one DAO member as its own entry, keyed dao_id:address."""
+        if self._store:
+            member = self.daos[dao_id].get_member(address)
+            self._store.save("members", f"{dao_id}:{address}", member)
+
+    def _save_vote(self, proposal_id: str, voter: str) -> None:
+        """Log one vote as its own entry, keyed proposal_id:voter."""
+        if self._store:
+            vote = self.proposals[proposal_id]._votes.get(voter)
+            self._store.save("votes", f"{proposal_id}:{voter}", vote)
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot every DAO and proposal."""
+        if not self._store:
             return
 
         state = {
-            "daos": {did: d.to_dict() for did, d in self.daos.items()},
-            "proposals": {pid: p.to_dict() for pid, p in self.proposals.items()},
+            "daos": {did: d.to_record() for did, d in self.daos.items()},
+            "members": {
+                f"{did}:{addr}": m.to_dict()
+                for did, d in self.daos.items()
+                for addr, m in d._members.items()
+            },
+            "proposals": {pid: p.to_record() for pid, p in self.proposals.items()},
+            "votes": {
+                f"{pid}:{voter}": v.to_dict()
+                for pid, p in self.proposals.items()
+                for voter, v in p._votes.items()
+            },
         }
-
-        with open(self.data_dir / "governance_state.json", "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        state_file = self.data_dir / "governance_state.json"
-        if not state_file.exists():
+        if not self._store:
             return
 
-        try:
-            with open(state_file) as f:
-                state = json.load(f)
+        state = self._store.load_state(legacy_file=self.data_dir / "governance_state.json")
+        if not state:
+            return
 
+        try:
             self.daos = {did: IPDAO.from_dict(d) for did, d in state.get("daos", {}).items()}
             self.proposals = {
                 pid: Proposal.from_dict(p) for pid, p in state.get("proposals", {}).items()
             }
-        except (json.JSONDecodeError, KeyError):
+            # Records written before members and votes were keyed separately
+            # still embed them; from_dict restores those
+            for key, member_data in state.get("members", {}).items():
+                dao_id, address = key.split(":", 1)
+                if dao_id in self.daos:
+                    self.daos[dao_id]._members[address] = DAOMember.from_dict(member_data)
+            for key, vote_data in state.get("votes", {}).items():
+                proposal_id, voter = key.split(":", 1)
+                if proposal_id in self.proposals:
+                    self.proposals[proposal_id]._votes[voter] = Vote.from_dict(vote_data)
+        except KeyError:
             pass
 
 
-def create_governance_manager(data_dir: Optional[str] = None) -> DAOGovernanceManager:
+def create_governance_manager(
+    data_dir: Optional[str] = None, storage_backend: str = "oplog"
+) -> DAOGovernanceManager:
     """Factory function to create a governance manager."""
     path = Path(data_dir) if data_dir else None
-    return DAOGovernanceManager(data_dir=path)
+    return DAOGovernanceManager(data_dir=path, storage_backend=storage_backend)
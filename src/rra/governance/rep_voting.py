@@ -15,9 +15,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import json
 import secrets
 
+from rra.governance.tally import TallyDict
+from rra.persistence.oplog import OpLogStore, open_store
 from rra.reputation.weighted import (
     ReputationManager,
     VotingPower,
@@ -76,6 +77,13 @@ class WeightedVote:
         }
 
 
+def _weighted_votes(
+    votes: Optional[Dict[str, WeightedVote]] = None,
+) -> TallyDict[str, WeightedVote]:
+    """Votes dict tallying effective power per choice and early voters."""
+    return TallyDict("effective_power", flag_attr="early_vote", votes=votes)
+
+
 @dataclass
 class RepWeightedProposal:
     """A reputation-weighted governance proposal."""
@@ -97,31 +105,35 @@ class RepWeightedProposal:
     # Proposal data
     data: Dict[str, Any] = field(default_factory=dict)
 
-    # Votes
-    votes: Dict[str, WeightedVote] = field(default_factory=dict)
+    # Votes (running tallies are kept by TallyDict)
+    votes: TallyDict[str, WeightedVote] = field(default_factory=_weighted_votes)
 
     # Dispute reference (if any)
     dispute_id: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.votes, TallyDict):
+            self.votes = _weighted_votes(self.votes)
+
     @property
     def power_for(self) -> int:
         """Total power voting for."""
-        return sum(v.effective_power for v in self.votes.values() if v.choice == VoteChoice.FOR)
+        return self.votes.tally.weight(VoteChoice.FOR)
 
     @property
     def power_against(self) -> int:
         """Total power voting against."""
-        return sum(v.effective_power for v in self.votes.values() if v.choice == VoteChoice.AGAINST)
+        return self.votes.tally.weight(VoteChoice.AGAINST)
 
     @property
     def power_abstain(self) -> int:
         """Total power abstaining."""
-        return sum(v.effective_power for v in self.votes.values() if v.choice == VoteChoice.ABSTAIN)
+        return self.votes.tally.weight(VoteChoice.ABSTAIN)
 
     @property
     def total_power(self) -> int:
         """Total power voted."""
-        return sum(v.effective_power for v in self.votes.values())
+        return self.votes.tally.total_weight
 
     @property
     def voter_count(self) -> int:
@@ -131,7 +143,7 @@ class RepWeightedProposal:
     @property
     def early_voter_count(self) -> int:
         """Number of early voters."""
-        return sum(1 for v in self.votes.values() if v.early_vote)
+        return self.votes.tally.flagged_count
 
     @property
     def is_active(self) -> bool:
@@ -169,8 +181,8 @@ class RepWeightedProposal:
             "passed": passed,
         }
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = self.get_result()
+    def to_record(self) -> Dict[str, Any]:
+        """Scalar fields for storage; votes are stored as their own entries."""
         return {
             "proposal_id": self.proposal_id,
             "title": self.title,
@@ -184,9 +196,14 @@ class RepWeightedProposal:
             "quorum_power": self.quorum_power,
             "approval_threshold": self.approval_threshold,
             "data": self.data,
-            "votes": {addr: v.to_dict() for addr, v in self.votes.items()},
             "dispute_id": self.dispute_id,
-            **result,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.to_record(),
+            "votes": {addr: v.to_dict() for addr, v in self.votes.items()},
+            **self.get_result(),
         }
 
 
@@ -216,9 +233,13 @@ class RepWeightedGovernance:
         self.dispute_proposals: Dict[str, List[str]] = {}
         self.participant_stakes: Dict[str, int] = {}  # For tracking stakes
         self.total_staked: int = 0
+        # Voting power snapshot key for the current stakes; renewed when they change
+        self._power_epoch = self._generate_id("epoch_")
 
+        self._store: Optional[OpLogStore] = None
         if data_dir:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(data_dir / "rep_governance_oplog")
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -234,7 +255,10 @@ class RepWeightedGovernance:
         old_stake = self.participant_stakes.get(address, 0)
         self.participant_stakes[address] = stake
         self.total_staked = self.total_staked - old_stake + stake
-        self._save_state()
+        self._power_epoch = self._generate_id("epoch_")
+        if self._store:
+            self._store.put("participant_stakes", address, stake)
+            self._store.set("total_staked", self.total_staked)
         return stake
 
     def get_stake(self, address: str) -> int:
@@ -307,7 +331,9 @@ class RepWeightedGovernance:
         # Record proposer activity
         self.reputation_manager.get_or_create_participant(proposer_address)
 
-        self._save_state()
+        self._save_entity("proposals", proposal.proposal_id)
+        if dispute_id:
+            self._save_entity("dispute_proposals", dispute_id)
         return proposal
 
     def get_proposal(self, proposal_id: str) -> Optional[RepWeightedProposal]:
@@ -370,8 +396,16 @@ class RepWeightedGovernance:
         if voter_stake <= 0:
             return None
 
-        # Calculate voting power
-        voting_power = self.reputation_manager.calculate_voting_power(voter_address, voter_stake)
+        # Calculate voting power (registered stakes: O(1) from the epoch snapshot)
+        voting_power: Optional[VotingPower] = None
+        if stake is None:
+            voting_power = self.reputation_manager.snapshot_voting_power(
+                self.participant_stakes.items(), epoch=self._power_epoch
+            ).get(voter_address)
+        if voting_power is None:
+            voting_power = self.reputation_manager.calculate_voting_power(
+                voter_address, voter_stake
+            )
 
         # Check if early vote
         now = datetime.now()
@@ -402,7 +436,7 @@ class RepWeightedGovernance:
                 voter_address, proposal.dispute_id or proposal.proposal_id
             )
 
-        self._save_state()
+        self._save_vote(proposal_id, voter_address)
         return vote
 
     def has_voted(self, proposal_id: str, voter_address: str) -> bool:
@@ -419,6 +453,22 @@ class RepWeightedGovernance:
             return None
         return proposal.votes.get(voter_address.lower())
 
+    def get_live_tally(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Current tally for a proposal, read from its running totals.
+
+        O(1) in the number of voters, so it can be polled while voting is open.
+        """
+        proposal = self.proposals.get(proposal_id)
+        if not proposal:
+            return None
+        return {
+            "proposal_id": proposal_id,
+            "status": proposal.status.value,
+            "is_active": proposal.is_active,
+            **proposal.get_result(),
+        }
+
     # =========================================================================
     # Finalization
     # =========================================================================
@@ -470,7 +520,7 @@ class RepWeightedGovernance:
                 accepted=False,
             )
 
-        self._save_state()
+        self._save_entity("proposals", proposal_id)
 
         return {
             "proposal_id": proposal_id,
@@ -490,7 +540,7 @@ class RepWeightedGovernance:
         proposal.status = ProposalStatus.EXECUTED
         proposal.executed_at = datetime.now()
 
-        self._save_state()
+        self._save_entity("proposals", proposal_id)
 
         return {
             "proposal_id": proposal_id,
@@ -508,8 +558,8 @@ class RepWeightedGovernance:
                 proposal.status = ProposalStatus.EXPIRED
                 expired.append(proposal.proposal_id)
 
-        if expired:
-            self._save_state()
+        for proposal_id in expired:
+            self._save_entity("proposals", proposal_id)
 
         return expired
 
@@ -627,12 +677,32 @@ class RepWeightedGovernance:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed proposal record or dispute proposal list."""
+        if self._store:
+            entity = getattr(self, collection).get(key)
+            if isinstance(entity, RepWeightedProposal):
+                entity = entity.to_record()
+            self._store.save(collection, key, entity)
+
+    def _save_vote(self, proposal_id: str, voter_address: str) -> None:
+        """Log one vote as its own entry, keyed proposal_id:voter_address."""
+        if self._store:
+            vote = self.proposals[proposal_id].votes.get(voter_address)
+            self._store.save("votes", f"{proposal_id}:{voter_address}", vote)
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot the whole governance state, including its config."""
+        if not self._store:
             return
 
         state = {
-            "proposals": {pid: p.to_dict() for pid, p in self.proposals.items()},
+            "proposals": {pid: p.to_record() for pid, p in self.proposals.items()},
+            "votes": {
+                f"{pid}:{addr}": v.to_dict()
+                for pid, p in self.proposals.items()
+                for addr, v in p.votes.items()
+            },
             "dispute_proposals": self.dispute_proposals,
             "participant_stakes": self.participant_stakes,
             "total_staked": self.total_staked,
@@ -642,34 +712,29 @@ class RepWeightedGovernance:
                 "approval_threshold": self.approval_threshold,
             },
         }
-
-        state_file = self.data_dir / "rep_governance_state.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        if not self.data_dir:
+        data_dir = self.data_dir
+        if not self._store or data_dir is None:
             return
 
-        state_file = self.data_dir / "rep_governance_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=data_dir / "rep_governance_state.json")
+        if not state:
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             # Restore proposals (simplified for brevity)
             self.dispute_proposals = state.get("dispute_proposals", {})
             self.participant_stakes = state.get("participant_stakes", {})
             self.total_staked = state.get("total_staked", 0)
 
             config = state.get("config", {})
-            self.voting_period_hours = config.get("voting_period_hours", 72)
-            self.quorum_percentage = config.get("quorum_percentage", 20.0)
-            self.approval_threshold = config.get("approval_threshold", 50.0)
+            self.voting_period_hours = config.get("voting_period_hours", self.voting_period_hours)
+            self.quorum_percentage = config.get("quorum_percentage", self.quorum_percentage)
+            self.approval_threshold = config.get("approval_threshold", self.approval_threshold)
 
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
 
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Running Vote Tallies for Governance Proposals.
+
+Shared by the DAO, treasury and reputation-weighted proposals:
+- VoteTally keeps per-choice weight and voter totals
+- TallyDict is the proposals' votes dict; it updates its VoteTally whenever a
+  vote is stored, replaced or removed, so totals are O(1) to read
+- recount()/verify() rebuild the totals from scratch as an invariant check
+"""
+
+from typing import Any, Dict, Optional, Tuple, TypeVar
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class VoteTally:
+    """Running vote weight and voter counts, per choice and overall."""
+
+    def __init__(self) -> None:
+        self.weights: Dict[Any, int] = {}
+        self.counts: Dict[Any, int] = {}
+        self.total_weight: int = 0
+        self.voter_count: int = 0
+        self.flagged_count: int = 0  # e.g. early votes
+
+    def add(self, choice: Any, weight: int, flagged: bool = False) -> None:
+        """Count one vote."""
+        self.weights[choice] = self.weights.get(choice, 0) + weight
+        self.counts[choice] = self.counts.get(choice, 0) + 1
+        self.total_weight += weight
+        self.voter_count += 1
+        if flagged:
+            self.flagged_count += 1
+
+    def remove(self, choice: Any, weight: int, flagged: bool = False) -> None:
+        """Uncount a vote previously passed to add()."""
+        self.weights[choice] -= weight
+        self.counts[choice] -= 1
+        if not self.counts[choice]:
+            del self.weights[choice]
+            del self.counts[choice]
+        self.total_weight -= weight
+        self.voter_count -= 1
+        if flagged:
+            self.flagged_count -= 1
+
+    def weight(self, choice: Any) -> int:
+        """Total weight cast for a choice."""
+        return self.weights.get(choice, 0)
+
+    def count(self, choice: Any) -> int:
+        """Number of voters who chose a choice."""
+        return self.counts.get(choice, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "weights": {_label(c): w for c, w in self.weights.items()},
+            "counts": {_label(c): n for c, n in self.counts.items()},
+            "total_weight": self.total_weight,
+            "voter_count": self.voter_count,
+            "flagged_count": self.flagged_count,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VoteTally):
+            return NotImplemented
+        return (
+            self.weights == other.weights
+            and self.counts == other.counts
+            and self.total_weight == other.total_weight
+            and self.voter_count == other.voter_count
+            and self.flagged_count == other.flagged_count
+        )
+
+    def __repr__(self) -> str:
+        return f"VoteTally({self.to_dict()})"
+
+
+def _label(choice: Any) -> Any:
+    return getattr(choice, "value", choice)
+
+
+class TallyDict(Dict[_K, _V]):
+    """
+    Votes keyed by voter, with a VoteTally kept in step with the contents.
+
+    The weight, choice and flag of each vote are read from the named
+    attributes when the vote is stored. That contribution is remembered, so
+    replacing or removing a vote subtracts exactly what was added even if the
+    vote object was mutated in between.
+    """
+
+    def __init__(
+        self,
+        weight_attr: str,
+        choice_attr: Optional[str] = "choice",
+        flag_attr: Optional[str] = None,
+        votes: Optional[Dict[_K, _V]] = None,
+    ):
+        super().__init__()
+        self.weight_attr = weight_attr
+        self.choice_attr = choice_attr
+        self.flag_attr = flag_attr
+        self.tally = VoteTally()
+        self._contributions: Dict[Any, Tuple[Any, int, bool]] = {}
+        if votes:
+            self.update(votes)
+
+    def _contribution(self, vote: Any) -> Tuple[Any, int, bool]:
+        choice = getattr(vote, self.choice_attr) if self.choice_attr else None
+        flagged = bool(getattr(vote, self.flag_attr)) if self.flag_attr else False
+        return choice, getattr(vote, self.weight_attr), flagged
+
+    def _uncount(self, key: Any) -> None:
+        contribution = self._contributions.pop(key, None)
+        if contribution is not None:
+            self.tally.remove(*contribution)
+
+    def __setitem__(self, key: Any, vote: Any) -> None:
+        contribution = self._contribution(vote)
+        self._uncount(key)
+        super().__setitem__(key, vote)
+        self._contributions[key] = contribution
+        self.tally.add(*contribution)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._uncount(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        vote = super().pop(key)
+        self._uncount(key)
+        return vote
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, vote = super().popitem()
+        self._uncount(key)
+        return key, vote
+
+    def clear(self) -> None:
+        super().clear()
+        self._contributions.clear()
+        self.tally = VoteTally()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, vote in dict(*args, **kwargs).items():
+            self[key] = vote
+
+    # Any-typed like dict's own overloads allow; both keep the tally in step
+    def __or__(self, other: Any) -> Any:
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ior__(self, other: Any) -> Any:
+        self.update(other)
+        return self
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def copy(self) -> "TallyDict[_K, _V]":
+        return TallyDict(self.weight_attr, self.choice_attr, self.flag_attr, dict(self))
+
+    def __reduce__(self):
+        return (
+            TallyDict,
+            (self.weight_attr, self.choice_attr, self.flag_attr, dict(self)),
+        )
+
+    def recount(self) -> VoteTally:
+        """Tally the current votes from scratch."""
+        tally = VoteTally()
+        for vote in self.values():
+            tally.add(*self._contribution(vote))
+        return tally
+
+    def verify(self) -> bool:
+        """Check the running tally against a full recount."""
+        return self.recount() == self.tally
@@ -15,9 +15,11 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
-import json
 import secrets
 
+from rra.governance.tally import TallyDict
+from rra.persistence.oplog import OpLogStore, open_store
+
 
 class TreasuryVoteType(Enum):
     """Types of treasury votes."""
@@ -84,6 +86,13 @@ class TreasuryVote:
         )
 
 
+def _treasury_votes(
+    votes: Optional[Dict[str, TreasuryVote]] = None,
+) -> TallyDict[str, TreasuryVote]:
+    """Votes dict tallying stake weight per choice."""
+    return TallyDict("stake_weight", votes=votes)
+
+
 @dataclass
 class TreasuryProposal:
     """A proposal for treasury decision."""
@@ -112,24 +121,28 @@ class TreasuryProposal:
     # Proposal data (e.g., payout shares, settlement terms)
     data: Dict[str, Any] = field(default_factory=dict)
 
-    # Votes by voter_id
-    _votes: Dict[str, TreasuryVote] = field(default_factory=dict)
+    # Votes by voter_id (running tallies are kept by TallyDict)
+    _votes: TallyDict[str, TreasuryVote] = field(default_factory=_treasury_votes)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self._votes, TallyDict):
+            self._votes = _treasury_votes(self._votes)
 
     @property
     def total_stake_voted(self) -> int:
-        return sum(v.stake_weight for v in self._votes.values())
+        return self._votes.tally.total_weight
 
     @property
     def stake_approved(self) -> int:
-        return sum(v.stake_weight for v in self._votes.values() if v.choice == VoteChoice.APPROVE)
+        return self._votes.tally.weight(VoteChoice.APPROVE)
 
     @property
     def stake_rejected(self) -> int:
-        return sum(v.stake_weight for v in self._votes.values() if v.choice == VoteChoice.REJECT)
+        return self._votes.tally.weight(VoteChoice.REJECT)
 
     @property
     def stake_abstained(self) -> int:
-        return sum(v.stake_weight for v in self._votes.values() if v.choice == VoteChoice.ABSTAIN)
+        return self._votes.tally.weight(VoteChoice.ABSTAIN)
 
     @property
     def voter_count(self) -> int:
@@ -183,7 +196,8 @@ class TreasuryProposal:
             "passed": passed,
         }
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_record(self) -> Dict[str, Any]:
+        """Scalar fields for storage; votes are stored as their own entries."""
         return {
             "proposal_id": self.proposal_id,
             "dispute_id": self.dispute_id,
@@ -200,6 +214,11 @@ class TreasuryProposal:
             "quorum_stake": self.quorum_stake,
             "approval_threshold": self.approval_threshold,
             "data": self.data,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.to_record(),
             "votes": {vid: v.to_dict() for vid, v in self._votes.items()},
             "stake_approved": self.stake_approved,
             "stake_rejected": self.stake_rejected,
@@ -337,9 +356,12 @@ class TreasuryVotingManager:
         self.treasuries: Dict[str, VotingTreasury] = {}
         self.proposals: Dict[str, TreasuryProposal] = {}
         self.dispute_stakes: Dict[str, Dict[str, int]] = {}  # dispute_id -> treasury_id -> stake
+        self._dispute_totals: Dict[str, int] = {}  # dispute_id -> running total stake
 
+        self._store: Optional[OpLogStore] = None
         if data_dir:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(data_dir / "treasury_votes_oplog")
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -366,7 +388,7 @@ class TreasuryVotingManager:
             treasury.add_signer(signer_addr)
 
         self.treasuries[treasury.treasury_id] = treasury
-        self._save_state()
+        self._save_entity("treasuries", treasury.treasury_id)
 
         return treasury
 
@@ -385,7 +407,7 @@ class TreasuryVotingManager:
             return None
 
         signer = treasury.add_signer(address, weight)
-        self._save_state()
+        self._save_entity("treasuries", treasury_id)
         return signer
 
     # =========================================================================
@@ -404,13 +426,15 @@ class TreasuryVotingManager:
 
         current = self.dispute_stakes[dispute_id].get(treasury_id, 0)
         self.dispute_stakes[dispute_id][treasury_id] = current + amount
+        self._dispute_totals[dispute_id] = self._dispute_totals.get(dispute_id, 0) + amount
 
         # Update treasury total stake
         treasury = self.treasuries.get(treasury_id)
         if treasury:
             treasury.stake += amount
+            self._save_entity("treasuries", treasury_id)
 
-        self._save_state()
+        self._save_entity("dispute_stakes", dispute_id)
         return self.dispute_stakes[dispute_id][treasury_id]
 
     def get_dispute_stakes(self, dispute_id: str) -> Dict[str, int]:
@@ -418,9 +442,8 @@ class TreasuryVotingManager:
         return self.dispute_stakes.get(dispute_id, {})
 
     def get_total_stake(self, dispute_id: str) -> int:
-        """Get total stake for a dispute."""
-        stakes = self.dispute_stakes.get(dispute_id, {})
-        return sum(stakes.values())
+        """Get total stake for a dispute, from its running total."""
+        return self._dispute_totals.get(dispute_id, 0)
 
     # =========================================================================
     # Proposal Management
@@ -470,7 +493,7 @@ class TreasuryVotingManager:
         )
 
         self.proposals[proposal.proposal_id] = proposal
-        self._save_state()
+        self._save_entity("proposals", proposal.proposal_id)
 
         return proposal
 
@@ -537,7 +560,7 @@ class TreasuryVotingManager:
         )
 
         if proposal.add_vote(vote):
-            self._save_state()
+            self._save_vote(proposal_id, vote.voter_id)
             return vote
 
         return None
@@ -589,7 +612,7 @@ class TreasuryVotingManager:
         # Store separately for signer consensus tracking
         # This doesn't directly affect proposal outcome
         if proposal.add_vote(vote):
-            self._save_state()
+            self._save_vote(proposal_id, vote.voter_id)
             return vote
 
         return None
@@ -646,6 +669,22 @@ class TreasuryVotingManager:
             "majority_choice": majority_choice.value,
         }
 
+    def get_live_tally(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Current tally for a proposal, read from its running totals.
+
+        O(1) in the number of voters, so it can be polled while voting is open.
+        """
+        proposal = self.proposals.get(proposal_id)
+        if not proposal:
+            return None
+        return {
+            "proposal_id": proposal_id,
+            "status": proposal.status.value,
+            "is_active": proposal.is_active,
+            **proposal.calculate_result(self.get_total_stake(proposal.dispute_id)),
+        }
+
     # =========================================================================
     # Finalization
     # =========================================================================
@@ -672,7 +711,7 @@ class TreasuryVotingManager:
         else:
             proposal.status = TreasuryVoteStatus.REJECTED
 
-        self._save_state()
+        self._save_entity("proposals", proposal_id)
 
         return {
             "proposal_id": proposal_id,
@@ -692,7 +731,7 @@ class TreasuryVotingManager:
         proposal.status = TreasuryVoteStatus.EXECUTED
         proposal.executed_at = datetime.now()
 
-        self._save_state()
+        self._save_entity("proposals", proposal_id)
 
         return {
             "proposal_id": proposal_id,
@@ -712,7 +751,7 @@ class TreasuryVotingManager:
 
         return {
             "dispute_id": dispute_id,
-            "total_stake": sum(stakes.values()),
+            "total_stake": self.get_total_stake(dispute_id),
             "treasury_count": len(stakes),
             "stakes_by_treasury": stakes,
             "proposal_count": len(proposals),
@@ -759,13 +798,33 @@ class TreasuryVotingManager:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed treasury, proposal record or dispute stake table."""
+        if self._store:
+            entity = getattr(self, collection).get(key)
+            if isinstance(entity, TreasuryProposal):
+                entity = entity.to_record()
+            self._store.save(collection, key, entity)
+
+    def _save_vote(self, proposal_id: str, voter_id: str) -> None:
+        """Log one vote as its own entry, keyed proposal_id:voter_id."""
+        if self._store:
+            vote = self.proposals[proposal_id].get_vote(voter_id)
+            self._store.save("votes", f"{proposal_id}:{voter_id}", vote)
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot the whole voting state, including its config."""
+        if not self._store:
             return
 
         state = {
             "treasuries": {tid: t.to_dict() for tid, t in self.treasuries.items()},
-            "proposals": {pid: p.to_dict() for pid, p in self.proposals.items()},
+            "proposals": {pid: p.to_record() for pid, p in self.proposals.items()},
+            "votes": {
+                f"{pid}:{vid}": v.to_dict()
+                for pid, p in self.proposals.items()
+                for vid, v in p._votes.items()
+            },
             "dispute_stakes": self.dispute_stakes,
             "config": {
                 "voting_period_hours": self.voting_period_hours,
@@ -774,36 +833,41 @@ class TreasuryVotingManager:
             },
         }
 
-        state_file = self.data_dir / "treasury_votes_state.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        if not self.data_dir:
+        data_dir = self.data_dir
+        if not self._store or data_dir is None:
             return
 
-        state_file = self.data_dir / "treasury_votes_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=data_dir / "treasury_votes_state.json")
+        if not state:
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             self.treasuries = {
                 tid: VotingTreasury.from_dict(t) for tid, t in state.get("treasuries", {}).items()
             }
             self.proposals = {
                 pid: TreasuryProposal.from_dict(p) for pid, p in state.get("proposals", {}).items()
             }
+            # Older proposal records embed their votes; from_dict restores those
+            for key, vote_data in state.get("votes", {}).items():
+                proposal_id, voter_id = key.split(":", 1)
+                if proposal_id in self.proposals:
+                    self.proposals[proposal_id]._votes[voter_id] = TreasuryVote.from_dict(vote_data)
             self.dispute_stakes = state.get("dispute_stakes", {})
+            self._dispute_totals = {
+                dispute_id: sum(stakes.values())
+                for dispute_id, stakes in self.dispute_stakes.items()
+            }
 
             config = state.get("config", {})
-            self.voting_period_hours = config.get("voting_period_hours", 72)
-            self.quorum_percentage = config.get("quorum_percentage", 50.0)
-            self.approval_threshold = config.get("approval_threshold", 50.0)
+            self.voting_period_hours = config.get("voting_period_hours", self.voting_period_hours)
+            self.quorum_percentage = config.get("quorum_percentage", self.quorum_percentage)
+            self.approval_threshold = config.get("approval_threshold", self.approval_threshold)
 
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
 
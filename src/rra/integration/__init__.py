@@ -43,10 +43,14 @@ from rra.integration.boundary_daemon import (
     Permission,
     ResourceType,
     AccessPolicy,
+    CompiledPolicy,
+    PolicyEngine,
     Principal,
     AccessToken,
     BoundaryMode,
     BoundaryEvent,
+    EventChain,
+    ChainCheckpoint,
     EventSeverity,
     ModeConstraints,
     DaemonConnection,
@@ -106,10 +110,14 @@ __all__ = [
     "Permission",
     "ResourceType",
     "AccessPolicy",
+    "CompiledPolicy",
+    "PolicyEngine",
     "Principal",
     "AccessToken",
     "BoundaryMode",
     "BoundaryEvent",
+    "EventChain",
+    "ChainCheckpoint",
     "EventSeverity",
     "ModeConstraints",
     "DaemonConnection",
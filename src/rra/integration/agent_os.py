@@ -12,10 +12,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import json
 import secrets
 import asyncio
 
+from rra.persistence.oplog import OpLogStore, open_store
+
 
 class AgentStatus(Enum):
     """Status of an agent instance."""
@@ -316,8 +317,10 @@ class AgentOSRuntime:
         self.instances: Dict[str, AgentInstance] = {}
         self.deployments: Dict[str, str] = {}  # repo_id -> instance_id
 
+        self._store: Optional[OpLogStore] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(self.data_dir / "agent_os_oplog")
             self._load_state()
         else:
             self._register_local_node()
@@ -362,7 +365,7 @@ class AgentOSRuntime:
         )
 
         self.nodes[node.node_id] = node
-        self._save_state()
+        self._save_entity("nodes", node.node_id)
 
         return node
 
@@ -383,7 +386,7 @@ class AgentOSRuntime:
             raise ValueError(f"Node not found: {node_id}")
 
         node.last_heartbeat = datetime.now()
-        self._save_state()
+        self._save_entity("nodes", node_id)
 
         return node
 
@@ -452,8 +455,10 @@ class AgentOSRuntime:
         # Track repo deployment
         if config.repo_id:
             self.deployments[config.repo_id] = instance.instance_id
+            self._save_entity("deployments", config.repo_id)
 
-        self._save_state()
+        self._save_entity("instances", instance.instance_id)
+        self._save_entity("nodes", node.node_id)
 
         return instance
 
@@ -474,7 +479,7 @@ class AgentOSRuntime:
         instance.health_status = "healthy"
         instance.last_health_check = datetime.now()
 
-        self._save_state()
+        self._save_entity("instances", instance_id)
 
         return instance
 
@@ -497,7 +502,9 @@ class AgentOSRuntime:
 
         instance.status = AgentStatus.STOPPED
 
-        self._save_state()
+        self._save_entity("instances", instance_id)
+        if node:
+            self._save_entity("nodes", node.node_id)
 
         return instance
 
@@ -510,7 +517,7 @@ class AgentOSRuntime:
         if instance.restart_count >= instance.config.max_restarts:
             instance.status = AgentStatus.FAILED
             instance.error_message = "Max restarts exceeded"
-            self._save_state()
+            self._save_entity("instances", instance_id)
             raise ValueError("Max restart limit reached")
 
         # Stop and start
@@ -525,7 +532,7 @@ class AgentOSRuntime:
         instance.last_health_check = datetime.now()
         instance.error_message = None
 
-        self._save_state()
+        self._save_entity("instances", instance_id)
 
         return instance
 
@@ -545,8 +552,9 @@ class AgentOSRuntime:
         if instance.config.repo_id:
             if self.deployments.get(instance.config.repo_id) == instance_id:
                 del self.deployments[instance.config.repo_id]
+                self._save_entity("deployments", instance.config.repo_id)
 
-        self._save_state()
+        self._save_entity("instances", instance_id)
 
         return instance
 
@@ -602,7 +610,7 @@ class AgentOSRuntime:
             if instance.restart_count < instance.config.max_restarts:
                 self.restart_agent(instance_id)
 
-        self._save_state()
+        self._save_entity("instances", instance_id)
 
         return instance
 
@@ -692,8 +700,14 @@ class AgentOSRuntime:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed node, instance or deployment."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot every node, instance and deployment."""
+        if not self._store:
             return
 
         state = {
@@ -702,19 +716,15 @@ class AgentOSRuntime:
             "deployments": self.deployments,
         }
 
-        with open(self.data_dir / "agent_os_state.json", "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        state_file = self.data_dir / "agent_os_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=self.data_dir / "agent_os_state.json")
+        if not state:
             self._register_local_node()
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             self.nodes = {
                 nid: RuntimeNode.from_dict(n) for nid, n in state.get("nodes", {}).items()
             }
@@ -725,7 +735,7 @@ class AgentOSRuntime:
 
             if not self.nodes:
                 self._register_local_node()
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             self._register_local_node()
 
 
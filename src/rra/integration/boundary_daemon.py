@@ -17,8 +17,12 @@ This module supports:
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, Flag, auto
-from typing import Dict, List, Optional, Any, Set, Callable, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Any, Set, Callable, Tuple
+from collections import OrderedDict, deque
 from pathlib import Path
+import atexit
+import heapq
+import itertools
 import json
 import secrets
 import hashlib
@@ -28,10 +32,15 @@ import logging
 import threading
 import time
 import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 
 try:
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+        Ed25519PublicKey,
+    )
     from cryptography.hazmat.primitives import serialization
 
     HAS_CRYPTO = True
@@ -234,6 +243,17 @@ class EventSeverity(Enum):
     CRITICAL = 5
 
 
+# CEF severity (0-10) for each event severity
+CEF_SEVERITY = {
+    EventSeverity.DEBUG: 0,
+    EventSeverity.INFO: 1,
+    EventSeverity.LOW: 3,
+    EventSeverity.MEDIUM: 5,
+    EventSeverity.HIGH: 7,
+    EventSeverity.CRITICAL: 10,
+}
+
+
 @dataclass
 class BoundaryEvent:
     """
@@ -280,14 +300,6 @@ class BoundaryEvent:
     def to_cef(self) -> str:
         """Convert event to CEF (Common Event Format) for SIEM."""
         # CEF:Version|Device Vendor|Device Product|Device Version|Signature ID|Name|Severity|Extension
-        severity_map = {
-            EventSeverity.DEBUG: 0,
-            EventSeverity.INFO: 1,
-            EventSeverity.LOW: 3,
-            EventSeverity.MEDIUM: 5,
-            EventSeverity.HIGH: 7,
-            EventSeverity.CRITICAL: 10,
-        }
 
         extensions = [
             f"rt={int(self.timestamp.timestamp() * 1000)}",
@@ -309,7 +321,7 @@ class BoundaryEvent:
 
         return (
             f"CEF:0|NatLangChain|RRA-Module|0.1.0|{self.event_type}|"
-            f"{self.event_type}|{severity_map[self.severity]}|{' '.join(extensions)}"
+            f"{self.event_type}|{CEF_SEVERITY[self.severity]}|{' '.join(extensions)}"
         )
 
     def to_json(self) -> Dict[str, Any]:
@@ -335,6 +347,465 @@ class BoundaryEvent:
     def to_dict(self) -> Dict[str, Any]:
         return self.to_json()
 
+    def to_record(self) -> Dict[str, Any]:
+        """Serialize for durable storage, including the signature."""
+        record = self.to_json()
+        record["signature"] = self.signature.hex() if self.signature else None
+        return record
+
+    def to_json_line(self) -> str:
+        """
+        Compact JSON encoding of ``to_json``.
+
+        Encoded from the current field values on every call; the SIEM
+        writers call it once per event where the event is sent or queued.
+        """
+        return json.dumps(self.to_json(), separators=(",", ":"))
+
+    def to_record_line(self) -> str:
+        """Compact JSON encoding of ``to_record``, built on ``to_json_line``."""
+        signature = json.dumps(self.signature.hex() if self.signature else None)
+        return f'{self.to_json_line()[:-1]},"signature":{signature}}}'
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "BoundaryEvent":
+        """Rebuild an event written by ``to_record``."""
+        return cls(
+            event_id=data["event_id"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            event_type=data["event_type"],
+            source=data["source"],
+            action=data["action"],
+            outcome=data["outcome"],
+            severity=EventSeverity(data["severity_value"]),
+            mode=BoundaryMode(data["mode"]),
+            principal_id=data.get("principal_id"),
+            resource_type=data.get("resource_type"),
+            resource_id=data.get("resource_id"),
+            context=data.get("context", {}),
+            previous_hash=data.get("previous_hash"),
+            signature=bytes.fromhex(data["signature"]) if data.get("signature") else None,
+        )
+
+
+class EventChain:
+    """
+    Fixed-capacity ring buffer for the hash-chained audit trail.
+
+    Appends are O(1): once the buffer is full the oldest slot is
+    overwritten in place instead of slicing a new list. Secondary indexes
+    by event type and severity keep filtered newest-first queries at
+    O(limit). Events leaving the in-memory window are appended to on-disk
+    overflow segments (when a directory is configured), so the full chain
+    stays verifiable; the hash of the last evicted event is kept as the
+    anchor for the first in-memory event.
+
+    Archived records carry their sequence number. On startup the chain
+    resumes numbering and the anchor hash from the newest archived record,
+    and ``spill`` archives the live window on shutdown so the next process
+    continues the same chain.
+    """
+
+    SEGMENT_PREFIX = "events-"
+    # Evicted events are written to the segment in groups of this size
+    OVERFLOW_BATCH = 256
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        overflow_dir: Optional[Path] = None,
+        segment_size: int = 100_000,
+    ):
+        """
+        Initialize the event chain.
+
+        Args:
+            capacity: Events kept in memory
+            overflow_dir: Directory for evicted-event segments (None = discard)
+            segment_size: Events per on-disk segment file
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
+        self.capacity = capacity
+        self.overflow_dir = overflow_dir
+        self.segment_size = segment_size
+
+        self._slots: List[Optional[BoundaryEvent]] = [None] * capacity
+        self._next_seq = 0  # Sequence number of the next append
+        self._by_type: Dict[str, Deque[int]] = {}
+        self._by_severity: Dict[int, Deque[int]] = {s.value: deque() for s in EventSeverity}
+        self._anchor_hash: Optional[str] = None  # Hash of the newest evicted event
+        self._lock = threading.RLock()
+
+        self._base_seq = 0  # First sequence number held by this process
+        self._archived_next = 0  # Sequence number the next archived record gets
+        self._overflow_buffer: List[str] = []
+        self._segment_index = 0
+        self._segment_count = 0
+        self._segment_file = None
+        if overflow_dir is not None:
+            overflow_dir.mkdir(parents=True, exist_ok=True)
+            self._resume_segments()
+            _open_chains.add(self)
+
+    # -------------------------------------------------------------------------
+    # Sequence bookkeeping
+    # -------------------------------------------------------------------------
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest in-memory event."""
+        return max(self._base_seq, self._next_seq - self.capacity)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended event will receive."""
+        return self._next_seq
+
+    @property
+    def anchor_hash(self) -> Optional[str]:
+        """Hash of the newest event evicted from memory, if any."""
+        return self._anchor_hash
+
+    @property
+    def archived_next_seq(self) -> int:
+        """Sequence number following the newest archived event."""
+        return self._archived_next
+
+    def __len__(self) -> int:
+        return self._next_seq - self.first_seq
+
+    def get(self, seq: int) -> Optional[BoundaryEvent]:
+        """Get an in-memory event by sequence number."""
+        if not self.first_seq <= seq < self._next_seq:
+            return None
+        return self._slots[seq % self.capacity]
+
+    def since(self, seq: int) -> List[Tuple[int, BoundaryEvent]]:
+        """
+        Snapshot in-memory events from a sequence number onward.
+
+        Args:
+            seq: First sequence number wanted (clamped to the window)
+
+        Returns:
+            (sequence number, event) pairs, oldest first
+        """
+        with self._lock:
+            start = max(seq, self.first_seq)
+            return [(s, self._slots[s % self.capacity]) for s in range(start, self._next_seq)]
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def append(self, event: BoundaryEvent) -> int:
+        """
+        Append an event, evicting the oldest when full.
+
+        Returns:
+            Sequence number assigned to the event
+        """
+        with self._lock:
+            seq = self._next_seq
+            slot = seq % self.capacity
+
+            if seq - self.capacity >= self._base_seq:
+                self._evict(seq - self.capacity, self._slots[slot])
+
+            self._slots[slot] = event
+            self._by_type.setdefault(event.event_type, deque()).append(seq)
+            self._by_severity[event.severity.value].append(seq)
+            self._next_seq = seq + 1
+            return seq
+
+    def _evict(self, seq: int, event: Optional[BoundaryEvent]) -> None:
+        """Drop the oldest event from memory and the indexes."""
+        if event is None:
+            return
+
+        type_index = self._by_type.get(event.event_type)
+        if type_index and type_index[0] == seq:
+            type_index.popleft()
+            if not type_index:
+                del self._by_type[event.event_type]
+        severity_index = self._by_severity[event.severity.value]
+        if severity_index and severity_index[0] == seq:
+            severity_index.popleft()
+
+        self._anchor_hash = event.compute_hash()
+        if self.overflow_dir is not None and seq >= self._archived_next:
+            self._write_overflow(seq, event)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[BoundaryEvent]:
+        """Iterate in-memory events oldest first."""
+        with self._lock:
+            start, end = self.first_seq, self._next_seq
+            events = [self._slots[seq % self.capacity] for seq in range(start, end)]
+        return iter(events)  # type: ignore[arg-type]
+
+    def newest(
+        self,
+        limit: int = 100,
+        event_type: Optional[str] = None,
+        severity_min: Optional[EventSeverity] = None,
+    ) -> List[BoundaryEvent]:
+        """
+        Get the newest in-memory events, optionally filtered.
+
+        Args:
+            limit: Maximum events to return
+            event_type: Only events of this type
+            severity_min: Only events at or above this severity
+
+        Returns:
+            Events, newest first
+        """
+        with self._lock:
+            if limit <= 0:
+                return []
+
+            if event_type is not None:
+                seqs: Iterable[int] = reversed(self._by_type.get(event_type, ()))
+                if severity_min is not None:
+                    floor = severity_min.value
+                    seqs = (
+                        s for s in seqs if self._slots[s % self.capacity].severity.value >= floor
+                    )
+            elif severity_min is not None:
+                # Merge the per-severity indexes newest first
+                seqs = heapq.merge(
+                    *(
+                        reversed(index)
+                        for level, index in self._by_severity.items()
+                        if level >= severity_min.value
+                    ),
+                    reverse=True,
+                )
+            else:
+                seqs = range(self._next_seq - 1, self.first_seq - 1, -1)
+
+            return [self._slots[s % self.capacity] for s in itertools.islice(seqs, limit)]
+
+    # -------------------------------------------------------------------------
+    # Overflow segments
+    # -------------------------------------------------------------------------
+
+    def _segment_path(self, index: int) -> Path:
+        assert self.overflow_dir is not None
+        return self.overflow_dir / f"{self.SEGMENT_PREFIX}{index:06d}.jsonl"
+
+    def segment_paths(self) -> List[Path]:
+        """On-disk overflow segments, oldest first."""
+        if self.overflow_dir is None:
+            return []
+        return sorted(self.overflow_dir.glob(f"{self.SEGMENT_PREFIX}*.jsonl"))
+
+    def _resume_segments(self) -> None:
+        """Continue the newest segment and the chain it ends with after a restart."""
+        segments = self.segment_paths()
+        if not segments:
+            return
+        last = segments[-1]
+        self._segment_index = int(last.stem[len(self.SEGMENT_PREFIX) :])
+
+        last_line = None
+        for path in reversed(segments):
+            count = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        count += 1
+                        last_line = line
+            if path == last:
+                self._segment_count = count
+            if last_line is not None:
+                break
+        if last_line is None:
+            return
+
+        record = json.loads(last_line)
+        seq = record.get("seq")
+        if seq is None:
+            # Segments written before records carried sequence numbers
+            seq = sum(1 for _ in self._iter_records(segments)) - 1
+        self._next_seq = self._base_seq = self._archived_next = seq + 1
+        self._anchor_hash = BoundaryEvent.from_record(record).compute_hash()
+
+    def _iter_records(self, paths: List[Path]) -> Iterator[Dict[str, Any]]:
+        for path in paths:
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def _write_overflow(self, seq: int, event: BoundaryEvent) -> None:
+        record = event.to_record()
+        record["seq"] = seq
+        self._overflow_buffer.append(json.dumps(record, sort_keys=True) + "\n")
+        self._archived_next = seq + 1
+        if len(self._overflow_buffer) >= self.OVERFLOW_BATCH:
+            self._flush_overflow()
+
+    def _flush_overflow(self) -> None:
+        """Write buffered records, rotating segments as they fill."""
+        lines = self._overflow_buffer
+        written = 0
+        while written < len(lines):
+            if self._segment_file is None or self._segment_count >= self.segment_size:
+                if self._segment_file is not None:
+                    self._segment_file.close()
+                if self._segment_count >= self.segment_size:
+                    self._segment_index += 1
+                    self._segment_count = 0
+                self._segment_file = open(self._segment_path(self._segment_index), "a")
+
+            take = min(len(lines) - written, self.segment_size - self._segment_count)
+            self._segment_file.write("".join(lines[written : written + take]))
+            self._segment_count += take
+            written += take
+
+        if self._segment_file is not None:
+            self._segment_file.flush()
+        lines.clear()
+
+    def flush(self) -> None:
+        """Write evicted events still buffered in memory to their segment."""
+        with self._lock:
+            if self._overflow_buffer:
+                self._flush_overflow()
+
+    def spill(self) -> None:
+        """Archive the in-memory window so a restarted chain can continue it."""
+        if self.overflow_dir is None or not self.overflow_dir.exists():
+            return
+        with self._lock:
+            for seq, event in self.since(self._archived_next):
+                self._write_overflow(seq, event)
+            self.flush()
+
+    def _first_record_seq(self, path: Path) -> Optional[int]:
+        """Sequence number of a segment's first record, if it carries one."""
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    seq = json.loads(line).get("seq")
+                    return int(seq) if seq is not None else None
+        return None
+
+    def iter_archived(
+        self, start_seq: int = 0, end_seq: Optional[int] = None
+    ) -> Iterator[BoundaryEvent]:
+        """
+        Iterate events from the overflow segments, oldest first.
+
+        Segments that end before ``start_seq`` are skipped without being
+        read, so resuming from a checkpoint only touches newer segments.
+
+        Args:
+            start_seq: First sequence number wanted
+            end_seq: Stop before this sequence number (default: all archived)
+        """
+        with self._lock:
+            self.flush()
+            paths = self.segment_paths()
+            stop = self._archived_next if end_seq is None else min(end_seq, self._archived_next)
+
+        first = 0
+        if start_seq > 0:
+            for i in range(1, len(paths)):
+                segment_start = self._first_record_seq(paths[i])
+                if segment_start is None or segment_start > start_seq:
+                    break
+                first = i
+
+        seq = 0
+        for record in self._iter_records(paths[first:]):
+            seq = record.get("seq", seq)
+            if seq >= stop:
+                return
+            if seq >= start_seq:
+                yield BoundaryEvent.from_record(record)
+            seq += 1
+
+    def close(self) -> None:
+        """Flush buffered evictions and close the open overflow segment."""
+        with self._lock:
+            if self.overflow_dir is not None and self.overflow_dir.exists():
+                self.flush()
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+        _open_chains.discard(self)
+
+
+# Chains with an overflow directory, archived at interpreter exit
+_open_chains: "weakref.WeakSet[EventChain]" = weakref.WeakSet()
+
+
+def _spill_open_chains() -> None:
+    for chain in list(_open_chains):
+        try:
+            chain.spill()
+            chain.close()
+        except OSError as e:
+            logger.error(f"Failed to archive event chain at exit: {e}")
+
+
+atexit.register(_spill_open_chains)
+
+
+@dataclass
+class ChainCheckpoint:
+    """Signed digest of the event chain up to a sequence number."""
+
+    seq: int
+    event_hash: str  # Hash of the event at ``seq``; commits to all earlier events
+    created_at: datetime
+    signature: Optional[bytes] = None
+
+    def digest(self) -> bytes:
+        """Bytes covered by the checkpoint signature."""
+        return f"checkpoint:{self.seq}:{self.event_hash}".encode()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "event_hash": self.event_hash,
+            "created_at": self.created_at.isoformat(),
+            "signature": self.signature.hex() if self.signature else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChainCheckpoint":
+        return cls(
+            seq=data["seq"],
+            event_hash=data["event_hash"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            signature=bytes.fromhex(data["signature"]) if data.get("signature") else None,
+        )
+
+
+def _verify_signature_batch(public_key: bytes, items: List[Tuple[str, bytes]]) -> int:
+    """
+    Verify (event hash, signature) pairs in a worker process.
+
+    Returns:
+        Index of the first invalid signature, or -1 if all are valid
+    """
+    key = Ed25519PublicKey.from_public_bytes(public_key)
+    for i, (event_hash, signature) in enumerate(items):
+        try:
+            key.verify(signature, event_hash.encode())
+        except Exception:
+            return i
+    return -1
+
 
 @dataclass
 class ModeConstraints:
@@ -648,6 +1119,271 @@ class AccessLog:
         }
 
 
+def _compile_condition(key: str, expected: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Compile one policy condition into a predicate over the request context."""
+    if not isinstance(expected, dict):
+
+        def check_equals(context: Dict[str, Any]) -> bool:
+            if key not in context:
+                return False
+            try:
+                if context[key] != expected:
+                    return False
+            except (TypeError, ValueError) as e:
+                # Fail closed on any comparison error
+                logger.warning(f"Condition evaluation error for '{key}': {e}")
+                return False
+            return True
+
+        return check_equals
+
+    bounds = [(op, expected[op]) for op in ("min", "max") if op in expected]
+    allowed = expected.get("in")
+    denied = expected.get("not_in")
+    has_in, has_not_in = "in" in expected, "not_in" in expected
+
+    def check_range(context: Dict[str, Any]) -> bool:
+        if key not in context:
+            return False
+        actual = context[key]
+        try:
+            for op, bound in bounds:
+                # Type-safe comparison
+                if type(actual) is not type(bound):
+                    logger.warning(
+                        f"Type mismatch in condition '{key}': {type(actual)} vs {type(bound)}"
+                    )
+                    return False
+                if (actual < bound) if op == "min" else (actual > bound):
+                    return False
+            if has_in and actual not in allowed:
+                return False
+            if has_not_in and actual in denied:
+                return False
+        except (TypeError, ValueError) as e:
+            # Fail closed on any comparison error
+            logger.warning(f"Condition evaluation error for '{key}': {e}")
+            return False
+        return True
+
+    return check_range
+
+
+def compile_conditions(conditions: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a policy's condition dict into a single predicate.
+
+    Equivalent to ``AccessPolicy.check_conditions`` but with the condition
+    structure inspected once rather than on every check.
+    """
+    checks = [_compile_condition(key, expected) for key, expected in conditions.items()]
+    if not checks:
+        return lambda context: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda context: all(check(context) for check in checks)
+
+
+@dataclass
+class CompiledPolicy:
+    """Evaluation-ready form of an AccessPolicy."""
+
+    policy_id: str
+    name: str
+    resource_type: ResourceType
+    resource_id: str
+    permissions: int  # Permission bitmask
+    active: bool
+    expires_ts: Optional[float]  # POSIX timestamp, None = never
+    check_conditions: Callable[[Dict[str, Any]], bool]
+
+    @classmethod
+    def from_policy(cls, policy: AccessPolicy) -> "CompiledPolicy":
+        return cls(
+            policy_id=policy.policy_id,
+            name=policy.name,
+            resource_type=policy.resource_type,
+            resource_id=policy.resource_id,
+            permissions=policy.permissions.value,
+            active=policy.active,
+            expires_ts=policy.expires_at.timestamp() if policy.expires_at else None,
+            check_conditions=compile_conditions(policy.conditions),
+        )
+
+    def is_valid_at(self, now: float) -> bool:
+        return self.active and (self.expires_ts is None or now <= self.expires_ts)
+
+
+@dataclass
+class _PolicyBucket:
+    """A principal's policies for one resource type."""
+
+    # (position in principal.policies, policy_id), sorted by position
+    exact: Dict[str, List[Tuple[int, str]]] = field(default_factory=dict)
+    wildcard: List[Tuple[int, str]] = field(default_factory=list)
+    permissions: int = 0  # Union of every policy's permissions
+
+
+class PolicyEngine:
+    """
+    Indexed policy evaluation for BoundaryDaemon.check_access.
+
+    Policies are compiled when created or changed, and each principal's
+    policies are indexed by resource type into an exact-id bucket and a
+    wildcard bucket. A check only visits policies that can apply to the
+    requested resource, in the principal's assignment order, so the first
+    granting policy is the same one a linear scan would find.
+
+    Decisions are cached for a short TTL, keyed on the full request
+    including the context. Any policy, principal or mode change clears
+    the cache.
+    """
+
+    def __init__(self, decision_ttl_seconds: float = 1.0, max_cached_decisions: int = 10000):
+        """
+        Initialize the engine.
+
+        Args:
+            decision_ttl_seconds: How long a decision is reused (0 disables caching)
+            max_cached_decisions: Cache entries kept before evicting the oldest
+        """
+        self.decision_ttl_seconds = decision_ttl_seconds
+        self.max_cached_decisions = max_cached_decisions
+        self._compiled: Dict[str, CompiledPolicy] = {}
+        self._index: Dict[str, Dict[ResourceType, _PolicyBucket]] = {}
+        # request key -> (expiry timestamp, granting policy id or None)
+        self._decisions: "OrderedDict[Tuple, Tuple[float, Optional[str]]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def rebuild(self, policies: Dict[str, AccessPolicy], principals: Dict[str, Principal]) -> None:
+        """Recompile every policy and reindex every principal."""
+        with self._lock:
+            self._compiled = {pid: CompiledPolicy.from_policy(p) for pid, p in policies.items()}
+            self._index = {}
+            for principal in principals.values():
+                self._index_principal(principal)
+            self._decisions.clear()
+
+    def update_policy(self, policy: AccessPolicy, principals: Iterable[Principal] = ()) -> None:
+        """
+        Recompile a created or changed policy.
+
+        Args:
+            policy: The policy
+            principals: Principals holding it, reindexed in case its target changed
+        """
+        with self._lock:
+            self._compiled[policy.policy_id] = CompiledPolicy.from_policy(policy)
+            for principal in principals:
+                self._index_principal(principal)
+            self._decisions.clear()
+
+    def update_principal(self, principal: Principal) -> None:
+        """Reindex a principal after its policy assignments changed."""
+        with self._lock:
+            self._index_principal(principal)
+            self._decisions.clear()
+
+    def invalidate(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._decisions.clear()
+
+    def _index_principal(self, principal: Principal) -> None:
+        buckets: Dict[ResourceType, _PolicyBucket] = {}
+        for position, policy_id in enumerate(principal.policies):
+            compiled = self._compiled.get(policy_id)
+            if compiled is None:
+                continue
+            bucket = buckets.setdefault(compiled.resource_type, _PolicyBucket())
+            entry = (position, policy_id)
+            if compiled.resource_id == "*":
+                bucket.wildcard.append(entry)
+            else:
+                bucket.exact.setdefault(compiled.resource_id, []).append(entry)
+            bucket.permissions |= compiled.permissions
+        self._index[principal.principal_id] = buckets
+
+    def evaluate(
+        self,
+        principal_id: str,
+        resource_type: ResourceType,
+        resource_id: str,
+        permission: Permission,
+        context: Dict[str, Any],
+    ) -> Optional[CompiledPolicy]:
+        """
+        Find the first of a principal's policies granting a permission.
+
+        Returns:
+            The granting policy, or None if access is denied
+        """
+        key: Optional[Tuple] = None
+        now = time.time()
+        if self.decision_ttl_seconds > 0:
+            try:
+                key = (principal_id, resource_type, resource_id, permission.value) + tuple(
+                    sorted(context.items())
+                )
+                hash(key)
+            except TypeError:
+                key = None  # Unhashable context values; evaluate uncached
+
+        with self._lock:
+            if key is not None:
+                cached = self._decisions.get(key)
+                if cached is not None and cached[0] > now:
+                    self.cache_hits += 1
+                    policy_id = cached[1]
+                    return self._compiled.get(policy_id) if policy_id else None
+                self.cache_misses += 1
+
+            granted = self._evaluate(
+                principal_id, resource_type, resource_id, permission, context, now
+            )
+
+            if key is not None:
+                expires = now + self.decision_ttl_seconds
+                if granted is not None and granted.expires_ts is not None:
+                    expires = min(expires, granted.expires_ts)
+                self._decisions[key] = (expires, granted.policy_id if granted else None)
+                if len(self._decisions) > self.max_cached_decisions:
+                    self._decisions.popitem(last=False)
+
+            return granted
+
+    def _evaluate(
+        self,
+        principal_id: str,
+        resource_type: ResourceType,
+        resource_id: str,
+        permission: Permission,
+        context: Dict[str, Any],
+        now: float,
+    ) -> Optional[CompiledPolicy]:
+        bucket = self._index.get(principal_id, {}).get(resource_type)
+        wanted = permission.value
+        if bucket is None or not (bucket.permissions & wanted):
+            return None
+
+        exact = bucket.exact.get(resource_id)
+        candidates: Iterable[Tuple[int, str]] = (
+            heapq.merge(exact, bucket.wildcard) if exact else bucket.wildcard
+        )
+        for _, policy_id in candidates:
+            compiled = self._compiled.get(policy_id)
+            if compiled is None or not compiled.is_valid_at(now):
+                continue
+            if not (compiled.permissions & wanted):
+                continue
+            if not compiled.check_conditions(context):
+                continue
+            return compiled
+        return None
+
+
 class DaemonConnection:
     """
     Connection manager for external Boundary-Daemon (Agent Smith) service.
@@ -968,9 +1704,25 @@ class EventSigner:
         if not self._public_key or not signature:
             return False
 
+        return self.verify_hash(event.compute_hash(), signature)
+
+    def verify_hash(self, event_hash: str, signature: bytes) -> bool:
+        """Verify a signature over an already computed event hash."""
+        return self.verify_bytes(event_hash.encode(), signature)
+
+    def sign_bytes(self, data: bytes) -> bytes:
+        """Sign arbitrary bytes (e.g. a chain checkpoint digest)."""
+        if not self._private_key:
+            return b""
+        return self._private_key.sign(data)
+
+    def verify_bytes(self, data: bytes, signature: bytes) -> bool:
+        """Verify a signature over arbitrary bytes."""
+        if not self._public_key or not signature:
+            return False
+
         try:
-            event_hash = event.compute_hash()
-            self._public_key.verify(signature, event_hash.encode())
+            self._public_key.verify(signature, data)
             return True
         except Exception:
             return False
@@ -994,12 +1746,18 @@ class BoundaryDaemon:
         external_daemon: Optional[DaemonConnection] = None,
         enable_siem_forwarding: bool = False,
         siem_callback: Optional[Callable[[BoundaryEvent], None]] = None,
+        max_events_in_memory: int = 10000,
+        checkpoint_interval: int = 1000,
+        decision_cache_ttl: float = 1.0,
     ):
         self.data_dir = data_dir or Path("data/permissions")
         self.policies: Dict[str, AccessPolicy] = {}
         self.principals: Dict[str, Principal] = {}
         self.tokens: Dict[str, AccessToken] = {}
-        self.access_logs: List[AccessLog] = []
+        self.access_logs: Deque[AccessLog] = deque(maxlen=1000)
+
+        # Compiled, indexed policies for check_access
+        self._policy_engine = PolicyEngine(decision_ttl_seconds=decision_cache_ttl)
 
         # External daemon connection
         self._external_daemon = external_daemon
@@ -1012,9 +1770,22 @@ class BoundaryDaemon:
         self._current_mode = BoundaryMode.RESTRICTED
         self._mode_constraints = ModeConstraints.for_mode(self._current_mode)
 
-        # Event chain for audit trail
-        self._event_chain: List[BoundaryEvent] = []
-        self._last_event_hash: Optional[str] = None
+        # Event chain for audit trail; evicted events spill to disk when
+        # a data_dir is configured
+        self._event_chain = EventChain(
+            capacity=max_events_in_memory,
+            overflow_dir=self.data_dir / "events" if data_dir else None,
+        )
+        # Continue the chain archived by a previous process, if any
+        self._last_event_hash: Optional[str] = self._event_chain.anchor_hash
+
+        # Incremental verification: events up to the watermark are trusted,
+        # with a signed checkpoint every checkpoint_interval events
+        self._checkpoint_interval = checkpoint_interval
+        self._verified_seq = -1
+        self._verified_hash: Optional[str] = None
+        self._checkpoints: Deque[ChainCheckpoint] = deque(maxlen=100)
+        self._verify_lock = threading.Lock()
 
         # SIEM forwarding
         self._enable_siem = enable_siem_forwarding
@@ -1028,6 +1799,9 @@ class BoundaryDaemon:
         signing_key = self._load_or_generate_signing_key()
         self._event_signer = EventSigner(private_key=signing_key)
 
+        # Resume the verification watermark from the last signed checkpoint
+        self._load_checkpoints()
+
     def _load_or_generate_signing_key(self) -> Optional[bytes]:
         """
         Load signing key from disk or generate and save a new one.
@@ -1107,6 +1881,7 @@ class BoundaryDaemon:
         old_mode = self._current_mode
         self._current_mode = mode
         self._mode_constraints = ModeConstraints.for_mode(mode)
+        self._policy_engine.invalidate()
 
         # Log mode transition
         self._create_event(
@@ -1135,6 +1910,7 @@ class BoundaryDaemon:
 
         self._current_mode = BoundaryMode.LOCKDOWN
         self._mode_constraints = ModeConstraints.for_mode(BoundaryMode.LOCKDOWN)
+        self._policy_engine.invalidate()
         logger.critical(f"LOCKDOWN triggered: {reason}")
 
     def check_mode_constraint(
@@ -1238,10 +2014,6 @@ class BoundaryDaemon:
         self._last_event_hash = event.compute_hash()
         self._event_chain.append(event)
 
-        # Keep only last 10000 events in memory
-        if len(self._event_chain) > 10000:
-            self._event_chain = self._event_chain[-10000:]
-
         # Forward to external daemon if connected
         if self._use_external and self._external_daemon:
             self._external_daemon.submit_event(event)
@@ -1272,38 +2044,229 @@ class BoundaryDaemon:
         Returns:
             List of events (newest first)
         """
-        events = list(reversed(self._event_chain))
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        if severity_min:
-            events = [e for e in events if e.severity.value >= severity_min.value]
+        return self._event_chain.newest(
+            limit=limit,
+            event_type=event_type or None,
+            severity_min=severity_min or None,
+        )
 
-        return events[:limit]
+    # Below this many signatures, a process pool costs more than it saves
+    PARALLEL_VERIFY_MIN = 256
 
-    def verify_event_chain(self) -> Tuple[bool, str]:
+    def verify_event_chain(
+        self,
+        include_archived: bool = False,
+        full: bool = False,
+        workers: Optional[int] = None,
+    ) -> Tuple[bool, str]:
         """
         Verify integrity of the event chain.
 
+        Verification is incremental: events up to the last verified
+        watermark are not re-hashed, so a call only checks events appended
+        since the previous one. A signed checkpoint is recorded every
+        ``checkpoint_interval`` verified events and persisted next to the
+        overflow segments; on startup the watermark resumes from the last
+        checkpoint whose signature verifies.
+
+        Args:
+            include_archived: Also verify events spilled to disk after the
+                newest signed checkpoint (the whole archive when ``full``)
+            full: Re-verify the whole in-memory window and its checkpoints
+            workers: Verify signatures across this many processes
+
         Returns:
             Tuple of (valid, message)
         """
-        if not self._event_chain:
+        chain = self._event_chain
+        with self._verify_lock:
+            # Snapshot the window and the hash it must link to atomically
+            with chain._lock:
+                if include_archived or full or self._verified_seq < chain.first_seq - 1:
+                    # Start from the window; the first in-memory event
+                    # links to the last evicted one
+                    start = chain.first_seq
+                    expected_prev_hash = chain.anchor_hash
+                else:
+                    start = self._verified_seq + 1
+                    expected_prev_hash = self._verified_hash
+                pending = chain.since(start)
+                total = len(chain)
+
+            archived_count = 0
+            if include_archived:
+                # Archived events up to a signed checkpoint are trusted; the
+                # first one after it must link to the checkpointed hash
+                checkpoint = None if full else self._checkpoint_before(start)
+                archive_start = checkpoint.seq + 1 if checkpoint else 0
+                # Events evicted after the snapshot are already in pending
+                archived = list(chain.iter_archived(start_seq=archive_start, end_seq=start))
+                valid, message, archived_hash = self._verify_events(
+                    archived, checkpoint.event_hash if checkpoint else None, workers
+                )
+                if not valid:
+                    return False, message
+                archived_count = archive_start + len(archived)
+                expected_prev_hash = archived_hash or expected_prev_hash
+
+            valid, message, last_hash = self._verify_events(
+                [event for _, event in pending], expected_prev_hash, workers
+            )
+            if not valid:
+                return False, message
+
+            if (include_archived or full) and not self._verify_checkpoints():
+                return False, "Checkpoint does not match event chain"
+
+            if pending:
+                self._verified_seq = pending[-1][0]
+                self._verified_hash = last_hash
+                self._maybe_checkpoint()
+
+        count = archived_count + total
+        if count == 0:
             return True, "Empty chain"
+        return True, f"Chain valid ({count} events)"
+
+    def _verify_events(
+        self,
+        events: List[BoundaryEvent],
+        expected_prev_hash: Optional[str],
+        workers: Optional[int] = None,
+    ) -> Tuple[bool, str, Optional[str]]:
+        """
+        Check hash links and signatures for consecutive events.
+
+        Returns:
+            Tuple of (valid, message, hash of the last event)
+        """
+        # Hash links are inherently sequential
+        hashes: List[str] = []
+        broken_at = len(events)
+        for i, event in enumerate(events):
+            if (i > 0 or expected_prev_hash is not None) and (
+                event.previous_hash != expected_prev_hash
+            ):
+                broken_at = i
+                break
+            expected_prev_hash = event.compute_hash()
+            hashes.append(expected_prev_hash)
 
-        for i, event in enumerate(self._event_chain):
-            # Verify hash chain
-            if i > 0:
-                expected_prev_hash = self._event_chain[i - 1].compute_hash()
-                if event.previous_hash != expected_prev_hash:
-                    return False, f"Hash chain broken at event {event.event_id}"
+        # Signatures are independent and can be checked in bulk
+        signed = [i for i in range(broken_at) if events[i].signature]
+        bad = self._first_bad_signature(
+            [(hashes[i], events[i].signature) for i in signed], workers  # type: ignore[misc]
+        )
+        if bad >= 0:
+            return False, f"Invalid signature on event {events[signed[bad]].event_id}", None
+        if broken_at < len(events):
+            return False, f"Hash chain broken at event {events[broken_at].event_id}", None
+
+        return True, "", expected_prev_hash
+
+    def _first_bad_signature(
+        self, items: List[Tuple[str, bytes]], workers: Optional[int] = None
+    ) -> int:
+        """Index of the first invalid (hash, signature) pair, or -1."""
+        public_key = self._event_signer.public_key_bytes
+        if workers and workers > 1 and public_key and len(items) >= self.PARALLEL_VERIFY_MIN:
+            chunk_size = -(-len(items) // workers)
+            chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_verify_signature_batch, [public_key] * len(chunks), chunks)
+                for n, bad in enumerate(results):
+                    if bad >= 0:
+                        return n * chunk_size + bad
+            return -1
+
+        for i, (event_hash, signature) in enumerate(items):
+            if not self._event_signer.verify_hash(event_hash, signature):
+                return i
+        return -1
+
+    def _maybe_checkpoint(self) -> None:
+        """Sign a checkpoint at the watermark once enough events are verified."""
+        last = self._checkpoints[-1].seq if self._checkpoints else -1
+        if self._verified_seq - last < self._checkpoint_interval:
+            return
 
-            # Verify signature
-            if event.signature and not self._event_signer.verify_signature(event, event.signature):
-                return False, f"Invalid signature on event {event.event_id}"
+        checkpoint = ChainCheckpoint(
+            seq=self._verified_seq,
+            event_hash=self._verified_hash,  # type: ignore[arg-type]
+            created_at=datetime.now(),
+        )
+        checkpoint.signature = self._event_signer.sign_bytes(checkpoint.digest())
+        self._checkpoints.append(checkpoint)
+
+        path = self._checkpoint_path()
+        if path:
+            with open(path, "a") as f:
+                f.write(json.dumps(checkpoint.to_dict()) + "\n")
+
+    def _verify_checkpoints(self) -> bool:
+        """Check in-memory checkpoints against their signatures and events."""
+        for checkpoint in self._checkpoints:
+            if checkpoint.signature and not self._event_signer.verify_bytes(
+                checkpoint.digest(), checkpoint.signature
+            ):
+                return False
+            event = self._event_chain.get(checkpoint.seq)
+            if event is not None and event.compute_hash() != checkpoint.event_hash:
+                return False
+        return True
+
+    def close(self) -> None:
+        """Archive the in-memory event window and close the overflow segment."""
+        self._event_chain.spill()
+        self._event_chain.close()
+
+    def _checkpoint_before(self, seq: int) -> Optional[ChainCheckpoint]:
+        """Newest signed checkpoint below a sequence number."""
+        for checkpoint in reversed(self._checkpoints):
+            if checkpoint.seq < seq and checkpoint.signature:
+                return checkpoint
+        return None
+
+    def _load_checkpoints(self) -> None:
+        """Load persisted checkpoints, keeping those up to the first invalid one."""
+        path = self._checkpoint_path()
+        if path is None or not path.exists():
+            return
+
+        next_seq = self._event_chain.next_seq
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    checkpoint = ChainCheckpoint.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Unreadable chain checkpoint, ignoring the rest: {e}")
+                    break
+                if checkpoint.seq >= next_seq or not (
+                    checkpoint.signature
+                    and self._event_signer.verify_bytes(checkpoint.digest(), checkpoint.signature)
+                ):
+                    logger.warning(
+                        f"Chain checkpoint at {checkpoint.seq} failed verification, "
+                        "ignoring the rest"
+                    )
+                    break
+                self._checkpoints.append(checkpoint)
 
-        return True, f"Chain valid ({len(self._event_chain)} events)"
+        if self._checkpoints:
+            last = self._checkpoints[-1]
+            self._verified_seq = last.seq
+            self._verified_hash = last.event_hash
+
+    def get_checkpoints(self) -> List[ChainCheckpoint]:
+        """Get recent signed chain checkpoints, oldest first."""
+        return list(self._checkpoints)
+
+    def _checkpoint_path(self) -> Optional[Path]:
+        if self._event_chain.overflow_dir is None:
+            return None
+        return self._event_chain.overflow_dir / "checkpoints.jsonl"
 
     def export_events_cef(self, limit: int = 1000) -> List[str]:
         """Export events in CEF format for SIEM ingestion."""
@@ -1342,6 +2305,7 @@ class BoundaryDaemon:
         )
 
         self.policies[policy.policy_id] = policy
+        self._policy_engine.update_policy(policy)
         self._save_state()
 
         return policy
@@ -1356,10 +2320,20 @@ class BoundaryDaemon:
             raise ValueError(f"Policy not found: {policy_id}")
 
         policy.active = False
+        self.refresh_policy(policy_id)
         self._save_state()
 
         return policy
 
+    def refresh_policy(self, policy_id: str) -> None:
+        """Recompile a policy after modifying it in place."""
+        policy = self.policies.get(policy_id)
+        if not policy:
+            raise ValueError(f"Policy not found: {policy_id}")
+
+        holders = [p for p in self.principals.values() if policy_id in p.policies]
+        self._policy_engine.update_policy(policy, holders)
+
     def list_policies(
         self, resource_type: Optional[ResourceType] = None, active_only: bool = True
     ) -> List[AccessPolicy]:
@@ -1390,6 +2364,7 @@ class BoundaryDaemon:
         )
 
         self.principals[principal.principal_id] = principal
+        self._policy_engine.update_principal(principal)
         self._save_state()
 
         return principal
@@ -1417,6 +2392,7 @@ class BoundaryDaemon:
 
         if policy_id not in principal.policies:
             principal.policies.append(policy_id)
+            self._policy_engine.update_principal(principal)
             self._save_state()
 
         return principal
@@ -1429,6 +2405,7 @@ class BoundaryDaemon:
 
         if policy_id in principal.policies:
             principal.policies.remove(policy_id)
+            self._policy_engine.update_principal(principal)
             self._save_state()
 
         return principal
@@ -1531,25 +2508,11 @@ class BoundaryDaemon:
             )
             return False, reason
 
-        # Check each policy assigned to the principal
-        for policy_id in principal.policies:
-            policy = self.policies.get(policy_id)
-            if not policy or not policy.is_valid:
-                continue
-
-            # Check if policy applies to this resource
-            if not policy.matches_resource(resource_type, resource_id):
-                continue
-
-            # Check if policy grants the required permission
-            if not (policy.permissions & permission):
-                continue
-
-            # Check conditions
-            if not policy.check_conditions(context):
-                continue
-
-            # Access granted
+        # First valid, matching policy in assignment order grants access
+        policy = self._policy_engine.evaluate(
+            principal_id, resource_type, resource_id, permission, context
+        )
+        if policy is not None:
             reason = f"Granted by policy: {policy.name}"
             self._log_access(
                 principal_id, resource_type, resource_id, permission, True, reason, context
@@ -1606,11 +2569,7 @@ class BoundaryDaemon:
             reason=reason,
             context=context,
         )
-        self.access_logs.append(log)
-
-        # Keep only last 1000 logs in memory
-        if len(self.access_logs) > 1000:
-            self.access_logs = self.access_logs[-1000:]
+        self.access_logs.append(log)  # Bounded to the last 1000 entries
 
     # =========================================================================
     # Convenience Methods
@@ -1716,6 +2675,7 @@ class BoundaryDaemon:
             self.tokens = {
                 tid: AccessToken.from_dict(t) for tid, t in state.get("tokens", {}).items()
             }
+            self._policy_engine.rebuild(self.policies, self.principals)
 
             logger.info(
                 f"Loaded state: {len(self.policies)} policies, "
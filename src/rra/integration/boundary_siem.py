@@ -17,7 +17,8 @@ This module supports:
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable, Set
+from typing import BinaryIO, Deque, Dict, List, Optional, Any, Callable, Set, Tuple
+from collections import deque
 from pathlib import Path
 import json
 import logging
@@ -26,11 +27,15 @@ import time
 import socket
 import os
 import re
+import gzip
+import http.client
+import ssl
+import struct
+import zlib
 
 from rra.integration.boundary_daemon import (
     BoundaryEvent,
     EventSeverity,
-    BoundaryMode,
 )
 
 logger = logging.getLogger(__name__)
@@ -165,6 +170,8 @@ class SIEMConfig:
     retry_delay_seconds: float = 1.0
     connect_timeout_seconds: float = 10.0
     read_timeout_seconds: float = 30.0
+    http_gzip: bool = False  # gzip-encode JSON HTTP request bodies
+    syslog_octet_counting: bool = True  # RFC 6587 framing for TCP syslog
 
     # Event filtering
     min_severity: EventSeverity = EventSeverity.INFO
@@ -242,50 +249,188 @@ class EventBuffer:
             return len(self._buffer)
 
 
+# Disk positions are (segment index, byte offset of frame, events already
+# consumed from that frame)
+_QueuePosition = Tuple[int, int, int]
+
+
+@dataclass
+class _Lease:
+    """A batch handed out by get_batch and not yet acknowledged."""
+
+    event_ids: List[str]
+    memory_events: List[BoundaryEvent]
+    disk_start: _QueuePosition
+    disk_end: _QueuePosition
+    disk_count: int
+
+
 class PersistentEventQueue:
     """
     Persistent event queue that spills to disk when memory buffer is full.
 
     Prevents event loss during SIEM outages or high event volume.
+
+    The disk queue is a series of fixed-size segment files of CRC-checked
+    frames, each frame holding a batch of events. A persisted cursor marks
+    the oldest unacknowledged event, so draining never rewrites files;
+    fully consumed segments are deleted. Delivery is two-phase:
+    ``get_batch`` leases events and ``acknowledge`` commits the cursor,
+    while ``requeue`` (or a crash) rewinds to the last commit. Delivery is
+    at-least-once: requeueing a batch also redelivers batches leased after
+    it.
+
+    Once a backlog exists, new events are appended behind it so delivery
+    stays FIFO.
     """
 
+    SEGMENT_PREFIX = "segment-"
+    SEGMENT_SUFFIX = ".q"
+    CURSOR_FILE = "cursor.json"
+    LEGACY_QUEUE_FILE = "pending_events.jsonl"
+    _FRAME_HEADER = struct.Struct(">III")  # payload length, crc32, event count
+
     def __init__(
         self,
         data_dir: Optional[Path] = None,
         memory_limit: int = 1000,
         disk_limit: int = 100000,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        spill_batch_size: int = 256,
+        fsync: bool = False,
     ):
+        """
+        Initialize the queue.
+
+        Args:
+            data_dir: Directory for segment files and the cursor
+            memory_limit: Events held in memory before spilling to disk
+            disk_limit: Maximum unacknowledged events on disk
+            segment_max_bytes: Segment size at which a new file is started
+            spill_batch_size: Events buffered per disk frame
+            fsync: fsync frames and cursor updates (durable across power loss)
+        """
         self.data_dir = data_dir or Path("data/siem_queue")
         self.memory_limit = memory_limit
         self.disk_limit = disk_limit
-        self._memory_buffer: List[BoundaryEvent] = []
+        self.segment_max_bytes = segment_max_bytes
+        self.spill_batch_size = max(1, spill_batch_size)
+        self.fsync = fsync
+
+        self._memory_buffer: Deque[BoundaryEvent] = deque()
+        self._spill: List[BoundaryEvent] = []  # Waiting to be framed onto disk
+        self._leases: Deque[_Lease] = deque()
         self._lock = threading.Lock()
-        self._disk_queue_file: Optional[Path] = None
-        self._disk_event_count = 0
+
+        self._committed: _QueuePosition = (0, 0, 0)
+        self._read_pos: _QueuePosition = (0, 0, 0)
+        self._write_segment = 0
+        self._write_offset = 0
+        self._write_file: Optional[BinaryIO] = None
+        self._reader: Optional[Tuple[int, BinaryIO]] = None
+        self._frame_cache: Optional[
+            Tuple[Tuple[int, int], Tuple[List[BoundaryEvent], int, int]]
+        ] = None
+        self._disk_event_count = 0  # Unacknowledged events on disk
+        self._disk_unread = 0  # Disk events not yet leased
 
         # Create data directory if needed
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self._disk_queue_file = self.data_dir / "pending_events.jsonl"
 
-        # Load any existing events from disk on startup
+        # Recover the queue from disk on startup
         self._load_from_disk()
 
-    def _load_from_disk(self) -> None:
-        """Load pending events from disk on startup."""
-        if not self._disk_queue_file or not self._disk_queue_file.exists():
-            return
+    # =========================================================================
+    # Startup
+    # =========================================================================
 
+    def _segment_path(self, index: int) -> Path:
+        return self.data_dir / f"{self.SEGMENT_PREFIX}{index:010d}{self.SEGMENT_SUFFIX}"
+
+    def _segment_indexes(self) -> List[int]:
+        prefix = len(self.SEGMENT_PREFIX)
+        return sorted(
+            int(p.name[prefix : -len(self.SEGMENT_SUFFIX)])
+            for p in self.data_dir.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}")
+        )
+
+    def _load_from_disk(self) -> None:
+        """Recover the cursor and count pending events from segment headers."""
         try:
-            with open(self._disk_queue_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        self._disk_event_count += 1
+            cursor_file = self.data_dir / self.CURSOR_FILE
+            segments = self._segment_indexes()
+            if cursor_file.exists():
+                data = json.loads(cursor_file.read_text())
+                self._committed = (data["segment"], data["offset"], data["skip"])
+            elif segments:
+                self._committed = (segments[0], 0, 0)
+
+            committed_segment, committed_offset, skip = self._committed
+            for index in segments:
+                if index < committed_segment:
+                    self._segment_path(index).unlink()
+                    continue
+                start = committed_offset if index == committed_segment else 0
+                self._disk_event_count += self._scan_segment(index, start)
+            self._disk_event_count -= skip if segments else 0
+
+            self._read_pos = self._committed
+            self._write_segment = max(segments[-1] if segments else 0, committed_segment)
+            self._open_writer()
+            self._disk_unread = self._disk_event_count
+
+            self._migrate_legacy_queue()
 
             if self._disk_event_count > 0:
                 logger.info(f"Loaded {self._disk_event_count} pending events from disk queue")
         except Exception as e:
             logger.error(f"Failed to load disk queue: {e}")
 
+    def _scan_segment(self, index: int, start: int) -> int:
+        """Count events in a segment, truncating a torn final frame."""
+        path = self._segment_path(index)
+        size = path.stat().st_size
+        count = 0
+        offset = 0
+        with open(path, "rb") as f:
+            while offset + self._FRAME_HEADER.size <= size:
+                f.seek(offset)
+                length, _, events = self._FRAME_HEADER.unpack(f.read(self._FRAME_HEADER.size))
+                end = offset + self._FRAME_HEADER.size + length
+                if end > size:
+                    break
+                if offset >= start:
+                    count += events
+                offset = end
+
+        if offset < size:
+            logger.warning(f"Truncating incomplete frame at {path}:{offset}")
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return count
+
+    def _migrate_legacy_queue(self) -> None:
+        """Import events from the single-file queue used by earlier versions."""
+        legacy = self.data_dir / self.LEGACY_QUEUE_FILE
+        if not legacy.exists():
+            return
+
+        events = []
+        with open(legacy, "r") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        events.append(BoundaryEvent.from_record(json.loads(line)))
+                    except Exception as e:
+                        logger.warning(f"Failed to parse disk event: {e}")
+        if events:
+            self._write_frame(events)
+        legacy.unlink()
+
+    # =========================================================================
+    # Enqueue
+    # =========================================================================
+
     def add(self, event: BoundaryEvent) -> bool:
         """
         Add event to queue. Returns True if added, False if queue is full.
@@ -293,127 +438,264 @@ class PersistentEventQueue:
         Events are first added to memory. When memory is full, they spill to disk.
         """
         with self._lock:
-            # Try memory buffer first
-            if len(self._memory_buffer) < self.memory_limit:
+            backlog = self._disk_event_count > 0 or self._spill
+            if not backlog and len(self._memory_buffer) < self.memory_limit:
                 self._memory_buffer.append(event)
                 return True
 
             # Spill to disk
-            if self._disk_event_count >= self.disk_limit:
+            if self._disk_event_count + len(self._spill) >= self.disk_limit:
                 logger.warning("Persistent event queue full - event dropped")
                 return False
 
-            return self._write_to_disk(event)
+            self._spill.append(event)
+            if len(self._spill) >= self.spill_batch_size:
+                return self._flush_spill()
+            return True
+
+    def flush(self) -> None:
+        """Write buffered spill events to disk."""
+        with self._lock:
+            self._flush_spill()
 
-    def _write_to_disk(self, event: BoundaryEvent) -> bool:
-        """Write event to disk queue."""
-        if not self._disk_queue_file:
+    def _flush_spill(self) -> bool:
+        if not self._spill:
+            return True
+        if not self._write_frame(self._spill):
             return False
+        self._spill = []
+        return True
 
+    def _open_writer(self) -> None:
+        path = self._segment_path(self._write_segment)
+        self._write_file = open(path, "ab")
+        self._write_offset = self._write_file.tell()
+
+    def _write_frame(self, events: List[BoundaryEvent]) -> bool:
+        """Append one frame holding a batch of events."""
         try:
-            with open(self._disk_queue_file, "a") as f:
-                f.write(json.dumps(event.to_json()) + "\n")
-            self._disk_event_count += 1
+            if self._write_file is None:
+                self._open_writer()
+            elif self._write_offset >= self.segment_max_bytes:
+                self._write_file.close()
+                self._write_segment += 1
+                self._open_writer()
+
+            payload = "\n".join(event.to_record_line() for event in events).encode()
+            header = self._FRAME_HEADER.pack(len(payload), zlib.crc32(payload), len(events))
+            self._write_file.write(header + payload)  # type: ignore[union-attr]
+            self._write_file.flush()  # type: ignore[union-attr]
+            if self.fsync:
+                os.fsync(self._write_file.fileno())  # type: ignore[union-attr]
+
+            self._write_offset += len(header) + len(payload)
+            self._disk_event_count += len(events)
+            self._disk_unread += len(events)
             return True
         except Exception as e:
-            logger.error(f"Failed to write event to disk: {e}")
+            logger.error(f"Failed to write events to disk: {e}")
             return False
 
+    # =========================================================================
+    # Dequeue
+    # =========================================================================
+
     def get_batch(self, batch_size: int = 100) -> List[BoundaryEvent]:
         """
-        Get a batch of events for sending.
+        Lease a batch of events for sending.
 
-        Prioritizes memory events, then reads from disk.
+        Prioritizes memory events, then reads from disk. The batch must be
+        passed to ``acknowledge`` once sent or to ``requeue`` on failure.
         """
-        events: List[BoundaryEvent] = []
-
         with self._lock:
-            # Get from memory first
-            if self._memory_buffer:
-                events = self._memory_buffer[:batch_size]
-                self._memory_buffer = self._memory_buffer[batch_size:]
-                remaining = batch_size - len(events)
-            else:
-                remaining = batch_size
+            memory_events: List[BoundaryEvent] = []
+            while self._memory_buffer and len(memory_events) < batch_size:
+                memory_events.append(self._memory_buffer.popleft())
 
-            # If we need more, read from disk
-            if remaining > 0 and self._disk_event_count > 0:
+            remaining = batch_size - len(memory_events)
+            if remaining > 0 and self._spill and self._disk_unread < remaining:
+                self._flush_spill()
+
+            disk_start = self._read_pos
+            disk_events: List[BoundaryEvent] = []
+            if remaining > 0 and self._disk_unread > 0:
                 disk_events = self._read_from_disk(remaining)
-                events.extend(disk_events)
 
-        return events
+            events = memory_events + disk_events
+            if events:
+                self._leases.append(
+                    _Lease(
+                        event_ids=[e.event_id for e in events],
+                        memory_events=memory_events,
+                        disk_start=disk_start,
+                        disk_end=self._read_pos,
+                        disk_count=len(disk_events),
+                    )
+                )
+            return events
 
     def _read_from_disk(self, count: int) -> List[BoundaryEvent]:
-        """Read events from disk queue."""
-        if not self._disk_queue_file or not self._disk_queue_file.exists():
-            return []
-
+        """Read events forward from the read cursor."""
         events: List[BoundaryEvent] = []
-        remaining_lines: List[str] = []
+        segment, offset, skip = self._read_pos
+        consumed = 0
 
         try:
-            with open(self._disk_queue_file, "r") as f:
-                lines = f.readlines()
+            while consumed < count and consumed < self._disk_unread:
+                frame = self._read_frame(segment, offset)
+                if frame is None:
+                    if segment >= self._write_segment:
+                        break
+                    segment, offset, skip = segment + 1, 0, 0
+                    continue
+
+                frame_events, frame_count, next_offset = frame
+                take = min(frame_count - skip, count - consumed)
+                events.extend(frame_events[skip : skip + take])
+                consumed += take
+                skip += take
+                if skip >= frame_count:
+                    offset, skip = next_offset, 0
+        except Exception as e:
+            logger.error(f"Failed to read from disk queue: {e}")
 
-            for i, line in enumerate(lines):
-                if i < count and line.strip():
-                    try:
-                        data = json.loads(line.strip())
-                        event = BoundaryEvent(
-                            event_id=data["event_id"],
-                            timestamp=datetime.fromisoformat(data["timestamp"]),
-                            event_type=data["event_type"],
-                            source=data["source"],
-                            action=data["action"],
-                            outcome=data["outcome"],
-                            severity=EventSeverity[data["severity"]],
-                            mode=BoundaryMode(data["mode"]),
-                            principal_id=data.get("principal_id"),
-                            resource_type=data.get("resource_type"),
-                            resource_id=data.get("resource_id"),
-                            context=data.get("context", {}),
-                            previous_hash=data.get("previous_hash"),
-                        )
-                        events.append(event)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse disk event: {e}")
-                else:
-                    remaining_lines.append(line)
+        self._read_pos = (segment, offset, skip)
+        self._disk_unread -= consumed
+        return events
 
-            # Rewrite file with remaining lines
-            with open(self._disk_queue_file, "w") as f:
-                f.writelines(remaining_lines)
+    def _read_frame(
+        self, segment: int, offset: int
+    ) -> Optional[Tuple[List[BoundaryEvent], int, int]]:
+        """
+        Decode the frame at a position.
 
-            self._disk_event_count = len(remaining_lines)
+        Returns:
+            (events, event count from the header, offset of the next frame),
+            or None at the end of the segment
+        """
+        if self._frame_cache and self._frame_cache[0] == (segment, offset):
+            return self._frame_cache[1]
+
+        if self._reader is None or self._reader[0] != segment:
+            self._close_reader()
+            self._reader = (segment, open(self._segment_path(segment), "rb"))
+        f = self._reader[1]
+
+        f.seek(offset)
+        header = f.read(self._FRAME_HEADER.size)
+        if len(header) < self._FRAME_HEADER.size:
+            return None
+        length, crc, frame_count = self._FRAME_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return None
+
+        # Positions count header events, so unparseable records are
+        # skipped without shifting the cursor
+        events: List[BoundaryEvent] = []
+        if zlib.crc32(payload) != crc:
+            logger.warning(f"Corrupt frame in {self._segment_path(segment)} at {offset}, skipping")
+        else:
+            for line in payload.split(b"\n"):
+                try:
+                    events.append(BoundaryEvent.from_record(json.loads(line)))
+                except Exception as e:
+                    logger.warning(f"Failed to parse disk event: {e}")
 
-        except Exception as e:
-            logger.error(f"Failed to read from disk queue: {e}")
+        frame = (events, frame_count, offset + len(header) + length)
+        self._frame_cache = ((segment, offset), frame)
+        return frame
 
-        return events
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            self._reader[1].close()
+            self._reader = None
+
+    # =========================================================================
+    # Acknowledgement
+    # =========================================================================
+
+    def _find_lease(self, events: List[BoundaryEvent]) -> Optional[int]:
+        event_ids = [e.event_id for e in events]
+        for i, lease in enumerate(self._leases):
+            if lease.event_ids == event_ids:
+                return i
+        return None
 
     def acknowledge(self, events: List[BoundaryEvent]) -> None:
         """
         Acknowledge that events were successfully sent.
 
-        In the current implementation, events are removed when get_batch is called,
-        so this is a no-op. Future versions may implement two-phase commit.
+        Commits the disk cursor past the batch (and any batches leased
+        before it) and deletes fully consumed segments.
         """
+        with self._lock:
+            index = self._find_lease(events)
+            if index is None:
+                return
+
+            committed = 0
+            for _ in range(index + 1):
+                lease = self._leases.popleft()
+                committed += lease.disk_count
+            self._disk_event_count -= committed
+            if committed:
+                self._commit(lease.disk_end)
+
+    def _commit(self, position: _QueuePosition) -> None:
+        """Persist the cursor and drop segments behind it."""
+        old_segment = self._committed[0]
+        self._committed = position
+        segment, offset, skip = position
+
+        cursor_file = self.data_dir / self.CURSOR_FILE
+        tmp = cursor_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"segment": segment, "offset": offset, "skip": skip}, f)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, cursor_file)
+
+        for index in range(old_segment, segment):
+            if self._reader is not None and self._reader[0] == index:
+                self._close_reader()
+            try:
+                self._segment_path(index).unlink()
+            except FileNotFoundError:
+                pass
 
     def requeue(self, events: List[BoundaryEvent]) -> None:
-        """Requeue events that failed to send."""
+        """
+        Requeue events that failed to send.
+
+        Rewinds the disk cursor to the start of the batch; batches leased
+        after it are redelivered too.
+        """
         with self._lock:
-            # Add back to front of memory buffer
-            self._memory_buffer = events + self._memory_buffer
+            index = self._find_lease(events)
+            if index is None:
+                # Not leased from this queue; add back to front of memory buffer
+                self._memory_buffer.extendleft(reversed(events))
+                return
 
-            # If memory overflows, spill excess to disk
-            while len(self._memory_buffer) > self.memory_limit:
-                event = self._memory_buffer.pop()
-                self._write_to_disk(event)
+            rewound = list(self._leases)[index:]
+            for _ in rewound:
+                self._leases.pop()
+
+            memory_events = [e for lease in rewound for e in lease.memory_events]
+            self._memory_buffer.extendleft(reversed(memory_events))
+            self._read_pos = rewound[0].disk_start
+            self._disk_unread += sum(lease.disk_count for lease in rewound)
+
+    # =========================================================================
+    # Introspection
+    # =========================================================================
 
     def size(self) -> int:
-        """Get total queue size (memory + disk)."""
+        """Get number of events waiting to be sent (memory + disk)."""
         with self._lock:
-            return len(self._memory_buffer) + self._disk_event_count
+            return len(self._memory_buffer) + len(self._spill) + self._disk_unread
 
     def memory_size(self) -> int:
         """Get memory buffer size."""
@@ -421,35 +703,234 @@ class PersistentEventQueue:
             return len(self._memory_buffer)
 
     def disk_size(self) -> int:
-        """Get disk queue size."""
+        """Get number of waiting events on (or bound for) disk."""
         with self._lock:
-            return self._disk_event_count
+            return len(self._spill) + self._disk_unread
+
+    def inflight_size(self) -> int:
+        """Get number of leased events awaiting acknowledgement."""
+        with self._lock:
+            return sum(len(lease.event_ids) for lease in self._leases)
 
     def clear(self) -> int:
         """Clear all events and return count of cleared events."""
         with self._lock:
-            count = len(self._memory_buffer) + self._disk_event_count
-            self._memory_buffer = []
+            count = len(self._memory_buffer) + len(self._spill) + self._disk_event_count
+            count += sum(len(lease.memory_events) for lease in self._leases)
+            self._memory_buffer.clear()
+            self._spill = []
+            self._leases.clear()
+
+            self._close_reader()
+            if self._write_file is not None:
+                self._write_file.close()
+                self._write_file = None
+            for index in self._segment_indexes():
+                self._segment_path(index).unlink()
+            cursor_file = self.data_dir / self.CURSOR_FILE
+            if cursor_file.exists():
+                cursor_file.unlink()
+
+            self._write_segment += 1
+            self._committed = self._read_pos = (self._write_segment, 0, 0)
+            self._frame_cache = None
             self._disk_event_count = 0
-
-            if self._disk_queue_file and self._disk_queue_file.exists():
-                self._disk_queue_file.unlink()
+            self._disk_unread = 0
 
             return count
 
+    def close(self) -> None:
+        """Flush spilled events and close segment files."""
+        with self._lock:
+            self._flush_spill()
+            self._close_reader()
+            if self._write_file is not None:
+                self._write_file.close()
+                self._write_file = None
+
     def get_stats(self) -> Dict[str, Any]:
         """Get queue statistics."""
         with self._lock:
+            disk_count = len(self._spill) + self._disk_unread
             return {
                 "memory_count": len(self._memory_buffer),
-                "disk_count": self._disk_event_count,
-                "total_count": len(self._memory_buffer) + self._disk_event_count,
+                "disk_count": disk_count,
+                "total_count": len(self._memory_buffer) + disk_count,
+                "inflight_count": sum(len(lease.event_ids) for lease in self._leases),
                 "memory_limit": self.memory_limit,
                 "disk_limit": self.disk_limit,
-                "disk_queue_path": str(self._disk_queue_file) if self._disk_queue_file else None,
+                "segments": len(self._segment_indexes()),
+                "committed_cursor": list(self._committed),
+                "disk_queue_path": str(self.data_dir),
             }
 
 
+# Syslog severity (RFC 5424) for each event severity
+SYSLOG_SEVERITY = {
+    EventSeverity.DEBUG: 7,
+    EventSeverity.INFO: 6,
+    EventSeverity.LOW: 5,
+    EventSeverity.MEDIUM: 4,
+    EventSeverity.HIGH: 3,
+    EventSeverity.CRITICAL: 2,
+}
+SYSLOG_FACILITY = 16  # local0
+
+
+class SocketTransport:
+    """
+    Long-lived TCP or UDP connection to a SIEM listener.
+
+    The socket is kept open across batches and re-established on failure
+    with exponential backoff. A TCP batch is written with a single
+    ``sendall`` of the pre-encoded buffer; UDP sends one datagram per
+    message.
+    """
+
+    def __init__(self, config: SIEMConfig, port: int, use_tcp: bool):
+        self.config = config
+        self.port = port
+        self.use_tcp = use_tcp
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            if self.use_tcp:
+                sock = socket.create_connection(
+                    (self.config.host, self.port), timeout=self.config.connect_timeout_seconds
+                )
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(self.config.read_timeout_seconds)
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.connect((self.config.host, self.port))
+            self._sock = sock
+            self.connects += 1
+        return self._sock
+
+    def send(self, messages: List[bytes]) -> None:
+        """
+        Send pre-encoded, already framed messages.
+
+        Raises:
+            OSError: If every attempt failed
+        """
+        with self._lock:
+            for attempt in range(max(1, self.config.retry_attempts)):
+                try:
+                    sock = self._connect()
+                    if self.use_tcp:
+                        sock.sendall(b"".join(messages))
+                    else:
+                        for message in messages:
+                            sock.send(message)
+                    return
+                except OSError as e:
+                    self._close()
+                    if attempt >= self.config.retry_attempts - 1:
+                        raise
+                    logger.warning(f"SIEM socket send failed (attempt {attempt + 1}): {e}")
+                    time.sleep(self.config.retry_delay_seconds * (2**attempt))
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._close()
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP(S) connection to the SIEM events API.
+
+    Reuses one ``http.client`` connection across batches, reconnecting
+    with exponential backoff when the server closes it or a request fails.
+    Responses with a retryable status (429 and 5xx) are retried with the
+    same backoff.
+    """
+
+    def __init__(self, config: SIEMConfig):
+        self.config = config
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if self.config.tls_enabled:
+                context = ssl.create_default_context(cafile=self.config.tls_cert_path)
+                self._conn = http.client.HTTPSConnection(
+                    self.config.host,
+                    self.config.port,
+                    timeout=self.config.connect_timeout_seconds,
+                    context=context,
+                )
+            else:
+                self._conn = http.client.HTTPConnection(
+                    self.config.host, self.config.port, timeout=self.config.connect_timeout_seconds
+                )
+            self.connects += 1
+        return self._conn
+
+    @staticmethod
+    def is_retryable(status: int) -> bool:
+        """Whether a response status is worth retrying."""
+        return status == 429 or status >= 500
+
+    def post(self, path: str, body: bytes, headers: Dict[str, str]) -> int:
+        """
+        POST a body, returning the response status.
+
+        Returns:
+            Status of the last attempt; a retryable status is only returned
+            once every attempt has been used
+
+        Raises:
+            OSError, http.client.HTTPException: If every attempt failed
+        """
+        attempts = max(1, self.config.retry_attempts)
+        with self._lock:
+            for attempt in range(attempts):
+                try:
+                    conn = self._connect()
+                    conn.request("POST", path, body=body, headers=headers)
+                    response = conn.getresponse()
+                    response.read()  # Drain so the connection can be reused
+                    if response.will_close:
+                        self._close()
+                    if not self.is_retryable(response.status) or attempt >= attempts - 1:
+                        return response.status
+                    logger.warning(
+                        f"SIEM returned status {response.status} (attempt {attempt + 1})"
+                    )
+                except (OSError, http.client.HTTPException) as e:
+                    self._close()
+                    if attempt >= attempts - 1:
+                        raise
+                    logger.warning(f"SIEM connection failed (attempt {attempt + 1}): {e}")
+                time.sleep(self.config.retry_delay_seconds * (2**attempt))
+        return 0
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._close()
+
+
 class BoundarySIEMClient:
     """
     Client for Boundary-SIEM integration.
@@ -488,6 +969,8 @@ class BoundarySIEMClient:
         self._shutdown_event = threading.Event()
         self._events_sent = 0
         self._events_failed = 0
+        self._hostname = socket.gethostname()
+        self._transports: Dict[str, Any] = {}
 
     def start(self) -> None:
         """Start the SIEM client background processing."""
@@ -529,6 +1012,7 @@ class BoundarySIEMClient:
                     self._queue.requeue(events)
                     remaining = self._queue.size()
                     break
+                self._queue.acknowledge(events)
             elif self._buffer:
                 events = self._buffer.flush()
                 if not events:
@@ -540,8 +1024,11 @@ class BoundarySIEMClient:
                 break
 
         if self._use_persistent_queue and self._queue:
+            self._queue.flush()
             remaining = self._queue.size()
 
+        self.close_transports()
+
         if remaining > 0:
             logger.warning(f"SIEM client stopped with {remaining} events remaining in queue")
         else:
@@ -600,7 +1087,9 @@ class BoundarySIEMClient:
                 if self._queue.size() >= self.config.batch_size:
                     events = self._queue.get_batch(self.config.batch_size)
                     if events:
-                        if not self._send_events(events):
+                        if self._send_events(events):
+                            self._queue.acknowledge(events)
+                        else:
                             self._queue.requeue(events)
             elif self._buffer and self._buffer.size() >= self.config.batch_size:
                 events = self._buffer.flush()
@@ -655,114 +1144,99 @@ class BoundarySIEMClient:
 
         return stats
 
+    def _http_transport(self) -> HTTPTransport:
+        """Get the long-lived HTTP connection."""
+        transport = self._transports.get("http")
+        if transport is None:
+            transport = self._transports["http"] = HTTPTransport(self.config)
+        return transport
+
+    def _socket_transport(self, use_tcp: bool) -> SocketTransport:
+        """Get the long-lived TCP or UDP connection."""
+        key = "tcp" if use_tcp else "udp"
+        transport = self._transports.get(key)
+        if transport is None:
+            port = self.config.port or (1514 if use_tcp else 514)
+            transport = self._transports[key] = SocketTransport(self.config, port, use_tcp)
+        return transport
+
+    def close_transports(self) -> None:
+        """Close SIEM connections; the next send reconnects."""
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+
     def _send_json_http(self, events: List[BoundaryEvent]) -> bool:
         """Send events via JSON HTTP API."""
-        import urllib.request
-        import urllib.error
-
-        url = f"{'https' if self.config.tls_enabled else 'http'}://{self.config.host}:{self.config.port}/api/v1/events"
-
-        payload = {
-            "events": [e.to_json() for e in events],
-            "source": "rra-module",
-            "timestamp": datetime.now().isoformat(),
+        # Splice the per-event encodings instead of re-encoding one big dict
+        body = (
+            '{"events":['
+            + ",".join(event.to_json_line() for event in events)
+            + '],"source":"rra-module","timestamp":'
+            + json.dumps(datetime.now().isoformat())
+            + "}"
+        ).encode()
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "RRA-Module/0.1.0",
+            "Connection": "keep-alive",
         }
-
-        data = json.dumps(payload).encode()
-        req = urllib.request.Request(url, data=data, method="POST")
-        req.add_header("Content-Type", "application/json")
-        req.add_header("User-Agent", "RRA-Module/0.1.0")
-
+        if self.config.http_gzip:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
         if self.config.api_key:
-            req.add_header("Authorization", f"Bearer {self.config.api_key}")
+            headers["Authorization"] = f"Bearer {self.config.api_key}"
 
-        for attempt in range(self.config.retry_attempts):
-            try:
-                with urllib.request.urlopen(
-                    req, timeout=self.config.connect_timeout_seconds
-                ) as resp:
-                    if resp.status == 200:
-                        logger.debug(f"Sent {len(events)} events to SIEM")
-                        return True
-                    else:
-                        logger.warning(f"SIEM returned status {resp.status}")
-            except urllib.error.URLError as e:
-                logger.warning(f"SIEM connection failed (attempt {attempt + 1}): {e}")
-                if attempt < self.config.retry_attempts - 1:
-                    time.sleep(self.config.retry_delay_seconds * (attempt + 1))
+        try:
+            status = self._http_transport().post("/api/v1/events", body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            logger.warning(f"SIEM connection failed: {e}")
+            return False
 
+        if status == 200:
+            logger.debug(f"Sent {len(events)} events to SIEM")
+            return True
+        logger.warning(f"SIEM returned status {status}")
         return False
 
     def _send_cef(self, events: List[BoundaryEvent], use_tcp: bool = False) -> bool:
         """Send events via CEF format."""
-        port = self.config.port or (1514 if use_tcp else 514)
+        messages = [(event.to_cef() + "\n").encode() for event in events]
 
         try:
-            if use_tcp:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(self.config.connect_timeout_seconds)
-                sock.connect((self.config.host, port))
-            else:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
-            for event in events:
-                cef_line = event.to_cef() + "\n"
-                if use_tcp:
-                    sock.sendall(cef_line.encode())
-                else:
-                    sock.sendto(cef_line.encode(), (self.config.host, port))
-
-            sock.close()
+            self._socket_transport(use_tcp).send(messages)
             logger.debug(f"Sent {len(events)} CEF events to SIEM")
             return True
-
-        except socket.error as e:
+        except OSError as e:
             logger.error(f"CEF socket error: {e}")
             return False
 
+    def _format_syslog(self, event: BoundaryEvent) -> str:
+        """Format an event as an RFC 5424 syslog message."""
+        priority = SYSLOG_FACILITY * 8 + SYSLOG_SEVERITY.get(event.severity, 6)
+        timestamp = event.timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        structured_data = f'[rra event_type="{event.event_type}" mode="{event.mode.value}"]'
+        message = event.to_json_line()
+        return (
+            f"<{priority}>1 {timestamp} {self._hostname} rra-module - - {structured_data} {message}"
+        )
+
     def _send_syslog(self, events: List[BoundaryEvent], use_tcp: bool = False) -> bool:
         """Send events via syslog (RFC 5424) format."""
-        port = self.config.port or (1514 if use_tcp else 514)
-        facility = 16  # local0
-        hostname = socket.gethostname()
-
-        try:
-            if use_tcp:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(self.config.connect_timeout_seconds)
-                sock.connect((self.config.host, port))
+        messages = []
+        for event in events:
+            line = self._format_syslog(event).encode()
+            if use_tcp and self.config.syslog_octet_counting:
+                # RFC 6587 octet-counted framing
+                messages.append(b"%d %s" % (len(line), line))
             else:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                messages.append(line + b"\n")
 
-            for event in events:
-                # Map severity to syslog priority
-                severity_map = {
-                    EventSeverity.DEBUG: 7,
-                    EventSeverity.INFO: 6,
-                    EventSeverity.LOW: 5,
-                    EventSeverity.MEDIUM: 4,
-                    EventSeverity.HIGH: 3,
-                    EventSeverity.CRITICAL: 2,
-                }
-                priority = facility * 8 + severity_map.get(event.severity, 6)
-
-                # RFC 5424 format
-                timestamp = event.timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                structured_data = f'[rra event_type="{event.event_type}" mode="{event.mode.value}"]'
-                message = json.dumps(event.to_json())
-
-                syslog_line = f"<{priority}>1 {timestamp} {hostname} rra-module - - {structured_data} {message}\n"
-
-                if use_tcp:
-                    sock.sendall(syslog_line.encode())
-                else:
-                    sock.sendto(syslog_line.encode(), (self.config.host, port))
-
-            sock.close()
+        try:
+            self._socket_transport(use_tcp).send(messages)
             logger.debug(f"Sent {len(events)} syslog events to SIEM")
             return True
-
-        except socket.error as e:
+        except OSError as e:
             logger.error(f"Syslog socket error: {e}")
             return False
 
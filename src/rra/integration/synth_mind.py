@@ -17,6 +17,8 @@ import secrets
 import asyncio
 from abc import ABC, abstractmethod
 
+from rra.persistence.oplog import OpLogStore, open_store
+
 
 class ModelProvider(Enum):
     """Supported LLM providers."""
@@ -232,8 +234,10 @@ class SynthMindRouter:
         # Register mock provider by default
         self.providers[ModelProvider.LOCAL] = MockLLMProvider()
 
+        self._store: Optional[OpLogStore] = None
         if data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(self.data_dir / "synth_mind_oplog")
             self._load_state()
         else:
             self._register_default_models()
@@ -302,7 +306,8 @@ class SynthMindRouter:
         """Register a model configuration."""
         self.models[config.model_id] = config
         self.rate_limits[config.model_id] = RateLimitState(model_id=config.model_id)
-        self._save_state()
+        if self._store:
+            self._store.save("models", config.model_id, config)
         return config
 
     def register_provider(self, provider_type: ModelProvider, provider: LLMProvider) -> None:
@@ -594,29 +599,22 @@ Format as JSON."""
     # =========================================================================
 
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot every registered model."""
+        if not self._store:
             return
 
-        # Ensure directory exists before writing
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-
         state = {
             "models": {mid: m.to_dict() for mid, m in self.models.items()},
         }
-
-        with open(self.data_dir / "synth_mind_state.json", "w") as f:
-            json.dump(state, f, indent=2)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        state_file = self.data_dir / "synth_mind_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=self.data_dir / "synth_mind_state.json")
+        if not state:
             self._register_default_models()
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             self.models = {
                 mid: ModelConfig.from_dict(m) for mid, m in state.get("models", {}).items()
             }
@@ -624,7 +622,7 @@ Format as JSON."""
             # Initialize rate limits
             for model_id in self.models:
                 self.rate_limits[model_id] = RateLimitState(model_id=model_id)
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             self._register_default_models()
 
 
@@ -7,18 +7,24 @@ Provides automated fork detection and derivative tracking:
 - GitHub webhook handlers for fork events
 - Fork owner notifications
 - Derivative registration automation
+
+Forks are indexed as a parent -> fork graph, so forks of forks can be
+followed through any number of generations; fork, notification and
+registration counts of every subtree are kept up to date as events arrive.
 """
 
 import hmac
 import hashlib
 import json
 import os
+from collections import Counter, deque
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from rra.persistence.oplog import OpLogStore, open_store
 
 # =============================================================================
 # Configuration
@@ -63,35 +69,133 @@ class ForkEvent(BaseModel):
 # =============================================================================
 
 
+def _weight(fork: ForkInfo) -> Counter:
+    """A fork's own contribution to the stats of the subtrees containing it."""
+    return Counter(
+        forks=1,
+        registered=int(fork.registered_as_derivative),
+        notified=int(fork.notified),
+    )
+
+
 class GitHubWebhookHandler:
     """Handle GitHub webhooks for fork detection."""
 
-    def __init__(self, secret: Optional[str] = None):
+    def __init__(self, secret: Optional[str] = None, data_path: Optional[Path] = None):
         """
         Initialize the webhook handler.
 
         Args:
             secret: GitHub webhook secret for signature verification
+            data_path: Legacy forks JSON file; forks are stored in an
+                operation log next to it (default: RRA_FORK_DATA_PATH)
         """
         self.secret = secret or GITHUB_WEBHOOK_SECRET
+        self.data_path = Path(data_path) if data_path is not None else FORK_DATA_PATH
+        self._store_dir = self.data_path.with_name(f"{self.data_path.stem}_oplog")
+        self._store: Optional[OpLogStore] = None
         self._forks: Dict[str, ForkInfo] = {}
+
+        # Fork graph: parent -> its forks (insertion ordered), the counts of
+        # each parent's direct forks, and the counts of all its descendants
+        self._children: Dict[str, Dict[str, None]] = {}
+        self._direct: Dict[str, Counter] = {}
+        self._subtree: Dict[str, Counter] = {}
         self._load_forks()
 
+    def _get_store(self) -> OpLogStore:
+        if self._store is None:
+            self._store = open_store(self._store_dir)
+        return self._store
+
     def _load_forks(self) -> None:
-        """Load fork data from storage."""
-        if FORK_DATA_PATH.exists():
+        """Load fork data from storage, importing a legacy forks file once."""
+        if self._store_dir.exists() or self.data_path.exists():
+            store = self._get_store()
             try:
-                with open(FORK_DATA_PATH, "r") as f:
-                    data = json.load(f)
-                    self._forks = {k: ForkInfo(**v) for k, v in data.items()}
-            except (json.JSONDecodeError, IOError):
+                if store.is_empty and self.data_path.exists():
+                    with open(self.data_path, "r") as f:
+                        store.replace_state({"forks": json.load(f)})
+                state = store.load_state() or {}
+                self._forks = {k: ForkInfo(**v) for k, v in state.get("forks", {}).items()}
+            except (ValueError, IOError):
                 self._forks = {}
+        self._rebuild_index()
 
-    def _save_forks(self) -> None:
-        """Save fork data to storage."""
-        FORK_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(FORK_DATA_PATH, "w") as f:
-            json.dump({k: v.model_dump() for k, v in self._forks.items()}, f, indent=2, default=str)
+    def _save_fork(self, fork_repo: str) -> None:
+        """Persist one changed fork."""
+        fork = self._forks.get(fork_repo)
+        self._get_store().save("forks", fork_repo, fork.model_dump() if fork else None)
+
+    # =========================================================================
+    # Fork Graph
+    # =========================================================================
+
+    def _rebuild_index(self) -> None:
+        """Build the fork graph and subtree counts from all forks."""
+        self._children = {}
+        self._direct = {}
+        for fork_repo, fork in self._forks.items():
+            self._children.setdefault(fork.parent_repo, {})[fork_repo] = None
+            self._direct.setdefault(fork.parent_repo, Counter()).update(_weight(fork))
+
+        # Post-order walk so each subtree is summed once from its forks' subtrees
+        self._subtree = {}
+        for start in self._children:
+            if start in self._subtree:
+                continue
+            stack = [(start, iter(self._children[start]))]
+            on_path = {start}
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    on_path.discard(node)
+                    totals = Counter()
+                    for fork_repo in self._children[node]:
+                        if fork_repo in on_path:
+                            continue  # Malformed cycle back to an ancestor
+                        totals.update(_weight(self._forks[fork_repo]))
+                        totals.update(self._subtree.get(fork_repo, Counter()))
+                    self._subtree[node] = totals
+                elif (
+                    child in self._children and child not in self._subtree and child not in on_path
+                ):
+                    stack.append((child, iter(self._children[child])))
+                    on_path.add(child)
+
+    def _iter_ancestors(self, repo: str) -> Iterator[str]:
+        """Yield the parent, grandparent, ... of a repository up to its root."""
+        seen = {repo}
+        fork = self._forks.get(repo)
+        while fork is not None and fork.parent_repo not in seen:
+            seen.add(fork.parent_repo)
+            yield fork.parent_repo
+            fork = self._forks.get(fork.parent_repo)
+
+    def _add_to_lineage(self, fork: ForkInfo, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a fork's branch in its ancestors' counts."""
+        own = _weight(fork)
+        branch = own + self._subtree.get(fork.fork_repo, Counter())
+        if sign < 0:
+            own = Counter({k: -v for k, v in own.items()})
+            branch = Counter({k: -v for k, v in branch.items()})
+        self._direct.setdefault(fork.parent_repo, Counter()).update(own)
+        for ancestor in self._iter_ancestors(fork.fork_repo):
+            self._subtree.setdefault(ancestor, Counter()).update(branch)
+
+    def _link(self, fork: ForkInfo) -> None:
+        self._children.setdefault(fork.parent_repo, {})[fork.fork_repo] = None
+        self._add_to_lineage(fork, 1)
+
+    def _unlink(self, fork: ForkInfo) -> None:
+        self._add_to_lineage(fork, -1)
+        siblings = self._children.get(fork.parent_repo, {})
+        siblings.pop(fork.fork_repo, None)
+        if not siblings:
+            self._children.pop(fork.parent_repo, None)
+            self._direct.pop(fork.parent_repo, None)
 
     def verify_signature(self, payload: bytes, signature: str) -> bool:
         """
@@ -138,8 +242,12 @@ class GitHubWebhookHandler:
 
         # Store fork info
         fork_key = f"{fork_info.fork_repo}"
+        previous = self._forks.get(fork_key)
+        if previous is not None:
+            self._unlink(previous)
         self._forks[fork_key] = fork_info
-        self._save_forks()
+        self._link(fork_info)
+        self._save_fork(fork_key)
 
         return fork_info
 
@@ -149,18 +257,77 @@ class GitHubWebhookHandler:
 
     def get_forks_for_parent(self, parent_repo: str) -> List[ForkInfo]:
         """Get all forks for a parent repository."""
-        return [fork for fork in self._forks.values() if fork.parent_repo == parent_repo]
+        return [self._forks[key] for key in self._children.get(parent_repo, ())]
 
     def get_all_forks(self) -> List[ForkInfo]:
         """Get all detected forks."""
         return list(self._forks.values())
 
+    def get_descendants(self, repo: str, max_depth: Optional[int] = None) -> List[ForkInfo]:
+        """
+        Get forks of a repository, forks of those forks, and so on.
+
+        Args:
+            repo: Repository name (owner/repo)
+            max_depth: Generations to follow (1: direct forks; None: all)
+
+        Returns:
+            Forks in breadth-first order (each generation after its parents)
+        """
+        descendants: List[ForkInfo] = []
+        seen = {repo}
+        queue = deque([(repo, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for fork_repo in self._children.get(node, ()):
+                if fork_repo not in seen:
+                    seen.add(fork_repo)
+                    descendants.append(self._forks[fork_repo])
+                    queue.append((fork_repo, depth + 1))
+        return descendants
+
+    def get_ancestors(self, repo: str) -> List[str]:
+        """Get the lineage of a fork: its parent, grandparent, ... up to the original."""
+        return list(self._iter_ancestors(repo))
+
+    def get_root(self, repo: str) -> str:
+        """Get the original repository a fork descends from (repo itself if not a fork)."""
+        ancestors = self.get_ancestors(repo)
+        return ancestors[-1] if ancestors else repo
+
+    def get_fork_counts(self, repo: str, direct: bool = False) -> Dict[str, int]:
+        """
+        Get fork, registration and notification counts below a repository.
+
+        Args:
+            repo: Repository name (owner/repo)
+            direct: Count only direct forks instead of all descendants
+
+        Returns:
+            Dict with forks, registered and notified counts
+        """
+        counts = (self._direct if direct else self._subtree).get(repo, Counter())
+        return {key: counts[key] for key in ("forks", "registered", "notified")}
+
+    def get_totals(self) -> Dict[str, int]:
+        """Get counts over all forks and the number of repositories with forks."""
+        totals: Counter = Counter()
+        for counts in self._direct.values():
+            totals.update(counts)
+        result = {key: totals[key] for key in ("forks", "registered", "notified")}
+        result["parents"] = len(self._children)
+        return result
+
     def mark_notified(self, fork_repo: str) -> bool:
         """Mark a fork as notified."""
         fork = self._forks.get(fork_repo)
         if fork:
+            self._add_to_lineage(fork, -1)
             fork.notified = True
-            self._save_forks()
+            self._add_to_lineage(fork, 1)
+            self._save_fork(fork_repo)
             return True
         return False
 
@@ -168,9 +335,11 @@ class GitHubWebhookHandler:
         """Mark a fork as registered as derivative."""
         fork = self._forks.get(fork_repo)
         if fork:
+            self._add_to_lineage(fork, -1)
             fork.registered_as_derivative = True
             fork.derivative_ip_asset_id = ip_asset_id
-            self._save_forks()
+            self._add_to_lineage(fork, 1)
+            self._save_fork(fork_repo)
             return True
         return False
 
@@ -339,30 +508,60 @@ Or visit: https://natlangchain.io/register-derivative/{ip_asset_id}
 class ForkTracker:
     """Track forks and build derivative trees."""
 
-    def __init__(self):
-        """Initialize the fork tracker."""
-        self.webhook_handler = GitHubWebhookHandler()
-        self.notifier = ForkNotifier()
+    def __init__(
+        self,
+        webhook_handler: Optional[GitHubWebhookHandler] = None,
+        notifier: Optional[ForkNotifier] = None,
+    ):
+        """
+        Initialize the fork tracker.
+
+        Args:
+            webhook_handler: Handler whose fork graph is read (pass the shared
+                handler so fork data is loaded once)
+            notifier: Fork owner notifier
+        """
+        self.webhook_handler = webhook_handler or GitHubWebhookHandler()
+        self.notifier = notifier or ForkNotifier()
+
+    @staticmethod
+    def _derivative_entry(fork: ForkInfo) -> Dict[str, Any]:
+        entry = {
+            "repo": fork.fork_repo,
+            "url": fork.fork_url,
+            "owner": fork.fork_owner,
+            "forked_at": fork.forked_at,
+        }
+        if fork.registered_as_derivative:
+            entry["ip_asset_id"] = fork.derivative_ip_asset_id
+            entry["type"] = "registered_derivative"
+        else:
+            entry["notified"] = fork.notified
+            entry["type"] = "unregistered_fork"
+        return entry
 
     def get_derivative_tree(
         self,
         parent_repo: str,
         include_unregistered: bool = True,
+        max_depth: int = 1,
     ) -> Dict[str, Any]:
         """
         Get the complete derivative tree for a repository.
 
         Args:
             parent_repo: Parent repository name (owner/repo)
-            include_unregistered: Include forks not yet registered
+            include_unregistered: Include forks not yet registered (when
+                False, their forks are left out as well)
+            max_depth: Generations to include; below the first, each
+                derivative lists its own "derivatives" (None: all)
 
         Returns:
             Derivative tree with statistics
         """
-        forks = self.webhook_handler.get_forks_for_parent(parent_repo)
-
-        registered = [f for f in forks if f.registered_as_derivative]
-        unregistered = [f for f in forks if not f.registered_as_derivative]
+        handler = self.webhook_handler
+        direct = handler.get_fork_counts(parent_repo, direct=True)
+        lineage = handler.get_fork_counts(parent_repo)
 
         # Build tree structure
         tree = {
@@ -372,58 +571,48 @@ class ForkTracker:
             },
             "derivatives": [],
             "stats": {
-                "total_forks": len(forks),
-                "registered_derivatives": len(registered),
-                "pending_registration": len(unregistered),
+                "total_forks": direct["forks"],
+                "registered_derivatives": direct["registered"],
+                "pending_registration": direct["forks"] - direct["registered"],
                 "notification_rate": (
-                    sum(1 for f in forks if f.notified) / len(forks) if forks else 0
+                    direct["notified"] / direct["forks"] if direct["forks"] else 0
                 ),
+                "total_descendants": lineage["forks"],
+                "registered_descendants": lineage["registered"],
             },
         }
 
-        # Add registered derivatives
-        for fork in registered:
-            tree["derivatives"].append(
-                {
-                    "repo": fork.fork_repo,
-                    "url": fork.fork_url,
-                    "owner": fork.fork_owner,
-                    "forked_at": fork.forked_at,
-                    "ip_asset_id": fork.derivative_ip_asset_id,
-                    "type": "registered_derivative",
-                }
-            )
-
-        # Add unregistered if requested
-        if include_unregistered:
-            for fork in unregistered:
-                tree["derivatives"].append(
-                    {
-                        "repo": fork.fork_repo,
-                        "url": fork.fork_url,
-                        "owner": fork.fork_owner,
-                        "forked_at": fork.forked_at,
-                        "notified": fork.notified,
-                        "type": "unregistered_fork",
-                    }
-                )
+        # Breadth-first, registered derivatives before unregistered forks
+        seen = {parent_repo}
+        queue = deque([(parent_repo, tree["derivatives"], 1)])
+        while queue:
+            repo, entries, depth = queue.popleft()
+            forks = handler.get_forks_for_parent(repo)
+            forks.sort(key=lambda f: not f.registered_as_derivative)
+            for fork in forks:
+                if fork.fork_repo in seen:
+                    continue
+                if not (include_unregistered or fork.registered_as_derivative):
+                    continue
+                seen.add(fork.fork_repo)
+                entry = self._derivative_entry(fork)
+                entries.append(entry)
+                if max_depth is None or depth < max_depth:
+                    entry["derivatives"] = []
+                    queue.append((fork.fork_repo, entry["derivatives"], depth + 1))
 
         return tree
 
     def get_fork_stats(self) -> Dict[str, Any]:
         """Get overall fork tracking statistics."""
-        all_forks = self.webhook_handler.get_all_forks()
+        totals = self.webhook_handler.get_totals()
 
         return {
-            "total_forks_detected": len(all_forks),
-            "total_notified": sum(1 for f in all_forks if f.notified),
-            "total_registered": sum(1 for f in all_forks if f.registered_as_derivative),
-            "registration_rate": (
-                sum(1 for f in all_forks if f.registered_as_derivative) / len(all_forks)
-                if all_forks
-                else 0
-            ),
-            "unique_parent_repos": len(set(f.parent_repo for f in all_forks)),
+            "total_forks_detected": totals["forks"],
+            "total_notified": totals["notified"],
+            "total_registered": totals["registered"],
+            "registration_rate": (totals["registered"] / totals["forks"] if totals["forks"] else 0),
+            "unique_parent_repos": totals["parents"],
         }
 
 
@@ -490,5 +679,5 @@ class RRARegistrationChecker:
 
 webhook_handler = GitHubWebhookHandler()
 fork_notifier = ForkNotifier()
-fork_tracker = ForkTracker()
+fork_tracker = ForkTracker(webhook_handler, fork_notifier)
 registration_checker = RRARegistrationChecker()
@@ -12,13 +12,17 @@ Enables real-time money streams for subscription-based licensing:
 Superfluid is best deployed on Polygon for low gas costs.
 """
 
+import copy
+import heapq
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+from rra.persistence.oplog import OpLogStore, open_store
+
 try:
     from web3 import Web3
     from web3.contract import Contract
@@ -71,12 +75,22 @@ class StreamingLicense:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        data = asdict(self)
-        data["status"] = self.status.value
-        data["start_time"] = self.start_time.isoformat()
-        if self.stop_time:
-            data["stop_time"] = self.stop_time.isoformat()
-        return data
+        # Built field by field: asdict() deep-copies and dominates per-license saves
+        return {
+            "license_id": self.license_id,
+            "repo_id": self.repo_id,
+            "buyer_address": self.buyer_address,
+            "seller_address": self.seller_address,
+            "flow_rate": self.flow_rate,
+            "token": self.token,
+            "monthly_cost_usd": self.monthly_cost_usd,
+            "start_time": self.start_time.isoformat(),
+            "grace_period_seconds": self.grace_period_seconds,
+            "status": self.status.value,
+            "tx_hash": self.tx_hash,
+            "stop_time": self.stop_time.isoformat() if self.stop_time else None,
+            "metadata": copy.deepcopy(self.metadata) if self.metadata else self.metadata,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StreamingLicense":
@@ -87,6 +101,13 @@ class StreamingLicense:
             data["stop_time"] = datetime.fromisoformat(data["stop_time"])
         return cls(**data)
 
+    @property
+    def grace_end(self) -> Optional[datetime]:
+        """When a stopped stream's grace period runs out (None unless stopped)."""
+        if self.status != StreamStatus.STOPPED or not self.stop_time:
+            return None
+        return self.stop_time + timedelta(seconds=self.grace_period_seconds)
+
 
 # Superfluid contract addresses by network
 SUPERFLUID_ADDRESSES = {
@@ -126,6 +147,12 @@ class SuperfluidManager:
     - Flow rate calculations
     - License status monitoring
     - Access revocation on stream stop
+
+    Licenses persist in an OpLogStore next to storage_path (one operation
+    per changed license). Grace-period ends of stopped streams are kept in
+    a min-heap, so revocation sweeps only visit licenses that expire.
+    Repo, buyer, (repo, buyer) and status indexes are updated whenever a
+    license is saved, so lookups and access decisions do not scan.
     """
 
     # Seconds per month (30 days)
@@ -149,6 +176,23 @@ class SuperfluidManager:
         self.network = network
         self.storage_path = storage_path or Path("agent_knowledge_bases/streaming_licenses.json")
         self._licenses: Dict[str, StreamingLicense] = {}
+
+        # (grace_end, license_id) for stopped streams; entries for licenses
+        # reactivated or restopped since are skipped when they surface
+        self._revocation_queue: List[Tuple[datetime, str]] = []
+        self._schedule_listeners: List[Callable[[datetime], None]] = []
+
+        # Secondary indexes: key -> license IDs (dicts as insertion-ordered sets)
+        self._by_repo: Dict[str, Dict[str, None]] = {}
+        self._by_buyer: Dict[str, Dict[str, None]] = {}
+        self._by_repo_buyer: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._by_status: Dict[StreamStatus, Dict[str, None]] = {}
+        self._indexed_status: Dict[str, StreamStatus] = {}
+        self._positions: Dict[str, int] = {}
+
+        # Opened on first write unless there is saved state to load
+        self._store_dir = self.storage_path.with_name(f"{self.storage_path.stem}_oplog")
+        self._store: Optional[OpLogStore] = None
         self._load_licenses()
 
         # Get contract addresses
@@ -157,23 +201,118 @@ class SuperfluidManager:
         else:
             self.addresses = {}
 
+    def _get_store(self) -> OpLogStore:
+        if self._store is None:
+            self._store = open_store(self._store_dir)
+        return self._store
+
     def _load_licenses(self) -> None:
-        """Load licenses from storage."""
-        if self.storage_path.exists():
+        """Load licenses from storage, importing a legacy licenses file once."""
+        if not self._store_dir.exists() and not self.storage_path.exists():
+            return
+
+        store = self._get_store()
+        if store.is_empty and self.storage_path.exists():
             try:
                 with open(self.storage_path, "r") as f:
-                    data = json.load(f)
-                    for license_id, license_data in data.items():
-                        self._licenses[license_id] = StreamingLicense.from_dict(license_data)
+                    store.replace_state({"licenses": json.load(f)})
             except (json.JSONDecodeError, IOError):
                 pass
 
+        state = store.load_state() or {}
+        for license_id, license_data in state.get("licenses", {}).items():
+            self._licenses[license_id] = StreamingLicense.from_dict(license_data)
+        self._rebuild_indexes()
+        self._rebuild_revocation_queue()
+
+    def _save_license(self, license_id: str) -> None:
+        """Persist one changed license and update its index entries."""
+        license = self._licenses.get(license_id)
+        if license is not None:
+            self._index_license(license)
+        self._get_store().save("licenses", license_id, license)
+
     def _save_licenses(self) -> None:
-        """Save licenses to storage."""
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {license_id: license.to_dict() for license_id, license in self._licenses.items()}
-        with open(self.storage_path, "w") as f:
-            json.dump(data, f, indent=2)
+        """Save all licenses (after bulk or direct edits), reindex and reschedule."""
+        self._get_store().replace_state(
+            {"licenses": {lid: lic.to_dict() for lid, lic in self._licenses.items()}}
+        )
+        self._rebuild_indexes()
+        self._rebuild_revocation_queue()
+
+    # =========================================================================
+    # Indexes
+    # =========================================================================
+
+    def _index_license(self, license: StreamingLicense) -> None:
+        license_id = license.license_id
+        old_status = self._indexed_status.get(license_id)
+        if old_status is None:
+            # Repo and buyer never change after creation
+            self._positions[license_id] = len(self._positions)
+            self._by_repo.setdefault(license.repo_id, {})[license_id] = None
+            self._by_buyer.setdefault(license.buyer_address, {})[license_id] = None
+            pair = (license.repo_id, license.buyer_address)
+            self._by_repo_buyer.setdefault(pair, {})[license_id] = None
+        elif old_status is license.status:
+            return
+        else:
+            del self._by_status[old_status][license_id]
+        self._by_status.setdefault(license.status, {})[license_id] = None
+        self._indexed_status[license_id] = license.status
+
+    def _rebuild_indexes(self) -> None:
+        self._by_repo = {}
+        self._by_buyer = {}
+        self._by_repo_buyer = {}
+        self._by_status = {}
+        self._indexed_status = {}
+        self._positions = {}
+        for license in self._licenses.values():
+            self._index_license(license)
+
+    def _licenses_with_status(self, status: StreamStatus) -> List[StreamingLicense]:
+        """Licenses in a status, in creation order like a scan of all licenses."""
+        ids = sorted(self._by_status.get(status, ()), key=self._positions.__getitem__)
+        return [self._licenses[license_id] for license_id in ids]
+
+    # =========================================================================
+    # Revocation Schedule
+    # =========================================================================
+
+    def _rebuild_revocation_queue(self) -> None:
+        self._revocation_queue = [
+            (lic.grace_end, lid) for lid, lic in self._licenses.items() if lic.grace_end
+        ]
+        heapq.heapify(self._revocation_queue)
+
+    def _schedule_revocation(self, license: StreamingLicense) -> None:
+        grace_end = license.grace_end
+        if grace_end is None:
+            return
+        heapq.heappush(self._revocation_queue, (grace_end, license.license_id))
+        for listener in self._schedule_listeners:
+            listener(grace_end)
+
+    def _is_scheduled(self, grace_end: datetime, license_id: str) -> bool:
+        license = self._licenses.get(license_id)
+        return license is not None and license.grace_end == grace_end
+
+    def add_schedule_listener(self, listener: Callable[[datetime], None]) -> None:
+        """
+        Register a callback for newly scheduled revocations.
+
+        Args:
+            listener: Function(grace_end) called when a stream stops
+        """
+        self._schedule_listeners.append(listener)
+
+    def next_revocation_at(self) -> Optional[datetime]:
+        """Earliest pending grace-period end, or None if nothing is scheduled."""
+        queue = self._revocation_queue
+        while queue and not self._is_scheduled(*queue[0]):
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
 
     def calculate_flow_rate(self, monthly_usd: float, decimals: int = 18) -> int:
         """
@@ -256,7 +395,7 @@ class SuperfluidManager:
         )
 
         self._licenses[license_id] = license
-        self._save_licenses()
+        self._save_license(license_id)
 
         return license
 
@@ -288,7 +427,7 @@ class SuperfluidManager:
 
         license.status = StreamStatus.ACTIVE
         license.start_time = datetime.utcnow()
-        self._save_licenses()
+        self._save_license(license_id)
 
         return {
             "license_id": license_id,
@@ -320,7 +459,8 @@ class SuperfluidManager:
         license = self._licenses[license_id]
         license.status = StreamStatus.STOPPED
         license.stop_time = datetime.utcnow()
-        self._save_licenses()
+        self._save_license(license_id)
+        self._schedule_revocation(license)
 
         return {
             "license_id": license_id,
@@ -388,32 +528,37 @@ class SuperfluidManager:
         if license.status == StreamStatus.ACTIVE:
             return True
 
-        if license.status == StreamStatus.STOPPED and license.stop_time:
-            # Check if within grace period
-            grace_end = license.stop_time + timedelta(seconds=license.grace_period_seconds)
-            if datetime.utcnow() < grace_end:
-                return True
+        # Check if within grace period
+        grace_end = license.grace_end
+        if grace_end and datetime.utcnow() < grace_end:
+            return True
 
         return False
 
-    async def revoke_expired_licenses(self) -> List[str]:
+    async def revoke_expired_licenses(self, now: Optional[datetime] = None) -> List[str]:
         """
         Revoke all licenses that have exceeded their grace period.
 
+        Only licenses at the front of the revocation queue are visited, so
+        the cost follows the number of expirations, not of licenses.
+
+        Args:
+            now: Current UTC time (defaults to datetime.utcnow())
+
         Returns:
             List of revoked license IDs
         """
+        now = now or datetime.utcnow()
         revoked = []
+        queue = self._revocation_queue
 
-        for license_id, license in self._licenses.items():
-            if license.status == StreamStatus.STOPPED and license.stop_time:
-                grace_end = license.stop_time + timedelta(seconds=license.grace_period_seconds)
-                if datetime.utcnow() >= grace_end:
-                    license.status = StreamStatus.REVOKED
-                    revoked.append(license_id)
-
-        if revoked:
-            self._save_licenses()
+        while queue and queue[0][0] <= now:
+            grace_end, license_id = heapq.heappop(queue)
+            if not self._is_scheduled(grace_end, license_id):
+                continue
+            self._licenses[license_id].status = StreamStatus.REVOKED
+            self._save_license(license_id)
+            revoked.append(license_id)
 
         return revoked
 
@@ -423,33 +568,44 @@ class SuperfluidManager:
 
     def get_licenses_for_repo(self, repo_id: str) -> List[StreamingLicense]:
         """Get all licenses for a repository."""
-        return [license for license in self._licenses.values() if license.repo_id == repo_id]
+        return [self._licenses[lid] for lid in self._by_repo.get(repo_id, ())]
 
     def get_licenses_for_buyer(self, buyer_address: str) -> List[StreamingLicense]:
         """Get all licenses for a buyer."""
-        buyer = buyer_address.lower()
-        return [license for license in self._licenses.values() if license.buyer_address == buyer]
+        return [self._licenses[lid] for lid in self._by_buyer.get(buyer_address.lower(), ())]
+
+    def get_licenses_for_repo_buyer(
+        self, repo_id: str, buyer_address: str
+    ) -> List[StreamingLicense]:
+        """Get a buyer's licenses for one repository."""
+        pair = (repo_id, buyer_address.lower())
+        return [self._licenses[lid] for lid in self._by_repo_buyer.get(pair, ())]
+
+    def find_access_license(self, repo_id: str, buyer_address: str) -> Optional[StreamingLicense]:
+        """
+        First license giving a buyer access to a repository, if any.
+
+        Only the buyer's licenses for that repository are checked, so the
+        decision does not depend on the total number of licenses.
+        """
+        for license_id in self._by_repo_buyer.get((repo_id, buyer_address.lower()), ()):
+            if self.check_access(license_id):
+                return self._licenses[license_id]
+        return None
 
     def get_active_licenses(self) -> List[StreamingLicense]:
         """Get all active streaming licenses."""
-        return [
-            license for license in self._licenses.values() if license.status == StreamStatus.ACTIVE
-        ]
+        return self._licenses_with_status(StreamStatus.ACTIVE)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get streaming payment statistics."""
-        active = len([lic for lic in self._licenses.values() if lic.status == StreamStatus.ACTIVE])
-        stopped = len(
-            [lic for lic in self._licenses.values() if lic.status == StreamStatus.STOPPED]
-        )
-        revoked = len(
-            [lic for lic in self._licenses.values() if lic.status == StreamStatus.REVOKED]
-        )
+        active = len(self._by_status.get(StreamStatus.ACTIVE, ()))
+        stopped = len(self._by_status.get(StreamStatus.STOPPED, ()))
+        revoked = len(self._by_status.get(StreamStatus.REVOKED, ()))
 
         total_monthly_revenue = sum(
-            lic.monthly_cost_usd
-            for lic in self._licenses.values()
-            if lic.status == StreamStatus.ACTIVE
+            self._licenses[lid].monthly_cost_usd
+            for lid in self._by_status.get(StreamStatus.ACTIVE, ())
         )
 
         return {
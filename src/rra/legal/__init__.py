@@ -46,6 +46,7 @@ from .compliance_rules import (
     IPLawRequirements,
     JurisdictionRules,
     JurisdictionRulesRegistry,
+    CompiledRuleset,
     create_rules_registry,
 )
 
@@ -82,5 +83,6 @@ __all__ = [
     "IPLawRequirements",
     "JurisdictionRules",
     "JurisdictionRulesRegistry",
+    "CompiledRuleset",
     "create_rules_registry",
 ]
@@ -10,13 +10,18 @@ Provides jurisdiction-specific:
 - Tax implications
 - Disclosure requirements
 - Dispute resolution rules
+
+The registry compiles its rules into an immutable CompiledRuleset (a
+pairwise compatibility matrix and region/framework bitsets), and memoizes
+merged rules and transaction compliance decisions on it, so repeated
+screening of the same corridors is a table lookup.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from .jurisdiction import JurisdictionCode, JurisdictionRegion
 
@@ -216,6 +221,98 @@ class JurisdictionRules:
     version: str = "1.0"
 
 
+def _fresh(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a memoized result so callers can modify what they get back."""
+    return {k: v.copy() if isinstance(v, (list, dict)) else v for k, v in result.items()}
+
+
+@dataclass(frozen=True)
+class CompiledRuleset:
+    """
+    Lookup tables compiled from a registry's rules.
+
+    Registered jurisdictions are numbered in registration order, and sets of
+    jurisdictions are int bitsets over those numbers. Merged rules and
+    compliance decisions are memoized per ruleset; registering rules
+    compiles a new ruleset, so no memoized answer outlives the rules it
+    was computed from.
+    """
+
+    codes: Tuple[JurisdictionCode, ...]
+    index: Dict[JurisdictionCode, int]
+    rules: Dict[JurisdictionCode, JurisdictionRules]
+    restricted: int
+    # Row i: bitset of the jurisdictions codes[i] may transact with
+    compatibility: Tuple[int, ...]
+    by_region: Dict[JurisdictionRegion, int]
+    by_framework: Dict[RegulatoryFramework, int]
+    # Destination -> amount from which a prospectus is required
+    prospectus_thresholds: Dict[JurisdictionCode, Decimal]
+    _merged: Dict[Tuple, Dict[str, Any]] = field(default_factory=dict, repr=False, compare=False)
+    _decisions: Dict[Tuple, Dict[str, Any]] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def compile(cls, rules: Dict[JurisdictionCode, JurisdictionRules]) -> "CompiledRuleset":
+        """Compile a snapshot of jurisdiction rules."""
+        codes = tuple(rules)
+        index = {code: i for i, code in enumerate(codes)}
+        everyone = (1 << len(codes)) - 1
+
+        restricted = 0
+        by_region: Dict[JurisdictionRegion, int] = {}
+        by_framework: Dict[RegulatoryFramework, int] = {}
+        thresholds: Dict[JurisdictionCode, Decimal] = {}
+        for code, rule in rules.items():
+            bit = 1 << index[code]
+            if rule.is_restricted:
+                restricted |= bit
+            by_region[rule.region] = by_region.get(rule.region, 0) | bit
+            for framework in rule.regulatory_frameworks:
+                by_framework[framework] = by_framework.get(framework, 0) | bit
+            if rule.disclosure.prospectus_required and rule.disclosure.prospectus_threshold:
+                thresholds[code] = rule.disclosure.prospectus_threshold
+
+        allowed = everyone & ~restricted
+        compatibility = tuple(0 if restricted >> i & 1 else allowed for i in range(len(codes)))
+
+        return cls(
+            codes=codes,
+            index=index,
+            rules=dict(rules),
+            restricted=restricted,
+            compatibility=compatibility,
+            by_region=by_region,
+            by_framework=by_framework,
+            prospectus_thresholds=thresholds,
+        )
+
+    def members(self, bits: int) -> List[JurisdictionCode]:
+        """Jurisdictions of a bitset, in registration order."""
+        return [code for i, code in enumerate(self.codes) if bits >> i & 1]
+
+    def is_compatible(
+        self, jurisdiction1: JurisdictionCode, jurisdiction2: JurisdictionCode
+    ) -> bool:
+        """Whether two registered jurisdictions may transact with each other."""
+        i = self.index.get(jurisdiction1)
+        j = self.index.get(jurisdiction2)
+        if i is None or j is None:
+            return False
+        return bool(self.compatibility[i] >> j & 1)
+
+    def amount_band(self, to_jurisdiction: JurisdictionCode, amount: Optional[Decimal]) -> int:
+        """
+        Band of a transaction amount for the destination's rules.
+
+        Returns:
+            1 if the amount reaches the destination's prospectus threshold, else 0
+        """
+        threshold = self.prospectus_thresholds.get(to_jurisdiction)
+        return int(
+            amount is not None and bool(amount) and threshold is not None and amount >= threshold
+        )
+
+
 class JurisdictionRulesRegistry:
     """
     Registry of compliance rules by jurisdiction.
@@ -229,6 +326,7 @@ class JurisdictionRulesRegistry:
 
     def __init__(self):
         self._rules: Dict[JurisdictionCode, JurisdictionRules] = {}
+        self._compiled: Optional[CompiledRuleset] = None
         self._initialize_default_rules()
 
     def _initialize_default_rules(self):
@@ -671,12 +769,32 @@ class JurisdictionRulesRegistry:
         return self._rules.copy()
 
     def register_rules(self, rules: JurisdictionRules):
-        """Register or update rules for a jurisdiction."""
+        """
+        Register or update rules for a jurisdiction.
+
+        Also call this after changing a registered JurisdictionRules in
+        place, so the compiled ruleset is rebuilt.
+        """
         self._rules[rules.jurisdiction] = rules
+        self._compiled = None
+
+    @property
+    def compiled(self) -> CompiledRuleset:
+        """The compiled ruleset (rebuilt on first use after rules change)."""
+        if self._compiled is None:
+            self._compiled = CompiledRuleset.compile(self._rules)
+        return self._compiled
 
     def get_rules_for_region(self, region: JurisdictionRegion) -> List[JurisdictionRules]:
         """Get all rules for a specific region."""
-        return [r for r in self._rules.values() if r.region == region]
+        compiled = self.compiled
+        return [compiled.rules[c] for c in compiled.members(compiled.by_region.get(region, 0))]
+
+    def get_rules_for_framework(self, framework: RegulatoryFramework) -> List[JurisdictionRules]:
+        """Get all rules of jurisdictions that apply a regulatory framework."""
+        compiled = self.compiled
+        bits = compiled.by_framework.get(framework, 0)
+        return [compiled.rules[c] for c in compiled.members(bits)]
 
     def get_compatible_rules(
         self, jurisdiction1: JurisdictionCode, jurisdiction2: JurisdictionCode
@@ -686,13 +804,26 @@ class JurisdictionRulesRegistry:
 
         Returns the more restrictive requirements from each jurisdiction.
         """
-        rules1 = self.get_rules(jurisdiction1)
-        rules2 = self.get_rules(jurisdiction2)
+        compiled = self.compiled
+        key = (jurisdiction1, jurisdiction2)
+        merged = compiled._merged.get(key)
+        if merged is None:
+            merged = compiled._merged[key] = self._merge_rules(compiled, *key)
+        return _fresh(merged)
+
+    def _merge_rules(
+        self,
+        compiled: CompiledRuleset,
+        jurisdiction1: JurisdictionCode,
+        jurisdiction2: JurisdictionCode,
+    ) -> Dict[str, Any]:
+        rules1 = compiled.rules.get(jurisdiction1)
+        rules2 = compiled.rules.get(jurisdiction2)
 
         if not rules1 or not rules2:
             return {"error": "One or both jurisdictions not found"}
 
-        if rules1.is_restricted or rules2.is_restricted:
+        if not compiled.is_compatible(jurisdiction1, jurisdiction2):
             return {
                 "compatible": False,
                 "reason": f"Restricted jurisdiction: {rules1.restriction_reason or rules2.restriction_reason}",
@@ -741,10 +872,43 @@ class JurisdictionRulesRegistry:
         """
         Check if a transaction is compliant across jurisdictions.
 
+        Decisions are memoized by (from, to, amount band): the amount only
+        matters through the destination's prospectus threshold, and the
+        transaction type does not change the outcome.
+
         Returns compliance status and any required actions.
         """
-        from_rules = self.get_rules(from_jurisdiction)
-        to_rules = self.get_rules(to_jurisdiction)
+        compiled = self.compiled
+        key = (from_jurisdiction, to_jurisdiction, compiled.amount_band(to_jurisdiction, amount))
+        decision = compiled._decisions.get(key)
+        if decision is None:
+            decision = compiled._decisions[key] = self._decide(compiled, *key)
+        return _fresh(decision)
+
+    def check_transactions_compliance(
+        self,
+        transactions: List[Tuple[JurisdictionCode, JurisdictionCode, str, Optional[Decimal]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Screen transactions in bulk.
+
+        Args:
+            transactions: (from, to, transaction type, amount) tuples
+
+        Returns:
+            One check_transaction_compliance result per transaction
+        """
+        return [self.check_transaction_compliance(*tx) for tx in transactions]
+
+    def _decide(
+        self,
+        compiled: CompiledRuleset,
+        from_jurisdiction: JurisdictionCode,
+        to_jurisdiction: JurisdictionCode,
+        amount_band: int,
+    ) -> Dict[str, Any]:
+        from_rules = compiled.rules.get(from_jurisdiction)
+        to_rules = compiled.rules.get(to_jurisdiction)
 
         issues = []
         required_actions = []
@@ -763,10 +927,8 @@ class JurisdictionRulesRegistry:
             }
 
         # Check prospectus requirements
-        if to_rules and to_rules.disclosure.prospectus_required:
-            if amount and to_rules.disclosure.prospectus_threshold:
-                if amount >= to_rules.disclosure.prospectus_threshold:
-                    required_actions.append(f"Prospectus required in {to_jurisdiction.value}")
+        if amount_band:
+            required_actions.append(f"Prospectus required in {to_jurisdiction.value}")
 
         # Check investor requirements
         if to_rules and to_rules.investor.accreditation_required:
@@ -182,8 +182,23 @@ class JurisdictionDetector:
     for licensing, compliance, and legal wrapper selection.
     """
 
+    # Weight of each detection method when aggregating signals
+    METHOD_WEIGHTS: Dict[DetectionMethod, float] = {
+        DetectionMethod.KYC_VERIFICATION: 1.0,
+        DetectionMethod.EXPLICIT_DECLARATION: 0.9,
+        DetectionMethod.REGISTRATION_DATA: 0.85,
+        DetectionMethod.ASSET_AUTHORITY: 0.85,
+        DetectionMethod.ADDRESS_PARSING: 0.8,
+        DetectionMethod.PHONE_NUMBER: 0.7,
+        DetectionMethod.IP_GEOLOCATION: 0.6,
+        DetectionMethod.SMART_CONTRACT_EVENT: 0.5,
+        DetectionMethod.DOCUMENT_ANALYSIS: 0.75,
+    }
+
     def __init__(self):
         self._participants: Dict[str, ParticipantJurisdiction] = {}
+        # (jurisdiction, jurisdiction) -> are_compatible result, built on first use
+        self._compatibility: Optional[Dict[Tuple[JurisdictionCode, JurisdictionCode], Any]] = None
 
         # Region mappings
         self._region_map: Dict[JurisdictionCode, JurisdictionRegion] = {
@@ -447,28 +462,17 @@ class JurisdictionDetector:
                 restriction_reason=None,
             )
 
-        # Weight signals by confidence and method
-        method_weights = {
-            DetectionMethod.KYC_VERIFICATION: 1.0,
-            DetectionMethod.EXPLICIT_DECLARATION: 0.9,
-            DetectionMethod.REGISTRATION_DATA: 0.85,
-            DetectionMethod.ASSET_AUTHORITY: 0.85,
-            DetectionMethod.ADDRESS_PARSING: 0.8,
-            DetectionMethod.PHONE_NUMBER: 0.7,
-            DetectionMethod.IP_GEOLOCATION: 0.6,
-            DetectionMethod.SMART_CONTRACT_EVENT: 0.5,
-            DetectionMethod.DOCUMENT_ANALYSIS: 0.75,
-        }
-
-        # Calculate weighted scores per jurisdiction
+        # Calculate weighted scores per jurisdiction (weighted by confidence and method)
+        method_weights = self.METHOD_WEIGHTS
         jurisdiction_scores: Dict[JurisdictionCode, float] = {}
+        kyc_verified = False
         for signal in signals:
             weight = method_weights.get(signal.method, 0.5)
             score = signal.confidence * weight
-
-            if signal.jurisdiction not in jurisdiction_scores:
-                jurisdiction_scores[signal.jurisdiction] = 0
-            jurisdiction_scores[signal.jurisdiction] += score
+            jurisdiction_scores[signal.jurisdiction] = (
+                jurisdiction_scores.get(signal.jurisdiction, 0) + score
+            )
+            kyc_verified = kyc_verified or signal.method == DetectionMethod.KYC_VERIFICATION
 
         # Sort by score
         sorted_jurisdictions = sorted(jurisdiction_scores.items(), key=lambda x: x[1], reverse=True)
@@ -481,7 +485,7 @@ class JurisdictionDetector:
         confidence_score = primary_score / total_score if total_score > 0 else 0
 
         # Determine confidence level
-        if any(s.method == DetectionMethod.KYC_VERIFICATION for s in signals):
+        if kyc_verified:
             confidence_level = ConfidenceLevel.VERIFIED
         elif confidence_score > 0.8:
             confidence_level = ConfidenceLevel.HIGH
@@ -520,18 +524,13 @@ class JurisdictionDetector:
     ) -> ParticipantJurisdiction:
         """Register a participant for jurisdiction tracking."""
         signals = initial_signals or []
-
-        if signals:
-            result = self.aggregate_signals(signals)
-            primary = result.primary_jurisdiction
-        else:
-            primary = JurisdictionCode.XX
+        result = self.aggregate_signals(signals) if signals else None
 
         profile = ParticipantJurisdiction(
             participant_id=participant_id,
             wallet_address=wallet_address,
-            primary_jurisdiction=primary,
-            detection_history=[self.aggregate_signals(signals)] if signals else [],
+            primary_jurisdiction=result.primary_jurisdiction if result else JurisdictionCode.XX,
+            detection_history=[result] if result else [],
         )
 
         self._participants[participant_id] = profile
@@ -599,24 +598,37 @@ class JurisdictionDetector:
         """
         Check if two jurisdictions are compatible for transactions.
 
+        Answers come from a pairwise matrix over all jurisdiction codes,
+        compiled on first use.
+
         Returns (compatible, reason_if_not).
         """
-        # Check if either is restricted
-        is_restricted1, reason1 = self.is_restricted(jurisdiction1)
-        is_restricted2, reason2 = self.is_restricted(jurisdiction2)
-
-        if is_restricted1:
-            return False, f"{jurisdiction1.value} is restricted: {reason1}"
-        if is_restricted2:
-            return False, f"{jurisdiction2.value} is restricted: {reason2}"
-
-        # Both in EU - highly compatible
-        eu_jurisdictions = set(self.get_eu_jurisdictions())
-        if jurisdiction1 in eu_jurisdictions and jurisdiction2 in eu_jurisdictions:
-            return True, None
-
-        # Generally compatible unless there are specific restrictions
-        return True, None
+        if self._compatibility is None:
+            self._compatibility = self._compile_compatibility()
+        return self._compatibility[(jurisdiction1, jurisdiction2)]
+
+    def _compile_compatibility(
+        self,
+    ) -> Dict[Tuple[JurisdictionCode, JurisdictionCode], Tuple[bool, Optional[str]]]:
+        matrix: Dict[Tuple[JurisdictionCode, JurisdictionCode], Tuple[bool, Optional[str]]] = {}
+        for jurisdiction1 in JurisdictionCode:
+            is_restricted1, reason1 = self.is_restricted(jurisdiction1)
+            for jurisdiction2 in JurisdictionCode:
+                is_restricted2, reason2 = self.is_restricted(jurisdiction2)
+                if is_restricted1:
+                    matrix[(jurisdiction1, jurisdiction2)] = (
+                        False,
+                        f"{jurisdiction1.value} is restricted: {reason1}",
+                    )
+                elif is_restricted2:
+                    matrix[(jurisdiction1, jurisdiction2)] = (
+                        False,
+                        f"{jurisdiction2.value} is restricted: {reason2}",
+                    )
+                else:
+                    # Generally compatible (EU pairs included) unless restricted
+                    matrix[(jurisdiction1, jurisdiction2)] = (True, None)
+        return matrix
 
 
 def create_jurisdiction_detector() -> JurisdictionDetector:
@@ -27,6 +27,7 @@ from rra.integration.network_resilience import (
     RetryConfig,
     calculate_delay,
 )
+from rra.persistence.oplog import OpLogStore, open_store
 
 logger = logging.getLogger(__name__)
 
@@ -415,8 +416,10 @@ class EventBridge:
         # Validators
         self.registered_validators: Dict[str, Dict[str, Any]] = {}
 
+        self._store: Optional[OpLogStore] = None
         if data_dir:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(data_dir / "event_bridge_oplog")
             self._load_state()
 
     def _generate_id(self, prefix: str = "") -> str:
@@ -494,8 +497,9 @@ class EventBridge:
             if dispute_id not in self.dispute_events:
                 self.dispute_events[dispute_id] = []
             self.dispute_events[dispute_id].append(event.event_id)
+            self._save_entity("dispute_events", dispute_id)
 
-        self._save_state()
+        self._save_entity("events", event.event_id)
         return event
 
     async def fetch_event_data(
@@ -527,7 +531,7 @@ class EventBridge:
 
         try:
             event.data = await fetcher.fetch(source_uri, json_path=json_path)
-            self._save_state()
+            self._save_entity("events", event_id)
             return event.data
         except Exception:
             return None
@@ -571,7 +575,7 @@ class EventBridge:
         if datetime.now() > event.requested_at + self.attestation_window:
             event.status = EventStatus.EXPIRED
             event.validated_at = datetime.now()
-            self._save_state()
+            self._save_entity("events", event_id)
             return None
 
         # Calculate data hash
@@ -589,7 +593,7 @@ class EventBridge:
         )
 
         if event.add_attestation(attestation):
-            self._save_state()
+            self._save_entity("events", event_id)
             return attestation
 
         return None
@@ -620,7 +624,7 @@ class EventBridge:
             "correct_count": 0,
             "metadata": metadata or {},
         }
-        self._save_state()
+        self._save_validator(address.lower())
 
     def is_registered_validator(self, address: str) -> bool:
         """Check if address is a registered validator."""
@@ -644,8 +648,7 @@ class EventBridge:
                 validator["attestation_count"] = validator.get("attestation_count", 0) + 1
                 if attestation.is_valid == consensus_valid:
                     validator["correct_count"] = validator.get("correct_count", 0) + 1
-
-        self._save_state()
+                self._save_validator(address.lower())
 
     # =========================================================================
     # Query Methods
@@ -694,8 +697,8 @@ class EventBridge:
                 event.validated_at = now
                 expired.append(event.event_id)
 
-        if expired:
-            self._save_state()
+        for event_id in expired:
+            self._save_entity("events", event_id)
 
         return expired
 
@@ -726,8 +729,18 @@ class EventBridge:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed event or dispute event list."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
+    def _save_validator(self, address: str) -> None:
+        if self._store:
+            self._store.save("validators", address, self.registered_validators.get(address))
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot the whole bridge state, including its config."""
+        if not self._store:
             return
 
         state = {
@@ -740,22 +753,18 @@ class EventBridge:
             },
         }
 
-        state_file = self.data_dir / "event_bridge_state.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        if not self.data_dir:
+        data_dir = self.data_dir
+        if not self._store or data_dir is None:
             return
 
-        state_file = self.data_dir / "event_bridge_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=data_dir / "event_bridge_state.json")
+        if not state:
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             # Restore events
             for eid, edata in state.get("events", {}).items():
                 event = BridgedEvent(
@@ -791,10 +800,11 @@ class EventBridge:
             self.registered_validators = state.get("validators", {})
 
             config = state.get("config", {})
-            self.consensus_threshold = config.get("consensus_threshold", 2)
-            self.attestation_window = timedelta(hours=config.get("attestation_window_hours", 24))
+            self.consensus_threshold = config.get("consensus_threshold", self.consensus_threshold)
+            if "attestation_window_hours" in config:
+                self.attestation_window = timedelta(hours=config["attestation_window_hours"])
 
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
 
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Persistence engines shared by the stateful managers.
+
+Provides:
+- OpLogStore: append-only operation log with group commit and snapshots
+- SQLiteStore: SQLite repository with indexed collections (WAL, batched commits)
+- open_repository: picks a backend by name for a manager's data directory
+- RecordArchive: append-only per-key record files for long histories
+- RollingLog: size-bounded segmented log for high-volume event streams
+"""
+
+from rra.persistence.archive import RecordArchive, open_archive
+from rra.persistence.oplog import OpLogStore, open_store
+from rra.persistence.repository import STORAGE_BACKENDS, open_repository
+from rra.persistence.rolling import RollingLog, open_rolling_log
+from rra.persistence.sqlite import IndexSpec, SQLiteStore, open_sqlite_store
+
+__all__ = [
+    "OpLogStore",
+    "open_store",
+    "SQLiteStore",
+    "open_sqlite_store",
+    "IndexSpec",
+    "STORAGE_BACKENDS",
+    "open_repository",
+    "RecordArchive",
+    "open_archive",
+    "RollingLog",
+    "open_rolling_log",
+]
@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Append-only record archive, one JSON-lines file per key.
+
+Used for histories that are too long to keep in memory or in a manager's
+state: the manager keeps a bounded recent window and appends every record
+here. Appends are buffered and group-committed like OpLogStore writes.
+
+Records of a key are stored in append order and carry an ISO timestamp
+(time_field), so a read starting from a timestamp binary-searches the
+file instead of scanning it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rra.persistence.oplog import DEFAULT_FLUSH_BYTES, DEFAULT_FLUSH_INTERVAL, _encode, _flusher
+
+logger = logging.getLogger(__name__)
+
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_\-][A-Za-z0-9_.\-]{0,127}")
+
+
+class RecordArchive:
+    """
+    Per-key append-only JSONL archive with group commit.
+
+    Example:
+        archive = RecordArchive(data_dir / "reputation_history")
+        archive.append(address, change.to_dict())
+        page = archive.read(address, since="2025-01-01T00:00:00", limit=100)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        time_field: str = "timestamp",
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        fsync: bool = True,
+    ):
+        """
+        Open (or create) an archive.
+
+        Args:
+            directory: Directory holding one file per key
+            time_field: Record field with the ISO timestamp reads filter on
+            flush_interval: Maximum seconds an append stays buffered
+            flush_bytes: Buffered bytes that trigger an immediate flush
+            fsync: fsync each flushed file
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.location = self.directory.resolve()
+        self.time_field = time_field
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._closed = False
+
+        # Stats
+        self.records_written = 0
+        self.group_commits = 0
+
+        _flusher.register(self)
+
+    def _path(self, key: str) -> Path:
+        name = key if _SAFE_NAME.fullmatch(key) else hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.jsonl"
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        """Append one record to a key's archive."""
+        line = _encode(record)
+        with self._lock:
+            if not self._pending_bytes:
+                self._pending_since = time.monotonic()
+            self._pending.setdefault(key, []).append(line)
+            self._pending_bytes += len(line)
+            self.records_written += 1
+            if self._pending_bytes >= self.flush_bytes:
+                self._flush_locked()
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            if (
+                self._pending_bytes
+                and time.monotonic() - self._pending_since >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered records now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or self._closed:
+            return
+        for key, lines in self._pending.items():
+            with open(self._path(key), "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+        self._pending = {}
+        self._pending_bytes = 0
+        self.group_commits += 1
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def _after(self, line: bytes, since: str) -> bool:
+        try:
+            after: bool = json.loads(line)[self.time_field] > since
+            return after
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
+            return True  # torn tail record
+
+    def _seek_after(self, f: Any, size: int, since: str) -> None:
+        """Position f at the first line whose timestamp is after since."""
+
+        def line_start(pos: int) -> int:
+            if pos == 0:
+                return 0
+            f.seek(pos - 1)
+            f.readline()
+            return int(f.tell())
+
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(line_start(mid))
+            line = f.readline()
+            if not line or self._after(line, since):
+                hi = mid
+            else:
+                lo = mid + 1
+        f.seek(line_start(lo))
+
+    def read(
+        self,
+        key: str,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a key's records in append order.
+
+        Args:
+            key: Archive key
+            since: Only records with a timestamp strictly after this ISO time
+                (pass the last timestamp of a page to get the next one)
+            limit: Maximum number of records
+
+        Returns:
+            Records, oldest first
+        """
+        # The file and the pending lines are read under one lock hold, so a
+        # flush cannot move lines from one to the other in between
+        with self._lock:
+            return self._read_locked(key, since, limit)
+
+    def _read_locked(
+        self, key: str, since: Optional[str], limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        path = self._path(key)
+
+        if path.exists():
+            with open(path, "rb") as f:
+                if since is not None:
+                    self._seek_after(f, os.fstat(f.fileno()).st_size, since)
+                for line in f:
+                    if limit is not None and len(records) >= limit:
+                        return records
+                    try:
+                        records.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.warning("Skipping torn record in %s", path)
+
+        for text in self._pending.get(key, ()):
+            if limit is not None and len(records) >= limit:
+                break
+            record = json.loads(text)
+            if since is None or record[self.time_field] > since:
+                records.append(record)
+        return records
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def close(self) -> None:
+        """Flush and stop background flushing."""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+        _flusher.unregister(self)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "pending_records": sum(len(lines) for lines in self._pending.values()),
+            "records_written": self.records_written,
+            "group_commits": self.group_commits,
+        }
+
+
+def open_archive(directory: Path, **kwargs: Any) -> RecordArchive:
+    """Open an archive, first flushing any open in-process archive on the same directory."""
+    _flusher.close_at(directory)
+    return RecordArchive(directory, **kwargs)
@@ -0,0 +1,428 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Append-only operation log with compacted snapshots for manager state.
+
+Managers used to persist by rewriting one JSON file with their whole state
+on every mutation. OpLogStore keeps the same JSON-shaped state (top-level
+names mapping to values, where dict values are collections of entities)
+but records each mutation as a small operation:
+
+1. put/delete touch one entity of a collection; set replaces a top-level value
+2. Operations are buffered and written as a group once flush_interval has
+   passed or flush_bytes have accumulated (one write and fsync per group)
+3. When the log outgrows compact_bytes the state is written to a snapshot
+   file (temp file, fsync, atomic rename) and a new log generation starts
+4. Opening a store loads the last snapshot and replays the logs written
+   after it; a torn record at the end of the last log is truncated away
+
+A write is therefore O(size of the change). Acknowledged writes may be lost
+if the process dies within flush_interval; call flush() where that matters.
+A store directory must be written by one store instance at a time.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.json"
+LOG_PREFIX = "oplog-"
+LOG_SUFFIX = ".jsonl"
+
+DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+DEFAULT_FLUSH_BYTES = 1024 * 1024
+DEFAULT_COMPACT_BYTES = 64 * 1024 * 1024
+
+
+def _encode(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+class _Flusher:
+    """
+    One daemon thread that flushes every open store's pending group.
+
+    Stores (OpLogStore, SQLiteStore) provide location, flush_interval,
+    flush(), close() and _flush_if_due().
+    """
+
+    def __init__(self) -> None:
+        self._stores: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._interval = DEFAULT_FLUSH_INTERVAL
+
+    def register(self, store: Any) -> None:
+        with self._lock:
+            self._stores.add(store)
+            self._interval = min(self._interval, store.flush_interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="oplog-flusher", daemon=True)
+                self._thread.start()
+
+    def unregister(self, store: Any) -> None:
+        with self._lock:
+            self._stores.discard(store)
+
+    def open_stores(self) -> List[Any]:
+        with self._lock:
+            return list(self._stores)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            for store in self.open_stores():
+                try:
+                    store._flush_if_due()
+                except Exception as e:  # keep flushing the other stores
+                    logger.error("Background flush failed for %s: %s", store.location, e)
+
+    def flush_all(self) -> None:
+        for store in self.open_stores():
+            try:
+                store.flush()
+            except Exception as e:
+                logger.error("Flush at exit failed for %s: %s", store.location, e)
+
+    def close_at(self, location: Path) -> None:
+        """Close any open store persisting to location."""
+        location = Path(location).resolve()
+        for store in self.open_stores():
+            if store.location == location:
+                store.close()
+
+
+_flusher = _Flusher()
+atexit.register(_flusher.flush_all)
+
+
+class OpLogStore:
+    """
+    JSON state persisted as an append-only operation log plus snapshots.
+
+    Example:
+        store = OpLogStore(data_dir / "reputation")
+        state = store.load_state(legacy_file=data_dir / "reputation_state.json")
+        store.put("participants", address, participant.to_dict())
+        store.set("total_staked", 1000)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+        fsync: bool = True,
+    ):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory: Directory holding the snapshot and log files
+            flush_interval: Maximum seconds an acknowledged write stays buffered
+            flush_bytes: Buffered bytes that trigger an immediate group commit
+            compact_bytes: Log size that triggers a snapshot
+            fsync: fsync each group commit and snapshot
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.location = self.directory.resolve()
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._state: Dict[str, Any] = {}
+        self._pending: List[str] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._generation = 0
+        self._log_file: Optional[TextIO] = None
+        self._log_bytes = 0
+        self._closed = False
+
+        # Stats
+        self.ops_written = 0
+        self.group_commits = 0
+        self.snapshots = 0
+
+        self._recover()
+        _flusher.register(self)
+
+    # =========================================================================
+    # Recovery
+    # =========================================================================
+
+    def _log_path(self, generation: int) -> Path:
+        return self.directory / f"{LOG_PREFIX}{generation:08d}{LOG_SUFFIX}"
+
+    def _log_generations(self) -> List[int]:
+        generations = []
+        for path in self.directory.glob(f"{LOG_PREFIX}*{LOG_SUFFIX}"):
+            try:
+                generations.append(int(path.name[len(LOG_PREFIX) : -len(LOG_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(generations)
+
+    def _recover(self) -> None:
+        snapshot_path = self.directory / SNAPSHOT_FILE
+        if snapshot_path.exists():
+            with open(snapshot_path) as f:
+                snapshot = json.load(f)
+            self._generation = snapshot["generation"]
+            self._state = snapshot["state"]
+
+        replayed = [g for g in self._log_generations() if g >= self._generation]
+        for i, generation in enumerate(replayed):
+            self._replay(self._log_path(generation), last=i == len(replayed) - 1)
+        if replayed:
+            self._generation = replayed[-1]
+
+        path = self._log_path(self._generation)
+        self._log_file = open(path, "a", encoding="utf-8")
+        self._log_bytes = path.stat().st_size
+
+    def _replay(self, path: Path, last: bool) -> None:
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
+                    if not last:
+                        raise
+                    logger.warning("Truncating torn record in %s at byte %d", path, offset)
+                    with open(path, "r+b") as g:
+                        g.truncate(offset)
+                    return
+                offset += len(line)
+
+    def _apply(self, op: Dict[str, Any]) -> None:
+        kind = op["op"]
+        if kind == "put":
+            collection = self._state.get(op["c"])
+            if not isinstance(collection, dict):
+                collection = self._state[op["c"]] = {}
+            collection[op["k"]] = op["v"]
+        elif kind == "del":
+            collection = self._state.get(op["c"])
+            if isinstance(collection, dict):
+                collection.pop(op["k"], None)
+        elif kind == "set":
+            self._state[op["c"]] = op["v"]
+        elif kind == "unset":
+            self._state.pop(op["c"], None)
+        else:
+            raise KeyError(kind)
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._state
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Current value of a top-level name (a collection dict for collections)."""
+        return self._state.get(name, default)
+
+    def load_state(self, legacy_file: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored state, importing a legacy JSON state file if needed.
+
+        Args:
+            legacy_file: Whole-state JSON file written by the old persistence;
+                imported (and snapshotted) when the store is empty
+
+        Returns:
+            Copy of the state shaped like the legacy file, or None if there is none
+        """
+        with self._lock:
+            if self.is_empty and legacy_file is not None and Path(legacy_file).exists():
+                try:
+                    with open(legacy_file) as f:
+                        legacy = json.load(f)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring unreadable legacy state file %s", legacy_file)
+                else:
+                    if isinstance(legacy, dict):
+                        self.replace_state(legacy)
+            if self.is_empty:
+                return None
+            return copy.deepcopy(self._state)
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def _append(self, op: Dict[str, Any]) -> None:
+        line = _encode(op)
+        # Apply the decoded form so the in-memory state matches a replay
+        self._apply(json.loads(line))
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self.ops_written += 1
+        if self._pending_bytes >= self.flush_bytes:
+            self._flush_locked()
+
+    def put(self, collection: str, key: str, value: Any) -> None:
+        """Insert or replace one entity of a collection."""
+        with self._lock:
+            self._append({"op": "put", "c": collection, "k": str(key), "v": value})
+
+    def delete(self, collection: str, key: str) -> None:
+        """Remove one entity of a collection."""
+        with self._lock:
+            self._append({"op": "del", "c": collection, "k": str(key)})
+
+    def save(self, collection: str, key: str, entity: Any) -> None:
+        """
+        Persist a manager's entity: put its to_dict() (or the plain value),
+        or delete the key when entity is None.
+        """
+        if entity is None:
+            self.delete(collection, key)
+        else:
+            self.put(collection, key, entity.to_dict() if hasattr(entity, "to_dict") else entity)
+
+    def set(self, name: str, value: Any) -> None:
+        """Replace a whole top-level value (small scalars and settings)."""
+        with self._lock:
+            self._append({"op": "set", "c": name, "v": value})
+
+    def unset(self, name: str) -> None:
+        """Remove a top-level value."""
+        with self._lock:
+            self._append({"op": "unset", "c": name})
+
+    def replace_state(self, state: Dict[str, Any]) -> None:
+        """Replace the whole state and write it straight to a snapshot."""
+        with self._lock:
+            self._state = json.loads(json.dumps(state, default=str))
+            self._pending.clear()
+            self._pending_bytes = 0
+            self._write_snapshot()
+
+    # =========================================================================
+    # Group Commit and Compaction
+    # =========================================================================
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            if self._pending and time.monotonic() - self._pending_since >= self.flush_interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered operations to the log now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or self._closed:
+            return
+        log_file = self._log_file
+        assert log_file is not None  # open from __init__ until close()
+        data = "".join(self._pending)
+        log_file.write(data)
+        log_file.flush()
+        if self.fsync:
+            os.fsync(log_file.fileno())
+        self._log_bytes += len(data.encode("utf-8"))
+        self._pending.clear()
+        self._pending_bytes = 0
+        self.group_commits += 1
+        if self._log_bytes >= self.compact_bytes:
+            self._write_snapshot()
+
+    def compact(self) -> None:
+        """Snapshot the current state and discard the logs it covers."""
+        with self._lock:
+            self._flush_locked()
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        generation = self._generation + 1
+        tmp_path = self.directory / f"{SNAPSHOT_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"generation": generation, "state": self._state},
+                f,
+                separators=(",", ":"),
+                default=str,
+            )
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.directory / SNAPSHOT_FILE)
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.directory, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        if self._log_file is not None:
+            self._log_file.close()
+        self._generation = generation
+        self._log_file = open(self._log_path(generation), "a", encoding="utf-8")
+        self._log_bytes = 0
+        for old in self._log_generations():
+            if old < generation:
+                self._log_path(old).unlink(missing_ok=True)
+        self.snapshots += 1
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            if self._log_file is not None:
+                self._log_file.close()
+        _flusher.unregister(self)
+
+    def __enter__(self) -> "OpLogStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "generation": self._generation,
+            "log_bytes": self._log_bytes,
+            "pending_ops": len(self._pending),
+            "ops_written": self.ops_written,
+            "group_commits": self.group_commits,
+            "snapshots": self.snapshots,
+        }
+
+
+def open_store(directory: Path, **kwargs: Any) -> OpLogStore:
+    """
+    Open a store, first flushing any open in-process store on the same directory.
+
+    Managers re-created on the same data_dir (for example to reload state)
+    then see every write acknowledged by the earlier instance.
+    """
+    _flusher.close_at(directory)
+    return OpLogStore(directory, **kwargs)
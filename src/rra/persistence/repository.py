@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Storage backend selection for the managers.
+
+- "oplog": OpLogStore under <data_dir>/<name>_oplog (default)
+- "sqlite": SQLiteStore at <data_dir>/<name>.db with the manager's indexes;
+  an existing op-log for the same name is imported on first open
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from rra.persistence.oplog import OpLogStore, open_store
+from rra.persistence.sqlite import IndexSpec, SQLiteStore, open_sqlite_store
+
+STORAGE_BACKENDS = ("oplog", "sqlite")
+
+
+def open_repository(
+    data_dir: Path,
+    name: str,
+    backend: str = "oplog",
+    indexes: Optional[Dict[str, Dict[str, IndexSpec]]] = None,
+    **kwargs: Any,
+) -> Union[OpLogStore, SQLiteStore]:
+    """
+    Open a manager's store.
+
+    Args:
+        data_dir: Manager data directory
+        name: Store name (file or directory stem)
+        backend: One of STORAGE_BACKENDS
+        indexes: Indexed columns per collection (SQLite only)
+
+    Returns:
+        OpLogStore or SQLiteStore
+    """
+    data_dir = Path(data_dir)
+    oplog_dir = data_dir / f"{name}_oplog"
+
+    if backend == "oplog":
+        return open_store(oplog_dir, **kwargs)
+
+    if backend == "sqlite":
+        store = open_sqlite_store(data_dir / f"{name}.db", indexes=indexes, **kwargs)
+        if store.is_empty and oplog_dir.exists():
+            previous = open_store(oplog_dir)
+            state = previous.load_state()
+            previous.close()
+            if state:
+                store.replace_state(state)
+        return store
+
+    raise ValueError(
+        f"Unknown storage backend: {backend} (expected one of {', '.join(STORAGE_BACKENDS)})"
+    )
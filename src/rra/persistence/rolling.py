@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Rolling append-only record log.
+
+Used for high-volume event streams that only need to be kept on disk for
+a while (e.g. widget events): records are appended to JSON-lines segments
+of bounded size, and the oldest segments are deleted once more than
+max_segments exist, so disk use stays bounded too. Appends are buffered
+and group-committed like OpLogStore writes.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rra.persistence.oplog import DEFAULT_FLUSH_BYTES, DEFAULT_FLUSH_INTERVAL, _encode, _flusher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+
+
+class RollingLog:
+    """
+    Size-bounded JSONL log split into numbered segments.
+
+    Example:
+        log = RollingLog(Path("data/widget/events"), name="events")
+        log.append({"widget_id": widget_id, "event_type": "widget_opened"})
+        recent = log.read(limit=100)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str = "log",
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        fsync: bool = False,
+    ):
+        """
+        Open (or create) a rolling log.
+
+        Args:
+            directory: Directory holding the segments
+            name: Segment file prefix (<name>.<number>.jsonl)
+            segment_bytes: Size at which a new segment is started
+            max_segments: Segments kept; older ones are deleted
+            flush_interval: Maximum seconds an append stays buffered
+            flush_bytes: Buffered bytes that trigger an immediate flush
+            fsync: fsync each flushed segment
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.location = self.directory.resolve()
+        self.name = name
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._pending: List[str] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._closed = False
+        self._pattern = re.compile(rf"{re.escape(name)}\.(\d+)\.jsonl")
+
+        numbers = self._segment_numbers()
+        self._segment = numbers[-1] if numbers else 1
+        self._segment_size = self._segment_path(self._segment).stat().st_size if numbers else 0
+
+        # Stats
+        self.records_written = 0
+        self.group_commits = 0
+        self.segments_removed = 0
+
+        _flusher.register(self)
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{self.name}.{number:06d}.jsonl"
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for path in self.directory.iterdir():
+            match = self._pattern.fullmatch(path.name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record."""
+        line = _encode(record)
+        with self._lock:
+            if not self._pending_bytes:
+                self._pending_since = time.monotonic()
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            self.records_written += 1
+            if self._pending_bytes >= self.flush_bytes:
+                self._flush_locked()
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            if (
+                self._pending_bytes
+                and time.monotonic() - self._pending_since >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered records now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or self._closed:
+            return
+        if self._segment_size >= self.segment_bytes:
+            self._rotate()
+        data = "".join(self._pending)
+        with open(self._segment_path(self._segment), "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._segment_size += len(data.encode("utf-8"))
+        self._pending = []
+        self._pending_bytes = 0
+        self.group_commits += 1
+
+    def _rotate(self) -> None:
+        self._segment += 1
+        self._segment_size = 0
+        numbers = self._segment_numbers()
+        for number in numbers[: max(0, len(numbers) + 1 - self.max_segments)]:
+            try:
+                self._segment_path(number).unlink()
+                self.segments_removed += 1
+            except OSError as e:
+                logger.warning("Could not remove log segment %s: %s", number, e)
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def read(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read the retained records, oldest first.
+
+        Args:
+            limit: Only the most recent limit records
+
+        Returns:
+            Records in append order
+        """
+        with self._lock:
+            self._flush_locked()
+            numbers = self._segment_numbers()
+        records: List[Dict[str, Any]] = []
+        for number in numbers:
+            try:
+                with open(self._segment_path(number), "rb") as f:
+                    for line in f:
+                        try:
+                            records.append(json.loads(line))
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            logger.warning("Skipping torn record in segment %s", number)
+            except FileNotFoundError:
+                continue  # rotated away while reading
+        return records[-limit:] if limit else records
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def close(self) -> None:
+        """Flush and stop background flushing."""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+        _flusher.unregister(self)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "segment": self._segment,
+            "segment_bytes": self._segment_size,
+            "pending_records": len(self._pending),
+            "records_written": self.records_written,
+            "group_commits": self.group_commits,
+            "segments_removed": self.segments_removed,
+        }
+
+
+def open_rolling_log(directory: Path, **kwargs: Any) -> RollingLog:
+    """Open a rolling log, first flushing any open in-process store on the same directory."""
+    _flusher.close_at(directory)
+    return RollingLog(directory, **kwargs)
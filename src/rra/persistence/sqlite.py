@@ -0,0 +1,456 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+SQLite repository backend for manager state.
+
+Same write interface as OpLogStore (put/delete/save/set/replace_state/
+load_state), so a manager can use either, plus indexed lookups:
+
+- One table per collection (key, JSON data, one column per declared index);
+  every top-level dict of the state is a collection, other values go to _meta
+- Indexes declared per collection as column -> to_dict() field name or
+  callable, e.g. {"stakes": {"staker": lambda d: d["staker_address"].lower()}}
+- query(collection, column=value, ...) returns matching keys in insertion
+  order using those indexes instead of scanning every entity
+- WAL journal; writes run inside one open transaction that is committed when
+  flush_interval has passed or batch_size writes have accumulated. Reads on
+  the store see uncommitted writes, so queries are never stale.
+
+Indexes reflect entities as last saved through the store.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from rra.persistence.oplog import DEFAULT_FLUSH_INTERVAL, _flusher
+
+logger = logging.getLogger(__name__)
+
+IndexSpec = Union[str, Callable[[Dict[str, Any]], Any]]
+
+DEFAULT_BATCH_SIZE = 1000
+
+_TABLE_PREFIX = "e_"
+_COLUMN_PREFIX = "i_"
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid collection or index name: {name!r}")
+    return name
+
+
+def _extract(spec: IndexSpec, value: Any) -> Any:
+    if callable(spec):
+        return spec(value)
+    return value.get(spec) if isinstance(value, dict) else None
+
+
+class _Collection:
+    """Prepared statements for one collection table."""
+
+    def __init__(self, name: str, columns: Dict[str, IndexSpec]):
+        self.name = name
+        self.table = _TABLE_PREFIX + name
+        self.columns = columns
+        names = ["key", "data"] + [_COLUMN_PREFIX + c for c in columns]
+        updates = ", ".join(f"{n} = excluded.{n}" for n in names[1:])
+        # ON CONFLICT ... DO UPDATE keeps the rowid, so rowid order stays insertion order
+        self.upsert = (
+            f"INSERT INTO {self.table} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT(key) DO UPDATE SET {updates}"
+        )
+        self.delete = f"DELETE FROM {self.table} WHERE key = ?"
+        self.select_all = f"SELECT key, data FROM {self.table} ORDER BY rowid"
+        self._queries: Dict[tuple, str] = {}
+        self._counts: Dict[tuple, str] = {}
+
+    def row(self, key: str, value: Any) -> tuple:
+        data = json.dumps(value, separators=(",", ":"), default=str)
+        return (key, data, *(_extract(spec, value) for spec in self.columns.values()))
+
+    def _where(self, columns: tuple) -> str:
+        where = " AND ".join(f"{_COLUMN_PREFIX}{c} = ?" for c in columns)
+        return f" WHERE {where}" if where else ""
+
+    def query_sql(self, columns: tuple) -> str:
+        sql = self._queries.get(columns)
+        if sql is None:
+            sql = f"SELECT key FROM {self.table}{self._where(columns)} ORDER BY rowid"
+            self._queries[columns] = sql
+        return sql
+
+    def count_sql(self, columns: tuple) -> str:
+        sql = self._counts.get(columns)
+        if sql is None:
+            sql = f"SELECT COUNT(*) FROM {self.table}{self._where(columns)}"
+            self._counts[columns] = sql
+        return sql
+
+
+class SQLiteStore:
+    """
+    Manager state in an SQLite database with indexed collections.
+
+    Example:
+        store = SQLiteStore(
+            data_dir / "staking.db",
+            indexes={"stakes": {"pool_id": "pool_id", "active": "active"}},
+        )
+        store.save("stakes", stake.stake_id, stake)
+        keys = store.query("stakes", pool_id=pool_id, active=True)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        indexes: Optional[Dict[str, Dict[str, IndexSpec]]] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        synchronous: str = "NORMAL",
+    ):
+        """
+        Open (or create) a database.
+
+        Args:
+            path: Database file
+            indexes: Indexed columns per collection
+            flush_interval: Maximum seconds a write stays uncommitted
+            batch_size: Writes that trigger an immediate commit
+            synchronous: SQLite synchronous mode (NORMAL is durable with WAL
+                except for the last transactions on power loss)
+        """
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid synchronous mode: {synchronous}")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.location = self.path.resolve()
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS _meta (name TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        self._in_transaction = False
+        self._pending = 0
+        self._pending_since = 0.0
+        self._closed = False
+
+        # Stats
+        self.ops_written = 0
+        self.transactions = 0
+
+        self._indexes = {
+            _check_identifier(c): {_check_identifier(col): spec for col, spec in cols.items()}
+            for c, cols in (indexes or {}).items()
+        }
+        self._collections: Dict[str, _Collection] = {}
+        for name in self._indexes:
+            self._collection(name)
+        for name in self._existing_collections():
+            self._collection(name)
+
+        _flusher.register(self)
+
+    # =========================================================================
+    # Schema
+    # =========================================================================
+
+    def _existing_collections(self) -> List[str]:
+        rows = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB ?",
+            (_TABLE_PREFIX + "*",),
+        ).fetchall()
+        return [name[len(_TABLE_PREFIX) :] for (name,) in rows]
+
+    def _collection(self, name: str) -> _Collection:
+        collection = self._collections.get(name)
+        if collection is not None:
+            return collection
+
+        collection = _Collection(_check_identifier(name), self._indexes.get(name, {}))
+        table = collection.table
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+        added = []
+        for column in collection.columns:
+            column_name = _COLUMN_PREFIX + column
+            if column_name not in existing:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_name}")
+                added.append(column)
+            # Covering index: key lookups by column never touch the table rows
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{name}_{column} ON {table} ({column_name}, key)"
+            )
+        if added:
+            self._backfill(collection)
+
+        self._collections[name] = collection
+        return collection
+
+    def _backfill(self, collection: _Collection) -> None:
+        """Populate index columns declared after rows were written."""
+        rows = [
+            collection.row(key, json.loads(data))
+            for key, data in self._conn.execute(collection.select_all)
+        ]
+        with self._lock:
+            self._begin()
+            self._conn.executemany(collection.upsert, rows)
+            self._commit()
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    @property
+    def is_empty(self) -> bool:
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM _meta LIMIT 1").fetchone():
+                return False
+            return not any(
+                self._conn.execute(f"SELECT 1 FROM {c.table} LIMIT 1").fetchone()
+                for c in self._collections.values()
+            )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Current value of a top-level name (a collection dict for collections)."""
+        with self._lock:
+            if name in self._collections:
+                collection = self._collections[name]
+                rows = self._conn.execute(collection.select_all).fetchall()
+                if rows:
+                    return {key: json.loads(data) for key, data in rows}
+            row = self._conn.execute("SELECT data FROM _meta WHERE name = ?", (name,)).fetchone()
+            return json.loads(row[0]) if row else default
+
+    def query(self, collection: str, **filters: Any) -> List[str]:
+        """
+        Keys of the entities whose indexed columns equal the given values.
+
+        Filters set to None are ignored. Keys come back in insertion order.
+        """
+        columns = tuple(sorted(c for c, v in filters.items() if v is not None))
+        with self._lock:
+            if collection not in self._collections:
+                return []
+            target = self._indexed(collection, columns)
+            rows = self._conn.execute(target.query_sql(columns), [filters[c] for c in columns])
+            return [key for (key,) in rows]
+
+    def count(self, collection: str, **filters: Any) -> int:
+        """Number of entities matching query(collection, **filters)."""
+        columns = tuple(sorted(c for c, v in filters.items() if v is not None))
+        with self._lock:
+            if collection not in self._collections:
+                return 0
+            target = self._indexed(collection, columns)
+            row = self._conn.execute(target.count_sql(columns), [filters[c] for c in columns])
+            return int(row.fetchone()[0])
+
+    def _indexed(self, collection: str, columns: tuple) -> _Collection:
+        target = self._collections[collection]
+        unknown = [c for c in columns if c not in target.columns]
+        if unknown:
+            raise ValueError(f"Not indexed on {collection}: {', '.join(unknown)}")
+        return target
+
+    def load_state(self, legacy_file: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored state, importing a legacy JSON state file if needed.
+
+        Args:
+            legacy_file: Whole-state JSON file imported when the database is empty
+
+        Returns:
+            State dict shaped like the legacy file, or None if there is none
+        """
+        with self._lock:
+            if self.is_empty and legacy_file is not None and Path(legacy_file).exists():
+                try:
+                    with open(legacy_file) as f:
+                        legacy = json.load(f)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring unreadable legacy state file %s", legacy_file)
+                else:
+                    if isinstance(legacy, dict):
+                        self.replace_state(legacy)
+            if self.is_empty:
+                return None
+
+            state: Dict[str, Any] = {}
+            for name, data in self._conn.execute("SELECT name, data FROM _meta"):
+                state[name] = json.loads(data)
+            for name, collection in self._collections.items():
+                rows = self._conn.execute(collection.select_all).fetchall()
+                if rows:
+                    state[name] = {key: json.loads(data) for key, data in rows}
+            return state
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def _begin(self) -> None:
+        if not self._in_transaction:
+            self._conn.execute("BEGIN")
+            self._in_transaction = True
+            self._pending_since = time.monotonic()
+
+    def _commit(self) -> None:
+        if self._in_transaction:
+            self._conn.execute("COMMIT")
+            self._in_transaction = False
+            self._pending = 0
+            self.transactions += 1
+
+    def _wrote(self) -> None:
+        self._pending += 1
+        self.ops_written += 1
+        if self._pending >= self.batch_size:
+            self._commit()
+
+    def put(self, collection: str, key: str, value: Any) -> None:
+        """Insert or replace one entity of a collection."""
+        with self._lock:
+            target = self._collection(collection)
+            self._begin()
+            self._conn.execute(target.upsert, target.row(str(key), value))
+            self._wrote()
+
+    def delete(self, collection: str, key: str) -> None:
+        """Remove one entity of a collection."""
+        with self._lock:
+            target = self._collection(collection)
+            self._begin()
+            self._conn.execute(target.delete, (str(key),))
+            self._wrote()
+
+    def save(self, collection: str, key: str, entity: Any) -> None:
+        """
+        Persist a manager's entity: put its to_dict() (or the plain value),
+        or delete the key when entity is None.
+        """
+        if entity is None:
+            self.delete(collection, key)
+        else:
+            self.put(collection, key, entity.to_dict() if hasattr(entity, "to_dict") else entity)
+
+    def set(self, name: str, value: Any) -> None:
+        """Replace a whole top-level value; dicts are stored as collections."""
+        with self._lock:
+            self._begin()
+            self._remove(name)
+            self._insert(name, value)
+            self._wrote()
+
+    def unset(self, name: str) -> None:
+        """Remove a top-level value."""
+        with self._lock:
+            self._begin()
+            self._remove(name)
+            self._wrote()
+
+    def _remove(self, name: str) -> None:
+        self._conn.execute("DELETE FROM _meta WHERE name = ?", (name,))
+        if name in self._collections:
+            self._conn.execute(f"DELETE FROM {self._collections[name].table}")
+
+    def _insert(self, name: str, value: Any) -> None:
+        if isinstance(value, dict):
+            target = self._collection(name)
+            self._conn.executemany(target.upsert, (target.row(str(k), v) for k, v in value.items()))
+        else:
+            self._conn.execute(
+                "INSERT INTO _meta (name, data) VALUES (?, ?)",
+                (name, json.dumps(value, separators=(",", ":"), default=str)),
+            )
+
+    def replace_state(self, state: Dict[str, Any]) -> None:
+        """Replace the whole state in one transaction."""
+        with self._lock:
+            self._begin()
+            self._conn.execute("DELETE FROM _meta")
+            for collection in self._collections.values():
+                self._conn.execute(f"DELETE FROM {collection.table}")
+            for name, value in state.items():
+                self._insert(name, value)
+            self._commit()
+
+    # =========================================================================
+    # Transactions
+    # =========================================================================
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            if (
+                self._in_transaction
+                and not self._closed
+                and time.monotonic() - self._pending_since >= self.flush_interval
+            ):
+                self._commit()
+
+    def flush(self) -> None:
+        """Commit the open transaction now."""
+        with self._lock:
+            if not self._closed:
+                self._commit()
+
+    def compact(self) -> None:
+        """Commit and fold the WAL back into the database file."""
+        with self._lock:
+            self.flush()
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._closed = True
+            self._conn.close()
+        _flusher.unregister(self)
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = {
+                name: self._conn.execute(f"SELECT COUNT(*) FROM {c.table}").fetchone()[0]
+                for name, c in self._collections.items()
+            }
+        return {
+            "path": str(self.path),
+            "rows": rows,
+            "indexes": {name: list(cols) for name, cols in self._indexes.items()},
+            "ops_written": self.ops_written,
+            "transactions": self.transactions,
+        }
+
+
+def open_sqlite_store(path: Path, **kwargs: Any) -> SQLiteStore:
+    """Open a database, first closing any open in-process store on the same file."""
+    _flusher.close_at(path)
+    return SQLiteStore(path, **kwargs)
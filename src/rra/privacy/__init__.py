@@ -27,6 +27,9 @@ from .secret_sharing import (
 )
 from .identity import (
     IdentityManager,
+    PoseidonHash,
+    PoseidonMerkleTree,
+    MerkleProof,
     generate_identity_secret,
     compute_identity_hash,
 )
@@ -54,6 +57,9 @@ __all__ = [
     "reconstruct_secret",
     # Identity
     "IdentityManager",
+    "PoseidonHash",
+    "PoseidonMerkleTree",
+    "MerkleProof",
     "generate_identity_secret",
     "compute_identity_hash",
     # Batch Queue (Inference Attack Prevention)
@@ -20,11 +20,24 @@ Security:
 import os
 import json
 import logging
-from typing import Optional, Tuple, Dict
+from operator import mul
+from typing import Optional, Tuple, Dict, List, Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from eth_utils import keccak, is_address, to_checksum_address
 
+# PERFORMANCE: Optional gmpy2 backend for the Poseidon permutation.
+# gmpy2's mpz multiplies and reduces 254-bit field elements faster than int.
+try:
+    import gmpy2
+    from gmpy2 import mpz
+
+    GMPY2_AVAILABLE = True
+except ImportError:
+    GMPY2_AVAILABLE = False
+    gmpy2 = None
+    mpz = int  # Fallback to Python int
+
 # SECURITY FIX LOW-002: Add logger for exception tracking
 logger = logging.getLogger(__name__)
 
@@ -39,6 +52,74 @@ class DisputeIdentity:
     address: Optional[str]  # Optional: Associated Ethereum address
 
 
+# =============================================================================
+# PERFORMANCE: Optimized Poseidon parameters
+# =============================================================================
+# The reference permutation adds t constants and multiplies by the dense MDS
+# matrix in every partial round, although only state[0] passes the S-box.
+# Both are rewritten once per width into an equivalent form:
+#
+# 1. Constant folding: the constants of non-S-boxed elements are pushed
+#    forward through the MDS matrix, so each partial round adds one constant
+#    and the leftover lands on the first constants of the final full rounds.
+# 2. Sparse matrices: M = S * D with D = diag(1, M') and S the identity
+#    except for its first row and column. D commutes with the partial S-box,
+#    so it is folded backwards into the previous round, leaving one O(t)
+#    sparse product per partial round and a modified last first-half matrix.
+#    Only used for the Cauchy matrices (t >= 4); MDS_2 and MDS_3 have small
+#    entries and stay dense.
+#
+# Outputs are bit-identical to the reference permutation.
+# =============================================================================
+
+
+def _mat_mul(a: List[List[int]], b: List[List[int]], p: int) -> List[List[int]]:
+    """Multiply two square matrices mod p."""
+    cols = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, col)) % p for col in cols] for row in a]
+
+
+def _mat_vec(matrix: List[List[int]], vector: Sequence[int], p: int) -> List[int]:
+    """Multiply a matrix by a column vector mod p."""
+    return [sum(m * v for m, v in zip(row, vector)) % p for row in matrix]
+
+
+def _mat_inverse(matrix: List[List[int]], p: int) -> List[List[int]]:
+    """
+    Invert a square matrix mod p by Gauss-Jordan elimination.
+
+    Raises:
+        ValueError: If the matrix is singular
+    """
+    n = len(matrix)
+    aug = [list(row) + [int(i == j) for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if aug[r][col] % p), None)
+        if pivot is None:
+            raise ValueError("Matrix is singular in the field")
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        inv = pow(aug[col][col], p - 2, p)
+        aug[col] = [x * inv % p for x in aug[col]]
+        for r in range(n):
+            if r != col and aug[r][col]:
+                factor = aug[r][col]
+                aug[r] = [(x - factor * y) % p for x, y in zip(aug[r], aug[col])]
+    return [row[n:] for row in aug]
+
+
+@dataclass(frozen=True)
+class _PoseidonParams:
+    """Precomputed optimized constants and matrices for one state width."""
+
+    width: int
+    first_constants: tuple  # t constants per first-half full round
+    first_matrices: tuple  # MDS for all but the last, which absorbs D_0
+    partial_constants: tuple  # one constant per partial round (state[0])
+    sparse_matrices: Optional[tuple]  # (m00, w_hat, v) per partial round, or dense
+    last_constants: tuple  # t constants per second-half full round
+    mds: tuple  # MDS for the second-half full rounds
+
+
 class PoseidonHash:
     """
     Poseidon hash implementation for BN254 (alt_bn128) scalar field.
@@ -98,13 +179,41 @@ class PoseidonHash:
         [1, 4, 9],
     ]
 
+    # Round configuration (matches circomlib)
+    FULL_ROUNDS = 8
+    PARTIAL_ROUNDS = {
+        2: 56,  # 1 input
+        3: 57,  # 2 inputs
+        4: 56,  # 3 inputs
+        5: 60,  # 4 inputs
+        6: 60,  # 5 inputs
+        7: 63,  # 6 inputs
+        8: 64,  # 7 inputs
+    }
+    DEFAULT_PARTIAL_ROUNDS = 60
+
+    # Optimized parameters are deterministic, so they are shared by all
+    # instances. Keyed by (width, use_gmpy2).
+    _params_cache: Dict[Tuple[int, bool], _PoseidonParams] = {}
+
     # Round constants are generated deterministically using keccak
     # NOTE (MED-007): circomlib uses grain LFSR, this uses keccak-based NIST approach
 
-    def __init__(self):
-        """Initialize Poseidon with precomputed constants."""
-        self._round_constants_cache = {}
-        self._mds_cache = {
+    def __init__(self, use_gmpy2: Optional[bool] = None):
+        """
+        Initialize Poseidon with precomputed constants.
+
+        Args:
+            use_gmpy2: Run the permutation on gmpy2 integers. Defaults to
+                using gmpy2 when it is installed.
+        """
+        if use_gmpy2 and not GMPY2_AVAILABLE:
+            raise ValueError("gmpy2 is not installed")
+        self.use_gmpy2 = GMPY2_AVAILABLE if use_gmpy2 is None else use_gmpy2
+        self._field = mpz(self.FIELD_PRIME) if self.use_gmpy2 else self.FIELD_PRIME
+        # Per-width parameters: (width, rounds) -> constants, width -> MDS matrix
+        self._round_constants_cache: Dict[Tuple[int, int], List[List[int]]] = {}
+        self._mds_cache: Dict[int, List[List[int]]] = {
             2: self.MDS_2,
             3: self.MDS_3,
         }
@@ -128,7 +237,7 @@ class PoseidonHash:
             if not self._is_mds_matrix(matrix, t):
                 raise ValueError(f"MDS matrix for t={t} failed verification")
 
-    def _is_mds_matrix(self, matrix: list, size: int) -> bool:
+    def _is_mds_matrix(self, matrix: List[List[int]], size: int) -> bool:
         """
         Check if a matrix has the MDS property.
 
@@ -178,7 +287,7 @@ class PoseidonHash:
         # In practice, Poseidon typically uses t <= 8
         return True
 
-    def _generate_round_constants(self, t: int, num_rounds: int) -> list:
+    def _generate_round_constants(self, t: int, num_rounds: int) -> List[List[int]]:
         """
         Generate round constants using nothing-up-my-sleeve approach.
 
@@ -208,7 +317,7 @@ class PoseidonHash:
         self._round_constants_cache[cache_key] = constants
         return constants
 
-    def _generate_mds(self, t: int) -> list:
+    def _generate_mds(self, t: int) -> List[List[int]]:
         """
         Generate MDS matrix for width t.
 
@@ -252,17 +361,8 @@ class PoseidonHash:
             new_state.append(acc)
         return new_state
 
-    def hash(self, inputs: list) -> int:
-        """
-        Compute Poseidon hash of inputs.
-
-        Args:
-            inputs: List of field elements (integers or bytes)
-
-        Returns:
-            Hash as integer in BN254 scalar field
-        """
-        # Normalize inputs to field elements
+    def _normalize(self, inputs: Iterable) -> List[int]:
+        """Map hash inputs (ints, bytes or str()-able values) to field elements."""
         normalized = []
         for inp in inputs:
             if isinstance(inp, int):
@@ -273,21 +373,173 @@ class PoseidonHash:
             else:
                 val = int.from_bytes(str(inp).encode()[:32].ljust(32, b"\x00"), "big")
                 normalized.append(val % self.FIELD_PRIME)
+        return normalized
+
+    def _partial_rounds(self, t: int) -> int:
+        """Number of partial rounds for state width t."""
+        return self.PARTIAL_ROUNDS.get(t, self.DEFAULT_PARTIAL_ROUNDS)
+
+    def _get_params(self, t: int) -> _PoseidonParams:
+        """Return the optimized parameters for width t, building them once."""
+        key = (t, self.use_gmpy2)
+        params = self._params_cache.get(key)
+        if params is None:
+            params = self._build_params(t)
+            self._params_cache[key] = params
+        return params
+
+    def _build_params(self, t: int) -> _PoseidonParams:
+        """
+        Derive constant-folded, sparse-matrix parameters for width t.
+
+        See the module-level notes above _PoseidonParams for the derivation.
+        """
+        p = self.FIELD_PRIME
+        half = self.FULL_ROUNDS // 2
+        partial_rounds = self._partial_rounds(t)
+        constants = self._generate_round_constants(t, self.FULL_ROUNDS + partial_rounds)
+        mds = [list(row) for row in self._generate_mds(t)]
+
+        # Constant folding: keep only the state[0] constant in partial rounds
+        partial_constants = []
+        carry = [0] * t
+        for round_consts in constants[half : half + partial_rounds]:
+            added = [(c + k) % p for c, k in zip(round_consts, carry)]
+            partial_constants.append(added[0])
+            added[0] = 0
+            carry = _mat_vec(mds, added, p)
+        last_constants = [list(c) for c in constants[half + partial_rounds :]]
+        last_constants[0] = [(c + k) % p for c, k in zip(last_constants[0], carry)]
+
+        # Sparse factorization, from the last partial round backwards. The
+        # small-integer MDS matrices for t=2 and t=3 are cheaper to apply
+        # densely than sparse factors whose entries are full field elements.
+        sparse = None
+        acc = mds
+        if max(x for row in mds for x in row).bit_length() > 64:
+            sparse = []
+            for _ in range(partial_rounds):
+                m_hat = [row[1:] for row in acc[1:]]
+                m_hat_inv = _mat_inverse(m_hat, p)
+                w = acc[0][1:]
+                w_hat = [
+                    sum(w[k] * m_hat_inv[k][j] for k in range(t - 1)) % p for j in range(t - 1)
+                ]
+                v = [row[0] for row in acc[1:]]
+                sparse.append((acc[0][0], w_hat, v))
+                d = [[1] + [0] * (t - 1)] + [[0] + row for row in m_hat]
+                acc = _mat_mul(d, mds, p)
+            sparse.reverse()
+
+        conv = mpz if self.use_gmpy2 else int
+
+        def vec(values: Iterable[int]) -> tuple:
+            return tuple(conv(x) for x in values)
+
+        return _PoseidonParams(
+            width=t,
+            first_constants=tuple(vec(c) for c in constants[:half]),
+            first_matrices=tuple(tuple(vec(row) for row in m) for m in [mds] * (half - 1) + [acc]),
+            partial_constants=vec(partial_constants),
+            sparse_matrices=(
+                None
+                if sparse is None
+                else tuple((conv(m00), vec(w), vec(v)) for m00, w, v in sparse)
+            ),
+            last_constants=tuple(vec(c) for c in last_constants),
+            mds=tuple(vec(row) for row in mds),
+        )
+
+    def _permute(self, params: _PoseidonParams, state: List[int]) -> int:
+        """
+        Run the optimized permutation and return state[0].
+
+        Matrix rows are accumulated unreduced and reduced once per row; in the
+        partial rounds the elements that skip the S-box are only reduced at
+        the end.
+        """
+        p = self._field
+
+        for consts, matrix in zip(params.first_constants, params.first_matrices):
+            state = [pow(x + c, 5, p) for x, c in zip(state, consts)]
+            state = [sum(map(mul, row, state)) % p for row in matrix]
+
+        mds = params.mds
+        if params.sparse_matrices is not None:
+            first, rest = state[0], state[1:]
+            for k, (m00, w_hat, v) in zip(params.partial_constants, params.sparse_matrices):
+                s0 = pow(first + k, 5, p)
+                first = (m00 * s0 + sum(map(mul, w_hat, rest))) % p
+                rest = [x + c * s0 for x, c in zip(rest, v)]
+            state = [first] + [x % p for x in rest]
+        elif params.width == 2:
+            # Single-input identity hashes: scalar state, second word left unreduced
+            (m00, m01), (m10, m11) = mds
+            a, b = state
+            for k in params.partial_constants:
+                s0 = pow(a + k, 5, p)
+                a, b = (m00 * s0 + m01 * b) % p, m10 * s0 + m11 * b
+            state = [a, b % p]
+        else:
+            for k in params.partial_constants:
+                state[0] = pow(state[0] + k, 5, p)
+                state = [sum(map(mul, row, state)) % p for row in mds]
+
+        for consts in params.last_constants[:-1]:
+            state = [pow(x + c, 5, p) for x, c in zip(state, consts)]
+            state = [sum(map(mul, row, state)) % p for row in mds]
+        # Only state[0] of the final round is needed
+        state = [pow(x + c, 5, p) for x, c in zip(state, params.last_constants[-1])]
+        return int(sum(map(mul, mds[0], state)) % p)
+
+    def hash(self, inputs: list) -> int:
+        """
+        Compute Poseidon hash of inputs.
+
+        Args:
+            inputs: List of field elements (integers or bytes)
+
+        Returns:
+            Hash as integer in BN254 scalar field
+        """
+        # State width = inputs + 1 (capacity of 1)
+        state = [0] + self._normalize(inputs)
+        return self._permute(self._get_params(len(state)), state)
+
+    def hash_many(self, batch: Iterable[Sequence]) -> List[int]:
+        """
+        Hash many input lists, sharing parameter lookup across the batch.
+
+        Args:
+            batch: Iterable of input lists, as accepted by hash()
+
+        Returns:
+            List of hashes, in input order
+        """
+        params_by_width: Dict[int, _PoseidonParams] = {}
+        permute = self._permute
+        results = []
+        for inputs in batch:
+            state = [0] + self._normalize(inputs)
+            params = params_by_width.get(len(state))
+            if params is None:
+                params = params_by_width[len(state)] = self._get_params(len(state))
+            results.append(permute(params, state))
+        return results
+
+    def _hash_reference(self, inputs: list) -> int:
+        """
+        Straightforward Poseidon permutation (dense MDS in every round).
+
+        Kept as the specification that the optimized hash() is checked against.
+        """
+        normalized = self._normalize(inputs)
 
         # State width = inputs + 1 (capacity of 1)
         t = len(normalized) + 1
 
-        # Round configuration (matches circomlib)
-        full_rounds = 8
-        partial_rounds = {
-            2: 56,  # 1 input
-            3: 57,  # 2 inputs
-            4: 56,  # 3 inputs
-            5: 60,  # 4 inputs
-            6: 60,  # 5 inputs
-            7: 63,  # 6 inputs
-            8: 64,  # 7 inputs
-        }.get(t, 60)
+        full_rounds = self.FULL_ROUNDS
+        partial_rounds = self._partial_rounds(t)
 
         total_rounds = full_rounds + partial_rounds
 
@@ -357,6 +609,122 @@ class PoseidonHash:
 PoseidonMock = PoseidonHash
 
 
+@dataclass
+class MerkleProof:
+    """Membership proof for one leaf of a PoseidonMerkleTree."""
+
+    leaf: int
+    index: int
+    path_elements: List[int]  # Sibling hashes, leaf level first
+    path_indices: List[int]  # 0 = node is a left child, 1 = right child
+    root: int
+
+
+class PoseidonMerkleTree:
+    """
+    Fixed-depth binary Merkle tree over Poseidon(left, right).
+
+    Used to commit to a set of identity hashes so a participant can prove
+    membership in the set without revealing which identity is theirs.
+    Empty slots hold ZERO_VALUE; each level is hashed with one hash_many call.
+    """
+
+    ZERO_VALUE = 0
+
+    def __init__(
+        self,
+        leaves: Iterable,
+        depth: Optional[int] = None,
+        poseidon: Optional[PoseidonHash] = None,
+    ):
+        """
+        Build the tree.
+
+        Args:
+            leaves: Leaf values (field elements or 32-byte identity hashes)
+            depth: Tree depth; defaults to the smallest depth that fits the leaves
+            poseidon: Hash instance to use (a new PoseidonHash by default)
+
+        Raises:
+            ValueError: If the leaves do not fit in a tree of the given depth
+        """
+        self.poseidon = poseidon or PoseidonHash()
+        leaf_values = self.poseidon._normalize(leaves)
+        if depth is None:
+            depth = max(1, (len(leaf_values) - 1).bit_length())
+        if len(leaf_values) > 1 << depth:
+            raise ValueError(f"{len(leaf_values)} leaves do not fit in a tree of depth {depth}")
+        self.depth = depth
+
+        self.zero_hashes = [self.ZERO_VALUE]
+        for _ in range(depth):
+            z = self.zero_hashes[-1]
+            self.zero_hashes.append(self.poseidon.hash([z, z]))
+
+        # Only the occupied prefix of each level is stored; the rest is zero_hashes
+        self.levels: List[List[int]] = [leaf_values]
+        for level in range(depth):
+            nodes = self.levels[-1]
+            if len(nodes) % 2:
+                nodes = nodes + [self.zero_hashes[level]]
+            pairs = [nodes[i : i + 2] for i in range(0, len(nodes), 2)]
+            self.levels.append(self.poseidon.hash_many(pairs))
+        self._positions = {leaf: i for i, leaf in reversed(list(enumerate(leaf_values)))}
+
+    @property
+    def root(self) -> int:
+        """Merkle root as a field element."""
+        top = self.levels[-1]
+        return top[0] if top else self.zero_hashes[self.depth]
+
+    @property
+    def leaves(self) -> List[int]:
+        """Occupied leaves, in insertion order."""
+        return list(self.levels[0])
+
+    def index_of(self, leaf) -> Optional[int]:
+        """Return the first index holding leaf, or None."""
+        return self._positions.get(self.poseidon._normalize([leaf])[0])
+
+    def _node(self, level: int, index: int) -> int:
+        nodes = self.levels[level]
+        return nodes[index] if index < len(nodes) else self.zero_hashes[level]
+
+    def proof(self, index: int) -> MerkleProof:
+        """
+        Build the membership proof for the leaf at index.
+
+        Raises:
+            IndexError: If index is not an occupied leaf
+        """
+        if not 0 <= index < len(self.levels[0]):
+            raise IndexError(f"Leaf index {index} out of range")
+        path_elements = []
+        path_indices = []
+        position = index
+        for level in range(self.depth):
+            path_elements.append(self._node(level, position ^ 1))
+            path_indices.append(position & 1)
+            position >>= 1
+        return MerkleProof(
+            leaf=self.levels[0][index],
+            index=index,
+            path_elements=path_elements,
+            path_indices=path_indices,
+            root=self.root,
+        )
+
+    @staticmethod
+    def verify_proof(proof: MerkleProof, poseidon: Optional[PoseidonHash] = None) -> bool:
+        """Recompute the root from a proof and compare it with proof.root."""
+        poseidon = poseidon or PoseidonHash()
+        current = proof.leaf
+        for sibling, is_right in zip(proof.path_elements, proof.path_indices):
+            pair = [sibling, current] if is_right else [current, sibling]
+            current = poseidon.hash(pair)
+        return current == proof.root
+
+
 class IdentityManager:
     """
     Manager for dispute identity creation and ZK proof preparation.
@@ -499,6 +867,73 @@ class IdentityManager:
             "counterpartyHash": str(int.from_bytes(counterparty_hash, "big")),
         }
 
+    def generate_identities(self, count: int) -> List[DisputeIdentity]:
+        """
+        Generate many random identities, hashing them in one batch.
+
+        Args:
+            count: Number of identities to generate
+
+        Returns:
+            List of DisputeIdentity with random secrets
+        """
+        salts = [os.urandom(32) for _ in range(count)]
+        secrets = [int.from_bytes(os.urandom(32), "big") for _ in range(count)]
+        hashes = self.poseidon.hash_many([secret] for secret in secrets)
+        return [
+            DisputeIdentity(
+                identity_secret=secret,
+                identity_hash=hash_int.to_bytes(32, "big"),
+                salt=salt,
+                address=None,
+            )
+            for secret, hash_int, salt in zip(secrets, hashes, salts)
+        ]
+
+    def build_identity_tree(
+        self, identity_hashes: List[bytes], depth: Optional[int] = None
+    ) -> PoseidonMerkleTree:
+        """
+        Build a Poseidon Merkle tree over a set of identity hashes.
+
+        Args:
+            identity_hashes: 32-byte identity hashes forming the set
+            depth: Optional fixed tree depth (must match the circuit)
+
+        Returns:
+            PoseidonMerkleTree whose root commits to the set
+        """
+        return PoseidonMerkleTree(identity_hashes, depth=depth, poseidon=self.poseidon)
+
+    def prepare_set_membership_inputs(
+        self, identity: DisputeIdentity, tree: PoseidonMerkleTree
+    ) -> Dict[str, object]:
+        """
+        Prepare inputs for proving that an identity belongs to a tree's set.
+
+        Compatible with snarkjs input format.
+
+        Args:
+            identity: DisputeIdentity to prove
+            tree: Tree built over the identity set
+
+        Returns:
+            Dictionary with identitySecret, pathElements, pathIndices and root
+
+        Raises:
+            ValueError: If the identity's hash is not in the tree
+        """
+        index = tree.index_of(identity.identity_hash)
+        if index is None:
+            raise ValueError("Identity is not a member of the tree")
+        proof = tree.proof(index)
+        return {
+            "identitySecret": str(identity.identity_secret),
+            "pathElements": [str(e) for e in proof.path_elements],
+            "pathIndices": [str(i) for i in proof.path_indices],
+            "root": str(proof.root),
+        }
+
     def save_identity(self, identity: DisputeIdentity, name: str, password: str) -> bool:
         """
         Save identity to encrypted storage.
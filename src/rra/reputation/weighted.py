@@ -9,14 +9,50 @@ Provides reputation-based weight calculations for dispute resolution:
 - Voting power calculation with reputation multipliers
 - Good-faith behavior bonuses
 - Bad actor penalties
+- Lazy inactivity decay with a sorted score index for rankings
+- Bounded in-memory history with a paginated on-disk archive
+- Columnar voting power snapshots for whole electorates
 """
 
+import heapq
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Any,
+    Tuple,
+)
 from pathlib import Path
-import json
+
+# PERFORMANCE: Optional NumPy evaluation of electorate-wide voting power
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    if not TYPE_CHECKING:
+        # Every use is guarded by NUMPY_AVAILABLE
+        np = None
+
+from rra.persistence.archive import RecordArchive, open_archive
+from rra.persistence.oplog import OpLogStore, open_store
+
+# Recent changes kept per participant; older ones live in the archive
+HISTORY_RING_SIZE = 50
+
+# Cached electorate snapshots per manager (one per governance epoch)
+POWER_SNAPSHOT_CACHE_SIZE = 8
 
 
 class ReputationAction(Enum):
@@ -79,7 +115,25 @@ class ParticipantReputation:
     total_votes: int = 0
     last_activity_at: datetime = field(default_factory=datetime.now)
     created_at: datetime = field(default_factory=datetime.now)
-    history: List[ReputationChange] = field(default_factory=list)
+    history: Deque[ReputationChange] = field(
+        default_factory=lambda: deque(maxlen=HISTORY_RING_SIZE)
+    )
+    # Lifetime count and delta sum per action value
+    history_summary: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # Start of the not-yet-applied decay periods (None: last_activity_at)
+    decay_epoch: Optional[datetime] = None
+
+    @property
+    def decay_since(self) -> datetime:
+        """Moment from which inactivity decay accrues."""
+        return self.decay_epoch or self.last_activity_at
+
+    def record_change(self, change: ReputationChange) -> None:
+        """Add a change to the recent history and the per-action summary."""
+        self.history.append(change)
+        summary = self.history_summary.setdefault(change.action.value, {"count": 0, "delta": 0})
+        summary["count"] += 1
+        summary["delta"] += change.delta
 
     @property
     def success_rate(self) -> float:
@@ -124,7 +178,9 @@ class ParticipantReputation:
             "total_votes": self.total_votes,
             "last_activity_at": self.last_activity_at.isoformat(),
             "created_at": self.created_at.isoformat(),
-            "history": [h.to_dict() for h in self.history[-50:]],  # Keep last 50
+            "decay_epoch": self.decay_epoch.isoformat() if self.decay_epoch else None,
+            "history": [h.to_dict() for h in self.history],
+            "history_summary": self.history_summary,
             "success_rate": self.success_rate,
             "alignment_rate": self.alignment_rate,
             "tenure_days": self.tenure_days,
@@ -144,7 +200,14 @@ class ParticipantReputation:
             last_activity_at=datetime.fromisoformat(data["last_activity_at"]),
             created_at=datetime.fromisoformat(data["created_at"]),
         )
-        rep.history = [ReputationChange.from_dict(h) for h in data.get("history", [])]
+        if data.get("decay_epoch"):
+            rep.decay_epoch = datetime.fromisoformat(data["decay_epoch"])
+        for change in data.get("history", []):
+            rep.record_change(ReputationChange.from_dict(change))
+        if "history_summary" in data:
+            rep.history_summary = {
+                action: dict(summary) for action, summary in data["history_summary"].items()
+            }
         return rep
 
 
@@ -198,6 +261,172 @@ class ReputationConfig:
     )
 
 
+def _power_formula(
+    config: ReputationConfig,
+    score: int,
+    tenure_days: int,
+    stake: int,
+) -> Tuple[float, float, int]:
+    """Reputation multiplier, tenure bonus and total power for one participant."""
+    # Score 100 = 1.0, Score 10000 = 3.0
+    score_range = config.max_reputation - config.min_reputation
+    score_normalized = (score - config.min_reputation) / score_range
+    multiplier_range = config.max_multiplier - config.min_multiplier
+    reputation_multiplier = config.min_multiplier + (score_normalized * multiplier_range)
+    reputation_multiplier = min(reputation_multiplier, config.max_multiplier)
+
+    # Tenure bonus (0% to 20%)
+    tenure_ratio = min(tenure_days / config.tenure_max_days, 1.0)
+    tenure_bonus = tenure_ratio * config.tenure_bonus_max
+
+    total_power = int(stake * reputation_multiplier * (1 + tenure_bonus))
+    return reputation_multiplier, tenure_bonus, total_power
+
+
+class VotingPowerSnapshot:
+    """
+    Voting power of a whole electorate, evaluated column-wise.
+
+    Holds score, tenure and stake columns for a set of addresses and
+    evaluates the multiplier and tenure-bonus formula over all rows at once
+    (vectorized with NumPy when installed). Lookups are O(1); a reputation
+    update re-evaluates only the affected row. Tenure is taken at snapshot
+    time, and the snapshot expires at valid_until: the next inactivity decay
+    boundary or tenure day of any of its participants, and at the latest the
+    next UTC day boundary.
+    """
+
+    def __init__(
+        self,
+        config: ReputationConfig,
+        addresses: List[str],
+        scores: List[int],
+        tenure_days: List[int],
+        stakes: List[int],
+        valid_until: datetime,
+    ):
+        self.config = config
+        self.addresses = addresses
+        self.scores = scores
+        self.tenure_days = tenure_days
+        self.stakes = stakes
+        self.valid_until = valid_until
+        self._positions = {address.lower(): i for i, address in enumerate(addresses)}
+
+        self.multipliers, self.tenure_bonuses, self.powers = self._evaluate()
+        self.total_power = sum(self.powers)
+
+    def _evaluate(self) -> Tuple[List[float], List[float], List[int]]:
+        config = self.config
+        if not NUMPY_AVAILABLE:
+            rows = [
+                _power_formula(config, score, tenure, stake)
+                for score, tenure, stake in zip(self.scores, self.tenure_days, self.stakes)
+            ]
+            return [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows]
+
+        # Same operations, in the same order, as _power_formula
+        scores = np.asarray(self.scores, dtype=np.float64)
+        score_range = config.max_reputation - config.min_reputation
+        multiplier_range = config.max_multiplier - config.min_multiplier
+        multipliers = np.minimum(
+            config.min_multiplier
+            + ((scores - config.min_reputation) / score_range) * multiplier_range,
+            config.max_multiplier,
+        )
+        tenure = np.asarray(self.tenure_days, dtype=np.float64)
+        bonuses = np.minimum(tenure / config.tenure_max_days, 1.0) * config.tenure_bonus_max
+        # Float stakes: token amounts overflow int64
+        powers = np.asarray(self.stakes, dtype=np.float64) * multipliers * (1 + bonuses)
+        return multipliers.tolist(), bonuses.tolist(), [int(p) for p in powers.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __contains__(self, address: str) -> bool:
+        return address.lower() in self._positions
+
+    def _power_at(self, i: int) -> VotingPower:
+        return VotingPower(
+            base_stake=self.stakes[i],
+            reputation_multiplier=self.multipliers[i],
+            tenure_bonus=self.tenure_bonuses[i],
+            total_power=self.powers[i],
+        )
+
+    def get(self, address: str) -> Optional[VotingPower]:
+        """Voting power of one address, or None if it is not in the snapshot."""
+        i = self._positions.get(address.lower())
+        return None if i is None else self._power_at(i)
+
+    def items(self) -> Iterator[Tuple[str, VotingPower]]:
+        """(address, VotingPower) for every row, in snapshot order."""
+        for i, address in enumerate(self.addresses):
+            yield address, self._power_at(i)
+
+    def set_score(self, address: str, score: int) -> None:
+        """Re-evaluate one row after its reputation score changed."""
+        i = self._positions.get(address)
+        if i is None:
+            return
+        self.scores[i] = score
+        multiplier, bonus, power = _power_formula(
+            self.config, score, self.tenure_days[i], self.stakes[i]
+        )
+        self.total_power += power - self.powers[i]
+        self.multipliers[i], self.tenure_bonuses[i], self.powers[i] = multiplier, bonus, power
+
+    def distribution(self) -> Dict[str, float]:
+        """Each address's share of the total power, in percent."""
+        if self.total_power == 0:
+            return {address: 0.0 for address in self.addresses}
+        total = self.total_power
+        return {
+            address: (power / total) * 100 for address, power in zip(self.addresses, self.powers)
+        }
+
+
+class _ScoreIndex:
+    """
+    Participants ordered by stored score.
+
+    Keeps (score, address) keys in a sorted list so leaderboards, ranks and
+    score percentiles are read off by position instead of sorting every
+    participant on each call.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[int, str]] = []
+        self._scores: Dict[str, int] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, address: str, score: int) -> None:
+        """Insert a participant or move it to its new score."""
+        old = self._scores.get(address)
+        if old == score:
+            return
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (old, address))]
+            self.total -= old
+        insort(self._keys, (score, address))
+        self._scores[address] = score
+        self.total += score
+
+    def descending(self) -> Iterator[Tuple[int, str]]:
+        return reversed(self._keys)
+
+    def score_at(self, position: int) -> int:
+        """Score at an ascending position."""
+        return self._keys[position][0]
+
+    def count_above(self, score: int) -> int:
+        """Number of participants with a strictly higher score."""
+        return len(self._keys) - bisect_left(self._keys, (score + 1,))
+
+
 class ReputationManager:
     """
     Manages participant reputation and voting power calculations.
@@ -207,6 +436,12 @@ class ReputationManager:
     - Good-faith actors have more influence
     - Bad actors are dampened
     - Calculations are transparent and auditable
+
+    Inactivity decay is closed-form: a participant's score decays by
+    decay_rate per whole decay period since decay_since, so reads compute it
+    without touching state. Decay is written back (materialized) for all due
+    participants at once by apply_decay_all() and before ranked reads, which
+    find them through a heap of next decay boundaries.
     """
 
     def __init__(
@@ -223,8 +458,17 @@ class ReputationManager:
         # Dispute tracking
         self.dispute_participants: Dict[str, List[str]] = {}
 
+        # Ranking and decay bookkeeping (rebuilt on load)
+        self._score_index = _ScoreIndex()
+        self._decay_due: List[Tuple[datetime, str]] = []
+        self._power_snapshots: "OrderedDict[Hashable, VotingPowerSnapshot]" = OrderedDict()
+
+        self._store: Optional[OpLogStore] = None
+        self._archive: Optional[RecordArchive] = None
         if data_dir:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._store = open_store(data_dir / "reputation_oplog")
+            self._archive = open_archive(data_dir / "reputation_history")
             self._load_state()
 
     # =========================================================================
@@ -235,11 +479,13 @@ class ReputationManager:
         """Get or create a participant."""
         address = address.lower()
         if address not in self.participants:
-            self.participants[address] = ParticipantReputation(
+            participant = ParticipantReputation(
                 address=address,
                 score=self.config.base_reputation,
             )
-            self._save_state()
+            self.participants[address] = participant
+            self._track(participant)
+            self._save_entity("participants", address)
         return self.participants[address]
 
     def get_participant(self, address: str) -> Optional[ParticipantReputation]:
@@ -250,9 +496,23 @@ class ReputationManager:
         """Get reputation score for address."""
         participant = self.get_participant(address)
         if participant:
-            return participant.score
+            return self._decayed_score(participant, datetime.now())[0]
         return self.config.base_reputation
 
+    def _track(self, participant: ParticipantReputation) -> None:
+        """Add a participant to the score index and the decay schedule."""
+        self._score_index.update(participant.address, participant.score)
+        heapq.heappush(self._decay_due, (self._next_decay_at(participant), participant.address))
+
+    def _next_decay_at(self, participant: ParticipantReputation) -> datetime:
+        return participant.decay_since + timedelta(days=self.config.decay_period_days)
+
+    def _set_score(self, participant: ParticipantReputation, score: int) -> None:
+        participant.score = score
+        self._score_index.update(participant.address, score)
+        for snapshot in self._power_snapshots.values():
+            snapshot.set_score(participant.address, score)
+
     # =========================================================================
     # Reputation Updates
     # =========================================================================
@@ -279,6 +539,7 @@ class ReputationManager:
             Updated participant reputation
         """
         participant = self.get_or_create_participant(address)
+        self._touch(participant)
 
         delta = custom_delta if custom_delta is not None else self.config.deltas.get(action, 0)
 
@@ -286,8 +547,7 @@ class ReputationManager:
         new_score = participant.score + delta
         new_score = max(self.config.min_reputation, min(self.config.max_reputation, new_score))
 
-        participant.score = new_score
-        participant.last_activity_at = datetime.now()
+        self._set_score(participant, new_score)
 
         # Record change
         change = ReputationChange(
@@ -297,11 +557,92 @@ class ReputationManager:
             dispute_id=dispute_id,
             reason=reason or f"Action: {action.value}",
         )
-        participant.history.append(change)
+        self._record_change(participant, change)
 
-        self._save_state()
+        self._save_entity("participants", participant.address)
         return participant
 
+    def _touch(self, participant: ParticipantReputation) -> None:
+        """Record activity, applying any decay accrued up to now first."""
+        now = datetime.now()
+        self._materialize_decay(participant, now)
+        participant.last_activity_at = now
+        participant.decay_epoch = None
+
+    def _decayed_score(self, participant: ParticipantReputation, now: datetime) -> Tuple[int, int]:
+        """Closed-form decayed score and the number of whole periods it covers."""
+        periods = (now - participant.decay_since).days // self.config.decay_period_days
+        if periods <= 0:
+            return participant.score, 0
+        decayed = int(participant.score * (1 - self.config.decay_rate) ** periods)
+        return max(min(decayed, participant.score), self.config.min_reputation), periods
+
+    def _materialize_decay(self, participant: ParticipantReputation, now: datetime) -> int:
+        """Apply accrued decay to the stored score; returns the amount removed."""
+        score, periods = self._decayed_score(participant, now)
+        if periods == 0:
+            return 0
+
+        decay_amount = participant.score - score
+        participant.decay_epoch = participant.decay_since + timedelta(
+            days=periods * self.config.decay_period_days
+        )
+        if decay_amount:
+            self._set_score(participant, score)
+            self._record_change(
+                participant,
+                ReputationChange(
+                    action=ReputationAction.DECAY_ADJUSTMENT,
+                    delta=-decay_amount,
+                    timestamp=now,
+                    reason=f"Inactivity decay: {periods} periods",
+                ),
+            )
+        return decay_amount
+
+    def _record_change(self, participant: ParticipantReputation, change: ReputationChange) -> None:
+        # Strictly increasing per participant, so a page ending at timestamp t
+        # continues at since=t without skipping or repeating changes
+        if participant.history and change.timestamp <= participant.history[-1].timestamp:
+            change.timestamp = participant.history[-1].timestamp + timedelta(microseconds=1)
+        participant.record_change(change)
+        if self._archive:
+            self._archive.append(participant.address, change.to_dict())
+
+    def get_history(
+        self,
+        address: str,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[ReputationChange]:
+        """
+        Get a page of a participant's reputation history, oldest first.
+
+        Reads the full archived history when persistence is enabled,
+        otherwise the recent in-memory window.
+
+        Args:
+            address: Participant address
+            since: Only changes after this time; pass the last timestamp of
+                a page to get the next page
+            limit: Maximum number of changes
+
+        Returns:
+            List of ReputationChange
+        """
+        address = address.lower()
+        if self._archive:
+            records = self._archive.read(
+                address, since=since.isoformat() if since else None, limit=limit
+            )
+            return [ReputationChange.from_dict(r) for r in records]
+
+        participant = self.participants.get(address)
+        if not participant:
+            return []
+        changes = [c for c in participant.history if since is None or c.timestamp > since]
+        return changes[:limit]
+
     def apply_decay(self, address: str) -> Optional[int]:
         """
         Apply inactivity decay to participant.
@@ -312,32 +653,41 @@ class ReputationManager:
         if not participant:
             return None
 
-        days_inactive = participant.days_since_activity
-        periods = days_inactive // self.config.decay_period_days
-
-        if periods == 0:
-            return None
-
-        decay_amount = int(participant.score * self.config.decay_rate * periods)
-        if decay_amount == 0:
+        decay_amount = self._materialize_decay(participant, datetime.now())
+        if not decay_amount:
             return None
 
-        self.update_reputation(
-            address,
-            ReputationAction.DECAY_ADJUSTMENT,
-            custom_delta=-decay_amount,
-            reason=f"Inactivity decay: {periods} periods",
-        )
-
+        self._save_entity("participants", participant.address)
         return decay_amount
 
-    def apply_decay_all(self) -> Dict[str, int]:
-        """Apply decay to all inactive participants."""
-        decayed = {}
-        for address in list(self.participants.keys()):
-            amount = self.apply_decay(address)
-            if amount:
-                decayed[address] = amount
+    def apply_decay_all(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Materialize decay for every participant with a due decay period.
+
+        Only participants whose next decay boundary has passed are visited,
+        and their updates are written as one batch.
+        """
+        now = now or datetime.now()
+        decayed: Dict[str, int] = {}
+        changed: List[str] = []
+
+        while self._decay_due and self._decay_due[0][0] <= now:
+            _, address = heapq.heappop(self._decay_due)
+            participant = self.participants.get(address)
+            if participant is None:
+                continue
+            if self._next_decay_at(participant) <= now:
+                amount = self._materialize_decay(participant, now)
+                changed.append(address)
+                if amount:
+                    decayed[address] = amount
+            # One schedule entry per participant, moved to its next boundary
+            heapq.heappush(self._decay_due, (self._next_decay_at(participant), address))
+
+        for address in changed:
+            self._save_entity("participants", address)
+        if changed and self._store:
+            self._store.flush()
         return decayed
 
     # =========================================================================
@@ -359,8 +709,9 @@ class ReputationManager:
         if address not in self.dispute_participants[dispute_id]:
             self.dispute_participants[dispute_id].append(address)
             participant.total_disputes += 1
-            participant.last_activity_at = datetime.now()
-            self._save_state()
+            self._touch(participant)
+            self._save_entity("participants", address)
+            self._save_entity("dispute_participants", dispute_id)
 
     def record_dispute_resolution(
         self,
@@ -505,26 +856,12 @@ class ReputationManager:
         tenure_days = 0
 
         if participant:
-            rep_score = participant.score
+            rep_score = self._decayed_score(participant, datetime.now())[0]
             tenure_days = participant.tenure_days
 
-        # Calculate reputation multiplier (1.0 to 3.0)
-        # Score 100 = 1.0, Score 10000 = 3.0
-        score_range = self.config.max_reputation - self.config.min_reputation
-        score_normalized = (rep_score - self.config.min_reputation) / score_range
-        multiplier_range = self.config.max_multiplier - self.config.min_multiplier
-        reputation_multiplier = self.config.min_multiplier + (score_normalized * multiplier_range)
-
-        # Cap multiplier
-        reputation_multiplier = min(reputation_multiplier, self.config.max_multiplier)
-
-        # Calculate tenure bonus (0% to 20%)
-        tenure_ratio = min(tenure_days / self.config.tenure_max_days, 1.0)
-        tenure_bonus = tenure_ratio * self.config.tenure_bonus_max
-
-        # Calculate total power
-        base_power = stake * reputation_multiplier
-        total_power = int(base_power * (1 + tenure_bonus))
+        reputation_multiplier, tenure_bonus, total_power = _power_formula(
+            self.config, rep_score, tenure_days, stake
+        )
 
         return VotingPower(
             base_stake=stake,
@@ -533,6 +870,72 @@ class ReputationManager:
             total_power=total_power,
         )
 
+    def snapshot_voting_power(
+        self,
+        participants: Iterable[Tuple[str, int]],
+        epoch: Optional[Hashable] = None,
+    ) -> VotingPowerSnapshot:
+        """
+        Evaluate voting power for a whole electorate at once.
+
+        With an epoch key the snapshot is cached: later calls with the same
+        key return it (participants is then not read again) until a decay
+        boundary or tenure day of one of its members, or the next UTC day
+        boundary, passes. Reputation updates are applied to cached snapshots
+        row by row. Use a new key whenever stakes change.
+
+        Args:
+            participants: (address, stake) pairs
+            epoch: Cache key identifying the stake set, e.g. a governance epoch
+
+        Returns:
+            VotingPowerSnapshot
+        """
+        now = datetime.now()
+        if epoch is not None:
+            snapshot = self._power_snapshots.get(epoch)
+            if snapshot and now < snapshot.valid_until:
+                self._power_snapshots.move_to_end(epoch)
+                return snapshot
+
+        addresses: List[str] = []
+        scores: List[int] = []
+        tenure: List[int] = []
+        stakes: List[int] = []
+        period = timedelta(days=self.config.decay_period_days)
+        # Never cache past the next UTC midnight (on the local clock used here)
+        utc_now = datetime.now(timezone.utc)
+        next_day = (utc_now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        valid_until = now + (next_day - utc_now)
+
+        for address, stake in participants:
+            participant = self.participants.get(address.lower())
+            addresses.append(address)
+            stakes.append(stake)
+            if participant is None:
+                scores.append(self.config.base_reputation)
+                tenure.append(0)
+                continue
+            score, periods = self._decayed_score(participant, now)
+            days = (now - participant.created_at).days
+            scores.append(score)
+            tenure.append(days)
+            valid_until = min(
+                valid_until,
+                participant.decay_since + period * (periods + 1),
+                participant.created_at + timedelta(days=days + 1),
+            )
+
+        snapshot = VotingPowerSnapshot(
+            self.config, addresses, scores, tenure, stakes, valid_until=valid_until
+        )
+        if epoch is not None:
+            self._power_snapshots[epoch] = snapshot
+            self._power_snapshots.move_to_end(epoch)
+            while len(self._power_snapshots) > POWER_SNAPSHOT_CACHE_SIZE:
+                self._power_snapshots.popitem(last=False)
+        return snapshot
+
     def calculate_batch_voting_power(
         self,
         participants: List[Tuple[str, int]],
@@ -546,9 +949,7 @@ class ReputationManager:
         Returns:
             Dict mapping address to VotingPower
         """
-        return {
-            address: self.calculate_voting_power(address, stake) for address, stake in participants
-        }
+        return dict(self.snapshot_voting_power(participants).items())
 
     def get_power_distribution(
         self,
@@ -563,13 +964,7 @@ class ReputationManager:
         Returns:
             Dict mapping address to percentage of total power
         """
-        powers = self.calculate_batch_voting_power(participants)
-        total = sum(p.total_power for p in powers.values())
-
-        if total == 0:
-            return {addr: 0.0 for addr, _ in participants}
-
-        return {addr: (power.total_power / total) * 100 for addr, power in powers.items()}
+        return self.snapshot_voting_power(participants).distribution()
 
     # =========================================================================
     # Analytics
@@ -581,25 +976,25 @@ class ReputationManager:
         if not participant:
             return None
 
-        # Calculate rank
-        all_scores = [p.score for p in self.participants.values()]
-        all_scores.sort(reverse=True)
-        rank = all_scores.index(participant.score) + 1
+        self.apply_decay_all()
+        total = len(self._score_index)
+        rank = self._score_index.count_above(participant.score) + 1
 
         return {
             **participant.to_dict(),
             "rank": rank,
             "total_participants": len(self.participants),
-            "percentile": ((len(all_scores) - rank) / len(all_scores)) * 100 if all_scores else 0,
+            "percentile": ((total - rank) / total) * 100 if total else 0,
         }
 
     def get_leaderboard(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get top participants by reputation."""
-        sorted_participants = sorted(
-            self.participants.values(),
-            key=lambda p: p.score,
-            reverse=True,
-        )
+        self.apply_decay_all()
+        leaders = []
+        for i, (_, address) in enumerate(self._score_index.descending()):
+            if i >= limit:
+                break
+            leaders.append(self.participants[address])
 
         return [
             {
@@ -610,7 +1005,7 @@ class ReputationManager:
                 "alignment_rate": p.alignment_rate,
                 "tenure_days": p.tenure_days,
             }
-            for i, p in enumerate(sorted_participants[:limit])
+            for i, p in enumerate(leaders)
         ]
 
     def get_stats(self) -> Dict[str, Any]:
@@ -622,15 +1017,16 @@ class ReputationManager:
                 "median_score": self.config.base_reputation,
             }
 
-        scores = [p.score for p in self.participants.values()]
-        scores.sort()
+        self.apply_decay_all()
+        index = self._score_index
+        count = len(index)
 
         return {
             "total_participants": len(self.participants),
-            "avg_score": sum(scores) / len(scores),
-            "median_score": scores[len(scores) // 2],
-            "min_score": min(scores),
-            "max_score": max(scores),
+            "avg_score": index.total / count,
+            "median_score": index.score_at(count // 2),
+            "min_score": index.score_at(0),
+            "max_score": index.score_at(count - 1),
             "total_disputes": sum(p.total_disputes for p in self.participants.values()),
             "total_successful": sum(p.successful_disputes for p in self.participants.values()),
         }
@@ -639,8 +1035,14 @@ class ReputationManager:
     # Persistence
     # =========================================================================
 
+    def _save_entity(self, collection: str, key: str) -> None:
+        """Log one changed participant or dispute roster."""
+        if self._store:
+            self._store.save(collection, key, getattr(self, collection).get(key))
+
     def _save_state(self) -> None:
-        if not self.data_dir:
+        """Snapshot the whole state (bulk changes; single updates use _save_entity)."""
+        if not self._store:
             return
 
         state = {
@@ -652,30 +1054,40 @@ class ReputationManager:
                 "min_reputation": self.config.min_reputation,
             },
         }
-
-        state_file = self.data_dir / "reputation_state.json"
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        self._store.replace_state(state)
 
     def _load_state(self) -> None:
-        if not self.data_dir:
+        data_dir = self.data_dir
+        if not self._store or data_dir is None:
             return
 
-        state_file = self.data_dir / "reputation_state.json"
-        if not state_file.exists():
+        state = self._store.load_state(legacy_file=data_dir / "reputation_state.json")
+        if not state:
             return
 
         try:
-            with open(state_file) as f:
-                state = json.load(f)
-
             self.participants = {
                 addr: ParticipantReputation.from_dict(data)
                 for addr, data in state.get("participants", {}).items()
             }
-            self.dispute_participants = state.get("dispute_participants", {})
-
-        except (json.JSONDecodeError, KeyError):
+            self.dispute_participants = {
+                did: list(addrs) for did, addrs in state.get("dispute_participants", {}).items()
+            }
+            self._score_index = _ScoreIndex()
+            self._decay_due = []
+            for participant in self.participants.values():
+                self._track(participant)
+
+            # State written before the archive existed: seed it with the
+            # recent history that state kept, then re-save the participant
+            # (now with a history_summary) so the import runs only once
+            for addr, data in state.get("participants", {}).items():
+                if "history_summary" not in data and self._archive:
+                    for change in self.participants[addr].history:
+                        self._archive.append(addr, change.to_dict())
+                    self._save_entity("participants", addr)
+
+        except KeyError:
             pass
 
 
@@ -3,5 +3,6 @@
 """RRA Services package."""
 
 from rra.services.deep_links import DeepLinkService
+from rra.services.kb_index import KnowledgeBaseIndex
 
-__all__ = ["DeepLinkService"]
+__all__ = ["DeepLinkService", "KnowledgeBaseIndex"]
@@ -51,10 +51,18 @@ class DeepLinkService:
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.mappings_path = mappings_path or Path("agent_knowledge_bases/repo_mappings.json")
         self._mappings: Dict[str, Dict[str, Any]] = {}
+        self._mappings_mtime: Optional[int] = None
         self._load_mappings()
 
+    def _mappings_file_mtime(self) -> Optional[int]:
+        try:
+            return self.mappings_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load_mappings(self) -> None:
         """Load repo ID mappings from file."""
+        self._mappings_mtime = self._mappings_file_mtime()
         if self.mappings_path.exists():
             try:
                 with open(self.mappings_path, "r") as f:
@@ -67,6 +75,19 @@ class DeepLinkService:
         self.mappings_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.mappings_path, "w") as f:
             json.dump(self._mappings, f, indent=2, default=str)
+        self._mappings_mtime = self._mappings_file_mtime()
+
+    def refresh_mappings(self) -> bool:
+        """
+        Reload the mappings if another process or service instance changed the file.
+
+        Returns:
+            True if the mappings were reloaded
+        """
+        if self._mappings_file_mtime() == self._mappings_mtime:
+            return False
+        self._load_mappings()
+        return True
 
     def generate_repo_id(self, repo_url: str) -> str:
         """
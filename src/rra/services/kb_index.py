@@ -0,0 +1,278 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Knowledge base index for RRA Module.
+
+Resolves an agent (repository) ID to its knowledge base file without
+loading every knowledge base in the directory. The index is built once,
+from the repo URL stored in each file, and refreshed when the directory,
+a knowledge base file or the deep link mappings change. Recently used
+knowledge bases are kept loaded.
+"""
+
+import gzip
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from rra.ingestion.knowledge_base import KnowledgeBase
+from rra.services.deep_links import DeepLinkService
+
+logger = logging.getLogger(__name__)
+
+# Loaded knowledge bases kept in memory
+DEFAULT_KB_CACHE_SIZE = 64
+
+# Minimum seconds between full rescans triggered by lookups that miss
+DEFAULT_RESCAN_INTERVAL = 1.0
+
+_GITHUB_REPO = re.compile(r"github\.com/([^/]+)/([^/]+)")
+
+_Signature = Tuple[int, int]
+
+
+def _signature(path: Path) -> Optional[_Signature]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_repo_url(path: Path) -> str:
+    """Read just the repo URL of a knowledge base file."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except UnicodeDecodeError:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    repo_url = data["repo_url"]
+    if not isinstance(repo_url, str):
+        raise TypeError(f"repo_url is {type(repo_url).__name__}, not str")
+    return repo_url
+
+
+class KnowledgeBaseIndex:
+    """
+    Agent ID -> knowledge base file index with a loaded-KB cache.
+
+    Lookup order matches the previous per-request scan: a registered deep
+    link mapping, then the ID generated from each file's repo URL, then a
+    file whose name contains the agent ID.
+
+    Example:
+        index = KnowledgeBaseIndex(Path("agent_knowledge_bases"))
+        kb = index.load(agent_id)
+    """
+
+    def __init__(
+        self,
+        kb_dir: Path = Path("agent_knowledge_bases"),
+        link_service: Optional[DeepLinkService] = None,
+        pattern: str = "*_kb.json",
+        cache_size: int = DEFAULT_KB_CACHE_SIZE,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+    ):
+        """
+        Initialize the index. Nothing is read until the first lookup.
+
+        Args:
+            kb_dir: Directory holding the knowledge base files
+            link_service: Deep link service for registered mappings
+                (default: one reading kb_dir/repo_mappings.json)
+            pattern: Glob pattern of knowledge base files
+            cache_size: Number of loaded knowledge bases to keep
+            rescan_interval: Minimum seconds between rescans on lookup misses
+        """
+        self.kb_dir = Path(kb_dir)
+        self.link_service = link_service or DeepLinkService(
+            mappings_path=self.kb_dir / "repo_mappings.json"
+        )
+        self.pattern = pattern
+        self.cache_size = cache_size
+        self.rescan_interval = rescan_interval
+
+        self._lock = threading.RLock()
+        self._location: Optional[Path] = None
+        self._dir_signature: Optional[_Signature] = None
+        self._scanned_at = float("-inf")
+        # path -> (file signature, generated repo ID or None if unreadable)
+        self._files: Dict[Path, Tuple[_Signature, Optional[str]]] = {}
+        self._by_repo_id: Dict[str, Path] = {}
+        self._loaded: "OrderedDict[Path, Tuple[_Signature, KnowledgeBase]]" = OrderedDict()
+
+        # Stats
+        self.scans = 0
+        self.files_parsed = 0
+
+    # =========================================================================
+    # Index maintenance
+    # =========================================================================
+
+    def _index_file(
+        self, path: Path, signature: _Signature, repo_url: Optional[str] = None
+    ) -> None:
+        previous = self._files.get(path)
+        if previous and previous[0] == signature:
+            return
+        if previous and previous[1] and self._by_repo_id.get(previous[1]) == path:
+            del self._by_repo_id[previous[1]]
+        try:
+            if repo_url is None:
+                repo_url = _read_repo_url(path)
+                self.files_parsed += 1
+            repo_id = self.link_service.generate_repo_id(repo_url)
+        except (json.JSONDecodeError, KeyError, OSError, TypeError, AttributeError) as e:
+            logger.debug(f"Could not index knowledge base {path}: {e}")
+            repo_id = None
+        self._files[path] = (signature, repo_id)
+        if repo_id:
+            self._by_repo_id.setdefault(repo_id, path)
+
+    def _scan(self) -> None:
+        """Bring the index in line with the directory, parsing only new or changed files."""
+        present = set()
+        for path in sorted(self.kb_dir.glob(self.pattern)):
+            signature = _signature(path)
+            if signature is None:
+                continue
+            present.add(path)
+            self._index_file(path, signature)
+
+        for path in [p for p in self._files if p not in present]:
+            _, repo_id = self._files.pop(path)
+            if repo_id and self._by_repo_id.get(repo_id) == path:
+                del self._by_repo_id[repo_id]
+                # Another file may carry the same repo URL
+                for other, (_, other_id) in self._files.items():
+                    if other_id == repo_id:
+                        self._by_repo_id[repo_id] = other
+                        break
+            self._loaded.pop(path, None)
+
+        self._scanned_at = time.monotonic()
+        self.scans += 1
+
+    def _reset(self) -> None:
+        self._dir_signature = None
+        self._files.clear()
+        self._by_repo_id.clear()
+        self._loaded.clear()
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Pick up changes to the directory and the deep link mappings.
+
+        A rescan happens when the directory changed (files added, removed or
+        renamed) or when forced; an in-place rewrite of one file is picked up
+        when that file is loaded.
+        """
+        with self._lock:
+            self.link_service.refresh_mappings()
+
+            location = self.kb_dir.resolve()
+            if location != self._location:
+                # Relative kb_dir and a changed working directory
+                self._location = location
+                self._reset()
+
+            dir_signature = _signature(self.kb_dir)
+            if dir_signature is None:
+                self._reset()
+                return
+            if force or dir_signature != self._dir_signature:
+                self._dir_signature = dir_signature
+                self._scan()
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def _mapped_path(self, agent_id: str) -> Optional[Path]:
+        mapping = self.link_service.resolve_repo_id(agent_id)
+        if not mapping:
+            return None
+        match = _GITHUB_REPO.search(mapping.get("repo_url", ""))
+        if not match:
+            return None
+        path = self.kb_dir / f"{match.group(1)}_{match.group(2)}_kb.json"
+        return path if path.exists() else None
+
+    def _find_locked(self, agent_id: str) -> Optional[Path]:
+        path = self._mapped_path(agent_id)
+        if path is None:
+            path = self._by_repo_id.get(agent_id)
+        if path is None and agent_id:
+            path = next((p for p in self._files if agent_id in str(p)), None)
+        return path
+
+    def find_path(self, agent_id: str) -> Optional[Path]:
+        """
+        Find the knowledge base file of an agent.
+
+        Args:
+            agent_id: Agent (repository) ID
+
+        Returns:
+            Path of the knowledge base file, or None
+        """
+        with self._lock:
+            self.refresh()
+            path = self._find_locked(agent_id)
+            if path is None and time.monotonic() - self._scanned_at >= self.rescan_interval:
+                # Files may have been rewritten in place since the last scan
+                self._scan()
+                path = self._find_locked(agent_id)
+            return path
+
+    def load(self, agent_id: str) -> Optional[KnowledgeBase]:
+        """
+        Load the knowledge base of an agent, reusing a cached instance if
+        its file is unchanged.
+
+        Args:
+            agent_id: Agent (repository) ID
+
+        Returns:
+            KnowledgeBase or None if not found or unreadable
+        """
+        with self._lock:
+            path = self.find_path(agent_id)
+            if path is None:
+                return None
+
+            signature = _signature(path)
+            cached = self._loaded.get(path)
+            if cached and cached[0] == signature:
+                self._loaded.move_to_end(path)
+                return cached[1]
+
+            try:
+                kb = KnowledgeBase.load(path)
+            except (json.JSONDecodeError, KeyError, OSError, ValueError) as e:
+                logger.debug(f"Could not load knowledge base {path}: {e}")
+                return None
+
+            if signature is not None:
+                if path in self._files:
+                    self._index_file(path, signature, kb.repo_url)
+                self._loaded[path] = (signature, kb)
+                while len(self._loaded) > self.cache_size:
+                    self._loaded.popitem(last=False)
+            return kb
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "kb_dir": str(self.kb_dir),
+            "indexed_files": len(self._files),
+            "indexed_ids": len(self._by_repo_id),
+            "loaded": len(self._loaded),
+            "scans": self.scans,
+            "files_parsed": self.files_parsed,
+        }
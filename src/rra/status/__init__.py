@@ -23,6 +23,7 @@ from rra.status.dreaming import (
     StatusEntry,
     StatusType,
 )
+from rra.status.bus import StatusBus, DropPolicy
 
 __all__ = [
     "DreamingStatus",
@@ -30,4 +31,6 @@ __all__ = [
     "configure_dreaming",
     "StatusEntry",
     "StatusType",
+    "StatusBus",
+    "DropPolicy",
 ]
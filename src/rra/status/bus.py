@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Non-blocking status bus for dreaming status subscribers.
+
+Publishing appends the entry to an inbox and returns; a dispatcher thread
+fans entries out to one bounded queue per subscriber, and each subscriber
+has its own delivery worker, so a slow or failing subscriber never holds
+up the producer or the other subscribers.
+
+Queued updates for the same operation are coalesced (a queued "start" is
+replaced by the "complete" that follows it); errors are never coalesced.
+When a subscriber's queue is full, the drop policy decides which entry is
+lost, and every coalesced, dropped or failed delivery is counted.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DropPolicy(str, Enum):
+    """What a full subscriber queue gives up."""
+
+    DROP_OLDEST = "drop_oldest"  # Lose the oldest queued update
+    DROP_NEWEST = "drop_newest"  # Lose the incoming update
+
+
+class _Subscription:
+    """A subscriber's bounded coalescing queue and its delivery worker."""
+
+    def __init__(
+        self,
+        callback: Callable[[Any], Any],
+        is_async: bool,
+        loop: Optional[asyncio.AbstractEventLoop],
+        max_queue: int,
+        drop_policy: DropPolicy,
+        delivery_timeout: float,
+    ):
+        self.callback = callback
+        self.is_async = is_async
+        self.loop = loop
+        self.max_queue = max_queue
+        self.drop_policy = drop_policy
+        self.delivery_timeout = delivery_timeout
+
+        self._queue: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+
+        # Stats
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"status-subscriber-{id(self):x}", daemon=True
+        )
+        self._thread.start()
+
+    def offer(self, key: Hashable, entry: Any) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            if key in self._queue:
+                del self._queue[key]
+                self.coalesced += 1
+            elif len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                if self.drop_policy == DropPolicy.DROP_NEWEST:
+                    return
+                self._queue.popitem(last=False)
+            self._queue[key] = entry
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                _, entry = self._queue.popitem(last=False)
+                self._busy = True
+            try:
+                delivered = self._deliver(entry)
+                failed = False
+            except Exception as e:
+                delivered, failed = False, True
+                logger.warning("Status subscriber %r failed: %s", self.callback, e)
+            with self._cond:
+                self._busy = False
+                if delivered:
+                    self.delivered += 1
+                elif failed:
+                    self.errors += 1
+                else:
+                    self.dropped += 1  # No event loop to run the subscriber on
+                self._cond.notify_all()
+
+    def _deliver(self, entry: Any) -> bool:
+        if not self.is_async:
+            self.callback(entry)
+            return True
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return False
+        future = asyncio.run_coroutine_threadsafe(self._call_async(entry), loop)
+        future.result(timeout=self.delivery_timeout)
+        return True
+
+    async def _call_async(self, entry: Any) -> None:
+        result = self.callback(entry)
+        if asyncio.iscoroutine(result):
+            await result
+
+    def wait_idle(self, timeout: Optional[float]) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._closed or (not self._queue and not self._busy), timeout
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "callback": getattr(self.callback, "__qualname__", repr(self.callback)),
+            "async": self.is_async,
+            "queued": len(self._queue),
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+class StatusBus:
+    """
+    Fan-out of status entries to subscribers without blocking the producer.
+
+    Example:
+        bus = StatusBus()
+        bus.subscribe(print_entry)
+        bus.subscribe(broadcast, is_async=True, loop=asyncio.get_running_loop())
+        bus.publish(entry)  # returns immediately
+    """
+
+    DEFAULT_QUEUE_SIZE = 256
+    DEFAULT_INBOX_SIZE = 4096
+    DEFAULT_DELIVERY_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+        inbox_size: int = DEFAULT_INBOX_SIZE,
+        delivery_timeout: float = DEFAULT_DELIVERY_TIMEOUT,
+    ):
+        """
+        Initialize the bus. Threads start with the first subscriber.
+
+        Args:
+            max_queue: Pending entries per subscriber
+            drop_policy: Which entry a full subscriber queue loses
+            inbox_size: Entries awaiting fan-out before the oldest are dropped
+            delivery_timeout: Seconds to wait for one async delivery
+        """
+        self.max_queue = max_queue
+        self.drop_policy = DropPolicy(drop_policy)
+        self.delivery_timeout = delivery_timeout
+
+        self._inbox: Deque[Any] = deque(maxlen=inbox_size)
+        self._cond = threading.Condition()
+        self._dispatching = False
+        self._subscriptions: List[_Subscription] = []
+        self._loopless = 0  # async subscriptions still waiting for an event loop
+        self._dispatcher: Optional[threading.Thread] = None
+        self._error_keys = itertools.count()
+
+        # Stats
+        self.published = 0
+        self.inbox_dropped = 0
+
+    # =========================================================================
+    # Subscriptions
+    # =========================================================================
+
+    def subscribe(
+        self,
+        callback: Callable[[Any], Any],
+        is_async: bool = False,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Add a subscriber with its own queue and delivery worker.
+
+        Args:
+            callback: Called with each entry
+            is_async: callback returns an awaitable to run on loop
+            loop: Event loop for an async subscriber (default: the loop of
+                the first publisher that runs inside one)
+        """
+        subscription = _Subscription(
+            callback,
+            is_async,
+            loop,
+            self.max_queue,
+            self.drop_policy,
+            self.delivery_timeout,
+        )
+        with self._cond:
+            self._subscriptions = self._subscriptions + [subscription]
+            if is_async and loop is None:
+                self._loopless += 1
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name="status-dispatcher", daemon=True
+                )
+                self._dispatcher.start()
+
+    def unsubscribe(self, callback: Callable[[Any], Any]) -> bool:
+        """Remove a subscriber, discarding its queued entries."""
+        with self._cond:
+            removed = [s for s in self._subscriptions if s.callback == callback]
+            self._subscriptions = [s for s in self._subscriptions if s.callback != callback]
+            self._loopless -= sum(1 for s in removed if s.is_async and s.loop is None)
+        for subscription in removed:
+            subscription.close()
+        return bool(removed)
+
+    def _bind_running_loop(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for subscription in self._subscriptions:
+            if subscription.is_async and subscription.loop is None:
+                subscription.loop = loop
+                self._loopless -= 1
+
+    # =========================================================================
+    # Publishing
+    # =========================================================================
+
+    def publish(self, entry: Any) -> None:
+        """Queue an entry for all subscribers and return immediately."""
+        with self._cond:
+            if not self._subscriptions:
+                return
+            if self._loopless:
+                self._bind_running_loop()
+            if len(self._inbox) == self._inbox.maxlen:
+                self.inbox_dropped += 1
+            self._inbox.append(entry)
+            self.published += 1
+            self._cond.notify()
+
+    def _key(self, entry: Any) -> Hashable:
+        if getattr(getattr(entry, "status_type", None), "value", None) == "error":
+            return ("error", next(self._error_keys))
+        return getattr(entry, "operation", id(entry))
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                while not self._inbox:
+                    self._cond.wait()
+                entries = list(self._inbox)
+                self._inbox.clear()
+                subscriptions = self._subscriptions
+                self._dispatching = True
+            for entry in entries:
+                key = self._key(entry)
+                for subscription in subscriptions:
+                    subscription.offer(key, entry)
+            with self._cond:
+                self._dispatching = False
+                self._cond.notify_all()
+
+    # =========================================================================
+    # Draining and stats
+    # =========================================================================
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every published entry has been delivered or dropped.
+
+        Returns:
+            True if the bus drained within timeout
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: not self._inbox and not self._dispatching, timeout):
+                return False
+            subscriptions = self._subscriptions
+        return all(s.wait_idle(timeout) for s in subscriptions)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            subscriptions = self._subscriptions
+            stats: Dict[str, Any] = {
+                "published": self.published,
+                "inbox_queued": len(self._inbox),
+                "inbox_dropped": self.inbox_dropped,
+            }
+        stats["subscribers"] = [s.get_stats() for s in subscriptions]
+        return stats
@@ -7,6 +7,7 @@ Provides Rich console integration for displaying dreaming status updates
 in the terminal.
 """
 
+import atexit
 import threading
 import time
 from typing import Optional
@@ -187,6 +188,8 @@ def enable_dreaming_output(console: Optional[Console] = None) -> None:
     dreaming = get_dreaming_status()
     callback = create_status_callback(console)
     dreaming.add_callback(callback)
+    # Updates are printed by a delivery worker: let it finish before exit
+    atexit.register(dreaming.wait_delivered, 1.0)
 
 
 def get_dreaming_summary(console: Optional[Console] = None) -> Table:
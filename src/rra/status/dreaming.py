@@ -5,7 +5,8 @@ Dreaming Status - Real-time visibility into RRA processing.
 
 Provides a lightweight status line that shows what's happening inside
 the code while it's working. Updates are throttled to once every 5 seconds
-to minimize performance impact.
+to minimize performance impact, and are handed to subscribers through a
+non-blocking StatusBus so callbacks never run on the caller's thread.
 
 Usage:
     from rra.status.dreaming import get_dreaming_status
@@ -25,6 +26,8 @@ from enum import Enum
 from typing import Optional, Callable, List, Dict, Any
 from collections import deque
 
+from rra.status.bus import DropPolicy, StatusBus
+
 
 class StatusType(Enum):
     """Type of status update."""
@@ -88,6 +91,8 @@ class DreamingStatus:
         throttle_seconds: float = DEFAULT_THROTTLE_SECONDS,
         enabled: bool = True,
         max_history: int = 100,
+        max_queue: int = StatusBus.DEFAULT_QUEUE_SIZE,
+        drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
     ):
         """
         Initialize the dreaming status tracker.
@@ -96,6 +101,8 @@ class DreamingStatus:
             throttle_seconds: Minimum time between status emissions
             enabled: Whether to emit status updates
             max_history: Maximum number of entries to keep in history
+            max_queue: Undelivered entries kept per subscriber
+            drop_policy: Which entry a full subscriber queue loses
         """
         self._throttle_seconds = throttle_seconds
         self._enabled = enabled
@@ -115,9 +122,9 @@ class DreamingStatus:
         self._current_status: Optional[str] = None
         self._current_operation: Optional[str] = None
 
-        # Callbacks for status updates (CLI, WebSocket, etc.)
-        self._callbacks: List[Callable[[StatusEntry], None]] = []
-        self._async_callbacks: List[Callable[[StatusEntry], Any]] = []
+        # PERFORMANCE: Subscribers (CLI, WebSocket, etc.) are fed through
+        # bounded per-subscriber queues with their own delivery workers
+        self._bus = StatusBus(max_queue=max_queue, drop_policy=drop_policy)
 
         # Thread safety
         self._lock = threading.Lock()
@@ -149,22 +156,38 @@ class DreamingStatus:
         return self._current_operation
 
     def add_callback(self, callback: Callable[[StatusEntry], None]) -> None:
-        """Add a synchronous callback for status updates."""
-        with self._lock:
-            self._callbacks.append(callback)
+        """Add a synchronous callback for status updates (run on its own worker thread)."""
+        self._bus.subscribe(callback)
 
     def add_async_callback(self, callback: Callable[[StatusEntry], Any]) -> None:
-        """Add an async callback for status updates."""
-        with self._lock:
-            self._async_callbacks.append(callback)
+        """
+        Add an async callback for status updates.
+
+        It runs on the event loop it was added from, or else on the loop of
+        the first status update emitted inside one.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self._bus.subscribe(callback, is_async=True, loop=loop)
 
     def remove_callback(self, callback: Callable) -> None:
         """Remove a callback."""
-        with self._lock:
-            if callback in self._callbacks:
-                self._callbacks.remove(callback)
-            if callback in self._async_callbacks:
-                self._async_callbacks.remove(callback)
+        self._bus.unsubscribe(callback)
+
+    def wait_delivered(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until emitted updates have reached every callback (or been dropped).
+
+        Returns:
+            True if delivery finished within timeout
+        """
+        return self._bus.wait_idle(timeout)
+
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Get per-subscriber delivery, coalescing, drop and error counters."""
+        return self._bus.get_stats()
 
     def _should_emit(self) -> bool:
         """Check if enough time has passed to emit a new status."""
@@ -182,31 +205,8 @@ class DreamingStatus:
             self._current_operation = entry.operation
             self._history.append(entry)
 
-            # Call synchronous callbacks
-            for callback in self._callbacks:
-                try:
-                    callback(entry)
-                except Exception:
-                    pass  # Don't let callback errors break status updates
-
-            # Schedule async callbacks if any
-            if self._async_callbacks:
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        for callback in self._async_callbacks:
-                            asyncio.create_task(self._call_async(callback, entry))
-                except RuntimeError:
-                    pass  # No event loop available
-
-    async def _call_async(self, callback: Callable, entry: StatusEntry) -> None:
-        """Call an async callback safely."""
-        try:
-            result = callback(entry)
-            if asyncio.iscoroutine(result):
-                await result
-        except Exception:
-            pass  # Don't let callback errors break status updates
+        # Delivery happens on the bus workers; failures are logged and counted
+        self._bus.publish(entry)
 
     def start(self, operation: str, details: Optional[str] = None) -> None:
         """
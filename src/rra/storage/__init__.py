@@ -15,6 +15,18 @@ from .encrypted_ipfs import (
     create_storage,
 )
 
+from .async_storage import (
+    AsyncEncryptedStorage,
+    AsyncStorageConfig,
+    EvidenceItem,
+)
+
+from .blob_cache import (
+    BlobCache,
+    BlobCacheEntry,
+    BlobCacheStats,
+)
+
 from .compression import (
     compress,
     decompress,
@@ -23,8 +35,16 @@ from .compression import (
     CompressionConfig,
     CompressionAlgorithm,
     CompressionResult,
+    CompressionDictionary,
     StreamingCompressor,
     is_gzip_compressed,
+    is_zstd_compressed,
+    is_compressed,
+    detect_algorithm,
+    estimate_entropy,
+    train_dictionary,
+    register_dictionary,
+    ZSTD_AVAILABLE,
 )
 
 __all__ = [
@@ -33,6 +53,12 @@ __all__ = [
     "StorageResult",
     "StorageProvider",
     "create_storage",
+    "AsyncEncryptedStorage",
+    "AsyncStorageConfig",
+    "EvidenceItem",
+    "BlobCache",
+    "BlobCacheEntry",
+    "BlobCacheStats",
     # Compression
     "compress",
     "decompress",
@@ -41,6 +67,14 @@ __all__ = [
     "CompressionConfig",
     "CompressionAlgorithm",
     "CompressionResult",
+    "CompressionDictionary",
     "StreamingCompressor",
     "is_gzip_compressed",
+    "is_zstd_compressed",
+    "is_compressed",
+    "detect_algorithm",
+    "estimate_entropy",
+    "train_dictionary",
+    "register_dictionary",
+    "ZSTD_AVAILABLE",
 ]
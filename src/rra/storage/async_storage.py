@@ -0,0 +1,408 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Async, pooled client for encrypted evidence storage.
+
+Wraps an EncryptedIPFSStorage (for configuration, packaging and the
+optional blob cache) with an asyncio transport:
+
+1. One shared httpx connection pool with keep-alive across all requests
+2. Bounded concurrency for in-flight uploads and downloads
+3. Retry with exponential backoff and a circuit breaker from
+   ``rra.integration.network_resilience``
+4. ``store_evidence_many`` pipelines encrypt -> compress -> upload: packages
+   are built on a thread pool while earlier packages are still uploading
+
+Usage:
+    async with AsyncEncryptedStorage(create_storage(StorageProvider.IPFS_LOCAL)) as client:
+        results = await client.store_evidence_many(items)
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from rra.exceptions import StorageDownloadError, StorageUploadError
+from rra.integration.network_resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    RetryConfig,
+    calculate_delay,
+)
+from rra.privacy.viewing_keys import ViewingKey
+from rra.storage.encrypted_ipfs import (
+    EncryptedIPFSStorage,
+    StorageProvider,
+    StorageResult,
+)
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _default_retry_config() -> RetryConfig:
+    retryable: Tuple = (ConnectionError, TimeoutError)
+    if HAS_HTTPX:
+        retryable = (httpx.TransportError, httpx.HTTPStatusError) + retryable
+    return RetryConfig(
+        max_retries=3,
+        base_delay=0.5,
+        max_delay=10.0,
+        retryable_exceptions=retryable,
+    )
+
+
+@dataclass
+class AsyncStorageConfig:
+    """Configuration for the async storage client."""
+
+    max_connections: int = 32  # Connection pool size
+    max_keepalive_connections: int = 16
+    max_concurrency: int = 16  # In-flight HTTP requests
+    cpu_workers: int = 4  # Threads for encrypt/compress/decrypt
+    retry: RetryConfig = field(default_factory=_default_retry_config)
+    circuit: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+
+    def __post_init__(self):
+        """Validate pool sizes."""
+        if self.max_concurrency < 1 or self.cpu_workers < 1 or self.max_connections < 1:
+            raise ValueError("Pool sizes must be at least 1")
+
+
+@dataclass
+class EvidenceItem:
+    """One piece of evidence for a bulk store."""
+
+    evidence: Dict[str, Any]
+    viewing_key: ViewingKey
+    dispute_id: int
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class AsyncEncryptedStorage:
+    """
+    Async storage client with a shared connection pool.
+
+    Use as an async context manager, or call ``aclose()`` when done.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[EncryptedIPFSStorage] = None,
+        config: Optional[AsyncStorageConfig] = None,
+        transport: Optional[Any] = None,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            storage: Sync storage providing config, packaging and cache
+            config: Pool, concurrency and retry settings
+            transport: Optional httpx transport (for tests)
+        """
+        if not HAS_HTTPX:
+            raise ImportError("httpx is required for AsyncEncryptedStorage")
+
+        self.storage = storage or EncryptedIPFSStorage()
+        self.config = config or AsyncStorageConfig()
+        self.circuit_breaker = CircuitBreaker(
+            f"storage:{self.storage.config.provider.value}", self.config.circuit
+        )
+
+        self._client = httpx.AsyncClient(
+            timeout=self.storage.config.timeout,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.cpu_workers, thread_name_prefix="rra-storage"
+        )
+        self._io_slots: Optional[asyncio.Semaphore] = None
+        self._downloads: Dict[str, "asyncio.Future[bytes]"] = {}
+
+    async def __aenter__(self) -> "AsyncEncryptedStorage":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool and worker threads."""
+        await self._client.aclose()
+        self._executor.shutdown(wait=False)
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def store_evidence(
+        self,
+        evidence: Dict[str, Any],
+        viewing_key: ViewingKey,
+        dispute_id: int,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> StorageResult:
+        """
+        Encrypt and store evidence.
+
+        Args:
+            evidence: Evidence data to store
+            viewing_key: Viewing key for encryption
+            dispute_id: Associated dispute ID
+            metadata: Optional metadata to store alongside
+
+        Returns:
+            StorageResult with URI and content hash
+
+        Raises:
+            ValidationError: If inputs are invalid
+            EncryptionError: If encryption fails
+            StorageUploadError: If upload fails
+        """
+        package_bytes, evidence_hash, compression_result = await self._run_cpu(
+            self.storage.build_package, evidence, viewing_key, dispute_id, metadata
+        )
+
+        try:
+            result = await self._upload(package_bytes, dispute_id)
+        except Exception as e:
+            logger.error(f"Failed to upload evidence: {e}")
+            raise StorageUploadError(
+                provider=self.storage.config.provider.value,
+                reason=str(e),
+                content_size=len(package_bytes),
+                cause=e,
+            )
+
+        if result.success and self.storage.cache is not None:
+            await self._run_cpu(
+                self.storage.cache.put, result.uri, package_bytes, evidence_hash.hex()
+            )
+        if compression_result.was_compressed:
+            result.metadata["compression"] = compression_result.to_dict()
+        return result
+
+    async def store_evidence_many(self, items: Iterable[EvidenceItem]) -> List[StorageResult]:
+        """
+        Store many pieces of evidence concurrently.
+
+        Packaging runs on the worker pool while other packages upload, with
+        at most ``max_concurrency`` uploads in flight. Failures do not abort
+        the batch; they are reported as unsuccessful results.
+
+        Args:
+            items: Evidence to store
+
+        Returns:
+            One StorageResult per item, in input order
+        """
+        items = list(items)
+        # Bound packages held in memory: enough to keep uploads and CPU busy
+        pipeline_slots = asyncio.Semaphore(self.config.max_concurrency + self.config.cpu_workers)
+
+        async def store_one(item: EvidenceItem) -> StorageResult:
+            async with pipeline_slots:
+                try:
+                    return await self.store_evidence(
+                        item.evidence, item.viewing_key, item.dispute_id, item.metadata
+                    )
+                except Exception as e:
+                    logger.warning(f"Bulk store failed for dispute {item.dispute_id}: {e}")
+                    return StorageResult(
+                        success=False,
+                        uri="",
+                        content_hash=b"",
+                        size_bytes=0,
+                        provider=self.storage.config.provider,
+                        timestamp=datetime.utcnow(),
+                        metadata={"dispute_id": item.dispute_id},
+                        error=str(e),
+                    )
+
+        results = await asyncio.gather(*(store_one(item) for item in items))
+        succeeded = sum(1 for r in results if r.success)
+        logger.info(f"Bulk store complete: {succeeded}/{len(items)} succeeded")
+        return list(results)
+
+    async def retrieve_evidence(
+        self,
+        uri: str,
+        viewing_key: ViewingKey,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Retrieve and decrypt evidence.
+
+        Args:
+            uri: Storage URI (ipfs://... or ar://...)
+            viewing_key: Viewing key for decryption
+
+        Returns:
+            Tuple of (evidence_data, metadata)
+
+        Raises:
+            ValidationError: If URI or viewing key is invalid
+            StorageDownloadError: If download fails
+            EncryptionError: If decryption fails
+        """
+        self.storage._validate_retrieve(uri, viewing_key)
+
+        try:
+            package_bytes = await self._download(uri)
+        except Exception as e:
+            logger.error(f"Failed to download from {uri}: {e}")
+            raise StorageDownloadError(uri=uri, reason=str(e), cause=e)
+
+        return await self._run_cpu(self.storage.open_package, uri, package_bytes, viewing_key)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get client resilience status."""
+        return {
+            "provider": self.storage.config.provider.value,
+            "circuit_state": self.circuit_breaker.state.value,
+            "failure_count": self.circuit_breaker._state.failure_count,
+            "downloads_in_flight": len(self._downloads),
+        }
+
+    # =========================================================================
+    # Transport
+    # =========================================================================
+
+    async def _run_cpu(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking function on the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _slots(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running loop
+        if self._io_slots is None:
+            self._io_slots = asyncio.Semaphore(self.config.max_concurrency)
+        return self._io_slots
+
+    async def _request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """Send a request with bounded concurrency, retries and circuit breaking."""
+        retry = self.config.retry
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(retry.max_retries + 1):
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError(self.circuit_breaker.name, self.config.circuit.timeout)
+
+            try:
+                async with self._slots():
+                    response = await self._client.request(method, url, **kwargs)
+                if response.status_code in retry.retryable_status_codes:
+                    raise httpx.HTTPStatusError(
+                        f"Retryable status: {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                response.raise_for_status()
+                self.circuit_breaker.record_success()
+                return response
+
+            except httpx.HTTPStatusError as e:
+                # Client errors (4xx other than 429) will not succeed on retry
+                if e.response.status_code not in retry.retryable_status_codes:
+                    raise
+                last_error = e
+            except retry.retryable_exceptions as e:
+                last_error = e
+
+            self.circuit_breaker.record_failure()
+            if attempt < retry.max_retries:
+                delay = calculate_delay(attempt, retry)
+                logger.warning(
+                    f"Storage request retry {attempt + 1}/{retry.max_retries} "
+                    f"after {delay:.2f}s: {last_error}"
+                )
+                await asyncio.sleep(delay)
+
+        assert last_error is not None
+        raise last_error
+
+    async def _upload(self, data: bytes, dispute_id: int) -> StorageResult:
+        """Upload a package to the configured provider."""
+        storage = self.storage
+        if storage.config.provider == StorageProvider.MOCK:
+            return storage._upload(data, dispute_id)
+
+        upload = storage.build_upload_request(data, dispute_id)
+        try:
+            response = await self._request(
+                "POST", upload.url, content=upload.body, headers=upload.headers
+            )
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            return storage.failed_upload_result(data, str(e))
+
+        result = storage.parse_upload_response(response.json(), data, dispute_id)
+
+        pin_url = storage.pin_url(result.metadata.get("cid", ""))
+        if pin_url:
+            try:
+                await self._request("POST", pin_url)
+            except (httpx.HTTPError, CircuitOpenError) as e:
+                logger.warning(f"Failed to pin {result.uri}: {e}")
+
+        return result
+
+    async def _download(self, uri: str) -> bytes:
+        """Download a package, via the blob cache and a per-URI single flight."""
+        cache = self.storage.cache
+        if cache is not None:
+            data = await self._run_cpu(cache.get, uri)
+            if data is not None:
+                return data
+
+        pending = self._downloads.get(uri)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[bytes]" = asyncio.get_running_loop().create_future()
+        self._downloads[uri] = future
+        try:
+            data = await self._fetch(uri)
+            if cache is not None:
+                await self._run_cpu(cache.put, uri, data, self.storage._package_evidence_hash(data))
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so the loop does not warn when no one else waits
+            future.exception()
+            raise
+        finally:
+            self._downloads.pop(uri, None)
+
+    async def _fetch(self, uri: str) -> bytes:
+        """Fetch a package from the provider, trying each candidate URL."""
+        if uri.startswith("mock://"):
+            return self.storage._fetch(uri)
+
+        last_error: Optional[BaseException] = None
+        for url in self.storage.download_urls(uri):
+            try:
+                response = await self._request("GET", url)
+                return response.content
+            except (httpx.HTTPError, CircuitOpenError) as e:
+                last_error = e
+                logger.debug(f"Download from {url} failed: {e}")
+
+        assert last_error is not None
+        raise last_error
@@ -0,0 +1,402 @@
+# SPDX-FileCopyrightText: 2025 Kase Branham
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+
+"""
+Content-addressed local blob cache for decentralized storage reads.
+
+IPFS CIDs and Arweave transaction IDs are immutable, so a downloaded
+package never goes stale. The cache keeps packages on local disk keyed by
+their storage URI so repeated evidence reviews become local reads:
+
+1. Blobs are written atomically (temp file + rename) with a sidecar record
+   holding the SHA-256 digest and the package's ``evidence_hash``
+2. Reads are served through mmap and verified against the recorded digest;
+   corrupted entries are dropped and re-fetched
+3. Entries are evicted least-recently-used once the size budget is exceeded
+4. A single-flight guard ensures concurrent misses for one URI trigger
+   exactly one download
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".rra_cache" / "blobs"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MiB
+
+
+@dataclass
+class BlobCacheEntry:
+    """Index record for a cached blob."""
+
+    uri: str
+    size: int
+    digest: str  # SHA-256 hex of the stored bytes
+    evidence_hash: Optional[str] = None  # From the package, if known
+
+
+@dataclass
+class BlobCacheStats:
+    """Hit/miss counters for a BlobCache."""
+
+    hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    evictions: int = 0
+    corrupted: int = 0
+
+
+class _Flight:
+    """An in-progress fetch that other callers can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+class BlobCache:
+    """
+    On-disk, content-addressed LRU cache for storage packages.
+
+    Thread-safe. Keys are storage URIs (``ipfs://<cid>``, ``ar://<tx_id>``,
+    ``mock://<cid>``); file names are derived from a hash of the key.
+    """
+
+    BLOB_SUFFIX = ".blob"
+    META_SUFFIX = ".meta"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the blob cache.
+
+        Args:
+            cache_dir: Directory for cached blobs (default: ~/.rra_cache/blobs)
+            max_bytes: Size budget; least-recently-used entries are evicted beyond it
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = BlobCacheStats()
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, BlobCacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._flights: Dict[str, _Flight] = {}
+
+        self._load_index()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def get(self, uri: str) -> Optional[bytes]:
+        """
+        Read a cached blob.
+
+        Args:
+            uri: Storage URI
+
+        Returns:
+            Blob bytes, or None on a miss or integrity failure
+        """
+        with self.view(uri) as view:
+            if view is None:
+                return None
+            return bytes(view)
+
+    @contextmanager
+    def view(self, uri: str) -> Iterator[Optional[memoryview]]:
+        """
+        Zero-copy access to a cached blob through mmap.
+
+        The view is only valid inside the ``with`` block.
+
+        Args:
+            uri: Storage URI
+
+        Yields:
+            Read-only memoryview of the blob, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is not None:
+                self._entries.move_to_end(uri)
+            else:
+                self.stats.misses += 1
+
+        if entry is None:
+            yield None
+            return
+
+        path = self._blob_path(uri)
+        try:
+            with open(path, "rb") as f:
+                if entry.size == 0:
+                    mm = None
+                    view = memoryview(b"")
+                else:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    view = memoryview(mm)
+        except OSError as e:
+            logger.warning(f"Cached blob unreadable for {uri}: {e}")
+            self._drop(uri, corrupted=True, miss=True)
+            yield None
+            return
+
+        try:
+            if len(view) != entry.size or not hmac.compare_digest(
+                hashlib.sha256(view).hexdigest(), entry.digest
+            ):
+                logger.warning(f"Cached blob failed integrity check: {uri}")
+                view.release()
+                self._drop(uri, corrupted=True, miss=True)
+                yield None
+                return
+
+            with self._lock:
+                self.stats.hits += 1
+            yield view
+        finally:
+            view.release()
+            if mm is not None:
+                mm.close()
+
+    def put(self, uri: str, data: bytes, evidence_hash: Optional[str] = None) -> None:
+        """
+        Store a blob.
+
+        Args:
+            uri: Storage URI
+            data: Blob bytes
+            evidence_hash: Evidence hash recorded in the package (hex), if known
+        """
+        if len(data) > self.max_bytes:
+            logger.debug(f"Blob for {uri} exceeds cache budget, not caching")
+            return
+
+        entry = BlobCacheEntry(
+            uri=uri,
+            size=len(data),
+            digest=hashlib.sha256(data).hexdigest(),
+            evidence_hash=evidence_hash,
+        )
+        self._atomic_write(self._blob_path(uri), data)
+        self._atomic_write(self._meta_path(uri), json.dumps(asdict(entry)).encode())
+
+        with self._lock:
+            previous = self._entries.pop(uri, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._entries[uri] = entry
+            self._total_bytes += entry.size
+            evicted = self._evict_locked()
+
+        for old_uri in evicted:
+            self._remove_files(old_uri)
+
+    def get_or_fetch(
+        self,
+        uri: str,
+        fetch: Callable[[str], bytes],
+        evidence_hash_of: Optional[Callable[[bytes], Optional[str]]] = None,
+    ) -> bytes:
+        """
+        Read a blob, fetching and caching it on a miss.
+
+        Concurrent misses for the same URI share one call to ``fetch``;
+        other callers block until it completes and receive its result or
+        exception.
+
+        Args:
+            uri: Storage URI
+            fetch: Downloads the blob for a URI
+            evidence_hash_of: Extracts the evidence hash from fetched bytes
+
+        Returns:
+            Blob bytes
+        """
+        data = self.get(uri)
+        if data is not None:
+            return data
+
+        with self._lock:
+            follower = self._flights.get(uri)
+            if follower is None:
+                flight = self._flights[uri] = _Flight()
+                self.stats.fetches += 1
+
+        if follower is not None:
+            follower.done.wait()
+            if follower.error is not None:
+                raise follower.error
+            assert follower.data is not None
+            return follower.data
+
+        try:
+            data = fetch(uri)
+            evidence_hash = evidence_hash_of(data) if evidence_hash_of else None
+            self.put(uri, data, evidence_hash)
+            flight.data = data
+            return data
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(uri, None)
+            flight.done.set()
+
+    def get_entry(self, uri: str) -> Optional[BlobCacheEntry]:
+        """
+        Get the index record for a cached blob without reading it.
+
+        Args:
+            uri: Storage URI
+
+        Returns:
+            BlobCacheEntry, or None if not cached
+        """
+        with self._lock:
+            return self._entries.get(uri)
+
+    def invalidate(self, uri: str) -> bool:
+        """
+        Remove a blob from the cache.
+
+        Args:
+            uri: Storage URI
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._drop(uri)
+
+    def clear(self) -> None:
+        """Remove every cached blob."""
+        with self._lock:
+            uris = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+        for uri in uris:
+            self._remove_files(uri)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently held by the cache."""
+        return self._total_bytes
+
+    def __contains__(self, uri: str) -> bool:
+        with self._lock:
+            return uri in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _key(self, uri: str) -> str:
+        return hashlib.sha256(uri.encode()).hexdigest()
+
+    def _blob_path(self, uri: str) -> Path:
+        return self.cache_dir / (self._key(uri) + self.BLOB_SUFFIX)
+
+    def _meta_path(self, uri: str) -> Path:
+        return self.cache_dir / (self._key(uri) + self.META_SUFFIX)
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _remove_files(self, uri: str) -> None:
+        for path in (self._meta_path(uri), self._blob_path(uri)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _drop(self, uri: str, corrupted: bool = False, miss: bool = False) -> bool:
+        with self._lock:
+            entry = self._entries.pop(uri, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+                if corrupted:
+                    self.stats.corrupted += 1
+            if miss:
+                self.stats.misses += 1
+        if entry is None:
+            return False
+        self._remove_files(uri)
+        return True
+
+    def _evict_locked(self) -> list:
+        """Pop LRU entries until within budget. Caller holds the lock."""
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._entries:
+            uri, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self.stats.evictions += 1
+            evicted.append(uri)
+        return evicted
+
+    def _load_index(self) -> None:
+        """Rebuild the in-memory index from sidecar records on disk."""
+        records = []
+        for meta_path in self.cache_dir.glob("*" + self.META_SUFFIX):
+            blob_path = meta_path.with_suffix(self.BLOB_SUFFIX)
+            try:
+                entry = BlobCacheEntry(**json.loads(meta_path.read_bytes()))
+                mtime = blob_path.stat().st_mtime
+            except (OSError, ValueError, TypeError):
+                for path in (meta_path, blob_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                continue
+            records.append((mtime, entry))
+
+        # Oldest first so the most recently written blobs survive eviction
+        for _, entry in sorted(records, key=lambda r: r[0]):
+            self._entries[entry.uri] = entry
+            self._total_bytes += entry.size
+
+        for uri in self._evict_locked():
+            self._remove_files(uri)
+
+        for tmp in self.cache_dir.glob(".tmp-*"):
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
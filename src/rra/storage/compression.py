@@ -5,20 +5,59 @@
 """
 Compression utilities for RRA storage and upload pipeline.
 
-Provides gzip compression for:
+Provides gzip and Zstandard compression for:
 1. IPFS/Arweave uploads - reduce storage costs
 2. Knowledge base files - reduce disk space
 3. API responses - reduce bandwidth
 
+Zstandard (optional, ``pip install zstandard``) adds:
+- Trained dictionaries for small, repetitive JSON payloads (evidence
+  envelopes, knowledge-base sections) where gzip has too little context
+- Multi-threaded compression for large inputs
+- Frame-level dictionary IDs so registered dictionaries are resolved
+  automatically on decompression
+
 Compression is optional and configurable per operation.
 """
 
 import gzip
-import io
 import logging
+import math
+import threading
+import zlib
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Tuple, Dict, Any
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Tuple,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+)
+
+# =============================================================================
+# PERFORMANCE: Optional zstandard backend
+# =============================================================================
+# zstd is ~3-5x faster than gzip at comparable ratios and supports trained
+# dictionaries, which matter most for payloads under a few kilobytes.
+# Falls back to gzip when the library is not installed.
+# =============================================================================
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    if not TYPE_CHECKING:
+        # Every use is guarded by ZSTD_AVAILABLE
+        zstandard = None
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +67,50 @@ class CompressionAlgorithm(str, Enum):
 
     NONE = "none"
     GZIP = "gzip"
-    # Future: ZSTD, LZ4, BROTLI
+    ZSTD = "zstd"
+    # Future: LZ4, BROTLI
+
+
+# Valid level ranges per algorithm
+_LEVEL_RANGES = {
+    CompressionAlgorithm.NONE: (1, 9),
+    CompressionAlgorithm.GZIP: (1, 9),
+    CompressionAlgorithm.ZSTD: (1, 22),
+}
+
+
+@dataclass
+class CompressionDictionary:
+    """
+    A trained Zstandard dictionary.
+
+    Dictionaries are identified by ``dict_id``, which zstd embeds in every
+    frame it produces. Register a dictionary with ``register_dictionary`` so
+    ``decompress`` can find it without the caller passing it explicitly.
+    """
+
+    data: bytes
+    dict_id: int = field(init=False)
+
+    def __post_init__(self):
+        """Resolve the dictionary ID from the raw dictionary bytes."""
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required for compression dictionaries")
+        self._zstd_dict = zstandard.ZstdCompressionDict(self.data)
+        self.dict_id = self._zstd_dict.dict_id()
+
+    def as_zstd(self) -> Any:
+        """Return the underlying ``zstandard.ZstdCompressionDict``."""
+        return self._zstd_dict
+
+    def to_bytes(self) -> bytes:
+        """Serialize the dictionary for persistence."""
+        return self.data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompressionDictionary":
+        """Load a dictionary previously produced by ``to_bytes``."""
+        return cls(data=data)
 
 
 @dataclass
@@ -36,14 +118,27 @@ class CompressionConfig:
     """Configuration for compression operations."""
 
     algorithm: CompressionAlgorithm = CompressionAlgorithm.GZIP
-    level: int = 6  # gzip level 1-9 (6 is default, good balance)
+    level: int = 6  # gzip level 1-9 (6 is default), zstd level 1-22
     min_size: int = 1024  # Minimum bytes to compress (skip small data)
     enabled: bool = True
+    # zstd only: trained dictionary for small repetitive payloads
+    dictionary: Optional[CompressionDictionary] = None
+    # zstd only: worker threads for inputs >= threaded_min_size (0 = single-threaded)
+    threads: int = 0
+    threaded_min_size: int = 1024 * 1024
+    # Skip payloads whose sampled entropy (bits/byte) exceeds the threshold
+    entropy_probe: bool = True
+    entropy_threshold: float = 7.5
 
     def __post_init__(self):
         """Validate compression level."""
-        if not 1 <= self.level <= 9:
-            raise ValueError(f"Compression level must be 1-9, got {self.level}")
+        low, high = _LEVEL_RANGES.get(self.algorithm, (1, 9))
+        if not low <= self.level <= high:
+            raise ValueError(f"Compression level must be {low}-{high}, got {self.level}")
+        if self.dictionary is not None and self.algorithm != CompressionAlgorithm.ZSTD:
+            raise ValueError("Compression dictionaries are only supported with zstd")
+        if self.threads < -1:
+            raise ValueError(f"threads must be >= -1, got {self.threads}")
 
 
 @dataclass
@@ -55,6 +150,7 @@ class CompressionResult:
     algorithm: CompressionAlgorithm
     was_compressed: bool
     compression_ratio: float = field(init=False)
+    dictionary_id: Optional[int] = None
 
     def __post_init__(self):
         """Calculate compression ratio."""
@@ -65,7 +161,7 @@ class CompressionResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
+        result = {
             "original_size": self.original_size,
             "compressed_size": self.compressed_size,
             "algorithm": self.algorithm.value,
@@ -75,10 +171,18 @@ class CompressionResult:
                 self.original_size - self.compressed_size if self.was_compressed else 0
             ),
         }
+        if self.dictionary_id is not None:
+            result["dictionary_id"] = self.dictionary_id
+        return result
 
 
 # Magic bytes for detecting compression
 GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Registry of trained dictionaries, keyed by zstd dict_id
+_dictionaries: Dict[int, CompressionDictionary] = {}
+_dictionaries_lock = threading.Lock()
 
 
 def is_gzip_compressed(data: bytes) -> bool:
@@ -94,6 +198,215 @@ def is_gzip_compressed(data: bytes) -> bool:
     return len(data) >= 2 and data[:2] == GZIP_MAGIC
 
 
+def is_zstd_compressed(data: bytes) -> bool:
+    """
+    Check if data is a Zstandard frame by examining magic bytes.
+
+    Args:
+        data: Bytes to check
+
+    Returns:
+        True if data appears to be zstd compressed
+    """
+    return len(data) >= 4 and data[:4] == ZSTD_MAGIC
+
+
+def detect_algorithm(data: bytes) -> CompressionAlgorithm:
+    """
+    Detect the compression algorithm from magic bytes.
+
+    Args:
+        data: Bytes to check
+
+    Returns:
+        Detected algorithm (NONE if the data is not compressed)
+    """
+    if is_gzip_compressed(data):
+        return CompressionAlgorithm.GZIP
+    if is_zstd_compressed(data):
+        return CompressionAlgorithm.ZSTD
+    return CompressionAlgorithm.NONE
+
+
+def is_compressed(data: bytes) -> bool:
+    """
+    Check if data is compressed with any supported algorithm.
+
+    Args:
+        data: Bytes to check
+
+    Returns:
+        True if data appears to be gzip or zstd compressed
+    """
+    return detect_algorithm(data) != CompressionAlgorithm.NONE
+
+
+def estimate_entropy(data: bytes, sample_size: int = 4096) -> float:
+    """
+    Estimate Shannon entropy in bits per byte from a sample of the data.
+
+    Samples the head, middle and tail of large inputs so the probe costs
+    O(sample_size) regardless of payload size. Encrypted or already
+    compressed payloads score close to 8.0; JSON typically scores 4-6.
+
+    Args:
+        data: Bytes to probe
+        sample_size: Total number of bytes to sample
+
+    Returns:
+        Estimated entropy in bits per byte (0.0 - 8.0)
+    """
+    if not data:
+        return 0.0
+
+    if len(data) <= sample_size:
+        sample = data
+    else:
+        part = sample_size // 3
+        middle = len(data) // 2
+        sample = data[:part] + data[middle : middle + part] + data[-part:]
+
+    total = len(sample)
+    entropy = 0.0
+    for count in Counter(sample).values():
+        p = count / total
+        entropy -= p * math.log2(p)
+    return entropy
+
+
+def train_dictionary(
+    samples: Sequence[bytes],
+    dict_size: int = 16 * 1024,
+    level: int = 3,
+    register: bool = True,
+) -> CompressionDictionary:
+    """
+    Train a Zstandard dictionary from representative samples.
+
+    Dictionaries pay off for small payloads with shared structure, such as
+    evidence envelopes (identical keys, similar metadata) or knowledge-base
+    sections. Train on a few hundred real samples and persist the result
+    with ``CompressionDictionary.to_bytes``.
+
+    Args:
+        samples: Representative payloads
+        dict_size: Target dictionary size in bytes
+        level: Compression level the dictionary is tuned for
+        register: Register the dictionary for automatic decompression
+
+    Returns:
+        Trained CompressionDictionary
+
+    Raises:
+        RuntimeError: If zstandard is not installed
+        ValueError: If too few samples were provided
+    """
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required to train compression dictionaries")
+    if len(samples) < 8:
+        raise ValueError(f"At least 8 samples are required, got {len(samples)}")
+
+    training: List[Union[bytes, bytearray, memoryview]] = list(samples)
+    trained = zstandard.train_dictionary(dict_size, training, level=level)
+    dictionary = CompressionDictionary(data=trained.as_bytes())
+    if register:
+        register_dictionary(dictionary)
+    logger.debug(f"Trained zstd dictionary {dictionary.dict_id} ({len(dictionary.data)} bytes)")
+    return dictionary
+
+
+def register_dictionary(dictionary: CompressionDictionary) -> None:
+    """
+    Register a dictionary so ``decompress`` can resolve it by frame dict ID.
+
+    Args:
+        dictionary: Dictionary to register
+    """
+    with _dictionaries_lock:
+        _dictionaries[dictionary.dict_id] = dictionary
+
+
+def get_dictionary(dict_id: int) -> Optional[CompressionDictionary]:
+    """
+    Look up a registered dictionary by ID.
+
+    Args:
+        dict_id: zstd dictionary ID
+
+    Returns:
+        The registered dictionary, or None
+    """
+    with _dictionaries_lock:
+        return _dictionaries.get(dict_id)
+
+
+def _resolve_algorithm(config: CompressionConfig) -> CompressionAlgorithm:
+    """Return the effective algorithm, falling back to gzip without zstandard."""
+    if config.algorithm == CompressionAlgorithm.ZSTD and not ZSTD_AVAILABLE:
+        logger.warning("zstandard not installed, falling back to gzip")
+        return CompressionAlgorithm.GZIP
+    return config.algorithm
+
+
+# ZstdCompressor/ZstdDecompressor are not safe for concurrent use, but are
+# expensive to build with a dictionary loaded, so cache them per thread.
+_zstd_local = threading.local()
+
+
+def _zstd_compressor(config: CompressionConfig, size: int = -1) -> Any:
+    """Get a cached ZstdCompressor for the config and input size."""
+    threads = 0
+    if config.threads and size >= config.threaded_min_size:
+        threads = config.threads
+    dictionary = config.dictionary
+    key = (config.level, dictionary.dict_id if dictionary else 0, threads)
+
+    cache = getattr(_zstd_local, "compressors", None)
+    if cache is None:
+        cache = _zstd_local.compressors = {}
+    compressor = cache.get(key)
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(
+            level=config.level,
+            dict_data=dictionary.as_zstd() if dictionary else None,
+            threads=threads,
+        )
+        cache[key] = compressor
+    return compressor
+
+
+def _zstd_decompressor(dictionary: Optional[CompressionDictionary]) -> Any:
+    """Get a cached ZstdDecompressor for the dictionary."""
+    key = dictionary.dict_id if dictionary else 0
+    cache = getattr(_zstd_local, "decompressors", None)
+    if cache is None:
+        cache = _zstd_local.decompressors = {}
+    decompressor = cache.get(key)
+    if decompressor is None:
+        decompressor = zstandard.ZstdDecompressor(
+            dict_data=dictionary.as_zstd() if dictionary else None
+        )
+        cache[key] = decompressor
+    return decompressor
+
+
+def _gzip_level(config: CompressionConfig) -> int:
+    """Clamp the configured level into gzip's range."""
+    return min(max(config.level, 1), 9)
+
+
+def _uncompressed(
+    data: bytes, algorithm: CompressionAlgorithm = CompressionAlgorithm.NONE
+) -> Tuple[bytes, CompressionResult]:
+    """Return data unchanged with a not-compressed result."""
+    return data, CompressionResult(
+        original_size=len(data),
+        compressed_size=len(data),
+        algorithm=algorithm,
+        was_compressed=False,
+    )
+
+
 def compress(
     data: bytes,
     config: Optional[CompressionConfig] = None,
@@ -117,72 +430,96 @@ def compress(
     config = config or CompressionConfig()
     original_size = len(data)
 
-    # Skip compression if disabled or data is too small
-    if not config.enabled or original_size < config.min_size:
+    # Skip compression if disabled or data is too small. A dictionary makes
+    # small payloads worth compressing, so min_size does not apply then.
+    if not config.enabled or (original_size < config.min_size and config.dictionary is None):
         logger.debug(
             f"Skipping compression: enabled={config.enabled}, "
             f"size={original_size}, min={config.min_size}"
         )
-        return data, CompressionResult(
-            original_size=original_size,
-            compressed_size=original_size,
-            algorithm=CompressionAlgorithm.NONE,
-            was_compressed=False,
-        )
+        return _uncompressed(data)
 
     # Skip if already compressed
-    if is_gzip_compressed(data):
+    existing = detect_algorithm(data)
+    if existing != CompressionAlgorithm.NONE:
         logger.debug("Data already compressed, skipping")
-        return data, CompressionResult(
-            original_size=original_size,
-            compressed_size=original_size,
-            algorithm=CompressionAlgorithm.GZIP,
-            was_compressed=False,
-        )
+        return _uncompressed(data, existing)
 
     if config.algorithm == CompressionAlgorithm.NONE:
-        return data, CompressionResult(
-            original_size=original_size,
-            compressed_size=original_size,
-            algorithm=CompressionAlgorithm.NONE,
-            was_compressed=False,
-        )
+        return _uncompressed(data)
 
-    if config.algorithm == CompressionAlgorithm.GZIP:
-        compressed = gzip.compress(data, compresslevel=config.level)
-        compressed_size = len(compressed)
+    # Skip incompressible payloads (encrypted blobs, media) before paying
+    # for a full compression pass whose output would be discarded
+    if config.entropy_probe:
+        entropy = estimate_entropy(data)
+        if entropy > config.entropy_threshold:
+            logger.debug(f"Skipping compression: entropy {entropy:.2f} bits/byte")
+            return _uncompressed(data)
 
-        # Only use compressed version if it's actually smaller
-        if compressed_size >= original_size:
-            logger.debug(f"Compression not beneficial: {original_size} -> {compressed_size}")
-            return data, CompressionResult(
-                original_size=original_size,
-                compressed_size=original_size,
-                algorithm=CompressionAlgorithm.NONE,
-                was_compressed=False,
-            )
+    algorithm = _resolve_algorithm(config)
+    dictionary_id = None
 
-        logger.debug(
-            f"Compressed {original_size} -> {compressed_size} "
-            f"({(1 - compressed_size / original_size):.1%} reduction)"
-        )
-        return compressed, CompressionResult(
-            original_size=original_size,
-            compressed_size=compressed_size,
-            algorithm=CompressionAlgorithm.GZIP,
-            was_compressed=True,
-        )
-
-    raise ValueError(f"Unsupported compression algorithm: {config.algorithm}")
-
-
-def decompress(data: bytes, expected_algorithm: Optional[CompressionAlgorithm] = None) -> bytes:
+    if algorithm == CompressionAlgorithm.GZIP:
+        compressed = gzip.compress(data, compresslevel=_gzip_level(config))
+    elif algorithm == CompressionAlgorithm.ZSTD:
+        compressed = _zstd_compressor(config, original_size).compress(data)
+        if config.dictionary is not None:
+            dictionary_id = config.dictionary.dict_id
+    else:
+        raise ValueError(f"Unsupported compression algorithm: {config.algorithm}")
+
+    compressed_size = len(compressed)
+
+    # Only use compressed version if it's actually smaller
+    if compressed_size >= original_size:
+        logger.debug(f"Compression not beneficial: {original_size} -> {compressed_size}")
+        return _uncompressed(data)
+
+    logger.debug(
+        f"Compressed {original_size} -> {compressed_size} "
+        f"({(1 - compressed_size / original_size):.1%} reduction, {algorithm.value})"
+    )
+    return compressed, CompressionResult(
+        original_size=original_size,
+        compressed_size=compressed_size,
+        algorithm=algorithm,
+        was_compressed=True,
+        dictionary_id=dictionary_id,
+    )
+
+
+def _zstd_decompress(data: bytes, dictionary: Optional[CompressionDictionary]) -> bytes:
+    """Decompress a zstd frame, resolving its dictionary if needed."""
+    if not ZSTD_AVAILABLE:
+        raise ValueError("zstandard is required to decompress zstd data")
+
+    try:
+        if dictionary is None:
+            dict_id = zstandard.get_frame_parameters(data).dict_id
+            if dict_id:
+                dictionary = get_dictionary(dict_id)
+                if dictionary is None:
+                    raise ValueError(f"Unknown zstd dictionary: {dict_id}")
+
+        # Streaming read handles frames without a content-size header
+        out: bytes = _zstd_decompressor(dictionary).decompressobj().decompress(data)
+        return out
+    except zstandard.ZstdError as e:
+        raise ValueError(f"Invalid zstd data: {e}") from e
+
+
+def decompress(
+    data: bytes,
+    expected_algorithm: Optional[CompressionAlgorithm] = None,
+    dictionary: Optional[CompressionDictionary] = None,
+) -> bytes:
     """
     Decompress data, auto-detecting algorithm if not specified.
 
     Args:
         data: Compressed bytes
         expected_algorithm: Expected compression algorithm (auto-detect if None)
+        dictionary: zstd dictionary (resolved from the registry if None)
 
     Returns:
         Decompressed bytes
@@ -192,11 +529,7 @@ def decompress(data: bytes, expected_algorithm: Optional[CompressionAlgorithm] =
     """
     # Auto-detect compression
     if expected_algorithm is None:
-        if is_gzip_compressed(data):
-            expected_algorithm = CompressionAlgorithm.GZIP
-        else:
-            # Data is not compressed
-            return data
+        expected_algorithm = detect_algorithm(data)
 
     if expected_algorithm == CompressionAlgorithm.NONE:
         return data
@@ -207,6 +540,9 @@ def decompress(data: bytes, expected_algorithm: Optional[CompressionAlgorithm] =
         except gzip.BadGzipFile as e:
             raise ValueError(f"Invalid gzip data: {e}") from e
 
+    if expected_algorithm == CompressionAlgorithm.ZSTD:
+        return _zstd_decompress(data, dictionary)
+
     raise ValueError(f"Unsupported compression algorithm: {expected_algorithm}")
 
 
@@ -248,7 +584,10 @@ class StreamingCompressor:
     """
     Streaming compressor for large files.
 
-    Use when data is too large to fit in memory at once.
+    Use when data is too large to fit in memory at once. Output produced by
+    ``write`` is held until the caller takes it with ``drain``; ``stream``
+    drains after every chunk, so nothing is buffered beyond the compressor's
+    own window. ``finalize`` returns whatever has not been drained yet.
     """
 
     def __init__(self, config: Optional[CompressionConfig] = None):
@@ -259,53 +598,116 @@ class StreamingCompressor:
             config: Compression configuration
         """
         self.config = config or CompressionConfig()
-        self._buffer = io.BytesIO()
-        self._compressor: Optional[gzip.GzipFile] = None
+        self.algorithm = _resolve_algorithm(self.config)
+        self._compressor: Optional[Any] = None
+        self._pending: List[bytes] = []
         self._total_input = 0
+        self._total_output = 0
         self._finalized = False
 
+    def _ensure_compressor(self) -> Any:
+        """Lazily create the underlying compression object."""
+        if self._compressor is None:
+            if self.algorithm == CompressionAlgorithm.ZSTD:
+                # Size unknown up front; threads apply whenever configured
+                config = self.config
+                self._compressor = zstandard.ZstdCompressor(
+                    level=config.level,
+                    dict_data=config.dictionary.as_zstd() if config.dictionary else None,
+                    threads=config.threads,
+                ).compressobj()
+            elif self.algorithm == CompressionAlgorithm.GZIP:
+                # wbits=31 emits a gzip container compatible with gzip.decompress
+                self._compressor = zlib.compressobj(_gzip_level(self.config), zlib.DEFLATED, 31)
+            else:
+                self._compressor = None
+        return self._compressor
+
+    def _emit(self, chunk: bytes) -> None:
+        """Hold produced output until it is drained."""
+        if chunk:
+            self._pending.append(chunk)
+            self._total_output += len(chunk)
+
     def write(self, data: bytes) -> None:
         """
         Write data to the compressor.
 
+        Compressed output is collected with ``drain`` or ``finalize``.
+
         Args:
             data: Bytes to compress
         """
         if self._finalized:
             raise RuntimeError("Compressor has been finalized")
 
-        if self._compressor is None:
-            self._compressor = gzip.GzipFile(
-                mode="wb",
-                fileobj=self._buffer,
-                compresslevel=self.config.level,
-            )
-
-        self._compressor.write(data)
         self._total_input += len(data)
+        compressor = self._ensure_compressor()
+        if compressor is None:
+            self._emit(bytes(data))
+        else:
+            self._emit(compressor.compress(data))
+
+    def drain(self) -> bytes:
+        """
+        Take all output produced so far.
+
+        Returns:
+            Compressed bytes not yet returned by ``drain`` or ``finalize``
+        """
+        data = b"".join(self._pending)
+        self._pending.clear()
+        return data
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Compress an iterable of chunks, yielding output as it is produced.
+
+        Finalizes the compressor once the input is exhausted.
+
+        Args:
+            chunks: Input chunks
+
+        Yields:
+            Compressed chunks
+        """
+        for chunk in chunks:
+            self.write(chunk)
+            out = self.drain()
+            if out:
+                yield out
+        tail, _ = self.finalize()
+        if tail:
+            yield tail
 
     def finalize(self) -> Tuple[bytes, CompressionResult]:
         """
         Finalize compression and return result.
 
         Returns:
-            Tuple of (compressed_data, compression_result)
+            Tuple of (remaining_compressed_data, compression_result)
         """
         if self._finalized:
             raise RuntimeError("Compressor already finalized")
 
         self._finalized = True
 
-        if self._compressor:
-            self._compressor.close()
+        compressor = self._ensure_compressor()
+        if compressor is not None:
+            self._emit(compressor.flush())
 
-        compressed_data = self._buffer.getvalue()
+        compressed_data = self.drain()
 
         return compressed_data, CompressionResult(
             original_size=self._total_input,
-            compressed_size=len(compressed_data),
-            algorithm=self.config.algorithm,
-            was_compressed=True,
+            compressed_size=self._total_output,
+            algorithm=self.algorithm,
+            was_compressed=self.algorithm != CompressionAlgorithm.NONE,
+            dictionary_id=(
+                self.config.dictionary.dict_id
+                if self.config.dictionary and self.algorithm == CompressionAlgorithm.ZSTD
+                else None
+            ),
         )
 
 
@@ -325,4 +727,6 @@ def get_content_type_for_compression(
     """
     if algorithm == CompressionAlgorithm.GZIP:
         return original_content_type, "gzip"
+    if algorithm == CompressionAlgorithm.ZSTD:
+        return original_content_type, "zstd"
     return original_content_type, None
@@ -15,15 +15,18 @@ Supports:
 - IPFS via HTTP API (Infura, Pinata, local node)
 - Arweave via HTTP API
 - Lit Protocol for access control (optional)
+- Local content-addressed blob cache for repeated reads (optional)
 """
 
 import logging
 import json
 import hashlib
-from typing import Optional, Dict, Any, Tuple
+import hmac
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+from pathlib import Path
 import urllib.request
 import urllib.error
 
@@ -33,8 +36,10 @@ from rra.storage.compression import (
     compress,
     decompress,
     CompressionConfig,
-    is_gzip_compressed,
+    CompressionResult,
+    is_compressed,
 )
+from rra.storage.blob_cache import BlobCache, DEFAULT_MAX_BYTES
 
 from rra.privacy.viewing_keys import (
     ViewingKeyManager,
@@ -103,6 +108,15 @@ class StorageConfig:
     )  # Compression settings
 
 
+@dataclass
+class UploadRequest:
+    """Provider-specific HTTP upload request."""
+
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+
+
 class EncryptedIPFSStorage:
     """
     Encrypted storage for ILRM dispute evidence.
@@ -123,6 +137,7 @@ class EncryptedIPFSStorage:
         self,
         config: Optional[StorageConfig] = None,
         viewing_key_manager: Optional[ViewingKeyManager] = None,
+        cache: Optional[BlobCache] = None,
     ):
         """
         Initialize encrypted storage.
@@ -130,12 +145,14 @@ class EncryptedIPFSStorage:
         Args:
             config: Storage provider configuration
             viewing_key_manager: Manager for viewing key operations
+            cache: Optional local blob cache for downloaded packages
         """
         self.config = config or StorageConfig(
             provider=StorageProvider.MOCK,
             api_url="",
         )
         self.vk_manager = viewing_key_manager or ViewingKeyManager()
+        self.cache = cache
 
         # Mock storage for testing
         self._mock_storage: Dict[str, bytes] = {}
@@ -164,6 +181,58 @@ class EncryptedIPFSStorage:
             EncryptionError: If encryption fails
             StorageUploadError: If upload fails
         """
+        package_bytes, evidence_hash, compression_result = self.build_package(
+            evidence, viewing_key, dispute_id, metadata
+        )
+
+        # Upload to storage provider
+        try:
+            result = self._upload(package_bytes, dispute_id)
+            # Write through so the uploader's own reads are local
+            if self.cache is not None and result.success:
+                self.cache.put(result.uri, package_bytes, evidence_hash.hex())
+            # Add compression info to result metadata
+            if compression_result.was_compressed:
+                result.metadata["compression"] = compression_result.to_dict()
+            logger.info(
+                f"Evidence stored successfully: {result.uri} " f"({result.size_bytes} bytes)"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Failed to upload evidence: {e}")
+            raise StorageUploadError(
+                provider=self.config.provider.value,
+                reason=str(e),
+                content_size=len(package_bytes),
+                cause=e,
+            )
+
+    def build_package(
+        self,
+        evidence: Dict[str, Any],
+        viewing_key: ViewingKey,
+        dispute_id: int,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bytes, bytes, CompressionResult]:
+        """
+        Encrypt, serialize and compress evidence into an upload-ready package.
+
+        CPU-bound and provider-independent, so batch uploaders can run it on
+        a worker pool while network I/O proceeds.
+
+        Args:
+            evidence: Evidence data to store
+            viewing_key: Viewing key for encryption
+            dispute_id: Associated dispute ID
+            metadata: Optional metadata to store alongside
+
+        Returns:
+            Tuple of (package_bytes, evidence_hash, compression_result)
+
+        Raises:
+            ValidationError: If inputs are invalid
+            EncryptionError: If encryption or serialization fails
+        """
         # Validate inputs
         if not evidence:
             raise ValidationError(
@@ -238,24 +307,7 @@ class EncryptedIPFSStorage:
                 cause=e,
             )
 
-        # 5. Upload to storage provider
-        try:
-            result = self._upload(package_bytes, dispute_id)
-            # Add compression info to result metadata
-            if compression_result.was_compressed:
-                result.metadata["compression"] = compression_result.to_dict()
-            logger.info(
-                f"Evidence stored successfully: {result.uri} " f"({result.size_bytes} bytes)"
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Failed to upload evidence: {e}")
-            raise StorageUploadError(
-                provider=self.config.provider.value,
-                reason=str(e),
-                content_size=len(package_bytes),
-                cause=e,
-            )
+        return package_bytes, evidence_hash, compression_result
 
     def retrieve_evidence(
         self,
@@ -277,7 +329,26 @@ class EncryptedIPFSStorage:
             StorageDownloadError: If download fails
             EncryptionError: If decryption fails
         """
-        # Validate inputs
+        self._validate_retrieve(uri, viewing_key)
+        logger.info(f"Retrieving evidence from {uri}")
+
+        # Download from storage
+        try:
+            package_bytes = self._download(uri)
+            logger.debug(f"Downloaded {len(package_bytes)} bytes from {uri}")
+        except Exception as e:
+            logger.error(f"Failed to download from {uri}: {e}")
+            raise StorageDownloadError(
+                uri=uri,
+                reason=str(e),
+                cause=e,
+            )
+
+        return self.open_package(uri, package_bytes, viewing_key)
+
+    @staticmethod
+    def _validate_retrieve(uri: str, viewing_key: ViewingKey) -> None:
+        """Validate retrieve_evidence inputs."""
         if not uri:
             raise ValidationError(
                 message="Storage URI is required",
@@ -292,23 +363,30 @@ class EncryptedIPFSStorage:
                 constraint="valid ViewingKey object",
             )
 
-        logger.info(f"Retrieving evidence from {uri}")
+    def open_package(
+        self,
+        uri: str,
+        package_bytes: bytes,
+        viewing_key: ViewingKey,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Decompress, parse and decrypt a downloaded storage package.
 
-        # 1. Download from storage
-        try:
-            package_bytes = self._download(uri)
-            logger.debug(f"Downloaded {len(package_bytes)} bytes from {uri}")
-        except Exception as e:
-            logger.error(f"Failed to download from {uri}: {e}")
-            raise StorageDownloadError(
-                uri=uri,
-                reason=str(e),
-                cause=e,
-            )
+        Args:
+            uri: Storage URI the package was read from (for error reporting)
+            package_bytes: Raw package bytes
+            viewing_key: Viewing key for decryption
+
+        Returns:
+            Tuple of (evidence_data, metadata)
 
-        # 2. Decompress if needed (auto-detects gzip)
+        Raises:
+            StorageDownloadError: If the package is malformed
+            EncryptionError: If decryption fails
+        """
+        # 1. Decompress if needed (auto-detects gzip/zstd)
         try:
-            if is_gzip_compressed(package_bytes):
+            if is_compressed(package_bytes):
                 decompressed_bytes = decompress(package_bytes)
                 logger.debug(
                     f"Decompressed package: {len(package_bytes)} -> {len(decompressed_bytes)} bytes"
@@ -318,7 +396,7 @@ class EncryptedIPFSStorage:
             logger.warning(f"Decompression failed, trying raw data: {e}")
             # Continue with original bytes - may not be compressed
 
-        # 3. Parse package
+        # 2. Parse package
         try:
             package = json.loads(package_bytes.decode())
         except json.JSONDecodeError as e:
@@ -337,12 +415,12 @@ class EncryptedIPFSStorage:
             )
 
         try:
-            # 4. Deserialize encrypted evidence
+            # 3. Deserialize encrypted evidence
             encrypted = self.vk_manager.deserialize_encrypted(
                 package["encrypted_evidence"].encode()
             )
 
-            # 5. Decrypt
+            # 4. Decrypt
             decrypted = self.vk_manager.decrypt_evidence(encrypted, viewing_key)
             logger.debug("Evidence decrypted successfully")
         except Exception as e:
@@ -353,7 +431,7 @@ class EncryptedIPFSStorage:
                 cause=e,
             )
 
-        # 6. Build metadata including package-level fields
+        # 5. Build metadata including package-level fields
         metadata = package.get("metadata", {}).copy()
         if "dispute_id" in package:
             metadata["dispute_id"] = package["dispute_id"]
@@ -376,17 +454,17 @@ class EncryptedIPFSStorage:
             True if hash matches
         """
         try:
+            # Cached blobs are re-hashed against their digest before use, so
+            # the evidence hash always comes from verified package bytes
             package_bytes = self._download(uri)
 
             # Decompress if needed
-            if is_gzip_compressed(package_bytes):
+            if is_compressed(package_bytes):
                 package_bytes = decompress(package_bytes)
 
             package = json.loads(package_bytes.decode())
             stored_hash = bytes.fromhex(package["evidence_hash"])
             # SECURITY FIX: Use constant-time comparison for evidence hash verification
-            import hmac
-
             return hmac.compare_digest(stored_hash, expected_hash)
         except Exception as e:
             logger.warning(f"Evidence verification failed for {uri}: {e}")
@@ -394,23 +472,28 @@ class EncryptedIPFSStorage:
 
     def _upload(self, data: bytes, dispute_id: int) -> StorageResult:
         """Upload data to storage provider."""
-        content_hash = keccak(data)
-
         if self.config.provider == StorageProvider.MOCK:
-            return self._mock_upload(data, content_hash, dispute_id)
-        elif self.config.provider in (
-            StorageProvider.IPFS_LOCAL,
-            StorageProvider.IPFS_INFURA,
-        ):
-            return self._ipfs_upload(data, content_hash, dispute_id)
-        elif self.config.provider == StorageProvider.IPFS_PINATA:
-            return self._pinata_upload(data, content_hash, dispute_id)
-        elif self.config.provider == StorageProvider.ARWEAVE:
-            return self._arweave_upload(data, content_hash, dispute_id)
-        else:
-            raise ValueError(f"Unsupported provider: {self.config.provider}")
+            return self._mock_upload(data, keccak(data), dispute_id)
+        return self._http_upload(data, dispute_id)
 
     def _download(self, uri: str) -> bytes:
+        """Download data, serving from the local blob cache when configured."""
+        if self.cache is None:
+            return self._fetch(uri)
+        return self.cache.get_or_fetch(uri, self._fetch, self._package_evidence_hash)
+
+    @staticmethod
+    def _package_evidence_hash(package_bytes: bytes) -> Optional[str]:
+        """Extract the evidence hash from a storage package, if parseable."""
+        try:
+            if is_compressed(package_bytes):
+                package_bytes = decompress(package_bytes)
+            evidence_hash: Optional[str] = json.loads(package_bytes.decode()).get("evidence_hash")
+        except (ValueError, AttributeError):
+            return None
+        return evidence_hash
+
+    def _fetch(self, uri: str) -> bytes:
         """Download data from storage provider."""
         if uri.startswith("mock://"):
             cid = uri.replace("mock://", "")
@@ -418,16 +501,7 @@ class EncryptedIPFSStorage:
                 raise ValueError(f"Not found: {uri}")
             return self._mock_storage[cid]
 
-        elif uri.startswith("ipfs://"):
-            cid = uri.replace("ipfs://", "")
-            return self._ipfs_download(cid)
-
-        elif uri.startswith("ar://"):
-            tx_id = uri.replace("ar://", "")
-            return self._arweave_download(tx_id)
-
-        else:
-            raise ValueError(f"Unsupported URI scheme: {uri}")
+        return self._http_download(uri)
 
     def _mock_upload(
         self,
@@ -449,78 +523,227 @@ class EncryptedIPFSStorage:
             metadata={"dispute_id": dispute_id},
         )
 
-    def _ipfs_upload(
+    # =========================================================================
+    # Provider wire format (shared by the sync and async clients)
+    # =========================================================================
+
+    def build_upload_request(self, data: bytes, dispute_id: int) -> UploadRequest:
+        """
+        Build the HTTP request that uploads a package to the configured provider.
+
+        Args:
+            data: Package bytes
+            dispute_id: Associated dispute ID
+
+        Returns:
+            UploadRequest with URL, body and headers
+        """
+        provider = self.config.provider
+
+        if provider in (StorageProvider.IPFS_LOCAL, StorageProvider.IPFS_INFURA):
+            # Create multipart form data
+            boundary = "----IPFSBoundary"
+            body = (
+                (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="file"; filename="evidence.json"\r\n'
+                    f"Content-Type: application/json\r\n\r\n"
+                ).encode()
+                + data
+                + f"\r\n--{boundary}--\r\n".encode()
+            )
+            headers = {
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+            }
+
+            # Add auth if configured
+            if self.config.api_key and self.config.api_secret:
+                import base64
+
+                credentials = base64.b64encode(
+                    f"{self.config.api_key}:{self.config.api_secret}".encode()
+                ).decode()
+                headers["Authorization"] = f"Basic {credentials}"
+
+            return UploadRequest(url=f"{self.config.api_url}/add", body=body, headers=headers)
+
+        if provider == StorageProvider.IPFS_PINATA:
+            boundary = "----PinataBoundary"
+
+            # Metadata for Pinata
+            pinata_metadata = json.dumps(
+                {
+                    "name": f"dispute_{dispute_id}_evidence",
+                    "keyvalues": {
+                        "dispute_id": str(dispute_id),
+                        "type": "ilrm_evidence",
+                    },
+                }
+            )
+
+            body = (
+                (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="file"; filename="evidence.json"\r\n'
+                    f"Content-Type: application/json\r\n\r\n"
+                ).encode()
+                + data
+                + (
+                    f"\r\n--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="pinataMetadata"\r\n'
+                    f"Content-Type: application/json\r\n\r\n"
+                    f"{pinata_metadata}\r\n"
+                    f"--{boundary}--\r\n"
+                ).encode()
+            )
+            headers = {
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Authorization": f"Bearer {self.config.api_key}",
+            }
+            return UploadRequest(
+                url=f"{self.config.api_url}/pinning/pinFileToIPFS", body=body, headers=headers
+            )
+
+        if provider == StorageProvider.ARWEAVE:
+            # Note: Real Arweave upload requires JWK signing
+            # This is a simplified implementation for demo purposes
+            tx = {
+                "data": data.hex(),
+                "tags": [
+                    {"name": "Content-Type", "value": "application/json"},
+                    {"name": "App-Name", "value": "ILRM"},
+                    {"name": "Dispute-ID", "value": str(dispute_id)},
+                ],
+            }
+            return UploadRequest(
+                url=f"{self.config.api_url}/tx",
+                body=json.dumps(tx).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    def parse_upload_response(
         self,
+        response: Dict[str, Any],
         data: bytes,
-        content_hash: bytes,
         dispute_id: int,
     ) -> StorageResult:
-        """Upload to IPFS via HTTP API."""
-        url = f"{self.config.api_url}/add"
-
-        # Create multipart form data
-        boundary = "----IPFSBoundary"
-        body = (
-            (
-                f"--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="file"; filename="evidence.json"\r\n'
-                f"Content-Type: application/json\r\n\r\n"
-            ).encode()
-            + data
-            + f"\r\n--{boundary}--\r\n".encode()
+        """
+        Build a StorageResult from a provider's upload response.
+
+        Args:
+            response: Decoded JSON response body
+            data: Uploaded package bytes
+            dispute_id: Associated dispute ID
+
+        Returns:
+            Successful StorageResult
+        """
+        provider = self.config.provider
+        metadata: Dict[str, Any] = {"dispute_id": dispute_id}
+
+        if provider == StorageProvider.ARWEAVE:
+            tx_id = response.get("id", hashlib.sha256(data).hexdigest()[:43])
+            uri = f"ar://{tx_id}"
+            metadata["tx_id"] = tx_id
+        elif provider == StorageProvider.IPFS_PINATA:
+            cid = response.get("IpfsHash")
+            uri = f"ipfs://{cid}"
+            metadata["cid"] = cid
+            metadata["pin_size"] = response.get("PinSize")
+        else:
+            cid = response.get("Hash")
+            uri = f"ipfs://{cid}"
+            metadata["cid"] = cid
+
+        return StorageResult(
+            success=True,
+            uri=uri,
+            content_hash=keccak(data),
+            size_bytes=len(data),
+            provider=provider,
+            timestamp=datetime.utcnow(),
+            metadata=metadata,
         )
 
-        headers = {
-            "Content-Type": f"multipart/form-data; boundary={boundary}",
-        }
+    def failed_upload_result(self, data: bytes, error: str) -> StorageResult:
+        """Build a StorageResult for an upload that did not succeed."""
+        return StorageResult(
+            success=False,
+            uri="",
+            content_hash=keccak(data),
+            size_bytes=len(data),
+            provider=self.config.provider,
+            timestamp=datetime.utcnow(),
+            error=error,
+        )
 
-        # Add auth if configured
-        if self.config.api_key and self.config.api_secret:
-            import base64
+    def pin_url(self, cid: str) -> Optional[str]:
+        """URL that pins a CID after upload, or None if the provider needs no pin call."""
+        if self.config.pin and self.config.provider in (
+            StorageProvider.IPFS_LOCAL,
+            StorageProvider.IPFS_INFURA,
+        ):
+            return f"{self.config.api_url}/pin/add?arg={cid}"
+        return None
 
-            credentials = base64.b64encode(
-                f"{self.config.api_key}:{self.config.api_secret}".encode()
-            ).decode()
-            headers["Authorization"] = f"Basic {credentials}"
+    def download_urls(self, uri: str) -> List[str]:
+        """
+        URLs to try, in order, when downloading a storage URI.
+
+        Args:
+            uri: Storage URI (ipfs://... or ar://...)
+
+        Returns:
+            Candidate URLs
+
+        Raises:
+            ValueError: If the URI scheme is not supported
+        """
+        if uri.startswith("ipfs://"):
+            cid = uri.replace("ipfs://", "")
+            urls = []
+            # Try configured API first
+            if self.config.api_url:
+                urls.append(f"{self.config.api_url}/cat?arg={cid}")
+            # Fallback to public gateway
+            urls.append(f"https://ipfs.io/ipfs/{cid}")
+            return urls
+
+        if uri.startswith("ar://"):
+            tx_id = uri.replace("ar://", "")
+            return [f"{self.config.api_url or 'https://arweave.net'}/{tx_id}"]
+
+        raise ValueError(f"Unsupported URI scheme: {uri}")
+
+    # =========================================================================
+    # Synchronous transport
+    # =========================================================================
+
+    def _http_upload(self, data: bytes, dispute_id: int) -> StorageResult:
+        """Upload via the provider's HTTP API."""
+        upload = self.build_upload_request(data, dispute_id)
 
         try:
-            request = urllib.request.Request(url, data=body, headers=headers)
+            request = urllib.request.Request(upload.url, data=upload.body, headers=upload.headers)
             with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                cid = result.get("Hash")
-
-                # Pin if configured
-                if self.config.pin:
-                    self._ipfs_pin(cid)
-
-                return StorageResult(
-                    success=True,
-                    uri=f"ipfs://{cid}",
-                    content_hash=content_hash,
-                    size_bytes=len(data),
-                    provider=self.config.provider,
-                    timestamp=datetime.utcnow(),
-                    metadata={
-                        "dispute_id": dispute_id,
-                        "cid": cid,
-                    },
+                result = self.parse_upload_response(
+                    json.loads(response.read().decode()), data, dispute_id
                 )
         except urllib.error.URLError as e:
-            return StorageResult(
-                success=False,
-                uri="",
-                content_hash=content_hash,
-                size_bytes=len(data),
-                provider=self.config.provider,
-                timestamp=datetime.utcnow(),
-                error=str(e),
-            )
-
-    def _ipfs_download(self, cid: str) -> bytes:
-        """Download from IPFS."""
-        # Try configured API first
-        if self.config.api_url:
-            url = f"{self.config.api_url}/cat?arg={cid}"
+            return self.failed_upload_result(data, str(e))
+
+        # Pin if configured
+        pin_url = self.pin_url(result.metadata.get("cid", ""))
+        if pin_url:
+            self._ipfs_pin(pin_url)
+        return result
+
+    def _http_download(self, uri: str) -> bytes:
+        """Download from the first candidate URL that responds."""
+        urls = self.download_urls(uri)
+        for url in urls[:-1]:
             try:
                 request = urllib.request.Request(url)
                 with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
@@ -528,163 +751,27 @@ class EncryptedIPFSStorage:
             except urllib.error.URLError:
                 pass
 
-        # Fallback to public gateway
-        gateway_url = f"https://ipfs.io/ipfs/{cid}"
-        request = urllib.request.Request(gateway_url)
+        request = urllib.request.Request(urls[-1])
         with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
             return response.read()
 
-    def _ipfs_pin(self, cid: str) -> bool:
+    def _ipfs_pin(self, pin_url: str) -> bool:
         """Pin content on IPFS."""
-        url = f"{self.config.api_url}/pin/add?arg={cid}"
         try:
-            request = urllib.request.Request(url, method="POST")
+            request = urllib.request.Request(pin_url, method="POST")
             with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
                 return response.status == 200
         except urllib.error.URLError:
             return False
 
-    def _pinata_upload(
-        self,
-        data: bytes,
-        content_hash: bytes,
-        dispute_id: int,
-    ) -> StorageResult:
-        """Upload to Pinata IPFS pinning service."""
-        url = f"{self.config.api_url}/pinning/pinFileToIPFS"
-
-        # Create multipart form data
-        boundary = "----PinataBoundary"
-
-        # Metadata for Pinata
-        pinata_metadata = json.dumps(
-            {
-                "name": f"dispute_{dispute_id}_evidence",
-                "keyvalues": {
-                    "dispute_id": str(dispute_id),
-                    "type": "ilrm_evidence",
-                },
-            }
-        )
-
-        body = (
-            (
-                f"--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="file"; filename="evidence.json"\r\n'
-                f"Content-Type: application/json\r\n\r\n"
-            ).encode()
-            + data
-            + (
-                f"\r\n--{boundary}\r\n"
-                f'Content-Disposition: form-data; name="pinataMetadata"\r\n'
-                f"Content-Type: application/json\r\n\r\n"
-                f"{pinata_metadata}\r\n"
-                f"--{boundary}--\r\n"
-            ).encode()
-        )
-
-        headers = {
-            "Content-Type": f"multipart/form-data; boundary={boundary}",
-            "Authorization": f"Bearer {self.config.api_key}",
-        }
-
-        try:
-            request = urllib.request.Request(url, data=body, headers=headers)
-            with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                cid = result.get("IpfsHash")
-
-                return StorageResult(
-                    success=True,
-                    uri=f"ipfs://{cid}",
-                    content_hash=content_hash,
-                    size_bytes=len(data),
-                    provider=self.config.provider,
-                    timestamp=datetime.utcnow(),
-                    metadata={
-                        "dispute_id": dispute_id,
-                        "cid": cid,
-                        "pin_size": result.get("PinSize"),
-                    },
-                )
-        except urllib.error.URLError as e:
-            return StorageResult(
-                success=False,
-                uri="",
-                content_hash=content_hash,
-                size_bytes=len(data),
-                provider=self.config.provider,
-                timestamp=datetime.utcnow(),
-                error=str(e),
-            )
-
-    def _arweave_upload(
-        self,
-        data: bytes,
-        content_hash: bytes,
-        dispute_id: int,
-    ) -> StorageResult:
-        """Upload to Arweave."""
-        # Note: Real Arweave upload requires JWK signing
-        # This is a simplified implementation for demo purposes
-        url = f"{self.config.api_url}/tx"
-
-        # Create Arweave transaction structure
-        tx = {
-            "data": data.hex(),
-            "tags": [
-                {"name": "Content-Type", "value": "application/json"},
-                {"name": "App-Name", "value": "ILRM"},
-                {"name": "Dispute-ID", "value": str(dispute_id)},
-            ],
-        }
-
-        try:
-            request = urllib.request.Request(
-                url,
-                data=json.dumps(tx).encode(),
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
-                result = json.loads(response.read().decode())
-                tx_id = result.get("id", hashlib.sha256(data).hexdigest()[:43])
-
-                return StorageResult(
-                    success=True,
-                    uri=f"ar://{tx_id}",
-                    content_hash=content_hash,
-                    size_bytes=len(data),
-                    provider=self.config.provider,
-                    timestamp=datetime.utcnow(),
-                    metadata={
-                        "dispute_id": dispute_id,
-                        "tx_id": tx_id,
-                    },
-                )
-        except urllib.error.URLError as e:
-            return StorageResult(
-                success=False,
-                uri="",
-                content_hash=content_hash,
-                size_bytes=len(data),
-                provider=self.config.provider,
-                timestamp=datetime.utcnow(),
-                error=str(e),
-            )
-
-    def _arweave_download(self, tx_id: str) -> bytes:
-        """Download from Arweave."""
-        url = f"{self.config.api_url or 'https://arweave.net'}/{tx_id}"
-        request = urllib.request.Request(url)
-        with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
-            return response.read()
-
 
 def create_storage(
     provider: StorageProvider = StorageProvider.MOCK,
     api_url: Optional[str] = None,
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: Optional[int] = None,
 ) -> EncryptedIPFSStorage:
     """
     Create an encrypted storage instance.
@@ -694,6 +781,8 @@ def create_storage(
         api_url: API endpoint URL
         api_key: API key for authentication
         api_secret: API secret for authentication
+        cache_dir: Enable the local blob cache in this directory
+        cache_max_bytes: Blob cache size budget (default 512 MiB)
 
     Returns:
         Configured EncryptedIPFSStorage instance
@@ -705,4 +794,8 @@ def create_storage(
         api_secret=api_secret,
     )
 
-    return EncryptedIPFSStorage(config)
+    cache = None
+    if cache_dir is not None:
+        cache = BlobCache(Path(cache_dir), max_bytes=cache_max_bytes or DEFAULT_MAX_BYTES)
+
+    return EncryptedIPFSStorage(config, cache=cache)
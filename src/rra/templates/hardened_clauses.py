@@ -13,13 +13,25 @@ Provides battle-tested clause templates with:
 
 Templates are organized by category and license type,
 with customizable parameters for specific use cases.
+
+Templates are compiled once into literal segments and parameter slots, and
+the library indexes them by category, license type, tag and text token and
+caches rendered clauses, so contract generation does no per-call scanning.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import re
 
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Lowercase word tokens used by the text index."""
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
 
 class TemplateCategory(Enum):
     """Categories of clause templates."""
@@ -71,6 +83,27 @@ class TemplateParameter:
         return True
 
 
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template's text split into literal segments around parameter slots."""
+
+    signature: Tuple
+    segments: Tuple[str, ...]  # One more than slots
+    slots: Tuple[str, ...]  # Parameter name between consecutive segments
+    defaults: Dict[str, str]
+
+    def key(self, values: Dict[str, str]) -> Tuple[str, ...]:
+        """The values that determine the rendered text, defaults filled in."""
+        return tuple([values.get(name, default) for name, default in self.defaults.items()])
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = [self.segments[0]]
+        for name, segment in zip(self.slots, self.segments[1:]):
+            parts.append(values.get(name, self.defaults[name]))
+            parts.append(segment)
+        return "".join(parts)
+
+
 @dataclass
 class ClauseTemplate:
     """A pre-hardened clause template."""
@@ -86,6 +119,42 @@ class ClauseTemplate:
     source: str = ""  # Where this template originated
     tags: List[str] = field(default_factory=list)
     related_templates: List[str] = field(default_factory=list)
+    _compiled: Optional[CompiledTemplate] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compile(self) -> CompiledTemplate:
+        """
+        Get the compiled form of the template.
+
+        Compiled once and reused; compiled again only if the text or the
+        parameters have been changed since.
+        """
+        signature = (
+            self.template_text,
+            tuple((p.name, p.default_value) for p in self.parameters),
+        )
+        compiled = self._compiled
+        if compiled is not None and compiled.signature == signature:
+            return compiled
+
+        # Only declared parameters are slots; other braces stay literal
+        defaults: Dict[str, str] = {}
+        for param in self.parameters:
+            defaults.setdefault(param.name, param.default_value)
+        if defaults:
+            pattern = "|".join(re.escape(name) for name in defaults)
+            parts = re.split(rf"\{{({pattern})\}}", self.template_text)
+        else:
+            parts = [self.template_text]
+        compiled = CompiledTemplate(
+            signature=signature,
+            segments=tuple(parts[0::2]),
+            slots=tuple(parts[1::2]),
+            defaults=defaults,
+        )
+        self._compiled = compiled
+        return compiled
 
     def render(self, values: Optional[Dict[str, str]] = None) -> str:
         """
@@ -97,15 +166,7 @@ class ClauseTemplate:
         Returns:
             Rendered clause text
         """
-        values = values or {}
-        text = self.template_text
-
-        for param in self.parameters:
-            placeholder = f"{{{param.name}}}"
-            value = values.get(param.name, param.default_value)
-            text = text.replace(placeholder, value)
-
-        return text
+        return self.compile().render(values or {})
 
     def get_required_parameters(self) -> List[str]:
         """Get list of required parameter names."""
@@ -137,16 +198,53 @@ class TemplateLibrary:
     with low dispute rates and clear, specific language.
     """
 
-    def __init__(self):
-        """Initialize the template library."""
+    DEFAULT_RENDER_CACHE_SIZE = 1024
+    CONTRACT_MAX_RISK = 0.3
+
+    def __init__(self, render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE):
+        """
+        Initialize the template library.
+
+        Args:
+            render_cache_size: Rendered clauses kept, least recently used
+                dropped first (0 disables the cache)
+        """
         self._templates: Dict[str, ClauseTemplate] = {}
+        # Template ID -> insertion position (kept when a template is replaced)
+        self._order: Dict[str, int] = {}
         self._by_category: Dict[TemplateCategory, List[str]] = {}
         self._by_license_type: Dict[LicenseType, List[str]] = {}
         self._by_tag: Dict[str, List[str]] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+
+        # Lowest-risk template per category for each license type
+        self._contract_plans: Dict[LicenseType, List[Tuple[TemplateCategory, str]]] = {}
+        # (template id, parameter values) -> (compiled template, rendered text)
+        self.render_cache_size = render_cache_size
+        self._render_cache: "OrderedDict[Tuple, Tuple[CompiledTemplate, str]]" = OrderedDict()
+        self.render_hits = 0
+        self.render_misses = 0
+
+    def _unindex(self, template: ClauseTemplate) -> None:
+        """Remove a replaced template from the indexes."""
+        postings = [self._by_category.get(template.category, [])]
+        postings += [self._by_license_type.get(lt, []) for lt in template.license_types]
+        postings += [self._by_tag.get(tag, []) for tag in template.tags]
+        for ids in postings:
+            if template.id in ids:
+                ids.remove(template.id)
+        for token_ids in self._by_token.values():
+            token_ids.discard(template.id)
 
     def add_template(self, template: ClauseTemplate) -> None:
-        """Add a template to the library."""
+        """Add a template to the library, replacing one with the same ID."""
+        previous = self._templates.get(template.id)
+        if previous is not None:
+            self._unindex(previous)
+        template.compile()
         self._templates[template.id] = template
+        self._order.setdefault(template.id, len(self._order))
+        self._contract_plans.clear()
 
         # Index by category
         if template.category not in self._by_category:
@@ -165,6 +263,11 @@ class TemplateLibrary:
                 self._by_tag[tag] = []
             self._by_tag[tag].append(template.id)
 
+        # Index by text token
+        text = " ".join([template.name, template.description, template.template_text])
+        for token in _tokenize(text) | _tokenize(" ".join(template.tags)):
+            self._by_token.setdefault(token, set()).add(template.id)
+
     def get_template(self, template_id: str) -> Optional[ClauseTemplate]:
         """Get a template by ID."""
         return self._templates.get(template_id)
@@ -184,12 +287,17 @@ class TemplateLibrary:
         ids = self._by_tag.get(tag, [])
         return [self._templates[tid] for tid in ids]
 
+    def _in_order(self, template_ids: Set[str]) -> List[ClauseTemplate]:
+        """Templates in the order they were added."""
+        return [self._templates[tid] for tid in sorted(template_ids, key=self._order.__getitem__)]
+
     def search(
         self,
         category: Optional[TemplateCategory] = None,
         license_type: Optional[LicenseType] = None,
         tags: Optional[List[str]] = None,
         max_risk_score: Optional[float] = None,
+        text: Optional[str] = None,
     ) -> List[ClauseTemplate]:
         """
         Search for templates matching criteria.
@@ -199,33 +307,93 @@ class TemplateLibrary:
             license_type: Filter by license type
             tags: Filter by tags (any match)
             max_risk_score: Maximum acceptable risk score
+            text: Words that must all appear in the name, description,
+                clause text or tags (case-insensitive)
 
         Returns:
-            List of matching templates
+            List of matching templates, lowest risk first (ties in the
+            order they were added)
         """
-        candidates = set(self._templates.keys())
-
+        # Intersect the posting lists, smallest first
+        postings: List[Set[str]] = []
         if category:
-            category_ids = set(self._by_category.get(category, []))
-            candidates &= category_ids
-
+            postings.append(set(self._by_category.get(category, [])))
         if license_type:
-            type_ids = set(self._by_license_type.get(license_type, []))
-            candidates &= type_ids
-
+            postings.append(set(self._by_license_type.get(license_type, [])))
         if tags:
-            tag_ids = set()
+            tag_ids: Set[str] = set()
             for tag in tags:
                 tag_ids.update(self._by_tag.get(tag, []))
-            candidates &= tag_ids
-
-        results = [self._templates[tid] for tid in candidates]
+            postings.append(tag_ids)
+        if text:
+            postings.extend(self._by_token.get(token, set()) for token in _tokenize(text))
+
+        if postings:
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                candidates &= ids
+            results = self._in_order(candidates)
+        else:
+            results = list(self._templates.values())
 
         if max_risk_score is not None:
             results = [t for t in results if t.risk_score <= max_risk_score]
 
         return sorted(results, key=lambda t: t.risk_score)
 
+    def render(self, template_id: str, values: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render a template, reusing the text rendered for the same values.
+
+        Args:
+            template_id: Template ID
+            values: Parameter values to substitute
+
+        Returns:
+            Rendered clause text
+
+        Raises:
+            KeyError: If the template does not exist
+        """
+        return self._render(self._templates[template_id], values or {})
+
+    def _render(self, template: ClauseTemplate, values: Dict[str, str]) -> str:
+        compiled = template.compile()
+        if not self.render_cache_size:
+            return compiled.render(values)
+
+        # Only the template's own parameters matter, with defaults filled in
+        key = (template.id, compiled.key(values))
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] is compiled:
+            self._render_cache.move_to_end(key)
+            self.render_hits += 1
+            return cached[1]
+
+        self.render_misses += 1
+        text = compiled.render(values)
+        self._render_cache[key] = (compiled, text)
+        self._render_cache.move_to_end(key)
+        while len(self._render_cache) > self.render_cache_size:
+            self._render_cache.popitem(last=False)
+        return text
+
+    def _contract_plan(self, license_type: LicenseType) -> List[Tuple[TemplateCategory, str]]:
+        plan = self._contract_plans.get(license_type)
+        if plan is None:
+            plan = []
+            for category in TemplateCategory:
+                templates = self.search(
+                    category=category,
+                    license_type=license_type,
+                    max_risk_score=self.CONTRACT_MAX_RISK,
+                )
+                if templates:
+                    plan.append((category, templates[0].id))
+            self._contract_plans[license_type] = plan
+        return plan
+
     def get_complete_contract(
         self,
         license_type: LicenseType,
@@ -244,19 +412,22 @@ class TemplateLibrary:
         values = values or {}
         contract = {}
 
-        for category in TemplateCategory:
-            templates = self.search(
-                category=category,
-                license_type=license_type,
-                max_risk_score=0.3,
-            )
-            if templates:
-                # Use the lowest-risk template
-                template = templates[0]
-                contract[category] = template.render(values)
+        # Use the lowest-risk template of each category
+        for category, template_id in self._contract_plan(license_type):
+            contract[category] = self._render(self._templates[template_id], values)
 
         return contract
 
+    def get_stats(self) -> Dict[str, int]:
+        """Get index and render cache statistics."""
+        return {
+            "templates": len(self._templates),
+            "indexed_tokens": len(self._by_token),
+            "cached_renders": len(self._render_cache),
+            "render_hits": self.render_hits,
+            "render_misses": self.render_misses,
+        }
+
     def list_all(self) -> List[ClauseTemplate]:
         """Get all templates."""
         return list(self._templates.values())
@@ -26,16 +26,24 @@ Example Flow:
     4. Timeout expires -> auto-cancel
 """
 
+import heapq
+import logging
 import os
 import re
 import threading
+from collections import OrderedDict, deque
 from decimal import Decimal, InvalidOperation
 from enum import Enum
-from typing import Dict, Any, Optional, List, Callable
+from pathlib import Path
+from typing import Deque, Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from eth_utils import keccak
 
+from rra.persistence.rolling import RollingLog, open_rolling_log
+
+logger = logging.getLogger(__name__)
+
 
 class TransactionStatus(str, Enum):
     """Transaction lifecycle states."""
@@ -238,6 +246,29 @@ class PendingTransaction:
             return f"{minutes}m {seconds}s"
         return f"{seconds}s"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the completed-transaction archive."""
+        return {
+            "transaction_id": self.transaction_id,
+            "buyer_id": self.buyer_id,
+            "seller_id": self.seller_id,
+            "repo_url": self.repo_url,
+            "license_model": self.license_model,
+            "price": str(self.price_commitment),
+            "commitment_hash": self.price_commitment.commitment_hash.hex(),
+            "floor_price": str(self.floor_price),
+            "target_price": str(self.target_price),
+            "created_at": self.created_at.isoformat(),
+            "expires_at": self.expires_at.isoformat(),
+            "status": self.status.value,
+            "confirmation_count": self.confirmation_count,
+            "required_confirmations": self.required_confirmations,
+            "cancellation_reason": (
+                self.cancellation_reason.value if self.cancellation_reason else None
+            ),
+            "metadata": self.metadata,
+        }
+
     def _generate_confirmation_message(self) -> str:
         """Generate confirmation prompt message."""
         return f"""Please confirm this transaction:
@@ -273,6 +304,10 @@ class TransactionConfirmation:
     # Minimum timeout: 30 seconds (can be overridden for testing)
     MIN_TIMEOUT_SECONDS = 30
 
+    # Completed transactions and audit entries kept in memory when archived
+    MAX_COMPLETED_IN_MEMORY = 10_000
+    AUDIT_RING_SIZE = 10_000
+
     def __init__(
         self,
         default_timeout: int = DEFAULT_TIMEOUT_SECONDS,
@@ -280,6 +315,9 @@ class TransactionConfirmation:
         on_confirmed: Optional[Callable[[PendingTransaction], None]] = None,
         require_double_confirmation: bool = False,
         min_timeout: Optional[int] = None,  # Override for testing
+        archive_dir: Optional[Path] = None,
+        max_completed: Optional[int] = None,
+        audit_ring_size: Optional[int] = None,
     ):
         """
         Initialize transaction confirmation manager.
@@ -290,6 +328,12 @@ class TransactionConfirmation:
             on_confirmed: Callback when transaction is confirmed
             require_double_confirmation: Require 2 confirmations for execution
             min_timeout: Override minimum timeout (for testing)
+            archive_dir: Directory for the completed-transaction and audit logs
+                (None keeps everything in memory)
+            max_completed: Completed transactions kept in memory (default:
+                MAX_COMPLETED_IN_MEMORY with an archive, unbounded without)
+            audit_ring_size: Audit entries kept in memory (default:
+                AUDIT_RING_SIZE with an archive, unbounded without)
         """
         self._min_timeout = min_timeout if min_timeout is not None else self.MIN_TIMEOUT_SECONDS
         self.default_timeout = min(
@@ -299,16 +343,48 @@ class TransactionConfirmation:
         self.on_confirmed = on_confirmed
         self.require_double_confirmation = require_double_confirmation
 
+        # Without an archive the in-memory windows are the only copy, so they
+        # are bounded only when asked to be (and drops are logged)
+        if archive_dir is not None:
+            max_completed = max_completed or self.MAX_COMPLETED_IN_MEMORY
+            audit_ring_size = audit_ring_size or self.AUDIT_RING_SIZE
+
         self.pending_transactions: Dict[str, PendingTransaction] = {}
-        self.completed_transactions: Dict[str, PendingTransaction] = {}
-        self.audit_log: List[Dict[str, Any]] = []
+        # Oldest completed transactions leave memory first; all are archived
+        self.completed_transactions: "OrderedDict[str, PendingTransaction]" = OrderedDict()
+        self.max_completed = max_completed
+        self.audit_log: Deque[Dict[str, Any]] = deque(maxlen=audit_ring_size)
+        self._audit_lock = threading.Lock()
+
+        # PERFORMANCE: (expires_at, transaction_id) min-heap of pending
+        # transactions, so cleanup visits only expired ones. Entries of
+        # confirmed/cancelled transactions are skipped when they surface.
+        self._expiry_queue: List[Tuple[datetime, str]] = []
+
+        # Completed-transaction and audit logs (rolling, append-only)
+        self._completed_archive: Optional[RollingLog] = None
+        self._audit_archive: Optional[RollingLog] = None
+        if archive_dir is not None:
+            self._completed_archive = open_rolling_log(
+                Path(archive_dir) / "completed", name="completed"
+            )
+            self._audit_archive = open_rolling_log(Path(archive_dir) / "audit", name="audit")
+
+        # Outcome counters (completed transactions leave memory)
+        self._outcomes: Dict[TransactionStatus, int] = {}
 
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
         self._cleanup_thread: Optional[threading.Thread] = None
         self._running = False
 
     def start_cleanup_daemon(self, interval_seconds: int = 10) -> None:
-        """Start background thread to cleanup expired transactions."""
+        """
+        Start background thread to cleanup expired transactions.
+
+        The thread sleeps until the earliest pending deadline, so expiry
+        callbacks fire on time; interval_seconds caps each sleep.
+        """
         self._running = True
         self._cleanup_thread = threading.Thread(
             target=self._cleanup_loop, args=(interval_seconds,), daemon=True
@@ -317,17 +393,23 @@ class TransactionConfirmation:
 
     def stop_cleanup_daemon(self) -> None:
         """Stop the cleanup daemon."""
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=2)
 
     def _cleanup_loop(self, interval: int) -> None:
         """Background loop to cleanup expired transactions."""
-        import time
-
-        while self._running:
-            self.cleanup_expired()
-            time.sleep(interval)
+        with self._wakeup:
+            while self._running:
+                self._cleanup_expired_internal()
+                timeout = float(interval)
+                if self._expiry_queue:
+                    until = (self._expiry_queue[0][0] - datetime.utcnow()).total_seconds()
+                    # Expiry is strictly after expires_at
+                    timeout = min(timeout, max(until, 0.0) + 0.001)
+                self._wakeup.wait(timeout)
 
     def create_pending_transaction(
         self,
@@ -413,6 +495,10 @@ class TransactionConfirmation:
 
         with self._lock:
             self.pending_transactions[tx_id] = pending
+            heapq.heappush(self._expiry_queue, (expires_at, tx_id))
+            if self._expiry_queue[0][1] == tx_id:
+                # New earliest deadline: reschedule the daemon
+                self._wakeup.notify()
 
         self._log_action(
             "created",
@@ -469,8 +555,7 @@ class TransactionConfirmation:
                 pending.status = TransactionStatus.CONFIRMED
 
                 # Move to completed
-                self.completed_transactions[transaction_id] = pending
-                del self.pending_transactions[transaction_id]
+                self._complete(pending)
 
                 self._log_action("confirmed", pending)
 
@@ -521,8 +606,7 @@ class TransactionConfirmation:
             pending.status = TransactionStatus.CANCELLED
             pending.cancellation_reason = reason
 
-            self.completed_transactions[transaction_id] = pending
-            del self.pending_transactions[transaction_id]
+            self._complete(pending)
 
         self._log_action("cancelled", pending, {"reason": reason.value})
 
@@ -569,23 +653,37 @@ class TransactionConfirmation:
 
     def _cleanup_expired_internal(self) -> int:
         """Internal cleanup (must hold lock)."""
-        expired_ids = [tx_id for tx_id, tx in self.pending_transactions.items() if tx.is_expired]
-
-        for tx_id in expired_ids:
-            self._expire_transaction(self.pending_transactions[tx_id])
+        now = datetime.utcnow()
+        expired = 0
+        queue = self._expiry_queue
+        while queue and queue[0][0] < now:
+            _, tx_id = heapq.heappop(queue)
+            pending = self.pending_transactions.get(tx_id)
+            if pending is not None and pending.is_pending:
+                self._expire_transaction(pending)
+                expired += 1
+        return expired
 
-        return len(expired_ids)
+    def _complete(self, pending: PendingTransaction) -> None:
+        """Move a transaction out of pending and archive it (must hold lock)."""
+        tx_id = pending.transaction_id
+        self.pending_transactions.pop(tx_id, None)
+        self.completed_transactions[tx_id] = pending
+        if self.max_completed is not None:
+            while len(self.completed_transactions) > self.max_completed:
+                dropped, _ = self.completed_transactions.popitem(last=False)
+                if self._completed_archive is None:
+                    logger.warning("Dropped completed transaction %s (no archive)", dropped)
+        self._outcomes[pending.status] = self._outcomes.get(pending.status, 0) + 1
+        if self._completed_archive is not None:
+            self._completed_archive.append(pending.to_dict())
 
     def _expire_transaction(self, pending: PendingTransaction) -> None:
         """Mark transaction as expired (must hold lock)."""
         pending.status = TransactionStatus.EXPIRED
         pending.cancellation_reason = CancellationReason.TIMEOUT_EXPIRED
 
-        tx_id = pending.transaction_id
-        self.completed_transactions[tx_id] = pending
-
-        if tx_id in self.pending_transactions:
-            del self.pending_transactions[tx_id]
+        self._complete(pending)
 
         self._log_action("expired", pending)
 
@@ -613,13 +711,26 @@ class TransactionConfirmation:
         if extra:
             entry.update(extra)
 
-        self.audit_log.append(entry)
+        with self._audit_lock:
+            if self._audit_archive is None and len(self.audit_log) == self.audit_log.maxlen:
+                logger.warning(
+                    "Dropped audit entry for %s (no archive)", self.audit_log[0]["transaction_id"]
+                )
+            self.audit_log.append(entry)
+        if self._audit_archive is not None:
+            self._audit_archive.append(entry)
 
     def get_audit_log(
         self, transaction_id: Optional[str] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Get audit log entries."""
-        logs = self.audit_log
+        """
+        Get recent audit log entries.
+
+        Only the in-memory ring is searched; older entries are in the audit
+        archive when archive_dir is set.
+        """
+        with self._audit_lock:
+            logs = list(self.audit_log)
 
         if transaction_id:
             logs = [log for log in logs if log.get("transaction_id") == transaction_id]
@@ -630,18 +741,26 @@ class TransactionConfirmation:
         """Get confirmation system statistics."""
         with self._lock:
             pending_count = len(self.pending_transactions)
-            completed = list(self.completed_transactions.values())
+            outcomes = dict(self._outcomes)
 
-        confirmed = sum(1 for t in completed if t.status == TransactionStatus.CONFIRMED)
-        cancelled = sum(1 for t in completed if t.status == TransactionStatus.CANCELLED)
-        expired = sum(1 for t in completed if t.status == TransactionStatus.EXPIRED)
+        confirmed = outcomes.get(TransactionStatus.CONFIRMED, 0)
+        cancelled = outcomes.get(TransactionStatus.CANCELLED, 0)
+        expired = outcomes.get(TransactionStatus.EXPIRED, 0)
+        completed = sum(outcomes.values())
 
         return {
             "pending": pending_count,
             "confirmed": confirmed,
             "cancelled": cancelled,
             "expired": expired,
-            "total_completed": len(completed),
-            "confirmation_rate": confirmed / len(completed) if completed else 0,
-            "expiry_rate": expired / len(completed) if completed else 0,
+            "total_completed": completed,
+            "confirmation_rate": confirmed / completed if completed else 0,
+            "expiry_rate": expired / completed if completed else 0,
         }
+
+    def close(self) -> None:
+        """Stop the cleanup daemon and flush the archives."""
+        self.stop_cleanup_daemon()
+        for archive in (self._completed_archive, self._audit_archive):
+            if archive is not None:
+                archive.close()
@@ -17,6 +17,7 @@ import pytest
 from unittest.mock import patch
 from datetime import datetime
 from pathlib import Path
+import json
 import tempfile
 
 from rra.integration.boundary_daemon import (
@@ -29,6 +30,7 @@ from rra.integration.boundary_daemon import (
     ModeConstraints,
     DaemonConnection,
     EventSigner,
+    EventChain,
     create_boundary_daemon,
     create_connected_boundary_daemon,
 )
@@ -40,11 +42,11 @@ from rra.integration.boundary_siem import (
     SIEMAlert,
     AlertSeverity,
     AlertStatus,
+    PersistentEventQueue,
     RRA_DETECTION_RULES,
     create_siem_event_callback,
 )
 
-
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -412,6 +414,278 @@ class TestEventChain:
         assert all("event_id" in e for e in json_events)
 
 
+class TestEventChainBuffer:
+    """Tests for the ring-buffer event chain."""
+
+    def _event(self, i, event_type="test", severity=EventSeverity.INFO, previous_hash=None):
+        return BoundaryEvent(
+            event_id=f"evt_{i}",
+            timestamp=datetime(2025, 1, 1, 12, 0, 0),
+            event_type=event_type,
+            source="test",
+            action="act",
+            outcome="success",
+            severity=severity,
+            mode=BoundaryMode.RESTRICTED,
+            context={"i": i},
+            previous_hash=previous_hash,
+        )
+
+    def test_capacity_evicts_oldest(self):
+        """Test the buffer keeps only the newest events."""
+        chain = EventChain(capacity=5)
+        for i in range(12):
+            chain.append(self._event(i))
+
+        assert len(chain) == 5
+        assert [e.event_id for e in chain] == [f"evt_{i}" for i in range(7, 12)]
+        assert chain.anchor_hash == self._event(6).compute_hash()
+
+    def test_filtered_queries_match_scan(self):
+        """Test indexed queries agree with a linear scan after wraparound."""
+        chain = EventChain(capacity=50)
+        severities = list(EventSeverity)
+        for i in range(173):
+            chain.append(
+                self._event(i, event_type=f"type_{i % 3}", severity=severities[i % len(severities)])
+            )
+
+        window = list(reversed(list(chain)))
+        for event_type in (None, "type_0", "type_2", "missing"):
+            for severity_min in (None, EventSeverity.LOW, EventSeverity.CRITICAL):
+                expected = [
+                    e
+                    for e in window
+                    if (event_type is None or e.event_type == event_type)
+                    and (severity_min is None or e.severity.value >= severity_min.value)
+                ][:7]
+                assert chain.newest(7, event_type, severity_min) == expected
+
+    def test_overflow_segments_round_trip(self, temp_data_dir):
+        """Test evicted events are archived with their signatures."""
+        chain = EventChain(capacity=3, overflow_dir=temp_data_dir, segment_size=4)
+        previous = None
+        for i in range(10):
+            event = self._event(i, previous_hash=previous)
+            event.signature = bytes([i]) * 8
+            chain.append(event)
+            previous = event.compute_hash()
+
+        archived = list(chain.iter_archived())
+        assert [e.event_id for e in archived] == [f"evt_{i}" for i in range(7)]
+        assert archived[2].signature == bytes([2]) * 8
+        assert (
+            archived[2].compute_hash()
+            == self._event(2, previous_hash=archived[1].compute_hash()).compute_hash()
+        )
+        assert len(chain.segment_paths()) == 2
+        chain.close()
+
+    def test_daemon_verifies_beyond_memory_window(self, temp_data_dir):
+        """Test the daemon chain stays verifiable after eviction."""
+        daemon = BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4)
+        for i in range(10):
+            daemon.set_mode(BoundaryMode.OPEN if i % 2 else BoundaryMode.TRUSTED)
+
+        assert len(daemon.get_event_chain(limit=100)) == 4
+        assert daemon.verify_event_chain() == (True, "Chain valid (4 events)")
+        valid, message = daemon.verify_event_chain(include_archived=True)
+        assert valid is True
+        assert message == "Chain valid (10 events)"
+
+    def test_daemon_chain_continues_after_restart(self, temp_data_dir):
+        """Test a restarted daemon extends the archived chain instead of forking it."""
+        daemon = BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4)
+        for i in range(10):
+            daemon.set_mode(BoundaryMode.OPEN if i % 2 else BoundaryMode.TRUSTED)
+        last_hash = daemon._last_event_hash
+        daemon.close()
+
+        restarted = BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4)
+        assert restarted._last_event_hash == last_hash
+        assert restarted._event_chain.next_seq == 10
+        for i in range(6):
+            restarted.set_mode(BoundaryMode.OPEN if i % 2 else BoundaryMode.TRUSTED)
+
+        assert restarted.verify_event_chain() == (True, "Chain valid (4 events)")
+        assert restarted.verify_event_chain(include_archived=True) == (
+            True,
+            "Chain valid (16 events)",
+        )
+        restarted.close()
+
+        archived = list(EventChain(overflow_dir=temp_data_dir / "events").iter_archived())
+        assert len(archived) == 16
+        assert archived[10].previous_hash == last_hash
+
+    def test_overflow_writes_are_batched(self, temp_data_dir):
+        """Test evicted events are buffered and written in groups."""
+        chain = EventChain(capacity=2, overflow_dir=temp_data_dir, segment_size=1000)
+        with patch.object(EventChain, "OVERFLOW_BATCH", 5):
+            for i in range(8):
+                chain.append(self._event(i))
+            # Six evictions: one batch of five written, one still buffered
+            assert chain.segment_paths()[0].read_text().count("\n") == 5
+            assert len(chain._overflow_buffer) == 1
+
+        assert len(list(chain.iter_archived())) == 6
+        chain.close()
+
+    def test_daemon_detects_tampering_in_memory(self, temp_data_dir):
+        """Test a modified event breaks verification."""
+        daemon = BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4)
+        for _ in range(6):
+            daemon.set_mode(BoundaryMode.OPEN)
+
+        oldest = list(daemon._event_chain)[0]
+        oldest.previous_hash = "0" * 64
+        valid, _ = daemon.verify_event_chain()
+        assert valid is False
+
+
+class TestIncrementalVerification:
+    """Tests for watermark-based chain verification and checkpoints."""
+
+    def test_only_new_events_are_verified(self, boundary_daemon):
+        """Test repeated calls skip events below the watermark."""
+        for _ in range(5):
+            boundary_daemon.set_mode(BoundaryMode.OPEN)
+        assert boundary_daemon.verify_event_chain()[0] is True
+
+        with patch.object(
+            boundary_daemon, "_verify_events", wraps=boundary_daemon._verify_events
+        ) as spy:
+            boundary_daemon.set_mode(BoundaryMode.TRUSTED)
+            valid, message = boundary_daemon.verify_event_chain()
+
+        assert valid is True
+        assert message == "Chain valid (6 events)"
+        assert len(spy.call_args.args[0]) == 1
+
+    def test_full_mode_catches_tampering_below_watermark(self, boundary_daemon):
+        """Test full verification re-checks already verified events."""
+        for _ in range(5):
+            boundary_daemon.set_mode(BoundaryMode.OPEN)
+        assert boundary_daemon.verify_event_chain()[0] is True
+
+        list(boundary_daemon._event_chain)[1].context["tampered"] = True
+
+        assert boundary_daemon.verify_event_chain()[0] is True
+        valid, _ = boundary_daemon.verify_event_chain(full=True)
+        assert valid is False
+
+    def test_new_event_must_link_to_watermark(self, boundary_daemon):
+        """Test an incremental call still checks the link to verified events."""
+        boundary_daemon.set_mode(BoundaryMode.OPEN)
+        assert boundary_daemon.verify_event_chain()[0] is True
+
+        boundary_daemon._last_event_hash = "0" * 64
+        boundary_daemon.set_mode(BoundaryMode.TRUSTED)
+
+        valid, _ = boundary_daemon.verify_event_chain()
+        assert valid is False
+
+    def test_checkpoints_are_signed_and_persisted(self, temp_data_dir):
+        """Test a checkpoint is recorded every checkpoint_interval events."""
+        daemon = BoundaryDaemon(data_dir=temp_data_dir, checkpoint_interval=3)
+        for _ in range(7):
+            daemon.set_mode(BoundaryMode.OPEN)
+            daemon.verify_event_chain()
+
+        checkpoints = daemon.get_checkpoints()
+        assert [c.seq for c in checkpoints] == [2, 5]
+        assert checkpoints[-1].event_hash == daemon._event_chain.get(5).compute_hash()
+        assert (temp_data_dir / "events" / "checkpoints.jsonl").read_text().count("\n") == 2
+        assert daemon.verify_event_chain(full=True)[0] is True
+
+    def _checkpointed_restart(self, temp_data_dir):
+        daemon = BoundaryDaemon(
+            data_dir=temp_data_dir, max_events_in_memory=4, checkpoint_interval=3
+        )
+        for i in range(12):
+            daemon.set_mode(BoundaryMode.OPEN if i % 2 else BoundaryMode.TRUSTED)
+            daemon.verify_event_chain()
+        daemon.close()
+        return BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4, checkpoint_interval=3)
+
+    def test_watermark_resumes_from_checkpoint_file(self, temp_data_dir):
+        """Test a restarted daemon loads its signed checkpoints."""
+        pytest.importorskip("cryptography")
+        restarted = self._checkpointed_restart(temp_data_dir)
+
+        assert [c.seq for c in restarted.get_checkpoints()] == [2, 5, 8, 11]
+        assert restarted._verified_seq == 11
+        assert restarted.verify_event_chain(include_archived=True) == (
+            True,
+            "Chain valid (12 events)",
+        )
+
+    def test_archived_verification_starts_after_checkpoint(self, temp_data_dir):
+        """Test only archived events after the last checkpoint are re-verified."""
+        pytest.importorskip("cryptography")
+        restarted = self._checkpointed_restart(temp_data_dir)
+        for _ in range(2):
+            restarted.set_mode(BoundaryMode.OPEN)
+
+        # Tamper with an event covered by the checkpoint at seq 8
+        segment = restarted._event_chain.segment_paths()[0]
+        lines = segment.read_text().splitlines()
+        record = json.loads(lines[1])
+        record["context"] = {"tampered": True}
+        lines[1] = json.dumps(record)
+        segment.write_text("\n".join(lines) + "\n")
+
+        with patch.object(restarted, "_verify_events", wraps=restarted._verify_events) as spy:
+            valid, message = restarted.verify_event_chain(include_archived=True)
+        assert (valid, message) == (True, "Chain valid (14 events)")
+        assert spy.call_args_list[0].args[0] == []
+
+        valid, _ = restarted.verify_event_chain(include_archived=True, full=True)
+        assert valid is False
+
+    def test_forged_checkpoint_is_not_trusted(self, temp_data_dir):
+        """Test a checkpoint with a bad signature does not move the watermark."""
+        pytest.importorskip("cryptography")
+        self._checkpointed_restart(temp_data_dir).close()
+
+        path = temp_data_dir / "events" / "checkpoints.jsonl"
+        lines = path.read_text().splitlines()
+        record = json.loads(lines[2])
+        record["event_hash"] = "0" * 64
+        lines[2] = json.dumps(record)
+        path.write_text("\n".join(lines) + "\n")
+
+        restarted = BoundaryDaemon(data_dir=temp_data_dir, max_events_in_memory=4)
+        assert [c.seq for c in restarted.get_checkpoints()] == [2, 5]
+        assert restarted._verified_seq == 5
+        assert restarted.verify_event_chain(include_archived=True)[0] is True
+
+    def test_archive_segments_before_start_are_skipped(self, temp_data_dir):
+        """Test iter_archived does not open segments that end before start_seq."""
+        chain = EventChain(capacity=2, overflow_dir=temp_data_dir, segment_size=4)
+        for i in range(20):
+            chain.append(TestEventChainBuffer()._event(i))
+        chain.flush()
+
+        chain.segment_paths()[0].write_text("not json\n")
+        archived = list(chain.iter_archived(start_seq=9))
+        assert [e.event_id for e in archived] == [f"evt_{i}" for i in range(9, 18)]
+        chain.close()
+
+    def test_parallel_signature_verification(self, boundary_daemon):
+        """Test batch mode verifies signatures across a process pool."""
+        pytest.importorskip("cryptography")
+        for i in range(BoundaryDaemon.PARALLEL_VERIFY_MIN + 10):
+            boundary_daemon.set_mode(BoundaryMode.OPEN if i % 2 else BoundaryMode.TRUSTED)
+
+        events = list(boundary_daemon._event_chain)
+        events[-3].signature = bytes(64)
+
+        valid, message = boundary_daemon.verify_event_chain(workers=2)
+        assert valid is False
+        assert message == f"Invalid signature on event {events[-3].event_id}"
+
+
 # =============================================================================
 # EventSigner Tests
 # =============================================================================
@@ -574,6 +848,351 @@ class TestBoundarySIEMClient:
         assert siem_client._should_forward(excluded_event) is False
 
 
+def _queue_event(i):
+    return BoundaryEvent(
+        event_id=f"evt_{i}",
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        event_type="test",
+        source="test",
+        action="test",
+        outcome="success",
+        severity=EventSeverity.INFO,
+        mode=BoundaryMode.OPEN,
+        context={"i": i},
+    )
+
+
+class TestPersistentEventQueue:
+    """Tests for the segmented on-disk SIEM queue."""
+
+    def _drain(self, queue, batch_size=7):
+        ids = []
+        while True:
+            batch = queue.get_batch(batch_size)
+            if not batch:
+                return ids
+            queue.acknowledge(batch)
+            ids.extend(e.event_id for e in batch)
+
+    def test_fifo_across_memory_and_segments(self, temp_data_dir):
+        """Test events drain in order across memory, frames and segments."""
+        queue = PersistentEventQueue(
+            data_dir=temp_data_dir, memory_limit=5, segment_max_bytes=2048, spill_batch_size=4
+        )
+        for i in range(60):
+            assert queue.add(_queue_event(i)) is True
+
+        assert queue.size() == 60
+        assert queue.get_stats()["segments"] > 1
+        assert self._drain(queue) == [f"evt_{i}" for i in range(60)]
+        assert queue.size() == 0
+
+    def test_unacknowledged_batch_survives_restart(self, temp_data_dir):
+        """Test a crash between get_batch and acknowledge redelivers events."""
+        queue = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=0, spill_batch_size=3)
+        for i in range(10):
+            queue.add(_queue_event(i))
+        queue.flush()
+
+        queue.acknowledge(queue.get_batch(4))
+        queue.get_batch(4)  # Leased, never acknowledged
+        queue.close()
+
+        reopened = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=0)
+        assert reopened.size() == 6
+        assert self._drain(reopened) == [f"evt_{i}" for i in range(4, 10)]
+
+    def test_requeue_rewinds_to_batch(self, temp_data_dir):
+        """Test requeue redelivers the batch and later leases."""
+        queue = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=2, spill_batch_size=2)
+        for i in range(8):
+            queue.add(_queue_event(i))
+
+        first = queue.get_batch(3)
+        second = queue.get_batch(3)
+        assert [e.event_id for e in first + second] == [f"evt_{i}" for i in range(6)]
+
+        queue.requeue(first)
+        assert queue.inflight_size() == 0
+        assert self._drain(queue, batch_size=3) == [f"evt_{i}" for i in range(8)]
+
+    def test_consumed_segments_are_deleted(self, temp_data_dir):
+        """Test acknowledged segments are removed without rewriting files."""
+        queue = PersistentEventQueue(
+            data_dir=temp_data_dir, memory_limit=0, segment_max_bytes=1024, spill_batch_size=2
+        )
+        for i in range(40):
+            queue.add(_queue_event(i))
+        segments_before = queue.get_stats()["segments"]
+
+        self._drain(queue, batch_size=30)
+        assert segments_before > 2
+        assert queue.get_stats()["segments"] == 1
+
+    def test_torn_frame_is_truncated(self, temp_data_dir):
+        """Test a partially written final frame is dropped on load."""
+        queue = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=0, spill_batch_size=2)
+        for i in range(4):
+            queue.add(_queue_event(i))
+        queue.close()
+
+        segment = sorted(temp_data_dir.glob("segment-*.q"))[-1]
+        with open(segment, "ab") as f:
+            f.write(b"\x00\x00\x10\x00partial")
+
+        reopened = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=0)
+        assert self._drain(reopened) == [f"evt_{i}" for i in range(4)]
+
+    def test_disk_limit(self, temp_data_dir):
+        """Test events are rejected once the disk budget is used."""
+        queue = PersistentEventQueue(data_dir=temp_data_dir, memory_limit=1, disk_limit=3)
+        results = [queue.add(_queue_event(i)) for i in range(6)]
+        assert results == [True, True, True, True, False, False]
+
+    def test_migrates_legacy_jsonl_queue(self, temp_data_dir):
+        """Test events queued by the single-file format are imported."""
+        with open(temp_data_dir / "pending_events.jsonl", "w") as f:
+            for i in range(3):
+                f.write(json.dumps(_queue_event(i).to_json()) + "\n")
+
+        queue = PersistentEventQueue(data_dir=temp_data_dir)
+        assert not (temp_data_dir / "pending_events.jsonl").exists()
+        assert self._drain(queue) == ["evt_0", "evt_1", "evt_2"]
+
+    def test_client_acknowledges_sent_batches(self, siem_config, temp_data_dir):
+        """Test the client commits the queue only after a successful send."""
+        client = BoundarySIEMClient(
+            config=siem_config, use_persistent_queue=True, queue_data_dir=temp_data_dir
+        )
+        for i in range(5):
+            client.send_event(_queue_event(i))
+
+        with patch.object(client, "_send_events", return_value=False):
+            assert client.stop(drain_timeout=1.0) == 5
+        with patch.object(client, "_send_events", return_value=True):
+            assert client.stop(drain_timeout=1.0) == 0
+        assert client._queue.inflight_size() == 0
+
+
+class _TCPCollector:
+    """Local TCP listener recording received bytes per connection."""
+
+    def __init__(self):
+        import socket
+        import threading
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen()
+        self.port = self.server.getsockname()[1]
+        self.connections = []
+        self._threads = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        import threading
+
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            buf = bytearray()
+            self.connections.append(buf)
+            thread = threading.Thread(target=self._read, args=(conn, buf), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _read(self, conn, buf):
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                conn.close()
+                return
+            buf.extend(chunk)
+
+    def wait_for(self, size, timeout=5.0):
+        import time
+
+        deadline = time.time() + timeout
+        while sum(len(b) for b in self.connections) < size and time.time() < deadline:
+            time.sleep(0.01)
+
+    def close(self):
+        self.server.close()
+
+
+class TestSIEMTransports:
+    """Tests for persistent SIEM connections and framing."""
+
+    def _client(self, protocol, port, **kwargs):
+        config = SIEMConfig(host="127.0.0.1", port=port, protocol=protocol, **kwargs)
+        return BoundarySIEMClient(config=config)
+
+    def test_tcp_syslog_octet_counting_single_connection(self):
+        """Test TCP syslog reuses one connection and frames per RFC 6587."""
+        collector = _TCPCollector()
+        client = self._client(SIEMProtocol.SYSLOG_TCP, collector.port)
+        try:
+            events = [_queue_event(i) for i in range(5)]
+            assert client._send_events(events[:3]) is True
+            assert client._send_events(events[3:]) is True
+
+            expected = [client._format_syslog(e).encode() for e in events]
+            collector.wait_for(sum(len(m) + len(str(len(m))) + 1 for m in expected))
+            assert len(collector.connections) == 1
+
+            data = bytes(collector.connections[0])
+            messages = []
+            while data:
+                length, _, rest = data.partition(b" ")
+                messages.append(rest[: int(length)])
+                data = rest[int(length) :]
+            assert messages == expected
+        finally:
+            client.close_transports()
+            collector.close()
+
+    def test_tcp_reconnects_after_server_restart(self):
+        """Test a dropped connection is re-established on the next batch."""
+        collector = _TCPCollector()
+        client = self._client(SIEMProtocol.CEF_TCP, collector.port, retry_delay_seconds=0.01)
+        try:
+            assert client._send_events([_queue_event(0)]) is True
+            client._socket_transport(True)._sock.close()
+            assert client._send_events([_queue_event(1)]) is True
+            assert client._socket_transport(True).connects == 2
+        finally:
+            client.close_transports()
+            collector.close()
+
+    def test_udp_cef(self):
+        """Test UDP sends one datagram per CEF event."""
+        import socket
+
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        client = self._client(SIEMProtocol.CEF_UDP, receiver.getsockname()[1])
+        try:
+            assert client._send_events([_queue_event(0), _queue_event(1)]) is True
+            datagrams = [receiver.recv(65536), receiver.recv(65536)]
+            assert all(d.startswith(b"CEF:0|") and d.endswith(b"\n") for d in datagrams)
+        finally:
+            client.close_transports()
+            receiver.close()
+
+    def test_http_keep_alive_and_gzip(self):
+        """Test JSON HTTP reuses one connection and gzip-encodes bodies."""
+        import gzip
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        received = []
+        peers = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                received.append(json.loads(body))
+                peers.add(self.client_address)
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = self._client(
+            SIEMProtocol.JSON_HTTP, server.server_address[1], http_gzip=True, api_key="k"
+        )
+        try:
+            assert client._send_events([_queue_event(0)]) is True
+            assert client._send_events([_queue_event(1), _queue_event(2)]) is True
+            assert [len(r["events"]) for r in received] == [1, 2]
+            assert len(peers) == 1
+        finally:
+            client.close_transports()
+            server.shutdown()
+            server.server_close()
+
+    def test_http_retries_server_errors(self):
+        """Test 5xx and 429 responses are retried on the kept-alive connection."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        statuses = [503, 429, 200, 400]
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                self.send_response(statuses.pop(0))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = self._client(
+            SIEMProtocol.JSON_HTTP,
+            server.server_address[1],
+            retry_attempts=3,
+            retry_delay_seconds=0.01,
+        )
+        try:
+            event = _queue_event(0)
+            assert client._send_events([event]) is True
+            assert len(received) == 3
+            assert received[0]["events"] == [event.to_json()]
+            # Client errors are not retried
+            assert client._send_events([event]) is False
+            assert len(received) == 4
+        finally:
+            client.close_transports()
+            server.shutdown()
+            server.server_close()
+
+    def test_event_json_line_matches_to_json(self):
+        """Test the compact encodings decode to the dict serializers."""
+        event = _queue_event(0)
+        event.signature = b"\x01" * 64
+        assert json.loads(event.to_json_line()) == event.to_json()
+        assert json.loads(event.to_record_line()) == event.to_record()
+        assert BoundaryEvent.from_record(json.loads(event.to_record_line())) == event
+
+    def test_event_json_line_follows_changes(self):
+        """Test a change after the first encoding reaches the next one."""
+        event = _queue_event(0)
+        event.to_json_line()
+        event.context["note"] = "added"
+        event.severity = EventSeverity.CRITICAL
+        line = json.loads(event.to_json_line())
+        assert line["context"]["note"] == "added"
+        assert line["severity"] == "CRITICAL"
+        assert line["hash"] == event.compute_hash()
+
+    def test_unreachable_siem_fails_batch(self):
+        """Test sends report failure when nothing is listening."""
+        collector = _TCPCollector()
+        port = collector.port
+        collector.close()
+        client = self._client(
+            SIEMProtocol.SYSLOG_TCP, port, retry_attempts=2, retry_delay_seconds=0.01
+        )
+        assert client._send_events([_queue_event(0)]) is False
+
+
 class TestSIEMAlert:
     """Tests for SIEM alert handling."""
 
@@ -704,6 +1323,144 @@ class TestBoundaryDaemonSIEMIntegration:
         assert daemon2 is not None
 
 
+class TestPolicyEngine:
+    """Tests for compiled, indexed policy evaluation."""
+
+    def _scan(self, daemon, principal_id, resource_type, resource_id, permission, context):
+        """Reference linear scan over the principal's policies."""
+        for policy_id in daemon.principals[principal_id].policies:
+            policy = daemon.policies[policy_id]
+            if (
+                policy.is_valid
+                and policy.matches_resource(resource_type, resource_id)
+                and policy.permissions & permission
+                and policy.check_conditions(context)
+            ):
+                return True, f"Granted by policy: {policy.name}"
+        return False, "No matching policy found"
+
+    def test_matches_linear_scan(self, temp_data_dir):
+        """Test indexed decisions agree with a scan over many policies."""
+        import random
+
+        rng = random.Random(7)
+        daemon = BoundaryDaemon(data_dir=temp_data_dir, decision_cache_ttl=0)
+        user = daemon.register_principal("user", "bulk")
+        resource_types = [ResourceType.REPOSITORY, ResourceType.AGENT]
+        permissions = [Permission.READ, Permission.MINT, Permission.NEGOTIATE, Permission.QUOTE]
+        conditions = [
+            {},
+            {"tier": "gold"},
+            {"amount": {"min": 10, "max": 100}},
+            {"region": {"in": ["eu"]}},
+        ]
+
+        for i in range(200):
+            policy = daemon.create_policy(
+                name=f"p{i}",
+                description="",
+                resource_type=rng.choice(resource_types),
+                resource_id=rng.choice(["*", "r1", "r2", "r3"]),
+                permissions=rng.choice(permissions) | rng.choice(permissions),
+                conditions=rng.choice(conditions),
+            )
+            daemon.assign_policy(user.principal_id, policy.policy_id)
+            if i % 9 == 0:
+                daemon.revoke_policy(policy.policy_id)
+
+        contexts = [{}, {"tier": "gold"}, {"amount": 50, "region": "eu"}, {"amount": "50"}]
+        for resource_type in resource_types:
+            for resource_id in ["r1", "r2", "r4"]:
+                for permission in permissions + [Permission.ADMIN]:
+                    for context in contexts:
+                        args = (user.principal_id, resource_type, resource_id, permission, context)
+                        assert daemon.check_access(*args) == self._scan(daemon, *args)
+
+    def test_first_policy_in_assignment_order_wins(self, boundary_daemon):
+        """Test wildcard and exact buckets keep assignment order."""
+        user = boundary_daemon.register_principal("user", "ordered")
+        names = ["wild-first", "exact", "wild-second"]
+        for name, resource_id in zip(names, ["*", "repo-1", "*"]):
+            policy = boundary_daemon.create_policy(
+                name, "", ResourceType.REPOSITORY, resource_id, Permission.READ
+            )
+            boundary_daemon.assign_policy(user.principal_id, policy.policy_id)
+
+        granted, reason = boundary_daemon.check_access(
+            user.principal_id, ResourceType.REPOSITORY, "repo-1", Permission.READ
+        )
+        assert granted is True
+        assert reason == "Granted by policy: wild-first"
+
+    def test_cache_invalidated_by_policy_changes(self, boundary_daemon):
+        """Test cached grants do not survive revocation or removal."""
+        user = boundary_daemon.register_principal("user", "cached")
+        policy = boundary_daemon.grant_repository_access(user.principal_id, "repo-1")
+        args = (user.principal_id, ResourceType.REPOSITORY, "repo-1", Permission.READ)
+
+        assert boundary_daemon.check_access(*args)[0] is True
+        assert boundary_daemon.check_access(*args)[0] is True
+        assert boundary_daemon._policy_engine.cache_hits == 1
+
+        boundary_daemon.revoke_policy(policy.policy_id)
+        assert boundary_daemon.check_access(*args)[0] is False
+
+        other = boundary_daemon.grant_repository_access(user.principal_id, "repo-1")
+        assert boundary_daemon.check_access(*args)[0] is True
+        boundary_daemon.remove_policy(user.principal_id, other.policy_id)
+        assert boundary_daemon.check_access(*args)[0] is False
+
+    def test_in_place_edits_need_refresh(self, boundary_daemon):
+        """Test refresh_policy recompiles a policy changed in place."""
+        user = boundary_daemon.register_principal("user", "edited")
+        policy = boundary_daemon.grant_repository_access(user.principal_id, "repo-1")
+        args = (user.principal_id, ResourceType.REPOSITORY, "repo-1", Permission.READ)
+
+        policy.conditions = {"tier": "gold"}
+        boundary_daemon.refresh_policy(policy.policy_id)
+        assert boundary_daemon.check_access(*args)[0] is False
+        assert boundary_daemon.check_access(*args, context={"tier": "gold"})[0] is True
+
+    def test_expired_policy_denies(self, boundary_daemon):
+        """Test expiry is enforced from the compiled timestamp."""
+        from datetime import timedelta
+
+        user = boundary_daemon.register_principal("user", "expiring")
+        policy = boundary_daemon.grant_repository_access(user.principal_id, "repo-1")
+        policy.expires_at = datetime.now() - timedelta(seconds=1)
+        boundary_daemon.refresh_policy(policy.policy_id)
+
+        granted, _ = boundary_daemon.check_access(
+            user.principal_id, ResourceType.REPOSITORY, "repo-1", Permission.READ
+        )
+        assert granted is False
+
+    def test_unhashable_context_is_evaluated(self, boundary_daemon):
+        """Test contexts with list values bypass the cache."""
+        user = boundary_daemon.register_principal("user", "lists")
+        policy = boundary_daemon.create_policy(
+            "tags", "", ResourceType.REPOSITORY, "*", Permission.READ, conditions={"tags": ["a"]}
+        )
+        boundary_daemon.assign_policy(user.principal_id, policy.policy_id)
+
+        granted, _ = boundary_daemon.check_access(
+            user.principal_id, ResourceType.REPOSITORY, "x", Permission.READ, {"tags": ["a"]}
+        )
+        assert granted is True
+
+    def test_index_rebuilt_on_load(self, temp_data_dir):
+        """Test persisted policies are compiled when state is loaded."""
+        daemon = BoundaryDaemon(data_dir=temp_data_dir)
+        user = daemon.register_principal("user", "persisted")
+        daemon.grant_repository_access(user.principal_id, "repo-1")
+
+        reloaded = BoundaryDaemon(data_dir=temp_data_dir)
+        granted, _ = reloaded.check_access(
+            user.principal_id, ResourceType.REPOSITORY, "repo-1", Permission.READ
+        )
+        assert granted is True
+
+
 class TestAccessControlFlow:
     """Tests for complete access control workflow."""
 
@@ -26,11 +26,11 @@ from src.rra.templates.hardened_clauses import (
     TemplateCategory,
     TemplateParameter,
     LicenseType,
+    TemplateLibrary,
     get_default_library,
 )
 from src.rra.analytics.clause_patterns import ClausePatternAnalyzer, ClauseCategory
 
-
 # =============================================================================
 # ClauseHardener Tests
 # =============================================================================
@@ -423,6 +423,28 @@ class TestClauseTemplate:
         required = template.get_required_parameters()
         assert required == ["a", "c"]
 
+    def test_compiled_render(self):
+        """Test that templates compile once and only declared parameters are slots."""
+        template = ClauseTemplate(
+            id="test_template",
+            name="Test Template",
+            category=TemplateCategory.GRANT,
+            license_types=[LicenseType.COMMERCIAL],
+            template_text="{max_users} users, {max_users} seats, {undeclared} kept.",
+            parameters=[
+                TemplateParameter(name="max_users", description="Users", default_value="10"),
+            ],
+        )
+
+        compiled = template.compile()
+        assert compiled.slots == ("max_users", "max_users")
+        assert template.render() == "10 users, 10 seats, {undeclared} kept."
+        assert template.render({"max_users": "5"}) == "5 users, 5 seats, {undeclared} kept."
+        assert template.compile() is compiled
+
+        template.template_text = "Up to {max_users}."
+        assert template.render() == "Up to 10."
+
 
 class TestTemplateLibrary:
     """Tests for the template library."""
@@ -486,6 +508,72 @@ class TestTemplateLibrary:
         # Should have templates for key categories
         assert TemplateCategory.GRANT in contract or TemplateCategory.TERMINATION in contract
 
+    def test_complete_contract_uses_render_cache(self, library):
+        """Test that repeated contracts reuse rendered clauses."""
+        first = library.get_complete_contract(LicenseType.SAAS, {"warranty_period": "180"})
+        misses = library.get_stats()["render_misses"]
+        second = library.get_complete_contract(LicenseType.SAAS, {"warranty_period": "180"})
+
+        assert second == first
+        assert library.get_stats()["render_misses"] == misses
+        assert library.get_stats()["render_hits"] == len(first)
+        for category, text in first.items():
+            template = library.search(category=category, license_type=LicenseType.SAAS)[0]
+            assert text == template.render({"warranty_period": "180"})
+
+    def test_search_by_text(self, library):
+        """Test full-text search over names, descriptions, clause text and tags."""
+        results = library.search(text="Cure period")
+
+        assert results
+        for template in results:
+            words = " ".join(
+                [template.name, template.description, template.template_text, *template.tags]
+            ).lower()
+            assert "cure" in words and "period" in words
+        assert library.search(text="cure nonexistentword") == []
+        assert library.search(category=TemplateCategory.TERMINATION, text="cure") == [
+            t for t in results if t.category == TemplateCategory.TERMINATION
+        ]
+
+    def test_replacing_template_updates_indexes(self, library):
+        """Test that re-adding a template ID replaces its index entries."""
+        original = library.get_template("termination_for_cause")
+        replacement = ClauseTemplate(
+            id=original.id,
+            name="Replacement",
+            category=TemplateCategory.AUDIT,
+            license_types=[LicenseType.DATA],
+            template_text="Audit once a year.",
+            risk_score=0.1,
+        )
+        library.add_template(replacement)
+
+        assert original.id not in [t.id for t in library.get_by_category(original.category)]
+        assert library.get_by_category(TemplateCategory.AUDIT) == [replacement]
+        assert library.search(text="cure", category=TemplateCategory.AUDIT) == []
+        assert library.get_complete_contract(LicenseType.DATA) == {
+            TemplateCategory.AUDIT: "Audit once a year."
+        }
+
+    def test_search_ties_keep_insertion_order(self):
+        """Test equal-risk matches come back in the order they were added."""
+        library = TemplateLibrary()
+        for tid in ["c", "a", "b"]:
+            library.add_template(
+                ClauseTemplate(
+                    id=tid,
+                    name=f"Clause {tid}",
+                    category=TemplateCategory.AUDIT,
+                    license_types=[LicenseType.DATA],
+                    template_text="Audit once a year.",
+                )
+            )
+        library.add_template(library.get_template("c"))
+
+        assert [t.id for t in library.search(category=TemplateCategory.AUDIT)] == ["c", "a", "b"]
+        assert [t.id for t in library.search(text="audit")] == ["c", "a", "b"]
+
 
 class TestDefaultTemplates:
     """Tests for specific default templates."""
@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Tests for dreaming status delivery through the status bus.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rra.status.bus import DropPolicy
+from rra.status.dreaming import DreamingStatus, StatusType
+
+
+def _blocked_subscriber(received):
+    """A callback that holds its first entry until released."""
+    release = threading.Event()
+
+    def callback(entry):
+        received.append(entry)
+        release.wait(5)
+
+    return callback, release
+
+
+class TestStatusBus:
+    """Test non-blocking fan-out of status entries."""
+
+    def test_slow_subscriber_does_not_block_emit(self):
+        """Emitting stays fast while a subscriber takes 50ms per entry."""
+        dreaming = DreamingStatus(throttle_seconds=0, max_queue=16)
+        received, fast = [], []
+        dreaming.add_callback(lambda e: (time.sleep(0.05), received.append(e)))
+        dreaming.add_callback(fast.append)
+
+        start = time.perf_counter()
+        for i in range(200):
+            dreaming.info(f"step {i}")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        assert dreaming.wait_delivered(timeout=5)
+        stats = dreaming.get_delivery_stats()
+        slow, quick = stats["subscribers"]
+        assert slow["delivered"] + slow["dropped"] == 200
+        assert quick["delivered"] + quick["dropped"] == 200
+        assert slow["dropped"] > 0
+        assert received[-1].operation == fast[-1].operation == "step 199"
+        assert stats["published"] == 200
+
+    def test_superseded_updates_are_coalesced(self):
+        """A queued start is replaced by its completion; errors are all kept."""
+        dreaming = DreamingStatus(throttle_seconds=0)
+        received = []
+        callback, release = _blocked_subscriber(received)
+        dreaming.add_callback(callback)
+
+        dreaming.info("warmup")
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        dreaming.start("Parsing")
+        dreaming.complete("Parsing")
+        dreaming.error("Parsing", "first")
+        dreaming.error("Parsing", "second")
+        dreaming.start("Indexing")
+        time.sleep(0.05)  # let the dispatcher queue them
+        release.set()
+        assert dreaming.wait_delivered(timeout=5)
+
+        assert [(e.operation, e.status_type) for e in received] == [
+            ("warmup", StatusType.INFO),
+            ("Parsing", StatusType.COMPLETE),
+            ("Parsing", StatusType.ERROR),
+            ("Parsing", StatusType.ERROR),
+            ("Indexing", StatusType.START),
+        ]
+        assert dreaming.get_delivery_stats()["subscribers"][0]["coalesced"] == 1
+
+    @pytest.mark.parametrize(
+        "policy,expected",
+        [
+            (DropPolicy.DROP_OLDEST, ["op7", "op8", "op9"]),
+            (DropPolicy.DROP_NEWEST, ["op0", "op1", "op2"]),
+        ],
+    )
+    def test_drop_policy(self, policy, expected):
+        """A full queue loses entries according to the policy, and counts them."""
+        dreaming = DreamingStatus(throttle_seconds=0, max_queue=3, drop_policy=policy)
+        received = []
+        callback, release = _blocked_subscriber(received)
+        dreaming.add_callback(callback)
+
+        dreaming.info("warmup")
+        deadline = time.monotonic() + 5
+        while not received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for i in range(10):
+            dreaming.info(f"op{i}")
+        time.sleep(0.05)
+        release.set()
+        assert dreaming.wait_delivered(timeout=5)
+
+        assert [e.operation for e in received[1:]] == expected
+        assert dreaming.get_delivery_stats()["subscribers"][0]["dropped"] == 7
+
+    def test_failing_subscriber_is_counted(self):
+        """Callback errors are counted and do not affect other subscribers."""
+        dreaming = DreamingStatus(throttle_seconds=0)
+        received = []
+
+        def broken(entry):
+            raise ValueError("boom")
+
+        dreaming.add_callback(broken)
+        dreaming.add_callback(received.append)
+        dreaming.info("one")
+        dreaming.info("two")
+        assert dreaming.wait_delivered(timeout=5)
+
+        stats = dreaming.get_delivery_stats()["subscribers"]
+        assert stats[0]["errors"] == 2
+        assert [e.operation for e in received] == ["one", "two"]
+
+        dreaming.remove_callback(broken)
+        assert len(dreaming.get_delivery_stats()["subscribers"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_callback_runs_on_its_loop(self):
+        """Async callbacks run on the loop they were added from."""
+        dreaming = DreamingStatus(throttle_seconds=0)
+        loop = asyncio.get_running_loop()
+        seen = []
+
+        async def callback(entry):
+            seen.append((entry.operation, asyncio.get_running_loop() is loop))
+
+        dreaming.add_async_callback(callback)
+        await asyncio.to_thread(dreaming.info, "from a worker thread")
+        dreaming.info("from the loop")
+        assert await asyncio.to_thread(dreaming.wait_delivered, 5)
+
+        assert seen == [("from a worker thread", True), ("from the loop", True)]
@@ -379,6 +379,50 @@ class TestDAOGovernance:
         assert updated_proposal.votes_for == 1500
         assert updated_proposal.voter_count == 2
 
+    def test_live_tally(self, manager):
+        from rra.governance.dao import Proposal, ProposalType, VoteChoice
+
+        dao = manager.create_dao(
+            name="Test DAO",
+            description="A test DAO",
+            creator="0x1111111111111111111111111111111111111111",
+            initial_voting_power=1000,
+        )
+        manager.add_dao_member(dao.dao_id, "0x2222222222222222222222222222222222222222", 500)
+        manager.add_dao_member(dao.dao_id, "0x2222222222222222222222222222222222222222", 250)
+        assert dao.total_voting_power == 1750
+
+        proposal = manager.create_proposal(
+            dao_id=dao.dao_id,
+            title="Test Proposal",
+            description="A test proposal",
+            proposal_type=ProposalType.PARAMETER_CHANGE,
+            proposer="0x1111111111111111111111111111111111111111",
+            voting_delay_hours=0,
+        )
+        manager.vote(
+            proposal.proposal_id, "0x1111111111111111111111111111111111111111", VoteChoice.FOR
+        )
+        manager.vote(
+            proposal.proposal_id, "0x2222222222222222222222222222222222222222", VoteChoice.FOR
+        )
+        manager.vote(
+            proposal.proposal_id, "0x2222222222222222222222222222222222222222", VoteChoice.ABSTAIN
+        )
+
+        tally = manager.get_live_tally(proposal.proposal_id)
+        assert tally["votes_for"] == 1000
+        assert tally["votes_abstain"] == 750
+        assert tally["total_votes"] == 1750
+        assert tally["quorum_met"] is True
+        assert proposal._votes.verify()
+        assert dao._members.verify()
+
+        # Tallies are rebuilt when loading from persisted state
+        restored = Proposal.from_dict(proposal.to_dict())
+        assert restored.votes_for == 1000
+        assert restored._votes.verify()
+
     def test_delegate_votes(self, manager):
         dao = manager.create_dao(
             name="Test DAO",
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: FSL-1.1-ALv2
+# Copyright 2025 Kase Branham
+"""
+Tests for the GitHub fork graph and derivative trees.
+"""
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from rra.integrations.github_webhooks import ForkTracker, GitHubWebhookHandler
+
+
+def fork_event(parent: str, fork: str) -> dict:
+    return {
+        "repository": {"full_name": parent, "html_url": f"https://github.com/{parent}"},
+        "forkee": {
+            "full_name": fork,
+            "html_url": f"https://github.com/{fork}",
+            "owner": {"login": fork.split("/")[0]},
+            "created_at": "2025-01-01T00:00:00",
+        },
+        "sender": {},
+    }
+
+
+def add_forks(handler: GitHubWebhookHandler, edges) -> None:
+    async def run():
+        for parent, fork in edges:
+            await handler.handle_fork_event(fork_event(parent, fork))
+
+    asyncio.run(run())
+
+
+def brute_descendants(handler: GitHubWebhookHandler, repo: str) -> set:
+    found, frontier = set(), {repo}
+    while frontier:
+        frontier = {f.fork_repo for f in handler.get_all_forks() if f.parent_repo in frontier}
+        frontier -= found
+        found |= frontier
+    return found
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return GitHubWebhookHandler(data_path=tmp_path / "forks.json")
+
+
+class TestForkGraph:
+    """Test the parent -> fork index and lineage queries."""
+
+    def test_multi_generation_lineage(self, handler):
+        add_forks(
+            handler,
+            [
+                ("orig/repo", "a/repo"),
+                ("orig/repo", "b/repo"),
+                ("a/repo", "c/repo"),
+                ("c/repo", "d/repo"),
+            ],
+        )
+
+        assert [f.fork_repo for f in handler.get_forks_for_parent("orig/repo")] == [
+            "a/repo",
+            "b/repo",
+        ]
+        assert [f.fork_repo for f in handler.get_descendants("orig/repo")] == [
+            "a/repo",
+            "b/repo",
+            "c/repo",
+            "d/repo",
+        ]
+        assert len(handler.get_descendants("orig/repo", max_depth=2)) == 3
+        assert handler.get_ancestors("d/repo") == ["c/repo", "a/repo", "orig/repo"]
+        assert handler.get_root("d/repo") == "orig/repo"
+        assert handler.get_root("orig/repo") == "orig/repo"
+        assert handler.get_fork_counts("orig/repo") == {"forks": 4, "registered": 0, "notified": 0}
+        assert handler.get_fork_counts("orig/repo", direct=True)["forks"] == 2
+
+        handler.mark_registered("d/repo", "0xd")
+        handler.mark_notified("c/repo")
+        assert handler.get_fork_counts("orig/repo") == {"forks": 4, "registered": 1, "notified": 1}
+        assert handler.get_fork_counts("a/repo") == {"forks": 2, "registered": 1, "notified": 1}
+        assert handler.get_fork_counts("orig/repo", direct=True)["registered"] == 0
+
+    def test_counts_match_brute_force(self, handler, tmp_path):
+        """Random fork-of-fork events (including re-parented forks) keep exact counts."""
+        rng = random.Random(7)
+        repos = ["root0/repo", "root1/repo"]
+        edges = []
+        for i in range(400):
+            fork = f"user{i}/repo" if i < 300 else rng.choice(repos[2:])  # re-delivered
+            # Parents are always older repositories, as on GitHub
+            older = repos[: repos.index(fork)] if fork in repos else repos
+            edges.append((rng.choice(older), fork))
+            if fork not in repos:
+                repos.append(fork)
+        add_forks(handler, edges)
+        for fork in rng.sample(repos[2:], 80):
+            handler.mark_registered(fork, f"ip-{fork}")
+        for fork in rng.sample(repos[2:], 120):
+            handler.mark_notified(fork)
+
+        reloaded = GitHubWebhookHandler(data_path=tmp_path / "forks.json")
+        for graph in (handler, reloaded):
+            for repo in repos:
+                expected = brute_descendants(handler, repo) - {repo}
+                forks = [handler.get_fork(r) for r in expected]
+                assert {f.fork_repo for f in graph.get_descendants(repo)} == expected
+                assert graph.get_fork_counts(repo) == {
+                    "forks": len(forks),
+                    "registered": sum(f.registered_as_derivative for f in forks),
+                    "notified": sum(f.notified for f in forks),
+                }
+
+    def test_imports_legacy_forks_file(self, tmp_path):
+        path = tmp_path / "forks.json"
+        legacy = GitHubWebhookHandler(data_path=tmp_path / "seed.json")
+        add_forks(legacy, [("orig/repo", "a/repo"), ("a/repo", "b/repo")])
+        path.write_text(json.dumps({f.fork_repo: f.model_dump() for f in legacy.get_all_forks()}))
+
+        handler = GitHubWebhookHandler(data_path=path)
+        assert handler.get_ancestors("b/repo") == ["a/repo", "orig/repo"]
+        assert (tmp_path / "forks_oplog").exists()
+
+
+class TestForkTracker:
+    """Test derivative trees built from the fork graph."""
+
+    def test_derivative_tree(self, handler):
+        add_forks(
+            handler,
+            [("orig/repo", "a/repo"), ("orig/repo", "b/repo"), ("b/repo", "c/repo")],
+        )
+        handler.mark_registered("b/repo", "0xb")
+        handler.mark_notified("a/repo")
+        tracker = ForkTracker(handler)
+
+        tree = tracker.get_derivative_tree("orig/repo")
+        assert [d["repo"] for d in tree["derivatives"]] == ["b/repo", "a/repo"]
+        assert "derivatives" not in tree["derivatives"][0]
+        assert tree["stats"] == {
+            "total_forks": 2,
+            "registered_derivatives": 1,
+            "pending_registration": 1,
+            "notification_rate": 0.5,
+            "total_descendants": 3,
+            "registered_descendants": 1,
+        }
+
+        deep = tracker.get_derivative_tree("orig/repo", max_depth=None)
+        assert [d["repo"] for d in deep["derivatives"][0]["derivatives"]] == ["c/repo"]
+        registered_only = tracker.get_derivative_tree(
+            "orig/repo", include_unregistered=False, max_depth=None
+        )
+        assert [d["repo"] for d in registered_only["derivatives"]] == ["b/repo"]
+        assert registered_only["derivatives"][0]["derivatives"] == []
+
+        assert tracker.get_fork_stats() == {
+            "total_forks_detected": 3,
+            "total_notified": 1,
+            "total_registered": 1,
+            "registration_rate": 1 / 3,
+            "unique_parent_repos": 2,
+        }
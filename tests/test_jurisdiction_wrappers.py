@@ -26,6 +26,7 @@ from rra.legal import (
     ContractLaw,
     DisputeResolution,
     IPLawTreaty,
+    JurisdictionRules,
     JurisdictionRulesRegistry,
     create_rules_registry,
 )
@@ -37,7 +38,6 @@ from rra.templates import (
     create_template_library,
 )
 
-
 # ============ Jurisdiction Detection Tests ============
 
 
@@ -360,6 +360,76 @@ class TestJurisdictionRulesRegistry:
         assert not merged["compatible"]
         assert "Restricted" in merged["reason"]
 
+    def test_compiled_ruleset(self, registry: JurisdictionRulesRegistry):
+        """Test the compiled matrix and bitsets against the rules."""
+        compiled = registry.compiled
+        rules = registry.get_all_rules()
+
+        assert set(compiled.codes) == set(rules)
+        for code1, rules1 in rules.items():
+            for code2, rules2 in rules.items():
+                expected = not (rules1.is_restricted or rules2.is_restricted)
+                assert compiled.is_compatible(code1, code2) == expected
+        assert not compiled.is_compatible(JurisdictionCode.US, JurisdictionCode.XX)
+
+        for region in JurisdictionRegion:
+            assert registry.get_rules_for_region(region) == [
+                r for r in rules.values() if r.region == region
+            ]
+        sg_mas = registry.get_rules_for_framework(RegulatoryFramework.SG_MAS)
+        assert [r.jurisdiction for r in sg_mas] == [JurisdictionCode.SG]
+
+    def test_compliance_decisions_are_memoized(self, registry: JurisdictionRulesRegistry):
+        """Test memoized decisions by amount band, returned as independent copies."""
+        below = registry.check_transaction_compliance(
+            JurisdictionCode.US, JurisdictionCode.GB, "license", Decimal("7999999")
+        )
+        below["required_actions"].append("caller's own note")
+        at = registry.check_transaction_compliance(
+            JurisdictionCode.US, JurisdictionCode.GB, "license", Decimal("8000000")
+        )
+        again = registry.check_transaction_compliance(
+            JurisdictionCode.US, JurisdictionCode.GB, "sale", Decimal("100")
+        )
+
+        assert "Prospectus required in GB" in at["required_actions"]
+        assert "Prospectus required in GB" not in again["required_actions"]
+        assert "caller's own note" not in again["required_actions"]
+        assert len(registry.compiled._decisions) == 2
+
+        bulk = registry.check_transactions_compliance(
+            [
+                (JurisdictionCode.US, JurisdictionCode.GB, "license", Decimal("8000000")),
+                (JurisdictionCode.US, JurisdictionCode.KP, "license", None),
+            ]
+        )
+        assert bulk[0] == at
+        assert not bulk[1]["compliant"]
+
+    def test_register_rules_recompiles(self, registry: JurisdictionRulesRegistry):
+        """Test that registering rules replaces memoized answers."""
+        assert registry.check_transaction_compliance(
+            JurisdictionCode.US, JurisdictionCode.BR, "license"
+        )["compliant"]
+
+        registry.register_rules(
+            JurisdictionRules(
+                jurisdiction=JurisdictionCode.BR,
+                region=JurisdictionRegion.OTHER,
+                name="Brazil",
+                is_restricted=True,
+                restriction_reason="Test restriction",
+            )
+        )
+
+        result = registry.check_transaction_compliance(
+            JurisdictionCode.US, JurisdictionCode.BR, "license"
+        )
+        assert not result["compliant"]
+        assert not registry.get_compatible_rules(JurisdictionCode.US, JurisdictionCode.BR)[
+            "compatible"
+        ]
+
     def test_check_transaction_compliance_success(self, registry: JurisdictionRulesRegistry):
         """Test successful transaction compliance check."""
         result = registry.check_transaction_compliance(
@@ -4,6 +4,7 @@
 Tests for new features: Multi-chain, Bundling, Adaptive Pricing.
 """
 
+import json
 import pytest
 import tempfile
 import shutil
@@ -28,7 +29,6 @@ from rra.pricing import (
     create_pricing_engine,
 )
 
-
 # =============================================================================
 # Multi-Chain Tests
 # =============================================================================
@@ -396,6 +396,89 @@ class TestBundleManager:
         results = self.manager.search_bundles("python")
         assert len(results) == 1
 
+    def _populate(self):
+        """Bundles sharing repos, owners, tags and words."""
+        repos = [
+            BundledRepo(f"r{i}", f"url{i}", f"Repo {i}", individual_price=10.0 * i)
+            for i in range(6)
+        ]
+        for i in range(12):
+            self.manager.create_bundle(
+                name=f"Kit {i} {'Python' if i % 2 else 'Rust'} Toolkit",
+                description=f"Starter bundle number {i}",
+                bundle_type=[BundleType.SUITE, BundleType.COLLECTION][i % 2],
+                owner_address=f"0x{i % 3}",
+                repos=[BundledRepo(**vars(r)) for r in repos[i % 3 : i % 3 + 3]],
+                discount=BundleDiscount(DiscountType.PERCENTAGE, 20.0),
+                tags=["tools", f"tag{i % 4}"],
+            )
+        return list(self.manager._bundles.values())
+
+    def test_indexed_queries_match_scans(self):
+        """Test index-backed lookups return what a full scan would."""
+        bundles = self._populate()
+        bundles[3].is_active = False
+        bundles[5].repos.pop()
+        self.manager.update_bundle(bundles[5])
+
+        for repo_id in ["r0", "r2", "r4", "missing"]:
+            assert self.manager.get_bundles_containing_repo(repo_id) == [
+                b for b in bundles if any(r.repo_id == repo_id for r in b.repos)
+            ]
+        for query in ["py", "python tool", "KIT 1", "umber 1", "tag2", "nothing here"]:
+            q = query.lower()
+            assert self.manager.search_bundles(query) == [
+                b
+                for b in bundles
+                if b.is_active
+                and (
+                    q in b.name.lower() or q in b.description.lower() or any(q in t for t in b.tags)
+                )
+            ]
+        assert self.manager.list_bundles(owner_address="0x1", tags=["tag1", "tag2"]) == [
+            b
+            for b in bundles
+            if b.owner_address == "0x1" and {"tag1", "tag2"} & set(b.tags) and b.is_active
+        ]
+
+    def test_pricing_cache_and_reprice(self):
+        """Test cached bundle prices follow membership changes and repricing."""
+        bundles = self._populate()
+        bundle = bundles[0]  # r0, r1, r2
+        assert bundle.bundle_price == 24.0
+
+        bundle.add_repo(BundledRepo("r9", "url9", "Repo 9", individual_price=100.0))
+        assert bundle.bundle_price == 104.0
+        bundle.discount = None
+        assert bundle.bundle_price == 130.0
+        bundle.remove_repo("r9")
+        assert bundle.total_individual_price == 30.0
+
+        affected = self.manager.reprice_repo("r2", 50.0)
+        assert affected == self.manager.get_bundles_containing_repo("r2")
+        assert bundle in affected
+        assert bundle.total_individual_price == 60.0
+        assert bundles[1].bundle_price == 0.8 * (10.0 + 50.0 + 30.0)
+
+        reloaded = BundleManager(storage_path=Path(self.temp_dir) / "bundles.json")
+        assert [b.total_individual_price for b in reloaded.list_bundles()] == [
+            b.total_individual_price for b in bundles
+        ]
+        assert len(reloaded.get_bundles_containing_repo("r2")) == len(affected)
+
+    def test_imports_legacy_bundles_file(self):
+        """Test a bundles.json written by earlier versions is imported."""
+        bundles = self._populate()
+        legacy_path = Path(self.temp_dir) / "legacy" / "bundles.json"
+        legacy_path.parent.mkdir()
+        legacy_path.write_text(json.dumps({b.bundle_id: b.to_dict() for b in bundles}))
+
+        manager = BundleManager(storage_path=legacy_path)
+        assert [b.bundle_id for b in manager.list_bundles()] == [b.bundle_id for b in bundles]
+        assert manager.search_bundles("rust toolkit") == [
+            b for b in manager.list_bundles() if "Rust" in b.name
+        ]
+
 
 # =============================================================================
 # Adaptive Pricing Tests
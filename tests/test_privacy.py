@@ -288,6 +288,95 @@ class TestIdentity:
             assert wrong_loaded is None
 
 
+class TestPoseidonEngine:
+    """Tests for the optimized Poseidon permutation and Merkle tree."""
+
+    def test_matches_reference_permutation(self):
+        """Optimized hash is bit-identical to the dense reference for every width."""
+        from rra.privacy.identity import PoseidonHash
+
+        poseidon = PoseidonHash()
+        for width in range(1, 10):
+            inputs = [int.from_bytes(os.urandom(32), "big") for _ in range(width)]
+            assert poseidon.hash(inputs) == poseidon._hash_reference(inputs)
+
+    def test_matches_reference_for_mixed_inputs(self):
+        """Bytes, strings and out-of-field integers normalize identically."""
+        from rra.privacy.identity import PoseidonHash
+
+        poseidon = PoseidonHash()
+        inputs = [b"\xff" * 40, "dispute-42", poseidon.FIELD_PRIME + 5]
+        assert poseidon.hash(inputs) == poseidon._hash_reference(inputs)
+        assert poseidon.hash([]) == poseidon._hash_reference([])
+
+    def test_hash_many(self):
+        """Batch hashing returns per-item hashes in order across widths."""
+        from rra.privacy.identity import PoseidonHash
+
+        poseidon = PoseidonHash()
+        batch = [[1], [1, 2], [3], [4, 5, 6, 7]]
+        assert poseidon.hash_many(batch) == [poseidon.hash(inputs) for inputs in batch]
+        assert poseidon.hash_many([]) == []
+
+    def test_gmpy2_backend_matches(self):
+        """gmpy2 backend produces the same hashes as plain integers."""
+        from rra.privacy.identity import PoseidonHash, GMPY2_AVAILABLE
+
+        if not GMPY2_AVAILABLE:
+            pytest.skip("gmpy2 not installed")
+
+        inputs = [123456789, 987654321]
+        expected = PoseidonHash(use_gmpy2=False).hash(inputs)
+        assert PoseidonHash(use_gmpy2=True).hash(inputs) == expected
+
+    def test_merkle_tree_proofs(self):
+        """Every leaf proof verifies and the root matches a naive build."""
+        from rra.privacy.identity import PoseidonHash, PoseidonMerkleTree
+
+        poseidon = PoseidonHash()
+        leaves = list(range(1, 6))
+        tree = PoseidonMerkleTree(leaves, poseidon=poseidon)
+        assert tree.depth == 3
+
+        level = leaves + [0] * 3
+        while len(level) > 1:
+            level = [poseidon.hash(level[i : i + 2]) for i in range(0, len(level), 2)]
+        assert tree.root == level[0]
+
+        for index in range(len(leaves)):
+            proof = tree.proof(index)
+            assert PoseidonMerkleTree.verify_proof(proof, poseidon)
+
+        proof = tree.proof(2)
+        proof.leaf = 99
+        assert not PoseidonMerkleTree.verify_proof(proof, poseidon)
+
+        with pytest.raises(IndexError):
+            tree.proof(5)
+        with pytest.raises(ValueError):
+            PoseidonMerkleTree(leaves, depth=2)
+
+    def test_identity_set_membership(self):
+        """Batch-generated identities can prove membership in their set."""
+        from rra.privacy.identity import IdentityManager
+
+        manager = IdentityManager()
+        identities = manager.generate_identities(4)
+        for identity in identities:
+            expected = manager.poseidon.hash([identity.identity_secret])
+            assert identity.identity_hash == expected.to_bytes(32, "big")
+
+        tree = manager.build_identity_tree([i.identity_hash for i in identities], depth=4)
+        inputs = manager.prepare_set_membership_inputs(identities[2], tree)
+        assert inputs["root"] == str(tree.root)
+        assert len(inputs["pathElements"]) == 4
+        assert inputs["pathIndices"] == ["0", "1", "0", "0"]
+
+        outsider = manager.generate_identity()
+        with pytest.raises(ValueError):
+            manager.prepare_set_membership_inputs(outsider, tree)
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
@@ -26,7 +26,6 @@ from rra.governance.rep_voting import (
     create_rep_weighted_governance,
 )
 
-
 # =============================================================================
 # ReputationManager Tests
 # =============================================================================
@@ -192,6 +191,36 @@ class TestReputationManager:
         assert decay_amount > 0
         assert manager.get_reputation_score("0x1111") < 1000
 
+    def test_decay_is_lazy_until_materialized(self, manager):
+        """Reads see decay without writing it; apply_decay_all writes it once."""
+        participant = manager.get_or_create_participant("0x1111")
+        participant.last_activity_at = datetime.now() - timedelta(days=65)
+
+        assert manager.get_reputation_score("0x1111") == int(1000 * 0.99**2)
+        assert participant.score == 1000
+        assert len(participant.history) == 0
+
+        later = datetime.now() + timedelta(days=40)
+        assert manager.apply_decay_all(now=later) == {"0x1111": 1000 - int(1000 * 0.99**3)}
+        assert participant.score == int(1000 * 0.99**3)
+        assert len(participant.history) == 1
+        # Nothing further is due until the next period boundary
+        assert manager.apply_decay_all(now=later) == {}
+
+    def test_activity_applies_pending_decay(self, manager):
+        """Activity settles accrued decay before the new delta and restarts the clock."""
+        participant = manager.get_or_create_participant("0x1111")
+        participant.last_activity_at = datetime.now() - timedelta(days=31)
+
+        manager.record_early_voting("0x1111", "dispute_1")
+
+        assert participant.score == 990 + 10
+        assert participant.decay_epoch is None
+        assert [h.action for h in participant.history] == [
+            ReputationAction.DECAY_ADJUSTMENT,
+            ReputationAction.EARLY_VOTING,
+        ]
+
     def test_persistence(self, persistent_manager, tmp_path):
         """Test state persistence."""
         persistent_manager.get_or_create_participant("0x1111")
@@ -213,6 +242,23 @@ class TestReputationManager:
 # =============================================================================
 
 
+def _electorate(manager, size=300):
+    """Participants with varied scores, tenure and inactivity, plus stakes."""
+    import random
+
+    rng = random.Random(11)
+    stakes = []
+    for i in range(size):
+        address = f"0x{i:04x}"
+        if i % 5:
+            participant = manager.get_or_create_participant(address)
+            participant.score = rng.randrange(100, 10000)
+            participant.created_at = datetime.now() - timedelta(days=rng.randrange(800))
+            participant.last_activity_at = datetime.now() - timedelta(days=rng.randrange(90))
+        stakes.append((address, rng.randrange(1, 10**21)))
+    return stakes
+
+
 class TestVotingPower:
     """Test voting power calculations."""
 
@@ -305,6 +351,90 @@ class TestVotingPower:
 # =============================================================================
 
 
+class TestVotingPowerSnapshot:
+    """Test electorate-wide voting power snapshots."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_snapshot_matches_per_address(self, monkeypatch, use_numpy):
+        """Test the columnar evaluation equals calculate_voting_power exactly."""
+        from rra.reputation import weighted
+
+        if use_numpy and not weighted.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(weighted, "NUMPY_AVAILABLE", use_numpy)
+
+        manager = create_reputation_manager()
+        stakes = _electorate(manager)
+
+        batch = manager.calculate_batch_voting_power(stakes)
+        for address, stake in stakes:
+            assert batch[address] == manager.calculate_voting_power(address, stake)
+
+        snapshot = manager.snapshot_voting_power(stakes)
+        assert snapshot.total_power == sum(p.total_power for p in batch.values())
+        distribution = manager.get_power_distribution(stakes)
+        assert abs(sum(distribution.values()) - 100) < 1e-6
+
+    def test_epoch_cache_follows_reputation_updates(self):
+        """Test cached snapshots are reused and patched row by row."""
+        manager = create_reputation_manager()
+        stakes = _electorate(manager, size=20)
+
+        snapshot = manager.snapshot_voting_power(stakes, epoch="e1")
+        assert manager.snapshot_voting_power([], epoch="e1") is snapshot
+
+        manager.record_evidence_provided("0x0001", "dispute_1")
+        assert snapshot.get("0x0001") == manager.calculate_voting_power("0x0001", stakes[1][1])
+        assert snapshot.total_power == sum(
+            manager.calculate_voting_power(a, s).total_power for a, s in stakes
+        )
+
+        assert manager.snapshot_voting_power(stakes, epoch="e2") is not snapshot
+
+    def test_snapshot_expires_at_next_tenure_day(self, monkeypatch):
+        """Test a cached snapshot is not reused once a tenure day passes."""
+        from datetime import datetime, timedelta
+
+        manager = create_reputation_manager()
+        participant = manager.get_or_create_participant("0x0001")
+        participant.created_at -= timedelta(days=10, hours=1)
+        participant.last_activity_at = participant.decay_epoch = datetime.now()
+        stakes = [("0x0001", 1000)]
+
+        snapshot = manager.snapshot_voting_power(stakes, epoch="e1")
+        assert snapshot.valid_until <= participant.created_at + timedelta(days=11)
+        assert snapshot.valid_until <= datetime.now() + timedelta(days=1)
+
+        assert manager.snapshot_voting_power([], epoch="e2").valid_until is not None
+
+        monkeypatch.setattr(manager._power_snapshots["e1"], "valid_until", datetime.now())
+        refreshed = manager.snapshot_voting_power(stakes, epoch="e1")
+        assert refreshed is not snapshot
+        assert refreshed.get("0x0001") == manager.calculate_voting_power("0x0001", 1000)
+
+    def test_governance_votes_use_snapshot(self):
+        """Test votes read powers from one snapshot per stake epoch."""
+        governance = create_rep_weighted_governance()
+        for i in range(5):
+            governance.register_stake(f"0x{i:04x}", 1000 * (i + 1))
+        proposal = governance.create_proposal(
+            title="Test", description="Desc", proposer_address="0x0000", voting_delay_hours=0
+        )
+
+        manager = governance.reputation_manager
+        for i in range(3):
+            voter = f"0x{i:04x}"
+            expected = manager.calculate_voting_power(voter, 1000 * (i + 1))
+            vote = governance.vote(proposal.proposal_id, voter, VoteChoice.FOR)
+            assert vote.voting_power == expected
+        assert len(manager._power_snapshots) == 1
+
+        governance.register_stake("0x0004", 1)
+        vote = governance.vote(proposal.proposal_id, "0x0004", VoteChoice.FOR)
+        assert vote.stake == 1
+        assert len(manager._power_snapshots) == 2
+
+
 class TestReputationAnalytics:
     """Test reputation analytics."""
 
@@ -352,6 +482,29 @@ class TestReputationAnalytics:
         assert "avg_score" in stats
         assert "median_score" in stats
 
+    def test_score_index_matches_full_sort(self):
+        """Leaderboard, ranks and stats agree with sorting every participant."""
+        import random
+
+        manager = create_reputation_manager()
+        rng = random.Random(5)
+        actions = list(ReputationAction)
+        for _ in range(500):
+            manager.update_reputation(f"0x{rng.randrange(60):04x}", rng.choice(actions))
+
+        scores = sorted((p.score for p in manager.participants.values()), reverse=True)
+        leaderboard = manager.get_leaderboard(limit=20)
+        assert [row["score"] for row in leaderboard] == scores[:20]
+
+        for participant in manager.participants.values():
+            rank = manager.get_participant_stats(participant.address)["rank"]
+            assert rank == scores.index(participant.score) + 1
+
+        stats = manager.get_stats()
+        assert stats["avg_score"] == sum(scores) / len(scores)
+        assert stats["median_score"] == sorted(scores)[len(scores) // 2]
+        assert (stats["min_score"], stats["max_score"]) == (scores[-1], scores[0])
+
 
 # =============================================================================
 # RepWeightedGovernance Tests
@@ -538,6 +691,138 @@ class TestRepWeightedGovernance:
         assert dispute_proposals[0].proposal_id == proposal.proposal_id
 
 
+class TestRunningTallies:
+    """Test running vote tallies kept on proposals."""
+
+    def _reference(self, proposal):
+        votes = list(proposal.votes.values())
+        power = {choice: 0 for choice in VoteChoice}
+        for v in votes:
+            power[v.choice] += v.effective_power
+        return (
+            power[VoteChoice.FOR],
+            power[VoteChoice.AGAINST],
+            power[VoteChoice.ABSTAIN],
+            sum(v.effective_power for v in votes),
+            sum(1 for v in votes if v.early_vote),
+        )
+
+    def test_tally_invariant_under_random_votes(self):
+        """Running tallies match a full recount after every insert, change and removal."""
+        import random
+        from rra.governance.rep_voting import RepWeightedProposal, WeightedVote
+        from rra.reputation.weighted import VotingPower
+
+        rng = random.Random(7)
+        now = datetime.now()
+        proposal = RepWeightedProposal(
+            proposal_id="rprop_test",
+            title="Tally",
+            description="Invariant",
+            proposer_address="0x1111",
+            status=ProposalStatus.ACTIVE,
+            created_at=now,
+            voting_start=now,
+            voting_end=now + timedelta(hours=1),
+        )
+        voters = [f"0x{i:04x}" for i in range(50)]
+
+        for _ in range(500):
+            voter = rng.choice(voters)
+            if voter in proposal.votes and rng.random() < 0.2:
+                del proposal.votes[voter]
+            else:
+                stake = rng.randint(1, 10_000)
+                proposal.votes[voter] = WeightedVote(
+                    voter_address=voter,
+                    choice=rng.choice(list(VoteChoice)),
+                    stake=stake,
+                    voting_power=VotingPower(
+                        base_stake=stake,
+                        reputation_multiplier=1.0,
+                        tenure_bonus=0.0,
+                        total_power=stake,
+                    ),
+                    voted_at=now,
+                    early_vote=rng.random() < 0.5,
+                )
+            assert proposal.votes.verify()
+            assert (
+                proposal.power_for,
+                proposal.power_against,
+                proposal.power_abstain,
+                proposal.total_power,
+                proposal.early_voter_count,
+            ) == self._reference(proposal)
+
+        proposal.votes.clear()
+        assert proposal.total_power == 0
+        assert proposal.votes.verify()
+
+    def test_plain_dict_votes_are_tallied(self):
+        """Proposals built with a plain votes dict still get running tallies."""
+        from rra.governance.rep_voting import RepWeightedProposal, WeightedVote
+        from rra.reputation.weighted import VotingPower
+
+        now = datetime.now()
+        vote = WeightedVote(
+            voter_address="0x1111",
+            choice=VoteChoice.FOR,
+            stake=100,
+            voting_power=VotingPower(
+                base_stake=100, reputation_multiplier=1.0, tenure_bonus=0.0, total_power=100
+            ),
+            voted_at=now,
+        )
+        proposal = RepWeightedProposal(
+            proposal_id="rprop_test",
+            title="Tally",
+            description="Plain dict",
+            proposer_address="0x1111",
+            status=ProposalStatus.ACTIVE,
+            created_at=now,
+            voting_start=now,
+            voting_end=now + timedelta(hours=1),
+            votes={"0x1111": vote},
+        )
+
+        assert proposal.power_for == 100
+        assert proposal.votes.verify()
+
+        merged = proposal.votes | {"0x2222": vote}
+        assert merged.tally.weight(VoteChoice.FOR) == 200 and merged.verify()
+        proposal.votes |= {"0x2222": vote}
+        assert proposal.power_for == 200 and proposal.votes.verify()
+
+    def test_live_tally_follows_vote_changes(self):
+        """Changing a vote moves its power between choices in the live tally."""
+        governance = create_rep_weighted_governance()
+        governance.register_stake("0x1111", 1000)
+        governance.register_stake("0x2222", 500)
+
+        proposal = governance.create_proposal(
+            title="Test",
+            description="Desc",
+            proposer_address="0x1111",
+            voting_delay_hours=0,
+        )
+        governance.vote(proposal.proposal_id, "0x1111", VoteChoice.FOR)
+        governance.vote(proposal.proposal_id, "0x2222", VoteChoice.FOR)
+        governance.vote(proposal.proposal_id, "0x2222", VoteChoice.AGAINST)
+
+        tally = governance.get_live_tally(proposal.proposal_id)
+        power_1111 = proposal.votes["0x1111"].effective_power
+        power_2222 = proposal.votes["0x2222"].effective_power
+
+        assert tally["voter_count"] == 2
+        assert tally["power_for"] == power_1111
+        assert tally["power_against"] == power_2222
+        assert tally["total_power"] == power_1111 + power_2222
+        assert tally["is_active"] is True
+        assert proposal.votes.verify()
+        assert governance.get_live_tally("missing") is None
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
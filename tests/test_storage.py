@@ -269,3 +269,456 @@ class TestStorageIntegration:
         for uri, key, original_evidence in disputes:
             retrieved, _ = storage.retrieve_evidence(uri, key)
             assert retrieved == original_evidence
+
+
+class TestCompression:
+    """Tests for compression utilities."""
+
+    @staticmethod
+    def _envelope(i: int) -> bytes:
+        import json
+
+        return json.dumps(
+            {
+                "version": "1.1",
+                "dispute_id": i,
+                "evidence_hash": f"{i:064x}",
+                "viewing_key_commitment": f"{i * 7:064x}",
+                "metadata": {"severity": "high", "repo_url": f"https://github.com/o/r{i}"},
+                "created_at": f"2025-01-{i % 28 + 1:02d}T10:00:00",
+            },
+            sort_keys=True,
+        ).encode()
+
+    def test_gzip_roundtrip_and_detection(self):
+        """Test gzip compression roundtrip with auto-detection."""
+        from rra.storage import compress, decompress, detect_algorithm, CompressionAlgorithm
+
+        data = b'{"key": "value"}' * 500
+        compressed, result = compress(data)
+
+        assert result.was_compressed is True
+        assert detect_algorithm(compressed) == CompressionAlgorithm.GZIP
+        assert decompress(compressed) == data
+
+    def test_entropy_probe_skips_random_data(self):
+        """Test incompressible payloads are skipped before compression."""
+        import os
+        from rra.storage import compress, estimate_entropy
+
+        data = os.urandom(64 * 1024)
+        assert estimate_entropy(data) > 7.5
+
+        out, result = compress(data)
+        assert out is data
+        assert result.was_compressed is False
+
+    def test_streaming_compressor_yields_chunks(self):
+        """Test streaming compressor produces output incrementally."""
+        import gzip
+        from rra.storage import StreamingCompressor
+
+        chunks = [self._envelope(i) * 50 for i in range(20)]
+        compressor = StreamingCompressor()
+        out = list(compressor.stream(chunks))
+
+        assert len(out) > 1
+        assert gzip.decompress(b"".join(out)) == b"".join(chunks)
+
+    def test_streaming_compressor_finalize_returns_all(self):
+        """Test write/finalize without draining still returns full output."""
+        import gzip
+        from rra.storage import StreamingCompressor
+
+        compressor = StreamingCompressor()
+        compressor.write(b"a" * 10000)
+        compressor.write(b"b" * 10000)
+        data, result = compressor.finalize()
+
+        assert gzip.decompress(data) == b"a" * 10000 + b"b" * 10000
+        assert result.compressed_size == len(data)
+        assert result.original_size == 20000
+
+    def test_streaming_compressor_finalize_returns_undrained_output(self):
+        """Test finalize returns all output when nothing was drained."""
+        import gzip
+        from rra.storage import StreamingCompressor
+
+        chunks = [self._envelope(i) * 200 for i in range(20)]
+        compressor = StreamingCompressor()
+        for chunk in chunks:
+            compressor.write(chunk)
+        data, result = compressor.finalize()
+
+        assert gzip.decompress(data) == b"".join(chunks)
+        assert result.compressed_size == len(data)
+
+    def test_streaming_compressor_drain_releases_output(self):
+        """Test drained output is not returned again by finalize."""
+        import gzip
+        from rra.storage import StreamingCompressor
+
+        compressor = StreamingCompressor()
+        parts = []
+        for i in range(20):
+            compressor.write(self._envelope(i) * 200)
+            parts.append(compressor.drain())
+            assert compressor._pending == []
+        tail, _ = compressor.finalize()
+
+        expected = b"".join(self._envelope(i) * 200 for i in range(20))
+        assert gzip.decompress(b"".join(parts) + tail) == expected
+
+    def test_zstd_roundtrip(self):
+        """Test zstd compression roundtrip."""
+        pytest.importorskip("zstandard")
+        from rra.storage import (
+            compress,
+            decompress,
+            is_zstd_compressed,
+            CompressionConfig,
+            CompressionAlgorithm,
+        )
+
+        data = b"".join(self._envelope(i) for i in range(100))
+        config = CompressionConfig(algorithm=CompressionAlgorithm.ZSTD, level=19, threads=2)
+        compressed, result = compress(data, config)
+
+        assert result.algorithm == CompressionAlgorithm.ZSTD
+        assert is_zstd_compressed(compressed)
+        assert decompress(compressed) == data
+
+    def test_zstd_dictionary_small_payloads(self):
+        """Test trained dictionaries compress small envelopes and auto-resolve."""
+        pytest.importorskip("zstandard")
+        from rra.storage import (
+            compress,
+            decompress,
+            train_dictionary,
+            CompressionConfig,
+            CompressionAlgorithm,
+        )
+
+        samples = [self._envelope(i) for i in range(500)]
+        dictionary = train_dictionary(samples, dict_size=4096)
+        config = CompressionConfig(algorithm=CompressionAlgorithm.ZSTD, dictionary=dictionary)
+
+        payload = self._envelope(10_001)
+        compressed, result = compress(payload, config)
+
+        assert result.was_compressed is True
+        assert result.dictionary_id == dictionary.dict_id
+        assert decompress(compressed) == payload
+
+    def test_dictionary_requires_zstd(self):
+        """Test dictionaries are rejected for gzip configs."""
+        pytest.importorskip("zstandard")
+        from rra.storage import CompressionConfig, CompressionDictionary
+
+        with pytest.raises(ValueError):
+            CompressionConfig(dictionary=CompressionDictionary(data=b"\x00" * 64))
+
+    def test_store_and_retrieve_with_zstd(self):
+        """Test encrypted storage roundtrip with zstd packages."""
+        pytest.importorskip("zstandard")
+        from rra.storage import create_storage, StorageProvider
+        from rra.storage import CompressionConfig, CompressionAlgorithm
+        from rra.privacy import generate_viewing_key
+
+        storage = create_storage(provider=StorageProvider.MOCK)
+        storage.config.compression = CompressionConfig(algorithm=CompressionAlgorithm.ZSTD)
+        viewing_key = generate_viewing_key()
+        evidence = {"claim": "x" * 4000}
+
+        result = storage.store_evidence(evidence, viewing_key, dispute_id=5)
+        retrieved, _ = storage.retrieve_evidence(result.uri, viewing_key)
+
+        assert retrieved == evidence
+
+
+class TestBlobCache:
+    """Tests for the local content-addressed blob cache."""
+
+    def test_put_get_roundtrip(self, tmp_path):
+        """Test blobs survive a cache restart."""
+        from rra.storage import BlobCache
+
+        cache = BlobCache(tmp_path)
+        cache.put("ipfs://QmA", b"package-bytes", evidence_hash="ab" * 32)
+
+        reopened = BlobCache(tmp_path)
+        assert reopened.get("ipfs://QmA") == b"package-bytes"
+        assert reopened.get_entry("ipfs://QmA").evidence_hash == "ab" * 32
+        assert reopened.get("ipfs://QmB") is None
+
+    def test_lru_eviction_under_budget(self, tmp_path):
+        """Test least-recently-used blobs are evicted beyond the size budget."""
+        from rra.storage import BlobCache
+
+        cache = BlobCache(tmp_path, max_bytes=250)
+        cache.put("ar://1", b"x" * 100)
+        cache.put("ar://2", b"y" * 100)
+        cache.get("ar://1")  # ar://2 becomes least recently used
+        cache.put("ar://3", b"z" * 100)
+
+        assert "ar://1" in cache
+        assert "ar://2" not in cache
+        assert "ar://3" in cache
+        assert cache.total_bytes == 200
+        assert cache.stats.evictions == 1
+
+    def test_corrupted_blob_is_dropped(self, tmp_path):
+        """Test blobs that fail the digest check are treated as misses."""
+        from rra.storage import BlobCache
+
+        cache = BlobCache(tmp_path)
+        cache.put("ipfs://QmA", b"original")
+        cache._blob_path("ipfs://QmA").write_bytes(b"tampered")
+
+        assert cache.get("ipfs://QmA") is None
+        assert "ipfs://QmA" not in cache
+        assert cache.stats.corrupted == 1
+
+    def test_single_flight_fetch(self, tmp_path):
+        """Test concurrent misses for one URI share a single fetch."""
+        import threading
+        import time
+        from rra.storage import BlobCache
+
+        cache = BlobCache(tmp_path)
+        calls = []
+
+        def fetch(uri):
+            calls.append(uri)
+            time.sleep(0.05)
+            return b"blob"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_fetch("ipfs://Qm", fetch)))
+            for _ in range(16)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == ["ipfs://Qm"]
+        assert results == [b"blob"] * 16
+
+    def test_storage_reads_served_from_cache(self, tmp_path):
+        """Test repeated retrievals do not hit the provider."""
+        from rra.storage import create_storage, StorageProvider
+        from rra.privacy import generate_viewing_key, encrypt_evidence
+
+        storage = create_storage(provider=StorageProvider.MOCK, cache_dir=str(tmp_path))
+        viewing_key = generate_viewing_key()
+        evidence = {"claim": "License violation"}
+        result = storage.store_evidence(evidence, viewing_key, dispute_id=7)
+
+        # Drop the write-through copy so the first read is a real download
+        storage.cache.invalidate(result.uri)
+        fetches = []
+        original_fetch = storage._fetch
+        storage._fetch = lambda uri: fetches.append(uri) or original_fetch(uri)
+
+        for _ in range(3):
+            retrieved, _ = storage.retrieve_evidence(result.uri, viewing_key)
+            assert retrieved == evidence
+        assert fetches == [result.uri]
+
+        # Hash verification is answered from the verified cached blob
+        _, expected_hash = encrypt_evidence(evidence, viewing_key, 7)
+        assert storage.verify_evidence_hash(result.uri, expected_hash) is True
+        assert storage.verify_evidence_hash(result.uri, bytes(32)) is False
+        assert fetches == [result.uri]
+
+    def test_verify_evidence_hash_ignores_tampered_sidecar(self, tmp_path):
+        """Test a forged evidence hash in the sidecar record is not trusted."""
+        import json
+        from rra.storage import create_storage, StorageProvider
+        from rra.privacy import generate_viewing_key, encrypt_evidence
+
+        storage = create_storage(provider=StorageProvider.MOCK, cache_dir=str(tmp_path))
+        viewing_key = generate_viewing_key()
+        result = storage.store_evidence({"claim": "A"}, viewing_key, dispute_id=3)
+
+        forged = "ff" * 32
+        meta_path = storage.cache._meta_path(result.uri)
+        record = json.loads(meta_path.read_bytes())
+        record["evidence_hash"] = forged
+        meta_path.write_text(json.dumps(record))
+        storage.cache.get_entry(result.uri).evidence_hash = forged
+
+        _, expected_hash = encrypt_evidence({"claim": "A"}, viewing_key, 3)
+        assert storage.verify_evidence_hash(result.uri, bytes.fromhex(forged)) is False
+        assert storage.verify_evidence_hash(result.uri, expected_hash) is True
+
+
+@pytest.fixture
+def stub_ipfs_server():
+    """Local HTTP server implementing the IPFS /add, /cat and /pin/add endpoints."""
+    import hashlib
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlparse, parse_qs
+
+    state = {"blobs": {}, "ports": set(), "requests": 0, "fail_next": 0, "pins": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status, body=b""):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _should_fail(self):
+            with lock:
+                state["requests"] += 1
+                state["ports"].add(self.client_address[1])
+                if state["fail_next"] > 0:
+                    state["fail_next"] -= 1
+                    return True
+            return False
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self._should_fail():
+                return self._reply(503)
+            path = urlparse(self.path).path
+            if path.endswith("/pin/add"):
+                state["pins"] += 1
+                return self._reply(200, b"{}")
+            boundary = self.headers["Content-Type"].split("boundary=")[1].encode()
+            start = body.index(b"\r\n\r\n") + 4
+            data = body[start : body.rindex(b"\r\n--" + boundary + b"--")]
+            cid = "Qm" + hashlib.sha256(data).hexdigest()[:44]
+            with lock:
+                state["blobs"][cid] = data
+            self._reply(200, json.dumps({"Hash": cid}).encode())
+
+        def do_GET(self):
+            if self._should_fail():
+                return self._reply(503)
+            cid = parse_qs(urlparse(self.path).query)["arg"][0]
+            data = state["blobs"].get(cid)
+            if data is None:
+                return self._reply(404)
+            self._reply(200, data)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}/api/v0"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncStorage:
+    """Tests for the async, pooled storage client."""
+
+    @staticmethod
+    def _client(url, **config_kwargs):
+        from rra.storage import AsyncEncryptedStorage, AsyncStorageConfig, StorageProvider
+        from rra.storage import create_storage
+        from rra.integration.network_resilience import RetryConfig
+        import httpx
+
+        storage = create_storage(provider=StorageProvider.IPFS_LOCAL, api_url=url)
+        retry = RetryConfig(
+            max_retries=3,
+            base_delay=0.01,
+            jitter=False,
+            retryable_exceptions=(httpx.TransportError, httpx.HTTPStatusError),
+        )
+        return AsyncEncryptedStorage(storage, AsyncStorageConfig(retry=retry, **config_kwargs))
+
+    @pytest.mark.asyncio
+    async def test_store_many_over_pooled_connections(self, stub_ipfs_server):
+        """Test bulk uploads reuse a bounded set of keep-alive connections."""
+        from rra.storage import EvidenceItem
+        from rra.privacy import generate_viewing_key
+
+        key = generate_viewing_key()
+        items = [EvidenceItem({"claim": f"violation {i}"}, key, dispute_id=i) for i in range(40)]
+
+        async with self._client(stub_ipfs_server["url"], max_connections=4) as client:
+            results = await client.store_evidence_many(items)
+
+            assert all(r.success for r in results)
+            assert [r.metadata["dispute_id"] for r in results] == list(range(40))
+            assert len(stub_ipfs_server["ports"]) <= 4
+            assert stub_ipfs_server["pins"] == 40
+
+            evidence, metadata = await client.retrieve_evidence(results[7].uri, key)
+            assert evidence == {"claim": "violation 7"}
+            assert metadata["dispute_id"] == 7
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self, stub_ipfs_server):
+        """Test 503 responses are retried with backoff."""
+        from rra.privacy import generate_viewing_key
+
+        stub_ipfs_server["fail_next"] = 2
+        async with self._client(stub_ipfs_server["url"]) as client:
+            result = await client.store_evidence({"claim": "x"}, generate_viewing_key(), 1)
+
+        assert result.success is True
+        assert client.circuit_breaker._state.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_failures_are_reported_per_item(self, stub_ipfs_server):
+        """Test invalid items fail individually without aborting the batch."""
+        from rra.storage import EvidenceItem
+        from rra.privacy import generate_viewing_key
+
+        key = generate_viewing_key()
+        items = [EvidenceItem({"a": 1}, key, 1), EvidenceItem({}, key, 2)]
+
+        async with self._client(stub_ipfs_server["url"]) as client:
+            results = await client.store_evidence_many(items)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "Evidence data is required" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_single_flight(self, stub_ipfs_server):
+        """Test concurrent reads of one URI issue a single download."""
+        import asyncio
+        from rra.privacy import generate_viewing_key
+
+        key = generate_viewing_key()
+        async with self._client(stub_ipfs_server["url"]) as client:
+            result = await client.store_evidence({"claim": "shared"}, key, 3)
+            before = stub_ipfs_server["requests"]
+
+            outputs = await asyncio.gather(
+                *(client.retrieve_evidence(result.uri, key) for _ in range(10))
+            )
+
+        assert all(evidence == {"claim": "shared"} for evidence, _ in outputs)
+        assert stub_ipfs_server["requests"] - before == 1
+
+    def test_sync_client_against_stub(self, stub_ipfs_server):
+        """Test the sync client shares the same provider wire format."""
+        from rra.storage import create_storage, StorageProvider
+        from rra.privacy import generate_viewing_key
+
+        storage = create_storage(
+            provider=StorageProvider.IPFS_LOCAL, api_url=stub_ipfs_server["url"]
+        )
+        key = generate_viewing_key()
+        result = storage.store_evidence({"claim": "sync"}, key, dispute_id=9)
+
+        assert result.success is True
+        assert result.uri.startswith("ipfs://Qm")
+        assert storage.retrieve_evidence(result.uri, key)[0] == {"claim": "sync"}
@@ -2,6 +2,10 @@
 # Copyright 2025 Kase Branham
 """Tests for Superfluid streaming payments integration."""
 
+import asyncio
+import json
+import shutil
+
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -148,6 +152,44 @@ class TestSuperfluidManager:
             assert license.status == StreamStatus.STOPPED
             assert license.stop_time is not None
 
+    @pytest.mark.asyncio
+    async def test_revocation_queue(self, tmp_path):
+        """Test sweeps revoke only expired licenses and skip reactivated ones."""
+        manager = SuperfluidManager(storage_path=tmp_path / "licenses.json")
+        licenses = [
+            manager.create_streaming_license(f"repo{i}", "0xBuyer", "0xSeller", 10.0)
+            for i in range(4)
+        ]
+        for i, license in enumerate(licenses):
+            license.grace_period_seconds = 3600 * (i + 1)
+            await manager.activate_stream(license.license_id)
+            await manager.stop_stream(license.license_id)
+        await manager.activate_stream(licenses[0].license_id)
+
+        now = datetime.utcnow()
+        assert manager.next_revocation_at() == licenses[1].grace_end
+        assert await manager.revoke_expired_licenses(now=now + timedelta(hours=1.5)) == []
+        revoked = await manager.revoke_expired_licenses(now=now + timedelta(hours=3.5))
+        assert revoked == [licenses[1].license_id, licenses[2].license_id]
+        assert licenses[0].status == StreamStatus.ACTIVE
+        assert licenses[3].status == StreamStatus.STOPPED
+
+        reloaded = SuperfluidManager(storage_path=tmp_path / "licenses.json")
+        assert reloaded.get_license(licenses[2].license_id).status == StreamStatus.REVOKED
+        assert reloaded.next_revocation_at() == licenses[3].grace_end
+
+    def test_legacy_licenses_file_imported(self, tmp_path):
+        """Test a licenses JSON file from the old storage is loaded once."""
+        storage_path = tmp_path / "licenses.json"
+        license = SuperfluidManager(storage_path=storage_path).create_streaming_license(
+            "repo", "0xBuyer", "0xSeller", 10.0
+        )
+        storage_path.write_text(json.dumps({license.license_id: license.to_dict()}))
+        shutil.rmtree(tmp_path / "licenses_oplog")
+
+        manager = SuperfluidManager(storage_path=storage_path)
+        assert manager.get_license(license.license_id).repo_id == "repo"
+
     def test_check_access_active(self):
         """Test access check for active stream."""
         with TemporaryDirectory() as tmpdir:
@@ -291,6 +333,27 @@ class TestSuperfluidManager:
 class TestStreamAccessController:
     """Test cases for StreamAccessController."""
 
+    @pytest.mark.asyncio
+    async def test_monitor_revokes_at_grace_end(self, tmp_path):
+        """Test the monitor re-arms for a new stop instead of waiting a full interval."""
+        manager = SuperfluidManager(storage_path=tmp_path / "licenses.json")
+        controller = StreamAccessController(manager, check_interval_seconds=60)
+        revoked = []
+        controller.add_revocation_callback(lambda license_id, buyer: revoked.append(license_id))
+
+        license = manager.create_streaming_license("repo", "0xBuyer", "0xSeller", 10.0)
+        license.grace_period_seconds = 1
+        await manager.activate_stream(license.license_id)
+        await controller.start_monitoring()
+        try:
+            await manager.stop_stream(license.license_id)
+            await asyncio.sleep(1.5)
+        finally:
+            await controller.stop_monitoring()
+
+        assert revoked == [license.license_id]
+        assert license.status == StreamStatus.REVOKED
+
     @pytest.mark.asyncio
     async def test_check_access(self):
         """Test access check through controller."""
@@ -459,3 +522,83 @@ class TestStreamingLicense:
         assert license.license_id == "sl_test123"
         assert license.status == StreamStatus.ACTIVE
         assert isinstance(license.start_time, datetime)
+
+
+class TestStreamingIndexes:
+    """Randomized operation sequences checked against full-scan lookups."""
+
+    REPOS = ["repo_a", "repo_b", "repo_c"]
+    BUYERS = ["0xAa", "0xbB", "0xCC", "0xdd"]
+
+    def assert_consistent(self, manager, controller):
+        licenses = list(manager._licenses.values())
+        for repo in self.REPOS:
+            assert manager.get_licenses_for_repo(repo) == [
+                lic for lic in licenses if lic.repo_id == repo
+            ]
+            assert controller.get_grants_for_repo(repo) == [
+                g for g in controller._access_grants.values() if g.repo_id == repo
+            ]
+            for buyer in self.BUYERS:
+                pair = [
+                    lic
+                    for lic in licenses
+                    if lic.repo_id == repo and lic.buyer_address == buyer.lower()
+                ]
+                assert manager.get_licenses_for_repo_buyer(repo, buyer) == pair
+                expected = next((lic for lic in pair if manager.check_access(lic.license_id)), None)
+                assert manager.find_access_license(repo, buyer) is expected
+        for buyer in self.BUYERS:
+            assert manager.get_licenses_for_buyer(buyer) == [
+                lic for lic in licenses if lic.buyer_address == buyer.lower()
+            ]
+        assert manager.get_active_licenses() == [
+            lic for lic in licenses if lic.status == StreamStatus.ACTIVE
+        ]
+        stats = manager.get_stats()
+        for status, key in (
+            (StreamStatus.ACTIVE, "active_streams"),
+            (StreamStatus.STOPPED, "stopped_streams"),
+            (StreamStatus.REVOKED, "revoked_licenses"),
+        ):
+            assert stats[key] == sum(1 for lic in licenses if lic.status == status)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_indexes_match_scans(self, tmp_path, seed):
+        """Test indexes stay consistent through every license and grant transition."""
+        import random
+
+        rng = random.Random(seed)
+        storage_path = tmp_path / "licenses.json"
+        manager = SuperfluidManager(storage_path=storage_path)
+        controller = StreamAccessController(manager)
+
+        for _ in range(150):
+            ids = list(manager._licenses)
+            op = rng.random()
+            if op < 0.25 or not ids:
+                license = manager.create_streaming_license(
+                    rng.choice(self.REPOS), rng.choice(self.BUYERS), "0xSeller", 10.0
+                )
+                license.grace_period_seconds = rng.choice([0, 3600])
+            elif op < 0.45:
+                await manager.activate_stream(rng.choice(ids))
+            elif op < 0.6:
+                await manager.stop_stream(rng.choice(ids))
+            elif op < 0.7:
+                await manager.revoke_expired_licenses(
+                    now=datetime.utcnow() + timedelta(seconds=rng.choice([1, 7200]))
+                )
+            elif op < 0.8:
+                await controller.grant_access(rng.choice(ids))
+            elif op < 0.88:
+                await controller.revoke_access(rng.choice(ids))
+            elif op < 0.95:
+                # Direct edit followed by a bulk save
+                manager.get_license(rng.choice(ids)).status = rng.choice(list(StreamStatus))
+                manager._save_licenses()
+            else:
+                manager = SuperfluidManager(storage_path=storage_path)
+                controller.sf = manager
+            self.assert_consistent(manager, controller)
@@ -28,7 +28,6 @@ from rra.transaction.safeguards import (
     SafeguardLevel,
 )
 
-
 # ============================================================================
 # Price Commitment Tests
 # ============================================================================
@@ -703,5 +702,180 @@ class TestSecurityEdgeCases:
         assert result.is_valid is False
 
 
+# ============================================================================
+# Expiry Queue, Archives and Concurrency
+# ============================================================================
+
+
+def _create(manager, i, timeout):
+    return manager.create_pending_transaction(
+        buyer_id=f"buyer{i}",
+        seller_id="seller456",
+        repo_url="https://github.com/test/repo",
+        license_model="perpetual",
+        agreed_price="0.5 ETH",
+        floor_price="0.3 ETH",
+        target_price="0.6 ETH",
+        timeout_seconds=timeout,
+    )
+
+
+class TestExpiryQueue:
+    """Tests for the expiry-ordered pending store."""
+
+    def test_cleanup_skips_completed_and_live(self):
+        """Only pending transactions past their deadline are expired, once."""
+        expired = []
+        manager = TransactionConfirmation(
+            default_timeout=60, min_timeout=1, on_expired=lambda tx: expired.append(tx)
+        )
+        short = [_create(manager, i, 1) for i in range(6)]
+        live = [_create(manager, i, 60) for i in range(100)]
+        manager.confirm_transaction(short[0].transaction_id)
+        manager.cancel_transaction(short[1].transaction_id)
+
+        time.sleep(1.1)
+        assert manager.cleanup_expired() == 4
+        assert manager.cleanup_expired() == 0
+        assert sorted(tx.transaction_id for tx in expired) == sorted(
+            tx.transaction_id for tx in short[2:]
+        )
+        assert len(manager.pending_transactions) == len(live)
+        assert len(manager._expiry_queue) == len(live)
+
+        stats = manager.get_stats()
+        assert (stats["confirmed"], stats["cancelled"], stats["expired"]) == (1, 1, 4)
+
+    def test_daemon_expires_at_deadline(self):
+        """The daemon wakes for the earliest deadline instead of its interval."""
+        fired = []
+        manager = TransactionConfirmation(
+            default_timeout=60, min_timeout=1, on_expired=lambda tx: fired.append(time.monotonic())
+        )
+        manager.start_cleanup_daemon(interval_seconds=60)
+        try:
+            time.sleep(0.05)  # daemon is waiting on an empty queue
+            start = time.monotonic()
+            _create(manager, 0, 1)
+            deadline = time.monotonic() + 5
+            while not fired and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            manager.stop_cleanup_daemon()
+
+        assert fired
+        assert 0.9 <= fired[0] - start < 1.5
+
+    def test_completed_and_audit_windows_are_archived(self, tmp_path):
+        """Memory keeps bounded windows; the rolling archives keep everything."""
+        from rra.persistence.rolling import open_rolling_log
+
+        manager = TransactionConfirmation(
+            default_timeout=60,
+            min_timeout=1,
+            archive_dir=tmp_path,
+            max_completed=5,
+            audit_ring_size=10,
+        )
+        txs = [_create(manager, i, 60) for i in range(20)]
+        for tx in txs:
+            manager.confirm_transaction(tx.transaction_id)
+        manager.close()
+
+        assert list(manager.completed_transactions) == [tx.transaction_id for tx in txs[-5:]]
+        assert len(manager.audit_log) == 10
+        assert manager.get_stats()["confirmed"] == 20
+
+        completed = open_rolling_log(tmp_path / "completed", name="completed").read()
+        assert [r["transaction_id"] for r in completed] == [tx.transaction_id for tx in txs]
+        assert all(r["status"] == "confirmed" for r in completed)
+        audit = open_rolling_log(tmp_path / "audit", name="audit").read()
+        assert [r["action"] for r in audit].count("created") == 20
+        assert [r["action"] for r in audit].count("confirmed") == 20
+
+    def test_unarchived_windows_are_unbounded_by_default(self, caplog):
+        """Without an archive nothing leaves memory unless a bound is set, and drops are logged."""
+        manager = TransactionConfirmation(default_timeout=60, min_timeout=1)
+        for i in range(30):
+            manager.confirm_transaction(_create(manager, i, 60).transaction_id)
+        assert len(manager.completed_transactions) == 30
+        assert len(manager.audit_log) == 60
+
+        bounded = TransactionConfirmation(
+            default_timeout=60, min_timeout=1, max_completed=5, audit_ring_size=10
+        )
+        with caplog.at_level("WARNING", logger="rra.transaction.confirmation"):
+            for i in range(6):
+                bounded.confirm_transaction(_create(bounded, i, 60).transaction_id)
+        assert len(bounded.completed_transactions) == 5
+        messages = [r.getMessage() for r in caplog.records]
+        assert sum("Dropped completed transaction" in m for m in messages) == 1
+        assert sum("Dropped audit entry" in m for m in messages) == 2
+
+    def test_concurrent_confirm_cancel_expire_stress(self):
+        """Thousands of racing threads leave every transaction in exactly one final state."""
+        import random
+        import threading
+
+        confirmed, expired = [], []
+        manager = TransactionConfirmation(
+            default_timeout=60,
+            min_timeout=1,
+            on_confirmed=lambda tx: confirmed.append(tx.transaction_id),
+            on_expired=lambda tx: expired.append(tx.transaction_id),
+            audit_ring_size=100_000,
+        )
+        manager.start_cleanup_daemon(interval_seconds=1)
+        txs = [_create(manager, i, 1) for i in range(400)]
+        ids = [tx.transaction_id for tx in txs]
+        rng = random.Random(45)
+        plan = [(rng.choice(ids), rng.randrange(4), rng.uniform(0.8, 1.2)) for _ in range(2000)]
+        errors = []
+
+        def race(tx_id, op, delay):
+            try:
+                time.sleep(delay)
+                if op == 0:
+                    manager.confirm_transaction(tx_id)
+                elif op == 1:
+                    manager.cancel_transaction(tx_id)
+                elif op == 2:
+                    manager.get_pending_transaction(tx_id)
+                else:
+                    manager.cleanup_expired()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=race, args=args) for args in plan]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        time.sleep(0.3)
+        manager.cleanup_expired()
+        manager.stop_cleanup_daemon()
+
+        assert not errors
+        assert not manager.pending_transactions
+        assert len(confirmed) == len(set(confirmed))
+        assert len(expired) == len(set(expired))
+        assert not set(confirmed) & set(expired)
+
+        final = {tx.transaction_id: tx.status for tx in txs}
+        assert set(final) == set(manager.completed_transactions)
+        assert {t for t, s in final.items() if s == TransactionStatus.CONFIRMED} == set(confirmed)
+        assert {t for t, s in final.items() if s == TransactionStatus.EXPIRED} == set(expired)
+
+        stats = manager.get_stats()
+        assert stats["total_completed"] == len(txs)
+        assert stats["confirmed"] + stats["cancelled"] + stats["expired"] == len(txs)
+
+        terminal = {}
+        for entry in manager.audit_log:
+            if entry["action"] in ("confirmed", "cancelled", "expired"):
+                terminal[entry["transaction_id"]] = terminal.get(entry["transaction_id"], 0) + 1
+        assert terminal == {tx_id: 1 for tx_id in ids}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -31,7 +31,6 @@ from rra.governance.treasury_votes import (
     create_treasury_voting_manager,
 )
 
-
 # =============================================================================
 # TreasuryCoordinator Tests
 # =============================================================================
@@ -520,6 +519,25 @@ class TestTreasuryVotingManager:
         assert stake == 1000
         assert voting_manager.get_total_stake("dispute_123") == 1000
 
+    def test_total_stake_is_kept_running(self, tmp_path):
+        """Test dispute totals follow every stake change and survive a reload."""
+        manager = create_treasury_voting_manager(data_dir=str(tmp_path))
+        treasuries = [
+            manager.register_treasury(name=f"T{i}", signers=[f"0x{i:040x}"]) for i in range(3)
+        ]
+        for i, treasury in enumerate(treasuries):
+            manager.stake_for_dispute("dispute_1", treasury.treasury_id, 100 * (i + 1))
+        manager.stake_for_dispute("dispute_1", treasuries[0].treasury_id, 50)
+        manager.stake_for_dispute("dispute_2", treasuries[1].treasury_id, 7)
+
+        assert manager.get_total_stake("dispute_1") == 650
+        assert manager.get_total_stake("dispute_2") == 7
+        assert manager.get_total_stake("missing") == 0
+
+        reloaded = create_treasury_voting_manager(data_dir=str(tmp_path))
+        assert reloaded.get_total_stake("dispute_1") == 650
+        assert reloaded.get_voting_stats("dispute_2")["total_stake"] == 7
+
     def test_create_proposal(self, voting_manager):
         """Test creating a voting proposal."""
         treasury = voting_manager.register_treasury(
@@ -583,6 +601,57 @@ class TestTreasuryVotingManager:
         proposal = voting_manager.get_proposal(proposal.proposal_id)
         assert proposal.stake_approved == 1000
 
+    def test_live_tally(self, voting_manager):
+        """Test live tally follows vote changes and matches a recount."""
+        treasury1 = voting_manager.register_treasury(
+            name="Treasury 1",
+            signers=["0x1111111111111111111111111111111111111111"],
+        )
+        treasury2 = voting_manager.register_treasury(
+            name="Treasury 2",
+            signers=["0x2222222222222222222222222222222222222222"],
+        )
+        voting_manager.stake_for_dispute("dispute_123", treasury1.treasury_id, 1000)
+        voting_manager.stake_for_dispute("dispute_123", treasury2.treasury_id, 500)
+
+        proposal = voting_manager.create_proposal(
+            dispute_id="dispute_123",
+            treasury_id=treasury1.treasury_id,
+            proposer_address="0x1111111111111111111111111111111111111111",
+            vote_type=TreasuryVoteType.RESOLUTION,
+            title="Resolution",
+            description="Settlement",
+        )
+        voting_manager.vote(
+            proposal.proposal_id,
+            treasury1.treasury_id,
+            "0x1111111111111111111111111111111111111111",
+            VotingChoice.APPROVE,
+        )
+        voting_manager.vote(
+            proposal.proposal_id,
+            treasury2.treasury_id,
+            "0x2222222222222222222222222222222222222222",
+            VotingChoice.APPROVE,
+        )
+        # Treasury 2 changes its vote
+        voting_manager.vote(
+            proposal.proposal_id,
+            treasury2.treasury_id,
+            "0x2222222222222222222222222222222222222222",
+            VotingChoice.REJECT,
+        )
+
+        tally = voting_manager.get_live_tally(proposal.proposal_id)
+
+        assert tally["stake_approved"] == 1000
+        assert tally["stake_rejected"] == 500
+        assert tally["total_stake_voted"] == 1500
+        assert tally["voter_count"] == 2
+        assert tally["participation_pct"] == 100
+        assert proposal._votes.verify()
+        assert voting_manager.get_live_tally("missing") is None
+
     def test_finalize_proposal(self, voting_manager):
         """Test finalizing a proposal."""
 
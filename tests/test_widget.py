@@ -5,6 +5,8 @@ Tests for the Embeddable Widget API.
 """
 
 import os
+
+import pytest
 from fastapi.testclient import TestClient
 
 # Set up test environment before imports
@@ -13,10 +15,19 @@ os.environ["RRA_API_KEY"] = "test-key"
 
 from rra.api.server import app
 
-
 client = TestClient(app, headers={"X-API-Key": "test-key"})
 
 
+@pytest.fixture(autouse=True)
+def widget_event_log(tmp_path, monkeypatch):
+    """Keep the widget event log of API tests under tmp_path."""
+    from rra.api import widget
+
+    monkeypatch.setattr(widget._widget_sessions, "event_log_dir", tmp_path / "widget_events")
+    yield tmp_path / "widget_events"
+    widget._widget_sessions.close()
+
+
 class TestWidgetAPI:
     """Test widget API endpoints."""
 
@@ -118,6 +129,20 @@ class TestWidgetAPI:
         assert response.status_code == 200
         assert response.json()["status"] == "recorded"
 
+    def test_widget_event_log_location(self, widget_event_log):
+        """Test events go to the configured log directory."""
+        from rra.api import widget
+
+        init_response = client.post("/api/widget/init", json={"agent_id": "log-test-agent"})
+        widget_id = init_response.json()["widget_id"]
+        client.post(
+            "/api/widget/event",
+            json={"widget_id": widget_id, "event_type": "widget_opened", "event_data": {}},
+        )
+
+        assert widget._widget_sessions.read_event_log()[-1]["widget_id"] == widget_id
+        assert list(widget_event_log.glob("events.*.jsonl"))
+
     def test_widget_event_not_found(self):
         """Test event recording for non-existent widget."""
         response = client.post(
@@ -243,3 +268,242 @@ class TestWidgetSecurity:
         response = client.get("/api/widget/embed.js")
         assert response.headers.get("access-control-allow-origin") == "*"
         assert "max-age" in response.headers.get("cache-control", "")
+
+
+def _write_kb(kb_dir, name, repo_url):
+    from pathlib import Path
+    from rra.ingestion.knowledge_base import KnowledgeBase
+    from rra.config.market_config import MarketConfig
+
+    kb = KnowledgeBase(repo_path=Path("."), repo_url=repo_url)
+    kb.market_config = MarketConfig(target_price="0.05 ETH", floor_price="0.02 ETH")
+    return kb.save(kb_dir / f"{name}_kb.json", compress=False)
+
+
+class TestKnowledgeBaseIndex:
+    """Test the agent ID -> knowledge base index used by the message path."""
+
+    def test_resolves_generated_id_without_rescanning(self, tmp_path):
+        """Files are parsed once; lookups afterwards do not reload them."""
+        from rra.services.kb_index import KnowledgeBaseIndex
+
+        for i in range(20):
+            _write_kb(tmp_path, f"owner_repo{i}", f"https://github.com/owner/repo{i}")
+        index = KnowledgeBaseIndex(tmp_path)
+        repo_id = index.link_service.generate_repo_id("https://github.com/owner/repo7")
+
+        kb = index.load(repo_id)
+        assert kb.repo_url == "https://github.com/owner/repo7"
+        assert index.files_parsed == 20
+
+        assert index.load(repo_id) is kb
+        assert index.files_parsed == 20
+        assert index.scans == 1
+
+    def test_picks_up_new_and_removed_files(self, tmp_path):
+        """Adding or removing a knowledge base refreshes the index."""
+        from rra.services.kb_index import KnowledgeBaseIndex
+
+        _write_kb(tmp_path, "owner_a", "https://github.com/owner/a")
+        index = KnowledgeBaseIndex(tmp_path, rescan_interval=3600)
+        new_id = index.link_service.generate_repo_id("https://github.com/owner/b")
+        assert index.load(new_id) is None
+
+        path = _write_kb(tmp_path, "owner_b", "https://github.com/owner/b")
+        assert index.find_path(new_id) == path
+
+        path.unlink()
+        assert index.find_path(new_id) is None
+
+    def test_rewritten_file_is_reloaded(self, tmp_path):
+        """An in-place rewrite of a cached knowledge base is not served stale."""
+        import os
+        from rra.services.kb_index import KnowledgeBaseIndex
+
+        path = _write_kb(tmp_path, "owner_a", "https://github.com/owner/a")
+        index = KnowledgeBaseIndex(tmp_path)
+        repo_id = index.link_service.generate_repo_id("https://github.com/owner/a")
+        first = index.load(repo_id)
+
+        _write_kb(tmp_path, "owner_a", "https://github.com/owner/a")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = index.load(repo_id)
+        assert second is not first
+        assert second.repo_url == first.repo_url
+
+    def test_registered_mapping_and_filename_fallback(self, tmp_path):
+        """Mappings registered by another service instance are seen on the next lookup."""
+        from rra.services.deep_links import DeepLinkService
+        from rra.services.kb_index import KnowledgeBaseIndex
+
+        path = _write_kb(tmp_path, "alice_tool", "https://example.com/other-url")
+        index = KnowledgeBaseIndex(tmp_path)
+        assert index.find_path("alice_tool") == path  # filename match
+
+        writer = DeepLinkService(mappings_path=tmp_path / "repo_mappings.json")
+        repo_id = writer.register_repo("https://github.com/alice/tool")
+        assert index.find_path(repo_id) == path
+
+
+class TestAgentPool:
+    """Test the bounded negotiator pool."""
+
+    def test_lru_bound_and_idle_eviction(self):
+        """The pool keeps at most max_size agents and drops idle ones."""
+        from rra.agents.pool import AgentPool
+
+        now = [0.0]
+        evicted = []
+        pool = AgentPool(
+            max_size=2, idle_ttl=10, on_evict=lambda k, a: evicted.append(k), clock=lambda: now[0]
+        )
+        pool.put("a", object())
+        pool.put("b", object())
+        assert pool.get("a") is not None
+        pool.put("c", object())
+        assert evicted == ["b"]
+        assert "a" in pool and "c" in pool
+
+        now[0] = 11.0
+        assert pool.get("a") is None
+        assert evicted == ["b", "a", "c"]
+        assert len(pool) == 0
+
+    def test_get_or_create_reuses_agent(self):
+        """The factory runs once per key while the agent is live."""
+        from rra.agents.pool import AgentPool
+
+        pool = AgentPool()
+        calls = []
+        first = pool.get_or_create("w", lambda: calls.append(1) or object())
+        assert pool.get_or_create("w", lambda: calls.append(1) or object()) is first
+        assert calls == [1]
+        assert pool.discard("w") is first
+        assert "w" not in pool
+
+
+class TestWidgetMessagePath:
+    """Test negotiator reuse across widget messages."""
+
+    @pytest.mark.asyncio
+    async def test_negotiator_context_kept_between_messages(self, tmp_path, monkeypatch):
+        """Messages of a session go to the same negotiator, which survives eviction."""
+        from rra.agents.pool import AgentPool
+        from rra.api import widget
+        from rra.services.kb_index import KnowledgeBaseIndex
+
+        _write_kb(tmp_path, "owner_repo", "https://github.com/owner/repo")
+        index = KnowledgeBaseIndex(tmp_path)
+        agent_id = index.link_service.generate_repo_id("https://github.com/owner/repo")
+        pool = AgentPool(on_evict=widget._save_negotiator_state)
+        monkeypatch.setattr(widget, "_kb_index", index)
+        monkeypatch.setattr(widget, "_negotiator_pool", pool)
+        monkeypatch.setitem(widget._widget_sessions, "w_test", {"agent_id": agent_id, "events": []})
+
+        class FakeRequest:
+            def __init__(self, body):
+                self.body = body
+
+            async def json(self):
+                return self.body
+
+        reply = await widget.widget_message(FakeRequest({"widget_id": "w_test", "message": "hi"}))
+        assert reply["phase"] != "error"
+        negotiator = pool.get("w_test")
+        history = len(negotiator.negotiation_history)
+
+        await widget.widget_message(FakeRequest({"widget_id": "w_test", "message": "price?"}))
+        assert pool.get("w_test") is negotiator
+        assert len(negotiator.negotiation_history) == history + 2
+
+        pool.evict_idle(now=float("inf"))
+        assert "negotiator_state" in widget._widget_sessions["w_test"]
+        await widget.widget_message(FakeRequest({"widget_id": "w_test", "message": "ok"}))
+        restored = pool.get("w_test")
+        assert restored is not negotiator
+        assert len(restored.negotiation_history) == history + 4
+
+
+class TestWidgetSessionStore:
+    """Test the bounded widget session store."""
+
+    def test_idle_expiry_and_size_bound(self, tmp_path):
+        """Idle sessions expire, and the least recently used go when full."""
+        from rra.api.widget_store import WidgetSessionStore
+
+        now = [0.0]
+        expired = []
+        store = WidgetSessionStore(
+            max_sessions=3,
+            idle_ttl=60,
+            event_log_dir=None,
+            on_evict=lambda wid, s: expired.append(wid),
+            clock=lambda: now[0],
+        )
+        for wid in ("a", "b", "c"):
+            store[wid] = {"agent_id": "agent", "events": []}
+        assert store.get("a") is not None
+        store["d"] = {"agent_id": "agent", "events": []}
+        assert expired == ["b"]
+        assert sorted(store) == ["a", "c", "d"]
+
+        now[0] = 30.0
+        store.get("c")
+        now[0] = 70.0
+        assert store.get("a") is None
+        assert sorted(store) == ["c"]
+        assert store.get("missing") is None
+
+    def test_events_capped_and_spilled(self, tmp_path):
+        """Only recent events stay in memory; all of them reach the event log."""
+        from rra.api.widget_store import WidgetSessionStore
+
+        store = WidgetSessionStore(max_events=5, event_log_dir=tmp_path / "events")
+        store["w1"] = {"agent_id": "agent", "events": []}
+        for i in range(12):
+            store.add_event("w1", {"event_type": "message_sent", "n": i})
+
+        assert [e["n"] for e in store["w1"]["events"]] == [7, 8, 9, 10, 11]
+        logged = store.read_event_log()
+        assert [e["n"] for e in logged] == list(range(12))
+        assert all(e["widget_id"] == "w1" for e in logged)
+        store.close()
+
+    def test_analytics_aggregated_incrementally(self, tmp_path):
+        """Agent analytics match a recount of the raw events, including expired sessions."""
+        import random
+        from rra.api.widget_store import WidgetSessionStore
+
+        rng = random.Random(44)
+        now = [0.0]
+        store = WidgetSessionStore(
+            max_sessions=20, idle_ttl=100, event_log_dir=None, clock=lambda: now[0]
+        )
+        raw = []
+        for i in range(2000):
+            now[0] += rng.random() * 5
+            wid = f"w{rng.randrange(60)}"
+            agent = f"agent{int(wid[1:]) % 3}"
+            if wid not in store:
+                store[wid] = {"agent_id": agent, "events": []}
+            event = {
+                "agent_id": agent,
+                "widget_id": wid,
+                "event_type": rng.choice(["widget_opened", "message_sent", "widget_closed"]),
+            }
+            store.add_event(wid, event, analytics=True)
+            raw.append(event)
+
+        for agent in ("agent0", "agent1", "agent2"):
+            events = [e for e in raw if e["agent_id"] == agent]
+            stats = store.get_agent_analytics(agent)
+            assert stats.count("widget_opened") == sum(
+                1 for e in events if e["event_type"] == "widget_opened"
+            )
+            assert stats.count("message_sent") == sum(
+                1 for e in events if e["event_type"] == "message_sent"
+            )
+            assert list(stats.recent) == events[-20:]
+        assert len(store) <= 20
+        assert store.get_agent_analytics("unknown") is None